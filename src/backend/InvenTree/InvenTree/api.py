@@ -16,15 +16,17 @@ from django.views.generic.base import RedirectView
 import structlog
 from django_q.models import OrmQ
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
-from rest_framework import permissions, serializers, viewsets
+from rest_framework import permissions, renderers, serializers, viewsets
 from rest_framework.generics import GenericAPIView
 from rest_framework.request import clone_request
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 import InvenTree.config
 import InvenTree.filters
+import InvenTree.instrumentation
 import InvenTree.permissions
 import InvenTree.version
 from common.settings import get_global_setting
@@ -169,6 +171,61 @@ class VersionView(APIView):
         })
 
 
+class PrometheusRenderer(renderers.BaseRenderer):
+    """Render instrumentation metrics in the Prometheus text format."""
+
+    media_type = 'text/plain'
+    format = 'prometheus'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render the endpoint metrics as Prometheus text."""
+        if not isinstance(data, dict):
+            data = {}
+
+        return InvenTree.instrumentation.render_prometheus(
+            data.get('endpoints', []), trees=data.get('trees', [])
+        )
+
+
+class InstrumentationSerializer(serializers.Serializer):
+    """Serializer for request instrumentation metrics."""
+
+    enabled = serializers.BooleanField(read_only=True)
+    sample_rate = serializers.FloatField(read_only=True)
+    endpoints = serializers.ListField(child=serializers.DictField(), read_only=True)
+    trees = serializers.ListField(child=serializers.DictField(), read_only=True)
+
+
+class InstrumentationView(APIView):
+    """Request-level performance metrics for this server process.
+
+    - GET: Return the aggregated metrics for each API endpoint (and tree rebuild durations)
+    - DELETE: Reset the aggregated metrics
+
+    Metrics can be returned in the Prometheus text format via ?format=prometheus
+    """
+
+    permission_classes = [InvenTree.permissions.IsAdminOrAdminScope]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, PrometheusRenderer]
+
+    @extend_schema(responses={200: OpenApiResponse(response=InstrumentationSerializer)})
+    def get(self, request, *args, **kwargs):
+        """Return the aggregated request metrics."""
+        return Response({
+            'enabled': InvenTree.instrumentation.is_enabled(),
+            'sample_rate': settings.INSTRUMENTATION_SAMPLE_RATE,
+            'endpoints': InvenTree.instrumentation.get_metrics(),
+            'trees': InvenTree.instrumentation.get_tree_metrics(),
+        })
+
+    @extend_schema(responses={204: None})
+    def delete(self, request, *args, **kwargs):
+        """Reset the aggregated request metrics."""
+        InvenTree.instrumentation.reset_metrics()
+        return Response(status=204)
+
+
 class VersionInformationSerializer(serializers.Serializer):
     """Serializer for a single version."""
 
@@ -824,6 +881,9 @@ class APISearchView(GenericAPIView):
         # Fetch and cache all groups associated with the current user
         groups = prefetch_rule_sets(request.user)
 
+        # Views (and query parameters) for each requested search type
+        search_views = {}
+
         for key, cls in self.get_result_types().items():
             # Only return results which are specifically requested
             if key in data:
@@ -844,18 +904,8 @@ class APISearchView(GenericAPIView):
                 if type(params) is not dict:
                     continue
 
-                is_viewset = issubclass(cls, viewsets.GenericViewSet) or issubclass(
-                    cls, viewsets.ViewSetMixin
-                )
-                view = cls if is_viewset else cls()
-
-                # Override regular query params with specific ones for this search request
-                cloned_request._request.GET = params
-                view.request = cloned_request
-                view.format_kwarg = 'format'
-
-                # Check permissions and update results dict with particular query
-                model = view.serializer_class.Meta.model
+                # Check permissions for the particular model
+                model = cls.serializer_class.Meta.model
 
                 if not check_user_permission(
                     request.user, model, 'view', groups=groups
@@ -865,23 +915,159 @@ class APISearchView(GenericAPIView):
                     }
                     continue
 
-                try:
-                    if is_viewset:
-                        # use dummy request to call the list method of the viewset
-                        req = HttpRequest()
-                        req.method = 'GET'
-                        req.user = request.user
-                        req.GET = params
-
-                        list_method = cls.as_view({'get': 'list'})(req, *args, **kwargs)
-                    else:
-                        list_method = view.list(request, *args, **kwargs)
-                    results[key] = list_method.data
-                except Exception as exc:
-                    results[key] = {'error': str(exc)}
+                search_views[key] = (cls, params)
+
+        if self.use_search_index(data):
+            # Search types with additional filters are queried against the individual models
+            indexed = {
+                key: view
+                for key, view in search_views.items()
+                if self.index_supports_filters(key, *view)
+            }
+
+            results.update(self.search_index(cloned_request, indexed, data))
+
+            search_views = {
+                key: view for key, view in search_views.items() if key not in indexed
+            }
+
+        for key, (cls, params) in search_views.items():
+            is_viewset = issubclass(cls, viewsets.GenericViewSet) or issubclass(
+                cls, viewsets.ViewSetMixin
+            )
+            view = cls if is_viewset else cls()
+
+            # Override regular query params with specific ones for this search request
+            cloned_request._request.GET = params
+            view.request = cloned_request
+            view.format_kwarg = 'format'
+
+            try:
+                if is_viewset:
+                    # use dummy request to call the list method of the viewset
+                    req = HttpRequest()
+                    req.method = 'GET'
+                    req.user = request.user
+                    req.GET = params
+
+                    list_method = cls.as_view({'get': 'list'})(req, *args, **kwargs)
+                else:
+                    list_method = view.list(request, *args, **kwargs)
+                results[key] = list_method.data
+            except Exception as exc:
+                results[key] = {'error': str(exc)}
 
         return Response(results)
 
+    def use_search_index(self, data) -> bool:
+        """Determine whether the search index can be used for this search request.
+
+        Regex and whole-word searches are not supported by the search index,
+        and are always performed against the individual models.
+        """
+        from common.search import search_index_enabled
+
+        if str2bool(data.get('search_regex', False)) or str2bool(
+            data.get('search_whole', False)
+        ):
+            return False
+
+        return search_index_enabled()
+
+    def index_supports_filters(self, key, cls, params) -> bool:
+        """Determine whether the search index supports all filters for a particular search type.
+
+        The search index only supports the boolean flags (e.g. 'active') and fixed filters
+        (e.g. 'is_supplier') for each search group. Any other filter must be applied before
+        the results are paginated, and so the individual model is searched instead.
+        """
+        import common.search
+
+        if not (group := common.search.get_search_groups().get(key)):
+            return False
+
+        filterset_class = getattr(cls, 'filterset_class', None)
+
+        filters = set(filterset_class.base_filters) if filterset_class else set()
+        filters |= set(getattr(cls, 'filterset_fields', None) or [])
+        filters -= {*group.filters, *group.flags}
+
+        return not any(name in filters for name in params)
+
+    def search_index(self, cloned_request, search_views, data) -> dict:
+        """Perform the search query against the search index.
+
+        All requested models are searched with a single query against the index,
+        and the matching objects are then serialized by the list view for each model.
+        """
+        import common.search
+
+        try:
+            limit = int(data.get('limit', 1))
+            offset = int(data.get('offset', 0))
+        except (TypeError, ValueError):
+            raise ValidationError({'limit': 'Invalid pagination values'})
+
+        matches = common.search.search(
+            str(data.get('search') or ''),
+            {key: params for key, (_cls, params) in search_views.items()},
+            notes=str2bool(data.get('search_notes', False)),
+            limit=limit,
+            offset=offset,
+        )
+
+        results = {}
+
+        for key, (cls, params) in search_views.items():
+            match = matches.get(key, {'count': 0, 'ids': []})
+
+            try:
+                results[key] = {
+                    'count': match['count'],
+                    'next': None,
+                    'previous': None,
+                    'results': self.serialize_results(
+                        cloned_request, cls, params, match['ids']
+                    ),
+                }
+            except Exception as exc:
+                results[key] = {'error': str(exc)}
+
+        return results
+
+    def serialize_results(self, cloned_request, cls, params, ids) -> list:
+        """Serialize the matching objects for a particular search type, in ranked order.
+
+        The list view for the model is used to construct the queryset and serializer,
+        so that the output matches a regular search request.
+        """
+        if not ids:
+            return []
+
+        view = cls()
+
+        # The search term has already been applied via the search index
+        cloned_request._request.GET = {
+            k: v for k, v in params.items() if k not in ['search', 'limit', 'offset']
+        }
+        view.request = cloned_request
+        view.format_kwarg = 'format'
+        view.args = ()
+        view.kwargs = {}
+
+        if isinstance(view, viewsets.ViewSetMixin):
+            view.action = 'list'
+            view.action_map = {'get': 'list'}
+
+        queryset = view.filter_queryset(view.get_queryset()).filter(pk__in=ids)
+        instances = {instance.pk: instance for instance in queryset}
+
+        serializer = view.get_serializer(
+            [instances[pk] for pk in ids if pk in instances], many=True
+        )
+
+        return serializer.data
+
 
 class GenericMetadataView(RetrieveUpdateAPI):
     """Metadata for specific instance; see https://docs.inventree.org/en/stable/plugins/metadata/ for more detail on how metadata works. Most core models support metadata."""
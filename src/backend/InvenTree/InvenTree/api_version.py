@@ -1,11 +1,32 @@
 """InvenTree API version information."""
 
 # InvenTree API version
-INVENTREE_API_VERSION = 534
+INVENTREE_API_VERSION = 541
 """Increment this API version number whenever there is a significant change to the API that any clients need to know about."""
 
 INVENTREE_API_TEXT = """
 
+v541 -> 2026-10-16
+    - Adds the "trees" field to the /api/instrumentation/ API endpoint, which provides the duration of tree rebuilds for each tree model
+
+v540 -> 2026-10-16
+    - Adds the /api/part/<id>/bom-explosion/ API endpoint, which returns the flattened multi-level BOM for an assembly
+
+v539 -> 2026-10-16
+    - Adds "dry_run" option to the BuildAutoAllocate API endpoint, which returns the proposed allocations without allocating stock
+
+v538 -> 2026-10-16
+    - Adds the /api/instrumentation/ API endpoint, which provides request-level performance metrics for each API endpoint
+
+v537 -> 2026-10-16
+    - Adds the "progress" field to the DataImportSession API endpoint, which tracks the number of validated rows
+
+v536 -> 2026-10-16
+    - Adds the /api/barcode/batch/ and /api/barcode/po-receive/batch/ API endpoints, for scanning multiple barcodes in a single request
+
+v535 -> 2026-10-16
+    - Adds "live" query parameter to the Part and PartRequirements API endpoints, to bypass cached availability data
+
 v534 -> 2026-08-21 : https://github.com/inventree/InvenTree/pull/12672
     - rename 'tags' filter to 'tag_name' to avoid name clash with the 'tags' field on various API endpoints
 
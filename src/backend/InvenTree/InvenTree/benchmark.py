@@ -0,0 +1,1041 @@
+"""Self-contained backend benchmark suite.
+
+Previously, the only performance tests (in src/performance) ran a handful of API list requests
+against a live server (via the inventree python client), which had to be set up and populated
+separately. Results depended on whatever data the server happened to contain, and were not
+recorded for comparison.
+
+Instead:
+
+- BenchmarkDataset generates a reproducible (seeded) synthetic dataset, of configurable scale
+  (at full scale: 100k parts, deep BOMs, 1M stock items and thousands of orders)
+- Each benchmark exercises a key model operation (pricing, allocation, stocktake, serialization,
+  tree rebuild, data import and export) or an API endpoint (via the django test client)
+- BenchmarkRunner records the timing and query count for each benchmark, and each benchmark
+  is run inside a transaction which is rolled back, so that the dataset is not modified
+- Results are written to a JSON file, which can be compared against a previous (baseline) result
+
+The suite is run via the 'benchmark' management command (or 'invoke dev.benchmark'),
+which creates (and destroys) a separate test database.
+"""
+
+import datetime
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from decimal import Decimal
+from itertools import batched
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Max
+
+import structlog
+
+import InvenTree.instrumentation
+
+logger = structlog.get_logger('inventree')
+
+# Number of objects generated (at full scale) for each type of dataset object
+DATASET_SIZES = {
+    'parts': 100_000,
+    'stock_items': 1_000_000,
+    'suppliers': 200,
+    'customers': 200,
+    'purchase_orders': 2_000,
+    'sales_orders': 2_000,
+    'build_orders': 1_000,
+}
+
+# Number of child nodes for each node in the category (and location) trees, at full scale
+TREE_BRANCHING = 10
+
+# Number of levels in the category (and location) trees
+TREE_DEPTH = 3
+
+# Number of BOM levels (above the component level)
+BOM_DEPTH = 6
+
+# Number of BOM lines for each assembly
+BOM_LINES = 8
+
+# Fraction of parts which are assemblies
+ASSEMBLY_FRACTION = 0.2
+
+# Every nth component is a template part, followed by VARIANT_COUNT variants
+VARIANT_INTERVAL = 20
+VARIANT_COUNT = 4
+
+# Number of line items for each purchase or sales order
+ORDER_LINES = 10
+
+# Number of objects inserted at once
+CHUNK_SIZE = 5000
+
+# Global setting which records the parameters of the generated dataset
+DATASET_SETTING = '_BENCHMARK_DATASET'
+
+# Registered benchmarks (name -> function)
+BENCHMARKS: dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function, which is called with the BenchmarkRunner instance."""
+
+    def decorator(fn):
+        BENCHMARKS[name] = fn
+        return fn
+
+    return decorator
+
+
+class BenchmarkDataset:
+    """Reproducible synthetic dataset for benchmarking.
+
+    The same seed and scale always produce the same dataset (in an empty database).
+
+    Example:
+        dataset = BenchmarkDataset(seed=0, scale=0.1)
+        dataset.generate()
+    """
+
+    USERNAME = 'benchmark'
+
+    def __init__(
+        self,
+        seed: int = 0,
+        scale: float = 1.0,
+        progress: Optional[Callable[[str], None]] = None,
+    ):
+        """Initialize the dataset generator.
+
+        Arguments:
+            seed: Random seed used to generate the dataset
+            scale: Scale factor for the number of generated objects (1.0 = full scale)
+            progress: Optional callback function, called with a message as each step completes
+        """
+        self.seed = seed
+        self.scale = scale
+        self.progress = progress
+        self.rng = random.Random(seed)
+
+        # Information about the generated dataset, used by the benchmarks
+        self.metadata: dict = {}
+
+    def size(self, key: str) -> int:
+        """Return the (scaled) number of objects to generate for the given key."""
+        return max(1, int(DATASET_SIZES[key] * self.scale))
+
+    @property
+    def parameters(self) -> dict:
+        """Return the parameters which uniquely identify this dataset."""
+        return {'seed': self.seed, 'scale': self.scale}
+
+    def exists(self) -> bool:
+        """Return True if a benchmark dataset (with any parameters) exists in the database."""
+        from django.contrib.auth.models import User
+
+        return User.objects.filter(username=self.USERNAME).exists()
+
+    def load(self) -> bool:
+        """Load the metadata for a previously generated dataset (with the same parameters).
+
+        Returns:
+            True if a matching dataset already exists in the database
+        """
+        from common.settings import get_global_setting
+
+        try:
+            data = json.loads(get_global_setting(DATASET_SETTING, '', cache=False))
+        except (TypeError, ValueError):
+            return False
+
+        if not isinstance(data, dict) or data.get('parameters') != self.parameters:
+            return False
+
+        self.metadata = data.get('metadata', {})
+        return True
+
+    def report(self, message: str) -> None:
+        """Report progress of the dataset generation."""
+        logger.info('Benchmark dataset: %s', message)
+
+        if self.progress:
+            self.progress(message)
+
+    def generate(self) -> None:
+        """Generate the complete dataset."""
+        from common.settings import set_global_setting
+
+        self.metadata = {}
+
+        t_start = time.perf_counter()
+
+        for step in [
+            self.create_user,
+            self.create_categories,
+            self.create_locations,
+            self.create_companies,
+            self.create_parts,
+            self.create_bom,
+            self.create_supplier_parts,
+            self.create_stock,
+            self.create_purchase_orders,
+            self.create_sales_orders,
+            self.create_build_orders,
+        ]:
+            t_step = time.perf_counter()
+
+            with transaction.atomic():
+                message = step()
+
+            self.report(f'{message} ({time.perf_counter() - t_step:.1f}s)')
+
+        set_global_setting('STOCKTAKE_ENABLE', True, None)
+
+        set_global_setting(
+            DATASET_SETTING,
+            json.dumps({'parameters': self.parameters, 'metadata': self.metadata}),
+            None,
+        )
+
+        self.report(f'Generated in {time.perf_counter() - t_start:.1f}s')
+
+    def create_user(self) -> str:
+        """Create the (superuser) account used for API requests."""
+        from django.contrib.auth.models import User
+
+        user = User.objects.create_superuser(
+            username=self.USERNAME, email='benchmark@example.com', password='benchmark'
+        )
+
+        self.metadata['user'] = user.pk
+
+        return f"Created user '{user.username}'"
+
+    def create_tree(self, model, prefix: str) -> list[int]:
+        """Create a tree structure of the provided model (e.g. PartCategory).
+
+        Tree updates are deferred until the complete structure has been created.
+
+        Returns:
+            The IDs of the leaf nodes in the tree
+        """
+        from InvenTree.trees import deferred_tree_updates
+
+        branching = max(2, round(TREE_BRANCHING * self.scale ** (1 / TREE_DEPTH)))
+
+        nodes = [None]
+
+        with deferred_tree_updates(model):
+            for level in range(TREE_DEPTH):
+                parents = [node for node in nodes for _ in range(branching)]
+
+                nodes = [
+                    model.objects.create(
+                        name=f'{prefix} {level}-{idx}',
+                        description=f'Benchmark {prefix.lower()}',
+                        parent=parent,
+                    )
+                    for idx, parent in enumerate(parents)
+                ]
+
+        return [node.pk for node in nodes]
+
+    def create_categories(self) -> str:
+        """Create the part category tree."""
+        from part.models import PartCategory
+
+        self.categories = self.create_tree(PartCategory, 'Category')
+
+        self.metadata['category'] = (
+            PartCategory.objects.filter(parent=None).order_by('pk').first().pk
+        )
+
+        return f'Created {PartCategory.objects.count()} part categories'
+
+    def create_locations(self) -> str:
+        """Create the stock location tree."""
+        from stock.models import StockLocation
+
+        self.locations = self.create_tree(StockLocation, 'Location')
+
+        self.metadata['location'] = self.locations[0]
+
+        return f'Created {StockLocation.objects.count()} stock locations'
+
+    def create_companies(self) -> str:
+        """Create supplier and customer companies."""
+        from company.models import Company
+
+        Company.objects.bulk_create([
+            *[
+                Company(
+                    name=f'Supplier {idx}',
+                    description='Benchmark supplier',
+                    is_supplier=True,
+                )
+                for idx in range(self.size('suppliers'))
+            ],
+            *[
+                Company(
+                    name=f'Customer {idx}',
+                    description='Benchmark customer',
+                    is_customer=True,
+                )
+                for idx in range(self.size('customers'))
+            ],
+        ])
+
+        self.suppliers = list(
+            Company.objects
+            .filter(is_supplier=True)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+        self.customers = list(
+            Company.objects
+            .filter(is_customer=True)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+        return f'Created {len(self.suppliers)} suppliers and {len(self.customers)} customers'
+
+    def create_parts(self) -> str:
+        """Create components (including templates and variants) and assemblies.
+
+        Assemblies are evenly distributed across BOM levels (1 to BOM_DEPTH).
+        The tree fields for each part (variant tree) are calculated directly.
+        """
+        from part.models import Part
+
+        n_parts = self.size('parts')
+        n_assemblies = max(BOM_DEPTH, int(n_parts * ASSEMBLY_FRACTION))
+        n_components = max(1, n_parts - n_assemblies)
+
+        next_tree = (Part.objects.aggregate(tree=Max('tree_id'))['tree'] or 0) + 1
+
+        # BOM level for each part (0 = component)
+        self.levels = [0] * n_components + [
+            1 + (idx * BOM_DEPTH) // n_assemblies for idx in range(n_assemblies)
+        ]
+
+        # Map of template index -> variant indices
+        variants = {
+            idx: list(range(idx + 1, idx + 1 + VARIANT_COUNT))
+            for idx in range(0, n_components - VARIANT_COUNT, VARIANT_INTERVAL)
+        }
+
+        variant_of = {
+            variant: template
+            for template, children in variants.items()
+            for variant in children
+        }
+
+        def make_part(idx: int, **kwargs) -> Part:
+            level = self.levels[idx]
+
+            return Part(
+                name=f'Part {idx}',
+                IPN=f'BM-{idx:06d}',
+                description=f'Benchmark part (BOM level {level})',
+                category_id=self.rng.choice(self.categories),
+                active=True,
+                component=level < BOM_DEPTH,
+                assembly=level > 0,
+                purchaseable=level == 0,
+                salable=level in [0, BOM_DEPTH],
+                is_template=idx in variants,
+                **kwargs,
+            )
+
+        roots = []
+        children = []
+
+        for idx in range(len(self.levels)):
+            if idx in variant_of:
+                # Variant parts are created (below) once the template part exists
+                children.append(idx)
+                continue
+
+            n_variants = len(variants.get(idx, []))
+
+            roots.append(
+                make_part(
+                    idx,
+                    tree_id=next_tree + idx,
+                    level=0,
+                    lft=1,
+                    rght=2 * n_variants + 2,
+                )
+            )
+
+        Part.objects.bulk_create(roots, batch_size=CHUNK_SIZE)
+
+        self.parts = dict(
+            Part.objects
+            .filter(IPN__startswith='BM-')
+            .order_by('pk')
+            .values_list('IPN', 'pk')
+        )
+
+        Part.objects.bulk_create(
+            [
+                make_part(
+                    idx,
+                    variant_of_id=self.parts[f'BM-{variant_of[idx]:06d}'],
+                    tree_id=next_tree + variant_of[idx],
+                    level=1,
+                    lft=2 * (idx - variant_of[idx]),
+                    rght=2 * (idx - variant_of[idx]) + 1,
+                )
+                for idx in children
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        self.parts = dict(
+            Part.objects
+            .filter(IPN__startswith='BM-')
+            .order_by('pk')
+            .values_list('IPN', 'pk')
+        )
+
+        # Part IDs for each BOM level (in order of generation)
+        self.part_levels = defaultdict(list)
+
+        for idx, level in enumerate(self.levels):
+            self.part_levels[level].append(self.parts[f'BM-{idx:06d}'])
+
+        self.templates = {self.parts[f'BM-{idx:06d}'] for idx in variants}
+
+        self.metadata['assembly'] = self.part_levels[BOM_DEPTH][0]
+        self.metadata['component'] = self.part_levels[0][0]
+
+        return f'Created {len(self.parts)} parts ({n_assemblies} assemblies)'
+
+    def create_bom(self) -> str:
+        """Create BOM lines for each assembly.
+
+        Each assembly includes at least one sub-assembly from the level below,
+        so that the BOM for each top-level assembly is BOM_DEPTH levels deep.
+        """
+        from part.models import BomItem
+
+        count = 0
+
+        for level in range(1, BOM_DEPTH + 1):
+            lower = [pk for lvl in range(level) for pk in self.part_levels[lvl]]
+
+            items = []
+
+            for assembly in self.part_levels[level]:
+                sub_parts = {self.rng.choice(self.part_levels[level - 1])}
+
+                while len(sub_parts) < min(BOM_LINES, len(lower)):
+                    sub_parts.add(self.rng.choice(lower))
+
+                for sub_part in sorted(sub_parts):
+                    quantity = self.rng.randint(1, 10)
+
+                    items.append(
+                        BomItem(
+                            part_id=assembly,
+                            sub_part_id=sub_part,
+                            quantity=quantity,
+                            raw_amount=str(quantity),
+                            reference=f'R{len(items)}',
+                        )
+                    )
+
+            BomItem.objects.bulk_create(items, batch_size=CHUNK_SIZE)
+            count += len(items)
+
+        return f'Created {count} BOM items ({BOM_DEPTH} levels)'
+
+    def create_supplier_parts(self) -> str:
+        """Create a supplier part (with a price break) for each component."""
+        from djmoney.money import Money
+
+        from common.currency import currency_code_default
+        from company.models import SupplierPart, SupplierPriceBreak
+
+        currency = currency_code_default()
+
+        SupplierPart.objects.bulk_create(
+            [
+                SupplierPart(
+                    part_id=part,
+                    supplier_id=self.rng.choice(self.suppliers),
+                    SKU=f'BM-SKU-{part}',
+                )
+                for part in self.part_levels[0]
+                if part not in self.templates
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        self.supplier_parts = list(
+            SupplierPart.objects
+            .filter(SKU__startswith='BM-SKU-')
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+        SupplierPriceBreak.objects.bulk_create(
+            [
+                SupplierPriceBreak(
+                    part_id=supplier_part,
+                    quantity=1,
+                    price=Money(Decimal(self.rng.randint(1, 10000)) / 100, currency),
+                )
+                for supplier_part in self.supplier_parts
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        return f'Created {len(self.supplier_parts)} supplier parts'
+
+    def create_stock(self) -> str:
+        """Create stock items for (non-template) parts, in chunks."""
+        from stock.models import StockItem
+
+        parts = [pk for pk in self.parts.values() if pk not in self.templates]
+        n_items = self.size('stock_items')
+
+        for chunk in batched(range(n_items), CHUNK_SIZE):
+            StockItem.objects.bulk_create([
+                StockItem(
+                    part_id=self.rng.choice(parts),
+                    location_id=self.rng.choice(self.locations),
+                    quantity=self.rng.randint(1, 1000),
+                    batch=f'B{idx % 1000}',
+                )
+                for idx in chunk
+            ])
+
+        return f'Created {n_items} stock items'
+
+    def create_orders(self, model, prefix: str, n_orders: int, **kwargs) -> list[int]:
+        """Create orders for the provided order model.
+
+        Arguments:
+            model: The order model (e.g. PurchaseOrder)
+            prefix: Reference prefix (matching the default reference pattern)
+            n_orders: The number of orders to create
+            kwargs: Callables which return the value of each order field (e.g. supplier_id)
+
+        Returns:
+            The IDs of the created orders
+        """
+        model.objects.bulk_create(
+            [
+                model(
+                    reference=f'{prefix}-{idx:04d}',
+                    reference_int=idx,
+                    description='Benchmark order',
+                    **{key: value() for key, value in kwargs.items()},
+                )
+                for idx in range(1, n_orders + 1)
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        return list(
+            model.objects
+            .filter(reference__startswith=f'{prefix}-')
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+    def create_purchase_orders(self) -> str:
+        """Create purchase orders (with line items)."""
+        from djmoney.money import Money
+
+        from common.currency import currency_code_default
+        from order.models import PurchaseOrder, PurchaseOrderLineItem
+
+        currency = currency_code_default()
+
+        orders = self.create_orders(
+            PurchaseOrder,
+            'PO',
+            self.size('purchase_orders'),
+            supplier_id=lambda: self.rng.choice(self.suppliers),
+        )
+
+        PurchaseOrderLineItem.objects.bulk_create(
+            [
+                PurchaseOrderLineItem(
+                    order_id=order,
+                    part_id=self.rng.choice(self.supplier_parts),
+                    quantity=self.rng.randint(1, 100),
+                    purchase_price=Money(
+                        Decimal(self.rng.randint(1, 10000)) / 100, currency
+                    ),
+                )
+                for order in orders
+                for _ in range(ORDER_LINES)
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        return f'Created {len(orders)} purchase orders'
+
+    def create_sales_orders(self) -> str:
+        """Create sales orders (with line items)."""
+        from order.models import SalesOrder, SalesOrderLineItem
+
+        salable = [
+            pk
+            for pk in self.part_levels[0] + self.part_levels[BOM_DEPTH]
+            if pk not in self.templates
+        ]
+
+        orders = self.create_orders(
+            SalesOrder,
+            'SO',
+            self.size('sales_orders'),
+            customer_id=lambda: self.rng.choice(self.customers),
+        )
+
+        SalesOrderLineItem.objects.bulk_create(
+            [
+                SalesOrderLineItem(
+                    order_id=order,
+                    part_id=self.rng.choice(salable),
+                    quantity=self.rng.randint(1, 100),
+                )
+                for order in orders
+                for _ in range(ORDER_LINES)
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        return f'Created {len(orders)} sales orders'
+
+    def create_build_orders(self) -> str:
+        """Create build orders (with build lines) for assemblies.
+
+        An additional build order is created (via the model) for the allocation benchmark.
+        """
+        from build.models import Build, BuildLine
+        from part.models import BomItem
+
+        n_builds = self.size('build_orders')
+        next_tree = (Build.objects.aggregate(tree=Max('tree_id'))['tree'] or 0) + 1
+
+        assemblies = [
+            pk for level in range(1, BOM_DEPTH + 1) for pk in self.part_levels[level]
+        ]
+
+        Build.objects.bulk_create(
+            [
+                Build(
+                    part_id=self.rng.choice(assemblies),
+                    quantity=self.rng.randint(1, 50),
+                    reference=f'BO-{idx:04d}',
+                    reference_int=idx,
+                    title='Benchmark build',
+                    tree_id=next_tree + idx,
+                    level=0,
+                    lft=1,
+                    rght=2,
+                )
+                for idx in range(1, n_builds + 1)
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        builds = list(
+            Build.objects.filter(reference__startswith='BO-').values_list(
+                'pk', 'part_id', 'quantity'
+            )
+        )
+
+        bom_items = defaultdict(list)
+
+        for pk, part, quantity in BomItem.objects.filter(
+            part__in={build[1] for build in builds}
+        ).values_list('pk', 'part_id', 'quantity'):
+            bom_items[part].append((pk, quantity))
+
+        BuildLine.objects.bulk_create(
+            [
+                BuildLine(build_id=build, bom_item_id=bom_item, quantity=bom_qty * qty)
+                for build, part, qty in builds
+                for bom_item, bom_qty in bom_items[part]
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+
+        # Build order for a first-level assembly (all lines are components with stock)
+        build = Build.objects.create(
+            part_id=self.part_levels[1][0],
+            quantity=10,
+            reference=f'BO-{n_builds + 1:04d}',
+            title='Benchmark allocation',
+        )
+
+        self.metadata['build'] = build.pk
+
+        return f'Created {n_builds + 1} build orders'
+
+
+class BenchmarkRunner:
+    """Run the registered benchmarks against a generated dataset.
+
+    Each benchmark is run (once to warm up, and then repeatedly) inside a transaction which is
+    rolled back, so that benchmarks do not affect each other. Note that on_commit callbacks
+    are therefore not executed.
+
+    Example:
+        runner = BenchmarkRunner(dataset, repeat=3)
+        results = runner.run(['pricing', 'api.part'])
+    """
+
+    def __init__(
+        self,
+        dataset: BenchmarkDataset,
+        repeat: int = 3,
+        progress: Optional[Callable[[str, dict], None]] = None,
+    ):
+        """Initialize the benchmark runner.
+
+        Arguments:
+            dataset: The (generated or loaded) benchmark dataset
+            repeat: Number of timed runs for each benchmark
+            progress: Optional callback function, called as progress(name, result) for each benchmark
+        """
+        from django.contrib.auth.models import User
+        from django.test import Client
+
+        self.dataset = dataset
+        self.repeat = max(1, repeat)
+        self.progress = progress
+
+        self.user = User.objects.get(pk=dataset.metadata['user'])
+
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def api(self, method: str, url: str, data: Optional[dict] = None):
+        """Perform an API request (via the test client), and check the response."""
+        if method == 'get':
+            response = self.client.get(url, data=data)
+        else:
+            response = getattr(self.client, method)(
+                url, data=data, content_type='application/json'
+            )
+
+        if response.status_code >= 400:
+            raise ValueError(f'{method.upper()} {url}: {response.status_code}')
+
+        return response
+
+    def measure(self, fn: Callable) -> dict:
+        """Run a single benchmark, and return the recorded metrics."""
+        timings = []
+
+        for idx in range(self.repeat + 1):
+            with InvenTree.instrumentation.request_timer() as metrics:
+                t_start = time.perf_counter()
+
+                with transaction.atomic():
+                    fn(self)
+                    transaction.set_rollback(True)
+
+                duration = time.perf_counter() - t_start
+
+            # The first run is used to warm up caches (and is not recorded)
+            if idx > 0:
+                timings.append(duration)
+
+        return {
+            'time': statistics.median(timings),
+            'min': min(timings),
+            'max': max(timings),
+            'queries': metrics.queries,
+            'db_time': metrics.db_time,
+        }
+
+    def run(self, filters: Optional[list[str]] = None) -> dict:
+        """Run all registered benchmarks (optionally filtered by name).
+
+        Arguments:
+            filters: Optional list of name prefixes (e.g. ['pricing', 'api.part'])
+
+        Returns:
+            The benchmark results, including metadata about the dataset and environment
+        """
+        from django.conf import settings
+
+        import InvenTree.version
+
+        results = {}
+
+        for name, fn in BENCHMARKS.items():
+            if filters and not any(name.startswith(prefix) for prefix in filters):
+                continue
+
+            try:
+                result = self.measure(fn)
+            except Exception as exc:
+                logger.exception('Benchmark %s failed', name)
+                result = {'error': str(exc)}
+
+            results[name] = result
+
+            if self.progress:
+                self.progress(name, result)
+
+        return {
+            'metadata': {
+                **self.dataset.parameters,
+                'version': InvenTree.version.inventreeVersion(),
+                'database': settings.DATABASES['default']['ENGINE'],
+                'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                'repeat': self.repeat,
+            },
+            'results': results,
+        }
+
+
+def compare_results(
+    results: dict, baseline: dict, tolerance: float = 0.25, min_time: float = 0.005
+) -> list[dict]:
+    """Compare benchmark results against a baseline.
+
+    Arguments:
+        results: The current benchmark results (see BenchmarkRunner.run)
+        baseline: The baseline benchmark results
+        tolerance: Allowed (fractional) increase in the median time
+        min_time: Increases in time below this value (in seconds) are ignored as noise
+
+    Returns:
+        A list of regressions, each a dict of benchmark name, metric, baseline and current value
+    """
+    regressions = []
+
+    if results.get('metadata', {}).get('scale') != baseline.get('metadata', {}).get(
+        'scale'
+    ):
+        logger.warning('Comparing benchmark results for different dataset scales')
+
+    for name, result in results.get('results', {}).items():
+        if not (previous := baseline.get('results', {}).get(name)):
+            continue
+
+        if 'error' in result and 'error' not in previous:
+            regressions.append({
+                'name': name,
+                'metric': 'error',
+                'baseline': None,
+                'current': result['error'],
+            })
+            continue
+
+        if 'error' in result or 'error' in previous:
+            continue
+
+        if result['queries'] > previous['queries']:
+            regressions.append({
+                'name': name,
+                'metric': 'queries',
+                'baseline': previous['queries'],
+                'current': result['queries'],
+            })
+
+        if (
+            result['time'] > previous['time'] * (1 + tolerance)
+            and result['time'] - previous['time'] > min_time
+        ):
+            regressions.append({
+                'name': name,
+                'metric': 'time',
+                'baseline': previous['time'],
+                'current': result['time'],
+            })
+
+    return regressions
+
+
+# Model operation benchmarks
+
+
+@benchmark('pricing.assembly')
+def pricing_assembly(runner: BenchmarkRunner):
+    """Recalculate pricing for a top-level assembly."""
+    from part.pricing import PricingEngine
+
+    engine = PricingEngine()
+    engine.add_parts([runner.dataset.metadata['assembly']])
+    engine.run(cascade=False)
+
+
+@benchmark('pricing.cascade')
+def pricing_cascade(runner: BenchmarkRunner):
+    """Recalculate pricing for all assemblies which (indirectly) use a component."""
+    from part.pricing import PricingEngine
+
+    engine = PricingEngine()
+    engine.add_changed([runner.dataset.metadata['component']])
+    engine.run()
+
+
+@benchmark('allocation.build')
+def allocation_build(runner: BenchmarkRunner):
+    """Automatically allocate stock against a build order."""
+    from build.models import Build
+
+    Build.objects.get(pk=runner.dataset.metadata['build']).auto_allocate_stock()
+
+
+@benchmark('stocktake.category')
+def stocktake_category(runner: BenchmarkRunner):
+    """Perform a stocktake for all parts in a (top-level) category."""
+    from part.stocktake import perform_stocktake
+
+    perform_stocktake(category_id=runner.dataset.metadata['category'])
+
+
+@benchmark('serialize.part')
+def serialize_part(runner: BenchmarkRunner):
+    """Serialize a page of parts (without the API request overhead)."""
+    from part.models import Part
+    from part.serializers import PartSerializer
+
+    queryset = PartSerializer.annotate_queryset(Part.objects.all())
+
+    PartSerializer(queryset.order_by('pk')[:250], many=True).data
+
+
+@benchmark('serialize.stock')
+def serialize_stock(runner: BenchmarkRunner):
+    """Serialize a page of stock items (without the API request overhead)."""
+    from stock.models import StockItem
+    from stock.serializers import StockItemSerializer
+
+    queryset = StockItemSerializer.annotate_queryset(StockItem.objects.all())
+
+    StockItemSerializer(queryset.order_by('pk')[:250], many=True).data
+
+
+@benchmark('tree.category')
+def tree_category(runner: BenchmarkRunner):
+    """Rebuild all part category trees (including pathstring values)."""
+    from InvenTree.trees import rebuild_trees
+    from part.models import PartCategory
+
+    rebuild_trees(
+        PartCategory,
+        PartCategory.objects.filter(parent=None).values_list('tree_id', flat=True),
+    )
+
+
+@benchmark('tree.location')
+def tree_location(runner: BenchmarkRunner):
+    """Rebuild all stock location trees (including pathstring values)."""
+    from InvenTree.trees import rebuild_trees
+    from stock.models import StockLocation
+
+    rebuild_trees(
+        StockLocation,
+        StockLocation.objects.filter(parent=None).values_list('tree_id', flat=True),
+    )
+
+
+@benchmark('export.stock')
+def export_stock(runner: BenchmarkRunner):
+    """Export the stock items in a location to a CSV file (via the API)."""
+    runner.api(
+        'get',
+        '/api/stock/',
+        {
+            'location': runner.dataset.metadata['location'],
+            'export': True,
+            'export_format': 'csv',
+            'export_plugin': 'inventree-exporter',
+        },
+    )
+
+
+@benchmark('import.parts')
+def import_parts(runner: BenchmarkRunner):
+    """Import parts from a CSV file (via a data import session)."""
+    from django.core.files.base import ContentFile
+
+    from importer.models import DataImportSession
+
+    category = runner.dataset.metadata['category']
+
+    lines = ['Name,Description,Category']
+    lines += [f'Imported {idx},Benchmark import,{category}' for idx in range(250)]
+
+    session = DataImportSession.objects.create(
+        data_file=ContentFile('\n'.join(lines), 'benchmark.csv'),
+        model_type='part',
+        user=runner.user,
+    )
+
+    session.import_data()
+
+    for row in session.rows.all():
+        row.validate(commit=True)
+
+
+# API benchmarks (name, URL, query parameters)
+API_BENCHMARKS = [
+    ('api.part.list', '/api/part/', {'limit': 100}),
+    ('api.part.category', '/api/part/category/', {'limit': 100}),
+    ('api.part.bom', '/api/bom/', {'limit': 100}),
+    ('api.stock.list', '/api/stock/', {'limit': 100}),
+    ('api.stock.location', '/api/stock/location/', {'limit': 100}),
+    ('api.company.list', '/api/company/', {'limit': 100}),
+    ('api.build.list', '/api/build/', {'limit': 100}),
+    ('api.build.line', '/api/build/line/', {'limit': 100}),
+    ('api.order.po', '/api/order/po/', {'limit': 100}),
+    ('api.order.po_line', '/api/order/po-line/', {'limit': 100}),
+    ('api.order.so', '/api/order/so/', {'limit': 100}),
+    ('api.order.so_line', '/api/order/so-line/', {'limit': 100}),
+    ('api.user.roles', '/api/user/me/roles/', {}),
+]
+
+
+def api_benchmark(url: str, params: dict) -> Callable:
+    """Construct a benchmark function for a GET request against an API endpoint."""
+
+    def fn(runner: BenchmarkRunner):
+        runner.api('get', url, params)
+
+    return fn
+
+
+for _name, _url, _params in API_BENCHMARKS:
+    benchmark(_name)(api_benchmark(_url, _params))
+
+
+@benchmark('api.search')
+def api_search(runner: BenchmarkRunner):
+    """Perform a global search (via the API)."""
+    runner.api(
+        'post',
+        '/api/search/',
+        {
+            'search': 'Part 1',
+            'limit': 10,
+            'part': {},
+            'partcategory': {},
+            'stockitem': {},
+            'stocklocation': {},
+            'supplierpart': {},
+            'purchaseorder': {},
+            'salesorder': {},
+            'build': {},
+        },
+    )
@@ -9,6 +9,7 @@ from django.db.utils import OperationalError, ProgrammingError
 import structlog
 
 import InvenTree.config
+import InvenTree.instrumentation
 import InvenTree.ready
 
 logger = structlog.get_logger('inventree')
@@ -156,6 +157,14 @@ def delete_session_cache() -> None:
         del thread_data.request_cache
 
 
+def is_session_cache_active() -> bool:
+    """Return True if the session cache is available (i.e. within a request)."""
+    return (
+        hasattr(thread_data, 'request')
+        and getattr(thread_data, 'request_cache', None) is not None
+    )
+
+
 def get_session_cache(key: str) -> Any:
     """Return a cached value from the session cache."""
     # Only return a cached value if the request object is available too
@@ -165,6 +174,7 @@ def get_session_cache(key: str) -> Any:
     request_cache = getattr(thread_data, 'request_cache', None)
     if request_cache is not None:
         val = request_cache.get(key, None)
+        InvenTree.instrumentation.record_cache_access(val is not None)
         return val
 
 
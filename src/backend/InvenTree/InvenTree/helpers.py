@@ -597,7 +597,11 @@ def increment_serial_number(serial, part=None):
 
 
 def extract_serial_numbers(
-    input_string, expected_quantity: int, starting_value=None, part=None
+    input_string,
+    expected_quantity: int,
+    starting_value=None,
+    part=None,
+    next_serials: Optional[list] = None,
 ):
     """Extract a list of serial numbers from a provided input string.
 
@@ -617,8 +621,9 @@ def extract_serial_numbers(
         expected_quantity: The number of (unique) serial numbers we expect
         starting_value: Provide a starting value for the sequence (or None)
         part: Part that should be used as context
+        next_serials: Serial numbers to substitute for the ~ character, in order (e.g. reserved via Part.reserve_serial_numbers)
     """
-    if starting_value is None:
+    if starting_value is None and next_serials is None:
         starting_value = increment_serial_number(None, part=part)
 
     try:
@@ -636,12 +641,17 @@ def extract_serial_numbers(
     if len(input_string) == 0:
         raise ValidationError([_('Empty serial number string')])
 
-    next_value = increment_serial_number(starting_value, part=part)
+    if next_serials is not None:
+        # Substitute ~ character with the provided values
+        for next_value in next_serials:
+            input_string = input_string.replace('~', str(next_value), 1)
+    else:
+        next_value = increment_serial_number(starting_value, part=part)
 
-    # Substitute ~ character with latest value
-    while '~' in input_string and next_value:
-        input_string = input_string.replace('~', str(next_value), 1)
-        next_value = increment_serial_number(next_value, part=part)
+        # Substitute ~ character with latest value
+        while '~' in input_string and next_value:
+            input_string = input_string.replace('~', str(next_value), 1)
+            next_value = increment_serial_number(next_value, part=part)
 
     # Split input string by whitespace or comma (,) characters
     groups = re.split(r'[\s,]+', input_string)
@@ -0,0 +1,353 @@
+"""Request-level performance instrumentation for InvenTree.
+
+When enabled (via the INVENTREE_INSTRUMENTATION setting), the following metrics are recorded for each (sampled) request:
+
+- Total request latency
+- Number of database queries, and the time spent executing them
+- Number of cache hits and misses
+- Time spent serializing data
+
+Metrics are aggregated in-process into histograms (per endpoint), and can be retrieved via the API.
+
+Tree (MPTT) rebuild durations are also reported, per tree model. As trees are rebuilt by the
+background worker, these are read from the TreeRebuild table (see InvenTree.trees) rather than
+being recorded in-process.
+
+Note: Request metrics are not shared between server processes - each process reports its own metrics.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+# Histogram buckets for timing values (seconds)
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Histogram buckets for query counts
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Maximum number of distinct endpoints which are tracked
+MAX_ENDPOINTS = 1000
+
+
+@dataclass
+class RequestMetrics:
+    """Metrics recorded for a single request."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    serializer_time: float = 0.0
+    serializer_depth: int = 0
+
+
+class Histogram:
+    """A cumulative histogram, with fixed bucket boundaries."""
+
+    def __init__(self, buckets: tuple):
+        """Initialize an empty histogram with the provided bucket boundaries."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        """Return the histogram data (with cumulative bucket counts)."""
+        buckets = {}
+        total = 0
+
+        for bound, count in zip([*self.buckets, '+Inf'], self.counts, strict=True):
+            total += count
+            buckets[str(bound)] = total
+
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated metrics for a single API endpoint."""
+
+    latency: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    db_time: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    serializer_time: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    queries: Histogram = field(default_factory=lambda: Histogram(QUERY_BUCKETS))
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def record(self, latency: float, metrics: RequestMetrics) -> None:
+        """Record the metrics for a single request."""
+        self.latency.observe(latency)
+        self.db_time.observe(metrics.db_time)
+        self.serializer_time.observe(metrics.serializer_time)
+        self.queries.observe(metrics.queries)
+        self.cache_hits += metrics.cache_hits
+        self.cache_misses += metrics.cache_misses
+
+    def to_dict(self) -> dict:
+        """Return the aggregated metrics for this endpoint."""
+        return {
+            'requests': self.latency.count,
+            'latency': self.latency.to_dict(),
+            'db_time': self.db_time.to_dict(),
+            'serializer_time': self.serializer_time.to_dict(),
+            'queries': self.queries.to_dict(),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+
+# Metrics for the current request (if it is being instrumented)
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    '_request_metrics', default=None
+)
+
+# Aggregated metrics for this process, keyed by (method, endpoint)
+_endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Return True if request instrumentation is enabled."""
+    return bool(getattr(settings, 'INSTRUMENTATION_ENABLED', False))
+
+
+def record_cache_access(hit: bool) -> None:
+    """Record a cache lookup against the current request."""
+    if (metrics := _request_metrics.get()) is None:
+        return
+
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+@contextmanager
+def request_timer():
+    """Record metrics for the duration of a single request.
+
+    Database queries are timed using a query execution wrapper (for each database connection).
+
+    Yields:
+        The RequestMetrics object for the request
+    """
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+
+    def execute_wrapper(execute, sql, params, many, context):
+        t_start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.queries += 1
+            metrics.db_time += time.perf_counter() - t_start
+
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(execute_wrapper))
+
+            yield metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+@contextmanager
+def serializer_timer():
+    """Record the time spent serializing data against the current request.
+
+    Nested serializers are only timed once (at the outermost level).
+    """
+    if (metrics := _request_metrics.get()) is None:
+        yield
+        return
+
+    metrics.serializer_depth += 1
+    t_start = time.perf_counter() if metrics.serializer_depth == 1 else None
+
+    try:
+        yield
+    finally:
+        metrics.serializer_depth -= 1
+
+        if t_start is not None:
+            metrics.serializer_time += time.perf_counter() - t_start
+
+
+def get_endpoint(request) -> str:
+    """Return the endpoint name for the provided request.
+
+    The URL pattern is used (rather than the URL path), so that requests for different objects are grouped together.
+    """
+    if match := getattr(request, 'resolver_match', None):
+        return f'/{match.route}'
+
+    return 'unknown'
+
+
+def record_request(method: str, endpoint: str, latency: float, metrics) -> None:
+    """Add the metrics for a single request to the aggregated metrics."""
+    key = (method, endpoint)
+
+    with _lock:
+        if (data := _endpoints.get(key)) is None:
+            if len(_endpoints) >= MAX_ENDPOINTS:
+                return
+
+            data = _endpoints[key] = EndpointMetrics()
+
+        data.record(latency, metrics)
+
+
+def get_tree_metrics() -> list[dict]:
+    """Return the tree rebuild durations for each tree model.
+
+    The histogram for each model contains the duration of the most recent rebuild of each tree,
+    as recorded in the TreeRebuild table (by the background worker).
+    """
+    from django.db.models import Count, Max, Q, Sum
+
+    from common.models import TreeRebuild
+
+    buckets = {
+        f'bucket_{idx}': Count('pk', filter=Q(duration__lte=bound))
+        for idx, bound in enumerate(TIME_BUCKETS)
+    }
+
+    rows = (
+        TreeRebuild.objects
+        .order_by('model')
+        .values('model')
+        .annotate(
+            count=Count('duration'),
+            sum=Sum('duration'),
+            pending=Count('pk', filter=Q(pending=True)),
+            rebuilt=Max('rebuilt'),
+            **buckets,
+        )
+    )
+
+    results = []
+
+    for row in rows:
+        histogram = {
+            str(bound): row[f'bucket_{idx}'] for idx, bound in enumerate(TIME_BUCKETS)
+        }
+        histogram['+Inf'] = row['count']
+
+        results.append({
+            'model': row['model'],
+            'pending': row['pending'],
+            'rebuilt': row['rebuilt'].isoformat() if row['rebuilt'] else None,
+            'count': row['count'],
+            'sum': row['sum'] or 0.0,
+            'buckets': histogram,
+        })
+
+    return results
+
+
+def get_metrics() -> list[dict]:
+    """Return the aggregated metrics for each endpoint."""
+    with _lock:
+        return [
+            {'method': method, 'endpoint': endpoint, **data.to_dict()}
+            for (method, endpoint), data in sorted(_endpoints.items())
+        ]
+
+
+def reset_metrics() -> None:
+    """Clear all aggregated metrics."""
+    with _lock:
+        _endpoints.clear()
+
+
+def render_prometheus(metrics: list[dict], trees: Optional[list[dict]] = None) -> str:
+    """Render the provided endpoint (and tree rebuild) metrics in the Prometheus text format."""
+    lines = []
+
+    histograms = [
+        ('latency', 'inventree_request_duration_seconds', 'Total request latency'),
+        ('db_time', 'inventree_request_db_seconds', 'Time spent in database queries'),
+        (
+            'serializer_time',
+            'inventree_request_serializer_seconds',
+            'Time spent serializing data',
+        ),
+        ('queries', 'inventree_request_queries', 'Number of database queries'),
+    ]
+
+    for key, name, description in histograms:
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} histogram')
+
+        for entry in metrics:
+            labels = f'method="{entry["method"]}",endpoint="{entry["endpoint"]}"'
+            data = entry[key]
+
+            for bound, count in data['buckets'].items():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+
+            lines.append(f'{name}_sum{{{labels}}} {data["sum"]}')
+            lines.append(f'{name}_count{{{labels}}} {data["count"]}')
+
+    counters = [
+        ('cache_hits', 'inventree_request_cache_hits_total', 'Number of cache hits'),
+        (
+            'cache_misses',
+            'inventree_request_cache_misses_total',
+            'Number of cache misses',
+        ),
+    ]
+
+    for key, name, description in counters:
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} counter')
+
+        for entry in metrics:
+            labels = f'method="{entry["method"]}",endpoint="{entry["endpoint"]}"'
+            lines.append(f'{name}{{{labels}}} {entry[key]}')
+
+    if trees:
+        # Tree rebuild data is a snapshot of the most recent rebuilds (not a cumulative count)
+        gauges = [
+            (
+                'count',
+                'inventree_tree_rebuilt_trees',
+                'Number of trees with a recorded rebuild',
+            ),
+            (
+                'sum',
+                'inventree_tree_rebuild_seconds',
+                'Total duration of the most recent rebuild of each tree',
+            ),
+            (
+                'pending',
+                'inventree_tree_pending_trees',
+                'Number of trees pending rebuild',
+            ),
+        ]
+
+        for key, name, description in gauges:
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} gauge')
+
+            for entry in trees:
+                lines.append(f'{name}{{model="{entry["model"]}"}} {entry[key]}')
+
+    return '\n'.join(lines) + '\n'
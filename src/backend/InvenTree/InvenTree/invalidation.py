@@ -0,0 +1,196 @@
+"""Cross-process invalidation of the in-memory plugin and machine registries.
+
+Each process (web server workers, background workers) holds its own copy of the
+plugin and machine registries. When one process changes the state of a registry,
+all other processes must reload their copy.
+
+Each registry has a shared *generation* counter, which is incremented whenever the
+registry state changes. Each process records the generation it has loaded, so that
+checking whether a reload is required is a local integer comparison:
+
+- If the global (redis) cache is enabled, the counter is incremented atomically in the
+  cache, and the new value is published to all processes (via redis pub/sub). A listener
+  thread in each process records the latest published generation. As a safeguard
+  against missed messages, the shared counter is also re-read periodically.
+- Otherwise, there is no shared channel available. Instead, the registry hash stored in
+  the database is polled, at most once every REGISTRY_POLL_INTERVAL seconds.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+# Interval (seconds) between re-reads of the shared counter, when the listener is running
+LISTENER_POLL_INTERVAL = 60
+
+
+class RegistryGeneration:
+    """Shared generation counter for an in-memory registry.
+
+    Example:
+        generation = RegistryGeneration('plugin')
+
+        if generation.should_check():
+            # Compare the registry hash, and reload if required
+            ...
+            generation.mark_current()
+    """
+
+    def __init__(self, name: str):
+        """Initialize the generation counter.
+
+        Arguments:
+            name: The name of the registry (e.g. 'plugin')
+        """
+        self.name = name
+        self.key = f'registry_generation:{name}'
+
+        # The generation of the registry state loaded by this process
+        self.local: int = 0
+
+        # The latest known shared generation
+        self.remote: int = 0
+
+        # Time of the last poll (of the shared counter or the database)
+        self.last_poll: float = 0.0
+
+        self.listener: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    @property
+    def shared(self) -> bool:
+        """Return True if the shared (redis) channel is available."""
+        return bool(getattr(settings, 'GLOBAL_CACHE_ENABLED', False))
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the interval (seconds) between polls of the shared state."""
+        if self.shared:
+            return LISTENER_POLL_INTERVAL
+
+        return getattr(settings, 'REGISTRY_POLL_INTERVAL', 0)
+
+    def get_connection(self):
+        """Return a connection to the redis server."""
+        from django_redis import get_redis_connection
+
+        return get_redis_connection('default')
+
+    def read(self) -> Optional[int]:
+        """Read the shared generation counter (or None if it is not available)."""
+        if not self.shared:
+            return None
+
+        try:
+            return int(cache.get(self.key) or 0)
+        except Exception:
+            logger.warning("Failed to read registry generation for '%s'", self.name)
+            return None
+
+    def poll(self) -> None:
+        """Update the latest known shared generation."""
+        self.last_poll = time.monotonic()
+
+        if (generation := self.read()) is not None:
+            self.remote = generation
+
+    def bump(self) -> None:
+        """Increment the shared generation counter, and notify all other processes.
+
+        This is called by the process which changed the registry state,
+        so the state held by this process is already current.
+        """
+        if not self.shared:
+            return
+
+        try:
+            cache.add(self.key, 0, timeout=None)
+            generation = cache.incr(self.key)
+        except Exception:
+            logger.warning("Failed to update registry generation for '%s'", self.name)
+            return
+
+        # Only mark this process as current if it has not missed any other changes
+        if self.local == generation - 1:
+            self.local = generation
+
+        self.remote = generation
+
+        try:
+            self.get_connection().publish(self.key, generation)
+        except Exception:
+            logger.warning("Failed to publish registry generation for '%s'", self.name)
+
+        logger.info("Registry generation for '%s' updated: %s", self.name, generation)
+
+    def listen(self) -> None:
+        """Start the listener thread (if it is not already running)."""
+        if self.listener is not None and self.listener.is_alive():
+            return
+
+        with self.lock:
+            if self.listener is not None and self.listener.is_alive():
+                return
+
+            self.listener = threading.Thread(
+                target=self.run_listener,
+                name=f'registry-generation-{self.name}',
+                daemon=True,
+            )
+            self.listener.start()
+
+    def run_listener(self) -> None:
+        """Record each generation published by other processes."""
+        try:
+            pubsub = self.get_connection().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.key)
+
+            for message in pubsub.listen():
+                try:
+                    self.remote = int(message['data'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+        except Exception:
+            # The listener is restarted on the next check
+            logger.warning("Registry generation listener for '%s' stopped", self.name)
+
+    def should_check(self) -> bool:
+        """Determine if the registry state should be checked against the database.
+
+        - With the shared channel, this is True only if another process has changed the registry
+        - Otherwise, this is True once every REGISTRY_POLL_INTERVAL seconds
+        """
+        if not self.shared:
+            if time.monotonic() - self.last_poll < self.poll_interval:
+                return False
+
+            self.last_poll = time.monotonic()
+            return True
+
+        self.listen()
+
+        if time.monotonic() - self.last_poll >= self.poll_interval:
+            self.poll()
+
+        return self.remote != self.local
+
+    def start_load(self) -> Optional[int]:
+        """Return the shared generation, before the registry state is loaded."""
+        self.poll()
+        return self.remote if self.shared else None
+
+    def mark_current(self, generation: Optional[int] = None) -> None:
+        """Mark the registry state held by this process as current.
+
+        Arguments:
+            generation: The generation which was loaded (default = the latest known generation)
+        """
+        self.local = self.remote if generation is None else generation
+        self.last_poll = time.monotonic()
@@ -0,0 +1,178 @@
+"""Custom management command to run the backend benchmark suite.
+
+- A separate test database is created, and populated with a seeded synthetic dataset
+- Timings and query counts for each benchmark are written to a JSON file
+- Results can be compared against a previous (baseline) result file
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+LOCAL_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class Command(BaseCommand):
+    """Run the backend benchmark suite against a generated dataset."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--seed', type=int, default=0, help='Random seed for the dataset'
+        )
+        parser.add_argument(
+            '--scale',
+            type=float,
+            default=1.0,
+            help='Scale factor for the dataset size (1.0 = 100k parts, 1M stock items)',
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=3, help='Number of timed runs per benchmark'
+        )
+        parser.add_argument(
+            '--filter',
+            action='append',
+            default=[],
+            help='Only run benchmarks whose name starts with this value',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default='benchmark.json',
+            help='Output file for the benchmark results',
+        )
+        parser.add_argument(
+            '--baseline',
+            type=str,
+            default='',
+            help='Baseline result file to compare against',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed (fractional) increase in time before a regression is reported',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keep the test database (and the generated dataset) for the next run',
+        )
+        parser.add_argument(
+            '--list', action='store_true', help='List the available benchmarks'
+        )
+
+    def handle(self, *args, **kwargs):
+        """Run the backend benchmark suite."""
+        from InvenTree.benchmark import BENCHMARKS, compare_results
+
+        if kwargs['list']:
+            for name, fn in BENCHMARKS.items():
+                self.stdout.write(f'{name}: {(fn.__doc__ or "").strip()}')
+            return
+
+        baseline = None
+
+        if kwargs['baseline']:
+            try:
+                with open(kwargs['baseline'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as exc:
+                raise CommandError(
+                    f"Invalid baseline file '{kwargs['baseline']}': {exc}"
+                )
+
+        verbosity = kwargs['verbosity']
+        keepdb = kwargs['keepdb']
+
+        setup_test_environment()
+
+        try:
+            # Files generated by the benchmarks are written to a temporary directory,
+            # and a local cache is used (so that a shared cache is not affected)
+            with (
+                tempfile.TemporaryDirectory() as media_root,
+                override_settings(
+                    MEDIA_ROOT=media_root,
+                    CACHES=LOCAL_CACHES,
+                    GLOBAL_CACHE_ENABLED=False,
+                ),
+            ):
+                config = setup_databases(verbosity, interactive=False, keepdb=keepdb)
+
+                try:
+                    results = self.run_benchmarks(**kwargs)
+                finally:
+                    teardown_databases(config, verbosity, keepdb=keepdb)
+        finally:
+            teardown_test_environment()
+
+        output = Path(kwargs['output'])
+
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+        self.stdout.write(f"Benchmark results written to '{output}'")
+
+        if baseline is None:
+            return
+
+        regressions = compare_results(results, baseline, tolerance=kwargs['tolerance'])
+
+        for regression in regressions:
+            self.stdout.write(
+                self.style.ERROR(
+                    f'Regression @ {regression["name"]}: {regression["metric"]} '
+                    f'{regression["baseline"]} -> {regression["current"]}'
+                )
+            )
+
+        if regressions:
+            raise CommandError(f'{len(regressions)} benchmark regressions detected')
+
+        self.stdout.write(self.style.SUCCESS('No benchmark regressions detected'))
+
+    def run_benchmarks(self, **kwargs) -> dict:
+        """Generate (or load) the dataset, and run the benchmarks."""
+        from InvenTree.benchmark import BenchmarkDataset, BenchmarkRunner
+
+        dataset = BenchmarkDataset(
+            seed=kwargs['seed'], scale=kwargs['scale'], progress=self.stdout.write
+        )
+
+        if dataset.load():
+            self.stdout.write('Using existing benchmark dataset')
+        elif dataset.exists():
+            raise CommandError(
+                'The test database contains a different benchmark dataset - run without --keepdb'
+            )
+        else:
+            dataset.generate()
+
+        runner = BenchmarkRunner(
+            dataset, repeat=kwargs['repeat'], progress=self.report_result
+        )
+
+        return runner.run(kwargs['filter'])
+
+    def report_result(self, name: str, result: dict):
+        """Report the result of a single benchmark."""
+        if 'error' in result:
+            self.stdout.write(self.style.ERROR(f'{name}: {result["error"]}'))
+        else:
+            self.stdout.write(
+                f'{name}: {result["time"]:.4f}s ({result["queries"]} queries)'
+            )
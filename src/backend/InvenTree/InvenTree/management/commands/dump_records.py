@@ -0,0 +1,54 @@
+"""Custom management command to export all database records to a JSON Lines file.
+
+- Records are streamed to file one model at a time (see InvenTree.records)
+- Files with a '.gz' suffix are compressed
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Stream all database records to a JSON Lines file."""
+
+    def add_arguments(self, parser):
+        """Add custom arguments for this command."""
+        parser.add_argument(
+            'filename', type=str, help='Output filename (.jsonl or .jsonl.gz)'
+        )
+        parser.add_argument(
+            '-e',
+            '--exclude',
+            action='append',
+            default=[],
+            help='App label or model label (app_label.ModelName) to exclude',
+        )
+        parser.add_argument(
+            '--include-permissions',
+            action='store_true',
+            default=False,
+            help='Include user and group permissions',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Stream all database records to a JSON Lines file."""
+        from InvenTree.records import RecordExporter, get_export_metadata, open_stream
+
+        filename = kwargs['filename']
+
+        logger.info("Exporting database records to '%s'", filename)
+
+        exporter = RecordExporter(
+            excludes=kwargs['exclude'],
+            include_permissions=kwargs['include_permissions'],
+        )
+
+        with open_stream(filename, 'wb') as stream:
+            count = exporter.export(stream, metadata=get_export_metadata())
+
+        self.stdout.write(
+            f"Exported {count} records ({len(exporter.counts)} models) to '{filename}'"
+        )
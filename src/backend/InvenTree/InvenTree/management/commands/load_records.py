@@ -0,0 +1,79 @@
+"""Custom management command to import database records from a JSON Lines file.
+
+- Records are streamed from file one model at a time (see InvenTree.records)
+- Progress is recorded in a '<filename>.progress' file, so an interrupted import can be resumed
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Stream database records from a JSON Lines file."""
+
+    def add_arguments(self, parser):
+        """Add custom arguments for this command."""
+        parser.add_argument(
+            'filename', type=str, help='Input filename (.jsonl or .jsonl.gz)'
+        )
+        parser.add_argument(
+            '--app',
+            action='append',
+            default=[],
+            help='Only load records for the specified app label',
+        )
+        parser.add_argument(
+            '-e',
+            '--exclude',
+            action='append',
+            default=[],
+            help='App label or model label (app_label.ModelName) to exclude',
+        )
+        parser.add_argument(
+            '-i',
+            '--ignorenonexistent',
+            action='store_true',
+            default=False,
+            help='Ignore models and fields which do not exist',
+        )
+        parser.add_argument(
+            '--phase',
+            type=str,
+            default='default',
+            help='Name under which the import progress is recorded',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            default=False,
+            help='Resume from the recorded progress of an interrupted import',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Stream database records from a JSON Lines file."""
+        from InvenTree.records import RecordImporter, open_stream
+
+        filename = kwargs['filename']
+
+        logger.info("Importing database records from '%s'", filename)
+
+        importer = RecordImporter(
+            apps=kwargs['app'],
+            excludes=kwargs['exclude'],
+            ignore_nonexistent=kwargs['ignorenonexistent'],
+            phase=kwargs['phase'],
+            progress_file=Path(f'{filename}.progress'),
+            resume=kwargs['resume'],
+        )
+
+        with open_stream(filename, 'rb') as stream:
+            count = importer.load(stream)
+
+        self.stdout.write(
+            f"Imported {count} records ({len(importer.counts)} models) from '{filename}'"
+        )
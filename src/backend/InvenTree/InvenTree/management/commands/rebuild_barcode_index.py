@@ -0,0 +1,25 @@
+"""Custom management command to rebuild the barcode index.
+
+- Removes all existing barcode index entries
+- Creates a new index entry for each object with an assigned third-party barcode
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the barcode index for all barcode-enabled models."""
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the barcode index for all barcode-enabled models."""
+        from common.models import BarcodeIndex
+
+        logger.info('Rebuilding barcode index')
+
+        count = BarcodeIndex.rebuild()
+
+        self.stdout.write(f'Barcode index rebuilt - {count} entries')
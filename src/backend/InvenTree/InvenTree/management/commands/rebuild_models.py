@@ -28,8 +28,12 @@ class Command(BaseCommand):
             logger.info('Rebuilding Part objects')
 
             from part.models import Part
+            from stock.models import SerialNumberIndex
 
             Part.objects.rebuild()
+
+            # Part tree IDs may have changed
+            SerialNumberIndex.invalidate()
         except Exception:
             logger.info('Error rebuilding Part objects')
 
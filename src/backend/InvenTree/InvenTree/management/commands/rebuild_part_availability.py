@@ -0,0 +1,55 @@
+"""Custom management command to rebuild cached part availability data.
+
+- Recalculates stock availability and "can build" quantities for all parts
+- With the --check option, reports any cached data which is inconsistent (no changes are made)
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild cached availability data for parts."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Check the cached data for consistency, without making any changes',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Rebuild cached availability data for parts."""
+        from part.availability import rebuild_availability
+
+        check = kwargs.get('check')
+
+        self.last_percent = -1
+
+        logger.info('Rebuilding part availability data')
+
+        mismatches = rebuild_availability(check=check, progress=self.report_progress)
+
+        for pk, fields in mismatches.items():
+            self.stdout.write(f'Part {pk}: {", ".join(fields)}')
+
+        if check:
+            self.stdout.write(
+                f'Availability check complete - {len(mismatches)} parts inconsistent'
+            )
+        else:
+            self.stdout.write(
+                f'Availability data rebuilt - {len(mismatches)} parts corrected'
+            )
+
+    def report_progress(self, completed: int, total: int):
+        """Report calculation progress (at 1% intervals)."""
+        percent = int(100 * completed / total) if total else 100
+
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.stdout.write(f'Progress: {completed} / {total} ({percent}%)')
@@ -0,0 +1,58 @@
+"""Custom management command to recalculate cached part pricing data.
+
+- Pricing for each affected part is calculated exactly once, in BOM dependency order
+- May be required after importing a new dataset, or changing the default currency
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Recalculate cached pricing data for parts."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            'parts',
+            nargs='*',
+            type=int,
+            help='IDs of the parts to recalculate (default = all parts)',
+        )
+
+        parser.add_argument(
+            '--no-cascade',
+            action='store_true',
+            help='Do not update pricing for assemblies and templates which use the specified parts',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Recalculate cached pricing data for parts."""
+        from part.models import Part
+        from part.pricing import PricingEngine
+
+        part_ids = kwargs.get('parts') or list(
+            Part.objects.values_list('pk', flat=True)
+        )
+
+        self.last_percent = -1
+
+        engine = PricingEngine(progress=self.report_progress)
+        engine.add_parts(part_ids)
+
+        logger.info('Recalculating pricing for %s parts', len(part_ids))
+
+        changed = engine.run(cascade=not kwargs.get('no_cascade'))
+
+        self.stdout.write(f'Pricing updated - {len(changed)} parts changed')
+
+    def report_progress(self, completed: int, total: int):
+        """Report calculation progress (at 1% intervals)."""
+        percent = int(100 * completed / total) if total else 100
+
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.stdout.write(f'Progress: {completed} / {total} ({percent}%)')
@@ -0,0 +1,41 @@
+"""Custom management command to rebuild the search index.
+
+- Recreates the search document for each searchable object
+- Removes any search documents for objects which no longer exist
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the search index for the global search API."""
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the search index for the global search API."""
+        from common.search import rebuild_search_index, search_index_enabled
+
+        if not search_index_enabled():
+            self.stdout.write(
+                'Search index is disabled - enable the INVENTREE_SEARCH_INDEX setting first'
+            )
+            return
+
+        self.last_percent = -1
+
+        logger.info('Rebuilding search index')
+
+        count = rebuild_search_index(progress=self.report_progress)
+
+        self.stdout.write(f'Search index rebuilt - {count} documents')
+
+    def report_progress(self, completed: int, total: int):
+        """Report indexing progress (at 1% intervals)."""
+        percent = int(100 * completed / total) if total else 100
+
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.stdout.write(f'Progress: {completed} / {total} ({percent}%)')
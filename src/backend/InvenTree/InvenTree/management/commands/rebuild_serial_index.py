@@ -0,0 +1,25 @@
+"""Custom management command to rebuild the serial number index.
+
+- Removes all existing serial number index entries
+- Recalculates the latest serial number for each part tree (and the global scope)
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the serial number index from existing stock items."""
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the serial number index from existing stock items."""
+        from stock.models import SerialNumberIndex
+
+        logger.info('Rebuilding serial number index')
+
+        count = SerialNumberIndex.rebuild()
+
+        self.stdout.write(f'Serial number index rebuilt - {count} entries')
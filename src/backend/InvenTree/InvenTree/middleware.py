@@ -1,6 +1,8 @@
 """Middleware for InvenTree."""
 
+import random
 import sys
+import time
 from typing import Optional
 from urllib.parse import urlsplit
 
@@ -17,6 +19,7 @@ import structlog
 from error_report.middleware import ExceptionProcessor
 
 import InvenTree.helpers
+import InvenTree.instrumentation
 from common.settings import get_global_setting
 from InvenTree.cache import create_session_cache, delete_session_cache
 from InvenTree.config import CONFIG_LOOKUPS, inventreeInstaller
@@ -344,6 +347,44 @@ class InvenTreeRequestCacheMiddleware(MiddlewareMixin):
         return response
 
 
+class InvenTreeInstrumentationMiddleware:
+    """Middleware to record performance metrics for each request.
+
+    Only active if request instrumentation is enabled (INVENTREE_INSTRUMENTATION).
+    A fraction of requests can be sampled (INVENTREE_INSTRUMENTATION_SAMPLE_RATE),
+    to further reduce the overhead of recording metrics.
+    """
+
+    def __init__(self, get_response):
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Record metrics for the provided request (if enabled and sampled)."""
+        # Checked for each request, as instrumentation can be toggled at runtime
+        if not InvenTree.instrumentation.is_enabled():
+            return self.get_response(request)
+
+        sample_rate = float(getattr(settings, 'INSTRUMENTATION_SAMPLE_RATE', 1))
+
+        if sample_rate < 1 and random.random() >= sample_rate:
+            return self.get_response(request)
+
+        t_start = time.perf_counter()
+
+        with InvenTree.instrumentation.request_timer() as metrics:
+            response = self.get_response(request)
+
+        InvenTree.instrumentation.record_request(
+            request.method,
+            InvenTree.instrumentation.get_endpoint(request),
+            time.perf_counter() - t_start,
+            metrics,
+        )
+
+        return response
+
+
 class InvenTreeHostSettingsMiddleware(MiddlewareMixin):
     """Middleware to check the host settings.
 
@@ -1,7 +1,9 @@
 """Generic models which provide extra functionality over base Django model types."""
 
+from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime
+from itertools import batched
 from string import Formatter
 from typing import Any, Optional
 
@@ -34,6 +36,7 @@ import InvenTree.format
 import InvenTree.helpers
 import InvenTree.helpers_model
 import InvenTree.sentry
+import InvenTree.trees
 import report.mixins
 
 logger = structlog.get_logger('inventree')
@@ -771,6 +774,9 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
         delete_children = kwargs.pop('delete_children', False)
         delete_items = kwargs.pop('delete_items', False)
 
+        # The tree structure must be valid before any nodes are removed
+        InvenTree.trees.rebuild_deferred_trees(self.__class__)
+
         # Ensure that we have the latest version of the database object
         try:
             self.refresh_from_db()
@@ -907,6 +913,9 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
 
         parent = getattr(self, self.NODE_PARENT_KEY, None)
 
+        # MPTT updates may be suspended (see InvenTree.trees.deferred_tree_updates)
+        deferred = InvenTree.trees.is_deferred(self.__class__)
+
         if not self.tree_id:
             if parent:
                 # If we have a parent, use the parent's tree_id
@@ -922,8 +931,17 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
             except self.__class__.DoesNotExist:
                 # If the instance does not exist, we cannot get the db instance
                 db_instance = None
+
+        if deferred:
+            self.prepare_deferred_save(db_instance, parent)
+
         try:
-            super().save(*args, **kwargs)
+            if deferred:
+                # Skip the MPTT updates for this save only - the affected trees
+                # are rebuilt when the deferred_tree_updates context exits
+                super(MPTTModel, self).save(*args, **kwargs)
+            else:
+                super().save(*args, **kwargs)
         except InvalidMove:
             # Provide better error for parent selection
             raise ValidationError({self.NODE_PARENT_KEY: _('Invalid choice')})
@@ -943,12 +961,16 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
             # New instance, so we need to rebuild the tree (if it has a parent)
             trees.add(self.tree_id)
 
+        if deferred and parent and trees:
+            # The node is moved into the parent tree when the trees are rebuilt
+            trees.add(parent.tree_id)
+
         # Flag to indicate that a tree rebuild task was triggered by this save
         self._tree_rebuild_offloaded = False
 
         if len(trees) > 0:
-            # Offload the tree rebuild(s) to the background worker.
-            # Note that repeated calls are de-duplicated (per tree),
+            # Mark the tree(s) for rebuild by the background worker.
+            # Note that pending rebuilds are coalesced (per tree),
             # so a bulk operation results in a single rebuild per affected tree.
             ran_sync = self.__class__.offload_tree_rebuild(trees)
             self._tree_rebuild_offloaded = True
@@ -965,50 +987,197 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
                     InvenTree.sentry.report_exception(e)
                     InvenTree.exceptions.log_error(f'{self.__class__.__name__}.save')
 
+    def prepare_deferred_save(self, db_instance, parent) -> None:
+        """Prepare this node to be saved while MPTT updates are suspended.
+
+        - Placeholder MPTT values are provided for a new node
+        - A node which is moved to the top level is assigned a new tree_id
+        - Recursive tree structures are prevented (by walking the parent chain)
+
+        The MPTT fields are corrected when the affected trees are rebuilt.
+        """
+        if self.lft is None:
+            self.lft = 1
+            self.rght = 2
+            self.level = parent.level + 1 if parent else 0
+
+        if db_instance is None:
+            return
+
+        if getattr(db_instance, self.NODE_PARENT_KEY) == parent:
+            return
+
+        if parent is None:
+            self.tree_id = self.getNextTreeID()
+            self.level = 0
+        else:
+            self.check_recursion(parent)
+
+    def check_recursion(self, parent) -> None:
+        """Ensure that the provided parent node is not this node (or one of its descendants).
+
+        The parent chain is walked directly, as the MPTT fields may not be valid.
+        """
+        parent_field = self._meta.get_field(self.NODE_PARENT_KEY).attname
+
+        node = parent.pk
+        visited = set()
+
+        while node is not None and node not in visited:
+            if node == self.pk:
+                raise ValidationError({self.NODE_PARENT_KEY: _('Invalid choice')})
+
+            visited.add(node)
+
+            node = (
+                self.__class__.objects
+                .filter(pk=node)
+                .values_list(parent_field, flat=True)
+                .first()
+            )
+
     @classmethod
     def offload_tree_rebuild(cls, tree_ids) -> bool:
-        """Offload a rebuild of the specified trees to the background worker.
+        """Mark the specified trees for rebuild by the background worker.
 
         - The tree structure (and pathstring values, where applicable) are rebuilt for each tree
         - If the background worker is not running, the rebuild is performed synchronously
-        - Identical pending tasks are skipped, so repeated calls (e.g. during a bulk
-          operation) result in (at most) a single queued rebuild per affected tree
+        - Pending rebuilds are coalesced, so repeated calls (e.g. during a bulk
+          operation) result in (at most) a single rebuild per affected tree
+
+        See InvenTree.trees for further information.
 
         Returns:
             bool: True if any rebuild was performed synchronously (in the calling thread)
         """
-        from InvenTree.tasks import offload_task
-
-        ran_sync = False
-
-        for tree_id in tree_ids:
-            if tree_id:
-                result = offload_task(
-                    'InvenTree.tasks.rebuild_model_tree', cls._meta.label_lower, tree_id
-                )
-
-                if result is True:
-                    # offload_task returns True if the task ran synchronously
-                    ran_sync = True
-
-        return ran_sync
+        return InvenTree.trees.mark_trees(cls, tree_ids)
 
     @classmethod
-    def rebuild_trees(cls, tree_ids) -> None:
+    def rebuild_trees(cls, tree_ids) -> set[int]:
         """Rebuild the specified trees, with fallback to a full rebuild.
 
-        - Perform a partial rebuild for each provided tree_id
-        - If any partial rebuild fails, rebuild the entire tree (expensive!!!)
+        - Repair each provided tree (see repair_tree)
+        - Perform a partial rebuild for each affected tree
+        - If any partial rebuild still fails, rebuild the entire tree (expensive!!!)
+
+        Returns:
+            The IDs of all trees which were rebuilt
         """
-        result = True
+        trees = set()
 
         for tree_id in tree_ids:
-            if tree_id and not cls.partial_rebuild(tree_id):
+            if tree_id:
+                trees |= cls.repair_tree(tree_id)
+
+        result = True
+
+        for tree_id in sorted(trees):
+            if not cls.partial_rebuild(tree_id):
                 result = False
 
         if not result:
             # Rebuild the entire tree (expensive!!!)
             cls.objects.rebuild()
+            cls.after_tree_ids_changed()
+
+        return trees
+
+    @classmethod
+    def repair_tree(cls, tree_id: int) -> set[int]:
+        """Ensure that each node with the specified tree_id belongs to the correct tree.
+
+        A partial rebuild fails if a tree contains multiple root nodes. Instead of
+        rebuilding the entire table, the affected nodes are assigned to the correct tree:
+
+        - Nodes (and their descendants) whose parent is in a different tree are moved to that tree
+        - Additional root nodes (and their descendants) are each assigned a new tree_id
+
+        Returns:
+            The IDs of the trees which must be rebuilt (empty if the tree no longer exists)
+        """
+        parent_field = cls._meta.get_field(cls.NODE_PARENT_KEY).attname
+
+        nodes = dict(
+            cls.objects.filter(tree_id=tree_id).values_list('pk', parent_field)
+        )
+
+        if not nodes:
+            return set()
+
+        children = defaultdict(list)
+
+        for pk, parent in nodes.items():
+            children[parent].append(pk)
+
+        def subtree(pk: int) -> list[int]:
+            """Return the IDs of the provided node and its descendants (within this tree)."""
+            result, stack = [], [pk]
+
+            while stack:
+                node = stack.pop()
+                result.append(node)
+                stack.extend(children[node])
+
+            return result
+
+        moves = {}
+
+        # Nodes whose parent has been moved to a different tree
+        foreign = {
+            pk: parent
+            for pk, parent in nodes.items()
+            if parent is not None and parent not in nodes
+        }
+
+        if foreign:
+            parent_trees = dict(
+                cls.objects.filter(pk__in=set(foreign.values())).values_list(
+                    'pk', 'tree_id'
+                )
+            )
+
+            for pk, parent in foreign.items():
+                if parent in parent_trees:
+                    moves[pk] = parent_trees[parent]
+
+        # The first root node (in insertion order) retains the tree_id
+        roots = list(
+            cls.objects
+            .filter(pk__in=children[None])
+            .order_by(*cls._mptt_meta.order_insertion_by, 'pk')
+            .values_list('pk', flat=True)
+        )
+
+        if len(roots) > 1:
+            next_tree_id = cls.getNextTreeID()
+
+            for root in roots[1:]:
+                moves[root] = next_tree_id
+                next_tree_id += 1
+
+        trees = {tree_id}
+
+        for pk, target in moves.items():
+            for chunk in batched(subtree(pk), 1000):
+                cls.objects.filter(pk__in=chunk).update(tree_id=target)
+
+            trees.add(target)
+
+        if moves:
+            logger.info(
+                'Repaired tree <%s> for %s (%s subtrees moved)',
+                tree_id,
+                cls.__name__,
+                len(moves),
+            )
+
+            cls.after_tree_ids_changed()
+
+        return trees
+
+    @classmethod
+    def after_tree_ids_changed(cls) -> None:
+        """Called after the tree_id values of existing nodes are changed by a rebuild or repair."""
 
     @classmethod
     def partial_rebuild(cls, tree_id: int) -> bool:
@@ -1128,6 +1297,12 @@ class PathStringMixin(models.Model):
         # Rebuild upper first, to ensure the lower nodes are updated correctly
         super().save(*args, **kwargs)
 
+        if InvenTree.trees.is_deferred(self.__class__):
+            # MPTT updates are suspended - the tree path is not yet valid,
+            # so pathstring values are updated when the tree is rebuilt
+            self.__class__.offload_tree_rebuild([self.tree_id])
+            return
+
         # Determine if a tree rebuild task was already triggered by this save
         # (e.g. if the node was re-parented) - if so, the pathstring values
         # for any lower nodes are updated by that task
@@ -1399,6 +1574,10 @@ class InvenTreeBarcodeMixin(models.Model):
     - barcode_hash : A 'hash' of the assigned barcode data used to improve matching
 
     The barcode_model_type_code() classmethod must be implemented in the model class.
+
+    Assigned barcodes are recorded in the common.BarcodeIndex table,
+    which is updated whenever the barcode_hash field changes.
+    Index entries for deleted objects are discarded when they are next looked up.
     """
 
     class Meta:
@@ -1409,6 +1588,13 @@ class InvenTreeBarcodeMixin(models.Model):
 
         abstract = True
 
+    def __init__(self, *args, **kwargs):
+        """Record the initial barcode hash, to detect changes on save."""
+        super().__init__(*args, **kwargs)
+
+        # Read from __dict__ to avoid loading a deferred field
+        self._barcode_hash_initial = self.__dict__.get('barcode_hash')
+
     barcode_data = models.CharField(
         blank=True,
         max_length=500,
@@ -1532,6 +1718,31 @@ class InvenTreeBarcodeMixin(models.Model):
         self.save()
 
 
+@receiver(post_save, dispatch_uid='barcode_index_post_save')
+def after_save_barcode(sender, instance, created: bool, raw: bool = False, **kwargs):
+    """Update the barcode index when a barcode is assigned to (or removed from) an object."""
+    if not isinstance(instance, InvenTreeBarcodeMixin):
+        return
+
+    # Ignore saves where the barcode hash was not loaded (e.g. update_fields / deferred)
+    if 'barcode_hash' not in instance.__dict__:
+        return
+
+    barcode_hash = instance.barcode_hash
+
+    if created or raw:
+        changed = bool(barcode_hash)
+    else:
+        changed = barcode_hash != instance._barcode_hash_initial
+
+    if changed:
+        from common.models import BarcodeIndex
+
+        BarcodeIndex.update_instance(instance)
+
+    instance._barcode_hash_initial = barcode_hash
+
+
 def notify_staff_users_of_error(instance, label: str, context: dict):
     """Helper function to notify staff users of an error."""
     import common.models
@@ -0,0 +1,613 @@
+"""Streaming export and import of database records.
+
+The export_records and import_records tasks previously used the 'dumpdata' and
+'loaddata' commands, and post-processed the entire data file in memory. For a large
+database, the complete dataset was held in memory (several times over).
+
+Instead, records can be streamed to (and from) a JSON Lines file:
+
+- The first line contains the export metadata (including the exported models, in order)
+- Each subsequent line contains a single serialized object, in the 'dumpdata' format
+- Records are exported one model at a time, in chunks, and filtered as they are written
+- Records are imported with bulk inserts, and constraint checks are deferred until each
+  group of inter-dependent models has been loaded
+- Progress is recorded as each group of models is committed, so that an interrupted
+  import can be resumed
+
+Files with a '.gz' suffix are compressed (and decompressed) on the fly.
+"""
+
+import datetime
+import gzip
+import json
+from itertools import batched, groupby
+from pathlib import Path
+from typing import Optional
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.models.constants import OnConflict
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+# Number of records serialized (or inserted) at once
+CHUNK_SIZE = 1000
+
+# Settings models for which temporary settings (key starting with '_') are not exported
+SETTINGS_MODELS = ['common.inventreesetting', 'common.inventreeusersetting']
+
+# Fields which contain the permissions assigned to a group or user
+PERMISSION_FIELDS = {'auth.group': 'permissions', 'auth.user': 'user_permissions'}
+
+
+def is_stream_file(filename) -> bool:
+    """Return True if the provided filename is a (streamed) JSON Lines data file."""
+    return str(filename).lower().endswith(('.jsonl', '.jsonl.gz'))
+
+
+def open_stream(filename, mode: str = 'rb'):
+    """Open a data file in binary mode (compressed if the filename ends with '.gz')."""
+    if str(filename).lower().endswith('.gz'):
+        return gzip.open(filename, mode)
+
+    return open(filename, mode)
+
+
+def get_export_metadata() -> dict:
+    """Return the metadata which is written to the start of an export file."""
+    from InvenTree.version import (
+        inventreeApiVersion,
+        inventreeCommitHash,
+        inventreeDjangoVersion,
+        inventreePythonVersion,
+        inventreeVersion,
+    )
+
+    return {
+        'metadata': True,
+        'comment': 'This file contains a dump of the InvenTree database',
+        'exported_at': datetime.datetime.now().isoformat(),
+        'exported_at_utc': datetime.datetime
+        .now(datetime.timezone.utc)
+        .replace(tzinfo=None)
+        .isoformat(),
+        'source_version': inventreeVersion(),
+        'api_version': inventreeApiVersion(),
+        'django_version': inventreeDjangoVersion(),
+        'python_version': inventreePythonVersion(),
+        'source_commit': inventreeCommitHash(),
+        'installed_apps': sorted(app.name for app in apps.get_app_configs()),
+    }
+
+
+def matches_label(label: str, names: set[str]) -> bool:
+    """Determine if a model label (e.g. 'part.part') matches any of the provided app or model labels."""
+    return label in names or label.split('.')[0] in names
+
+
+class RecordExporter:
+    """Stream all database records to a JSON Lines file.
+
+    Example:
+        exporter = RecordExporter(excludes=['contenttypes'])
+
+        with open_stream('data.jsonl.gz', 'wb') as stream:
+            exporter.export(stream)
+    """
+
+    def __init__(
+        self,
+        excludes: Optional[list[str]] = None,
+        include_permissions: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        using: str = DEFAULT_DB_ALIAS,
+    ):
+        """Initialize the exporter.
+
+        Arguments:
+            excludes: App labels or model labels (e.g. 'auth.permission') to exclude
+            include_permissions: If True, export user and group permissions
+            chunk_size: Number of records to serialize at once
+            using: The database alias to export from
+        """
+        self.excludes = {label.lower() for label in excludes or []}
+        self.include_permissions = include_permissions
+        self.chunk_size = chunk_size
+        self.using = using
+
+        # Number of records exported for each model
+        self.counts: dict[str, int] = {}
+
+    def get_models(self) -> list:
+        """Return the models to export, sorted so that dependencies are exported first (as per dumpdata)."""
+        app_list = {}
+
+        for app_config in apps.get_app_configs():
+            if app_config.models_module is None:
+                continue
+
+            models = [
+                model
+                for model in app_config.get_models()
+                if not model._meta.proxy
+                and router.allow_migrate_model(self.using, model)
+                and not matches_label(model._meta.label_lower, self.excludes)
+            ]
+
+            if models:
+                app_list[app_config] = models
+
+        return serializers.sort_dependencies(app_list.items(), allow_cycles=True)
+
+    def get_queryset(self, model):
+        """Return the (ordered) queryset of records for a model, with related objects preloaded."""
+        opts = model._meta
+
+        queryset = model._default_manager.using(self.using).order_by(opts.pk.name)
+
+        # Related objects which are serialized via a natural key
+        related = [
+            field.name
+            for field in opts.concrete_fields
+            if field.is_relation and hasattr(field.related_model, 'natural_key')
+        ]
+
+        if related:
+            queryset = queryset.select_related(*related)
+
+        # Many-to-many fields are serialized along with the model
+        m2m = [
+            field.name
+            for field in opts.many_to_many
+            if field.serialize and field.remote_field.through._meta.auto_created
+        ]
+
+        if m2m:
+            queryset = queryset.prefetch_related(*m2m)
+
+        # Temporary settings are not exported
+        if opts.label_lower in SETTINGS_MODELS:
+            queryset = queryset.exclude(key__startswith='_')
+
+        return queryset
+
+    def filter_record(self, record: dict) -> dict:
+        """Filter a serialized record before it is written to file."""
+        if not self.include_permissions and record['model'] in PERMISSION_FIELDS:
+            record['fields'][PERMISSION_FIELDS[record['model']]] = []
+
+        return record
+
+    def write(self, stream, data: dict) -> None:
+        """Write a single line to the output stream."""
+        stream.write(json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8') + b'\n')
+
+    def export(self, stream, metadata: Optional[dict] = None) -> int:
+        """Export all records to the provided (binary) stream.
+
+        Arguments:
+            stream: The output stream
+            metadata: Metadata to write to the start of the file
+
+        Returns:
+            The total number of records exported
+        """
+        models = self.get_models()
+
+        self.write(
+            stream,
+            {
+                **(metadata or {}),
+                'metadata': True,
+                'format': 'jsonl',
+                'models': [model._meta.label_lower for model in models],
+            },
+        )
+
+        total = 0
+
+        for model in models:
+            label = model._meta.label_lower
+            count = 0
+
+            records = self.get_queryset(model).iterator(chunk_size=self.chunk_size)
+
+            for chunk in batched(records, self.chunk_size):
+                for record in serializers.serialize(
+                    'python', chunk, use_natural_foreign_keys=True
+                ):
+                    self.write(stream, self.filter_record(record))
+                    count += 1
+
+            self.counts[label] = count
+            total += count
+
+            logger.debug('Exported %s records for model %s', count, label)
+
+        return total
+
+
+class RecordImporter:
+    """Stream records from a JSON Lines file into the database.
+
+    Records are loaded one model at a time, in the order in which they were exported.
+    Each group of models is loaded in a single transaction, with constraint checks
+    deferred until the group is complete. A group is committed as soon as none of the
+    loaded models reference a model which is yet to be loaded.
+
+    Example:
+        importer = RecordImporter(apps=['common'], progress_file=Path('data.jsonl.progress'))
+
+        with open_stream('data.jsonl') as stream:
+            importer.load(stream)
+    """
+
+    def __init__(
+        self,
+        apps: Optional[list[str]] = None,
+        excludes: Optional[list[str]] = None,
+        ignore_nonexistent: bool = False,
+        phase: str = 'default',
+        progress_file: Optional[Path] = None,
+        resume: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        using: str = DEFAULT_DB_ALIAS,
+    ):
+        """Initialize the importer.
+
+        Arguments:
+            apps: Only load records for these apps (default = all apps)
+            excludes: App labels or model labels (e.g. 'auth.permission') to exclude
+            ignore_nonexistent: If True, ignore models and fields which do not exist
+            phase: The name under which import progress is recorded
+            progress_file: File in which import progress is recorded (optional)
+            resume: If True, resume from the progress recorded for this phase
+            chunk_size: Number of records to insert at once
+            using: The database alias to import into
+        """
+        self.apps = {label.lower() for label in apps or []}
+        self.excludes = {label.lower() for label in excludes or []}
+        self.ignore_nonexistent = ignore_nonexistent
+        self.phase = phase
+        self.progress_file = Path(progress_file) if progress_file else None
+        self.resume = resume
+        self.chunk_size = chunk_size
+        self.using = using
+
+        self.connection = connections[using]
+
+        self.metadata: dict = {}
+
+        # Position (in the input stream) of the next record to load
+        self.position: int = 0
+
+        # Exported models (which will be loaded), in file order
+        self.order: dict[str, int] = {}
+
+        # Deserialized objects with unresolved (forward) references
+        self.deferred: list = []
+
+        # Number of records loaded for each model
+        self.counts: dict[str, int] = {}
+
+    def should_load(self, label: str) -> bool:
+        """Determine if records for the specified model should be loaded."""
+        if self.apps and label.split('.')[0] not in self.apps:
+            return False
+
+        return not matches_label(label, self.excludes)
+
+    def read_metadata(self, stream) -> dict:
+        """Read the metadata from the start of the input stream."""
+        stream.seek(0)
+
+        try:
+            data = json.loads(stream.readline() or '{}')
+        except json.JSONDecodeError:
+            return {}
+
+        return data if isinstance(data, dict) and data.get('metadata') else {}
+
+    def read_records(self, stream, offset: int):
+        """Yield each record in the input stream, starting at the provided offset."""
+        stream.seek(offset)
+
+        while True:
+            start = stream.tell()
+            line = stream.readline()
+
+            if not line:
+                break
+
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+
+            if record.get('metadata', False):
+                continue
+
+            self.position = start
+
+            yield record
+
+        self.position = stream.tell()
+
+    def read_checkpoint(self) -> dict:
+        """Read the recorded progress for all import phases."""
+        if not self.progress_file or not self.progress_file.exists():
+            return {}
+
+        try:
+            return json.loads(self.progress_file.read_text())
+        except (json.JSONDecodeError, OSError):
+            logger.warning(
+                "Failed to read import progress from '%s'", self.progress_file
+            )
+            return {}
+
+    def save_checkpoint(self, complete: bool = False) -> None:
+        """Record the import progress for this phase (after a group has been committed)."""
+        if not self.progress_file:
+            return
+
+        progress = self.read_checkpoint()
+        progress[self.phase] = {'offset': self.position, 'complete': complete}
+
+        tmp = self.progress_file.with_name(self.progress_file.name + '.tmp')
+        tmp.write_text(json.dumps(progress))
+        tmp.replace(self.progress_file)
+
+    def get_model(self, label: Optional[str]):
+        """Return the model class for a label (or None if the records should be skipped)."""
+        if not label:
+            logger.warning('Invalid entry in data file - missing "model" key')
+            return None
+
+        if not self.should_load(label):
+            return None
+
+        try:
+            return apps.get_model(label)
+        except (LookupError, ValueError):
+            if self.ignore_nonexistent:
+                return None
+
+            raise
+
+    def forward_dependencies(self, model) -> set[str]:
+        """Return the models referenced by a model which are yet to be loaded from the file."""
+        opts = model._meta
+        label = opts.label_lower
+
+        related = {
+            field.related_model
+            for field in [*opts.concrete_fields, *opts.many_to_many]
+            if field.is_relation and field.related_model
+        }
+
+        return {
+            other._meta.label_lower
+            for other in related
+            if self.order.get(other._meta.label_lower, -1) > self.order.get(label, -1)
+        }
+
+    def filter_record(self, record: dict) -> dict:
+        """Filter a record before it is loaded (user and group permissions are not imported)."""
+        if record['model'] in PERMISSION_FIELDS:
+            record['fields'][PERMISSION_FIELDS[record['model']]] = []
+
+        return record
+
+    def conflict_options(self, model, fields: list) -> dict:
+        """Return the insert options, so that existing records are updated (as per loaddata)."""
+        features = self.connection.features
+
+        update_fields = [field for field in fields if not field.primary_key]
+
+        if update_fields and features.supports_update_conflicts:
+            return {
+                'on_conflict': OnConflict.UPDATE,
+                'update_fields': update_fields,
+                'unique_fields': [model._meta.pk]
+                if features.supports_update_conflicts_with_target
+                else [],
+            }
+
+        if features.supports_ignore_conflicts:
+            return {'on_conflict': OnConflict.IGNORE}
+
+        return {}
+
+    def insert(self, model, objects: list) -> None:
+        """Insert a chunk of deserialized objects for a single model."""
+        opts = model._meta
+
+        if opts.parents or any(obj.object.pk is None for obj in objects):
+            # Multi-table inherited models (and objects without a primary key) are saved individually
+            for obj in objects:
+                obj.save(using=self.using)
+
+            return
+
+        fields = [field for field in opts.local_concrete_fields if not field.generated]
+        instances = [obj.object for obj in objects]
+        options = self.conflict_options(model, fields)
+
+        queryset = model._base_manager.using(self.using)
+        batch_size = max(self.connection.ops.bulk_batch_size(fields, instances), 1)
+
+        # Records are inserted in 'raw' mode (as per Model.save_base(raw=True) in loaddata),
+        # so that stored values (e.g. auto_now timestamps) are not modified
+        for batch in batched(instances, batch_size):
+            queryset._insert(batch, fields=fields, raw=True, **options)
+
+        self.insert_m2m(model, objects)
+
+    def insert_m2m(self, model, objects: list) -> None:
+        """Insert the many-to-many relationships for a chunk of deserialized objects."""
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+
+            # Explicit 'through' models are exported separately
+            if not through._meta.auto_created:
+                continue
+
+            pks = [obj.object.pk for obj in objects if field.name in obj.m2m_data]
+
+            if not pks:
+                continue
+
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+            manager = through._base_manager.using(self.using)
+
+            # Replace any existing relationships (as per loaddata)
+            manager.filter(**{f'{source}__in': pks}).delete()
+
+            manager.bulk_create(
+                [
+                    through(**{source: obj.object.pk, target: value})
+                    for obj in objects
+                    for value in obj.m2m_data.get(field.name, [])
+                ],
+                batch_size=self.chunk_size,
+            )
+
+    def load_model(self, model, records) -> int:
+        """Load all records (for a single model) from the provided iterator."""
+        count = 0
+
+        for chunk in batched(records, self.chunk_size):
+            objects = list(
+                serializers.deserialize(
+                    'python',
+                    [self.filter_record(record) for record in chunk],
+                    using=self.using,
+                    ignorenonexistent=self.ignore_nonexistent,
+                    handle_forward_references=True,
+                )
+            )
+
+            self.insert(model, objects)
+            self.deferred.extend(obj for obj in objects if obj.deferred_fields)
+
+            count += len(objects)
+
+        label = model._meta.label_lower
+        self.counts[label] = self.counts.get(label, 0) + count
+
+        logger.debug('Loaded %s records for model %s', count, label)
+
+        return count
+
+    def finish_group(self, models: list) -> None:
+        """Resolve deferred references and check constraints for a group of loaded models."""
+        for obj in self.deferred:
+            obj.save_deferred_fields(using=self.using)
+
+        self.deferred = []
+
+        if not models:
+            return
+
+        tables = []
+
+        for model in models:
+            tables.append(model._meta.db_table)
+            tables.extend(
+                field.remote_field.through._meta.db_table
+                for field in model._meta.many_to_many
+                if field.remote_field.through._meta.auto_created
+            )
+
+        self.connection.check_constraints(table_names=tables)
+
+        # Primary key sequences must be updated, as records were inserted with explicit keys
+        if sequence_sql := self.connection.ops.sequence_reset_sql(no_style(), models):
+            with self.connection.cursor() as cursor:
+                for line in sequence_sql:
+                    cursor.execute(line)
+
+    def load(self, stream) -> int:
+        """Load all records from the provided (binary) stream.
+
+        Returns:
+            The total number of records loaded
+        """
+        self.metadata = self.read_metadata(stream)
+
+        if 'models' in self.metadata:
+            labels = [
+                label for label in self.metadata['models'] if self.should_load(label)
+            ]
+            self.order = {label: idx for idx, label in enumerate(labels)}
+        else:
+            # Without a list of exported models, all records are loaded in a single group
+            logger.warning('No model list found in data file - loading as single group')
+            self.order = {}
+
+        offset = 0
+
+        if self.resume:
+            progress = self.read_checkpoint().get(self.phase, {})
+
+            if progress.get('complete', False):
+                logger.info("Import phase '%s' already complete", self.phase)
+                return 0
+
+            offset = progress.get('offset', 0)
+
+        segments = groupby(
+            self.read_records(stream, offset), key=lambda record: record.get('model')
+        )
+
+        total = 0
+        complete = False
+
+        while not complete:
+            with (
+                self.connection.constraint_checks_disabled(),
+                transaction.atomic(using=self.using),
+            ):
+                models = []
+                pending = set()
+
+                for label, records in segments:
+                    model = self.get_model(label)
+
+                    if model is None:
+                        # Skip all records for this model
+                        for _record in records:
+                            pass
+
+                        continue
+
+                    total += self.load_model(model, records)
+                    models.append(model)
+
+                    # Models which precede this model in the file have now been loaded
+                    position = self.order.get(model._meta.label_lower, -1)
+
+                    pending = {
+                        label
+                        for label in pending | self.forward_dependencies(model)
+                        if self.order[label] > position
+                    }
+
+                    if self.order and not pending:
+                        break
+                else:
+                    complete = True
+
+                self.finish_group(models)
+
+            self.save_checkpoint(complete=complete)
+
+        return total
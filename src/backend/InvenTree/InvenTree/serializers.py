@@ -27,6 +27,7 @@ from rest_framework.serializers import DecimalField, Serializer
 from rest_framework.utils import model_meta
 from taggit.serializers import TaggitSerializer
 
+import InvenTree.instrumentation
 import InvenTree.ready
 from common.currency import currency_code_default, currency_code_mappings
 from InvenTree.fields import InvenTreeRestURLField, InvenTreeURLField
@@ -821,6 +822,11 @@ class InvenTreeModelSerializer(serializers.ModelSerializer):
 
         return instance
 
+    def to_representation(self, instance):
+        """Serialize the provided instance, recording the time spent (if instrumentation is enabled)."""
+        with InvenTree.instrumentation.serializer_timer():
+            return super().to_representation(instance)
+
     def run_validation(self, data=empty):
         """Perform serializer validation.
 
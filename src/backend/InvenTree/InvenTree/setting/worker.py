@@ -1,9 +1,53 @@
 """Configuration settings for the InvenTree background worker process."""
 
 import sys
+from typing import Optional
 
 from InvenTree.config import get_setting
 
+# Name of the main worker cluster (which processes the default task queue)
+CLUSTER_NAME = 'InvenTree'
+
+DEFAULT_QUEUE = 'default'
+LOW_PRIORITY_QUEUE = 'low'
+
+# Task groups which are offloaded to a particular queue by default
+DEFAULT_GROUP_QUEUES = {'pricing': LOW_PRIORITY_QUEUE, 'stocktake': LOW_PRIORITY_QUEUE}
+
+
+def get_queue_cluster_name(queue: str) -> str:
+    """Return the name of the worker cluster which processes the provided task queue."""
+    if queue == DEFAULT_QUEUE:
+        return CLUSTER_NAME
+
+    return f'{CLUSTER_NAME}-{queue}'
+
+
+def get_task_cluster(queue: Optional[str] = None, group: str = '') -> Optional[str]:
+    """Return the name of the (alternative) worker cluster which a task should be offloaded to.
+
+    Arguments:
+        queue: The name of the task queue (if not specified, determined by the task group)
+        group: The group that the task belongs to
+
+    Returns:
+        The name of the worker cluster, or None if the task should be offloaded to the main cluster.
+        Tasks are offloaded to the main cluster if the requested queue is not configured.
+    """
+    from django.conf import settings
+
+    queue = queue or DEFAULT_GROUP_QUEUES.get(group, DEFAULT_QUEUE)
+
+    if queue == DEFAULT_QUEUE:
+        return None
+
+    cluster = get_queue_cluster_name(queue)
+
+    if cluster in settings.Q_CLUSTER.get('ALT_CLUSTERS', {}):
+        return cluster
+
+    return None
+
 
 def get_worker_config(
     db_engine: str,
@@ -49,6 +93,31 @@ def get_worker_config(
     if 'sqlite' in db_engine:
         BACKGROUND_WORKER_COUNT = 1
 
+    # Additional task queues, each processed by a separate worker cluster
+    # e.g. {"low": 1} to process low-priority tasks with a single dedicated worker
+    BACKGROUND_QUEUES = get_setting(
+        'INVENTREE_BACKGROUND_QUEUES', 'background.queues', {}, typecast=dict
+    )
+
+    alt_clusters = {}
+
+    # Separate worker clusters are not supported with SQLite (database locking issues)
+    if 'sqlite' not in db_engine:
+        for queue, workers in (BACKGROUND_QUEUES or {}).items():
+            try:
+                workers = int(workers)
+            except (TypeError, ValueError):
+                continue
+
+            if queue == DEFAULT_QUEUE or workers <= 0:
+                continue
+
+            alt_clusters[get_queue_cluster_name(queue)] = {
+                'workers': workers if global_cache else 1,
+                # Scheduled tasks are only run by the main cluster
+                'scheduler': False,
+            }
+
     # Check if '--sync' was passed in the command line
     if '--sync' in sys.argv and '--noreload' in sys.argv and debug:
         SYNC_TASKS = True
@@ -61,7 +130,7 @@ def get_worker_config(
 
     # django-q background worker configuration
     config = {
-        'name': 'InvenTree',
+        'name': CLUSTER_NAME,
         'label': 'Background Tasks',
         'workers': BACKGROUND_WORKER_COUNT,
         'timeout': BACKGROUND_WORKER_TIMEOUT,
@@ -77,6 +146,9 @@ def get_worker_config(
         'poll': 1.5,
     }
 
+    if alt_clusters:
+        config['ALT_CLUSTERS'] = alt_clusters
+
     if global_cache:
         # If using external redis cache, make the cache the broker for Django Q
         config['django_redis'] = 'worker'
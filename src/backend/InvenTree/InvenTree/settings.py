@@ -246,6 +246,12 @@ PLUGIN_RETRY = get_setting(
     'INVENTREE_PLUGIN_RETRY', 'PLUGIN_RETRY', 3, typecast=int
 )  # How often should plugin loading be tried?
 
+# Interval (seconds) between checks for plugin / machine registry changes made by other processes
+# Note: This is only used if the global cache is not enabled (changes are otherwise pushed)
+REGISTRY_POLL_INTERVAL = get_setting(
+    'INVENTREE_REGISTRY_POLL_INTERVAL', 'registry_poll_interval', 5, typecast=int
+)
+
 # Hash of the plugin file (will be updated on each change)
 PLUGIN_FILE_HASH = ''
 
@@ -390,12 +396,26 @@ MIDDLEWARE = CONFIG.get(
         'maintenance_mode.middleware.MaintenanceModeMiddleware',
         'InvenTree.middleware.InvenTreeExceptionProcessor',  # Error reporting
         'InvenTree.middleware.InvenTreeRequestCacheMiddleware',  # Request caching
+        'InvenTree.middleware.InvenTreeInstrumentationMiddleware',  # Request metrics
         'InvenTree.middleware.InvenTreeHostSettingsMiddleware',  # Ensuring correct hosting/security settings
         'django_structlog.middlewares.RequestMiddleware',  # Structured logging
         'InvenTree.middleware.InvenTreeVersionHeaderMiddleware',
     ],
 )
 
+# Request instrumentation (per-endpoint performance metrics)
+INSTRUMENTATION_ENABLED = get_boolean_setting(
+    'INVENTREE_INSTRUMENTATION', 'instrumentation', False
+)
+
+# Fraction of requests which are instrumented (0.0 - 1.0)
+INSTRUMENTATION_SAMPLE_RATE = get_setting(
+    'INVENTREE_INSTRUMENTATION_SAMPLE_RATE',
+    'instrumentation_sample_rate',
+    1.0,
+    typecast=float,
+)
+
 # In DEBUG mode, add support for django-silk
 # Ref: https://silk.readthedocs.io/en/latest/
 DJANGO_SILK_ENABLED = (
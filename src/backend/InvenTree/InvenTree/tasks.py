@@ -1,8 +1,10 @@
 """Functions for tasks and a few general async tasks."""
 
 import contextvars
+import hashlib
 import json
 import os
+import pickle
 import re
 import warnings
 from collections import defaultdict
@@ -161,10 +163,32 @@ def record_task_success(task_name: str):
     set_global_setting(f'_{task_name}_SUCCESS', datetime.now().isoformat(), None)
 
 
+def get_task_key(taskname, group: str, args: tuple, kwargs: dict) -> Optional[str]:
+    """Return a unique key for a task, used to detect duplicate tasks.
+
+    The key is a hash of the task name, group, args and kwargs.
+
+    Returns:
+        Optional[str]: The task key, or None if the task arguments cannot be hashed
+    """
+    if callable(taskname):
+        taskname = f'{taskname.__module__}.{taskname.__qualname__}'
+
+    try:
+        data = pickle.dumps(
+            (taskname, group, tuple(args), sorted((kwargs or {}).items())), protocol=4
+        )
+    except Exception:
+        return None
+
+    return hashlib.sha256(data).hexdigest()
+
+
 def check_existing_task(taskname, group: str, *args, **kwargs) -> Optional[str]:
     """Test if an identical task is already registered with the worker.
 
     This will only return true if the task name, group, args and kwargs all match an existing task.
+    Queued tasks are looked up via the task queue index (see common.models.TaskQueueIndex).
 
     Arguments:
         taskname: The name of the task to check for, in the format 'app.module.function'
@@ -175,33 +199,73 @@ def check_existing_task(taskname, group: str, *args, **kwargs) -> Optional[str]:
     Returns:
         Optional[str]: The ID of the matching task, if found, otherwise None
     """
-    from django_q.models import OrmQ
+    from common.models import TaskQueueIndex
+
+    if not (key := get_task_key(taskname, group, args, kwargs)):
+        return None
+
+    try:
+        return TaskQueueIndex.lookup(key)
+    except (OperationalError, ProgrammingError):
+        # The database is not ready yet
+        return None
+
+
+def register_queued_tasks(taskname, group: str, entries: list) -> list[str]:
+    """Record tasks in the task queue index, before they are queued.
+
+    Tasks must be indexed *before* they are queued, as a worker may start the task
+    (and remove the index entry) before the queueing process continues.
+
+    Arguments:
+        taskname: The name of the task, in the format 'app.module.function'
+        group: The group that the tasks belong to
+        entries: List of (task_id, args, kwargs) tuples, one per task.
+            If the task ID is not yet known, it can be recorded later via update_queued_task()
+
+    Returns:
+        list[str]: The task keys which were registered
+    """
+    from common.models import TaskQueueIndex
 
-    task_id = None
+    keys = [
+        (key, task_id)
+        for task_id, args, kwargs in entries
+        if (key := get_task_key(taskname, group, args, kwargs))
+    ]
 
-    # Iterate through all available tasks, with the most recent first
-    for task in OrmQ.objects.all().order_by('-id'):
-        if task.func() != taskname and task.task.get('func') != taskname:
-            # Task does not match
-            continue
+    try:
+        if len(keys) == 1:
+            TaskQueueIndex.register(*keys[0])
+        elif keys:
+            TaskQueueIndex.register_many(keys)
+    except (OperationalError, ProgrammingError):
+        # The database is not ready yet
+        return []
 
-        if task.group() != group:
-            # Group does not match
-            continue
+    return [key for key, _task_id in keys]
 
-        if task.args() != args:
-            # Task args do not match
-            continue
 
-        if task.kwargs() != kwargs:
-            # Task kwargs do not match
-            continue
+def update_queued_task(keys: list[str], task_id: Optional[str]) -> None:
+    """Update the task queue index entries registered for a single task.
 
-        task_id = task.task_id()
+    Arguments:
+        keys: The task keys returned by register_queued_tasks()
+        task_id: The ID of the queued task, or None if the task could not be queued
+    """
+    from common.models import TaskQueueIndex
 
-        break
+    if not keys:
+        return
 
-    return task_id
+    try:
+        if task_id:
+            TaskQueueIndex.assign(keys, task_id)
+        else:
+            TaskQueueIndex.objects.filter(key__in=keys, task_id='').delete()
+    except (OperationalError, ProgrammingError):
+        # The database is not ready yet
+        pass
 
 
 # Context-local batch of pending offload_task() calls (see batch_offload_tasks())
@@ -211,7 +275,7 @@ _task_batch: contextvars.ContextVar = contextvars.ContextVar('task_batch', defau
 class TaskBatch:
     """Collects offload_task() calls made within a batch_offload_tasks() scope.
 
-    Entries are grouped by (taskname, group, force_async), so that each distinct
+    Entries are grouped by (taskname, group, force_async, queue), so that each distinct
     combination triggered within the batch is flushed via its own bulk_offload_task() call.
     """
 
@@ -220,18 +284,28 @@ class TaskBatch:
         self.entries: dict[tuple, list] = defaultdict(list)
 
     def add(
-        self, taskname, group: str, force_async: bool, args: tuple, kwargs: dict
+        self,
+        taskname,
+        group: str,
+        force_async: bool,
+        args: tuple,
+        kwargs: dict,
+        queue: Optional[str] = None,
     ) -> None:
         """Record a single offload_task() call against this batch."""
-        self.entries[taskname, group, force_async].append((args, kwargs))
+        self.entries[taskname, group, force_async, queue].append((args, kwargs))
 
     def flush(self) -> None:
-        """Fire a bulk_offload_task() call for each (taskname, group, force_async) group collected so far."""
+        """Fire a bulk_offload_task() call for each (taskname, group, force_async, queue) group collected so far."""
         entries, self.entries = self.entries, defaultdict(list)
 
-        for (taskname, group, force_async), task_entries in entries.items():
+        for (taskname, group, force_async, queue), task_entries in entries.items():
             bulk_offload_task(
-                taskname, task_entries, group=group, force_async=force_async
+                taskname,
+                task_entries,
+                group=group,
+                force_async=force_async,
+                queue=queue,
             )
 
 
@@ -246,7 +320,7 @@ def batch_offload_tasks():
     with its side effects visible, by the time offload_task() returns control to the caller -
     deferring it would silently break that contract.
 
-    The queued calls are flushed - grouped by (taskname, group, force_async), one
+    The queued calls are flushed - grouped by (taskname, group, force_async, queue), one
     bulk_offload_task() call per group - when the current database transaction commits (or
     immediately, if no transaction is active). If the transaction is instead rolled back, the
     queued calls are discarded, rather than being fired for a write that never happened.
@@ -290,6 +364,7 @@ def offload_task(
     force_async: bool = False,
     force_sync: bool = False,
     check_duplicates: bool = True,
+    queue: Optional[str] = None,
     **kwargs,
 ) -> str | bool:
     """Create an AsyncTask if workers are running. This is different to a 'scheduled' task, in that it only runs once!
@@ -302,6 +377,7 @@ def offload_task(
         force_async: If True, force the task to be offloaded (even if workers are not running)
         force_sync: If True, force the task to be run synchronously (even if workers are running)
         check_duplicates: If True, check for existing identical tasks before offloading
+        queue: The task queue to offload the task to (default = determined by the task group)
         **kwargs: Keyword arguments to be passed to the task function
 
     Returns:
@@ -314,7 +390,7 @@ def offload_task(
         # A batch_offload_tasks() context is active - queue this task rather than
         # offloading it immediately (force_sync=True calls never reach this branch -
         # see batch_offload_tasks() for why they are excluded from batching)
-        batch.add(taskname, group, force_async, args, kwargs)
+        batch.add(taskname, group, force_async, args, kwargs, queue=queue)
         return True
 
     from InvenTree.exceptions import log_error
@@ -322,8 +398,10 @@ def offload_task(
     try:
         import importlib
 
+        from django_q.brokers import get_broker
         from django_q.tasks import AsyncTask
 
+        from InvenTree.setting.worker import get_task_cluster
         from InvenTree.status import is_worker_running
     except AppRegistryNotReady:  # pragma: no cover
         logger.warning("Could not offload task '%s' - app registry not ready", taskname)
@@ -354,12 +432,28 @@ def offload_task(
 
         # Running as asynchronous task
         try:
-            task = AsyncTask(taskname, *args, group=group, **kwargs)
-            with tracer.start_as_current_span(f'async worker: {taskname}'):
-                task.run()
+            options = {'group': group}
+
+            # Offload to a dedicated worker cluster (if configured for this queue)
+            if cluster := get_task_cluster(queue, group):
+                options['broker'] = get_broker(list_key=cluster)
+
+            task = AsyncTask(taskname, *args, **options, **kwargs)
+
+            # The task ID is only known once the task has been queued
+            keys = register_queued_tasks(taskname, group, [('', args, kwargs)])
 
-                # Return the ID of the offloaded task, so that it can be tracked if needed
-                return task.id
+            try:
+                with tracer.start_as_current_span(f'async worker: {taskname}'):
+                    task.run()
+            except Exception:
+                update_queued_task(keys, None)
+                raise
+
+            update_queued_task(keys, task.id)
+
+            # Return the ID of the offloaded task, so that it can be tracked if needed
+            return task.id
         except ImportError:
             raise_warning(f"WARNING: '{taskname}' not offloaded - Function not found")
             return False
@@ -419,6 +513,7 @@ def bulk_offload_task(
     group: str = 'inventree',
     force_sync: bool = False,
     force_async: bool = False,
+    queue: Optional[str] = None,
 ) -> bool:
     """Queue the same background task many times, in a single bulk database write.
 
@@ -436,6 +531,7 @@ def bulk_offload_task(
         group: The task group to assign to each queued task
         force_sync: If True, run all tasks synchronously (even if workers are running)
         force_async: If True, force all tasks to be queued (even if workers are not running)
+        queue: The task queue to offload the tasks to (default = determined by the task group)
 
     Returns:
         bool: True if the tasks were queued (or run synchronously), False otherwise
@@ -449,6 +545,7 @@ def bulk_offload_task(
         from django_q.models import OrmQ
         from django_q.signing import SignedPackage
 
+        from InvenTree.setting.worker import get_task_cluster
         from InvenTree.status import is_worker_running
     except AppRegistryNotReady:  # pragma: no cover
         logger.warning(
@@ -473,12 +570,18 @@ def bulk_offload_task(
 
         return True
 
-    broker = get_broker()
+    if cluster := get_task_cluster(queue, group):
+        # Offload to a dedicated worker cluster (if configured for this queue)
+        broker = get_broker(list_key=cluster)
+    else:
+        broker = get_broker()
 
     tasks = []
+    queued = []
 
     for args, kwargs in entries:
         name, task_id = uuid()
+        queued.append((task_id, args, kwargs))
 
         task = {
             'id': task_id,
@@ -498,7 +601,17 @@ def bulk_offload_task(
             )
         )
 
-    OrmQ.objects.bulk_create(tasks)
+    keys = register_queued_tasks(taskname, group, queued)
+
+    try:
+        OrmQ.objects.bulk_create(tasks)
+    except Exception:
+        from common.models import TaskQueueIndex
+
+        TaskQueueIndex.objects.filter(
+            key__in=keys, task_id__in=[task_id for task_id, *_ in queued]
+        ).delete()
+        raise
 
     return True
 
@@ -621,9 +734,8 @@ def scheduled_task(
 def rebuild_model_tree(model: str, tree_id: int) -> None:
     """Rebuild the tree structure (and pathstring values) for a tree model.
 
-    This task is offloaded to the background worker whenever nodes are
-    restructured (e.g. re-parented), to avoid expensive tree rebuild
-    operations blocking the calling thread.
+    Note: Trees are now marked for rebuild, and rebuilt by the rebuild_pending_trees task.
+    This task is retained for any rebuild tasks which are already queued.
 
     Arguments:
         model: Label of the model class to rebuild, e.g. 'stock.stocklocation'
@@ -632,6 +744,7 @@ def rebuild_model_tree(model: str, tree_id: int) -> None:
     from django.apps import apps
 
     import InvenTree.models
+    import InvenTree.trees
 
     try:
         model_class = apps.get_model(model)
@@ -643,12 +756,21 @@ def rebuild_model_tree(model: str, tree_id: int) -> None:
         logger.warning("rebuild_model_tree: Model '%s' is not a tree model", model)
         return
 
-    # Rebuild the tree structure, based on the parent-child relationships
-    model_class.rebuild_trees([tree_id])
+    # Rebuild the tree structure, and the 'pathstring' values (if applicable)
+    InvenTree.trees.rebuild_trees(model_class, [tree_id])
+
+
+@tracer.start_as_current_span('rebuild_pending_trees')
+@scheduled_task(ScheduledTask.MINUTES, 5)
+def rebuild_pending_trees() -> None:
+    """Rebuild all tree models which are marked as requiring a rebuild, in a single pass.
+
+    This task is offloaded whenever a tree is marked for rebuild (see InvenTree.trees),
+    and also runs periodically to rebuild any trees which were marked (but not rebuilt).
+    """
+    import InvenTree.trees
 
-    # Rebuild the 'pathstring' values for the entire tree (if applicable)
-    if issubclass(model_class, InvenTree.models.PathStringMixin):
-        model_class.rebuild_tree_pathstring_values([tree_id])
+    InvenTree.trees.rebuild_pending_trees()
 
 
 @tracer.start_as_current_span('heartbeat')
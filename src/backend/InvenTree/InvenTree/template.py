@@ -15,6 +15,8 @@ class InvenTreeTemplateLoader(CachedLoader):
 
         Any custom report or label templates will be forced to reload (without cache).
         This ensures that generated PDF reports / labels are always up-to-date.
+
+        Within a single print job, each template is reloaded only once (see report.render).
         """
         # List of template patterns to skip cache for
         skip_cache_dirs = [
@@ -29,7 +31,17 @@ class InvenTreeTemplateLoader(CachedLoader):
         template_path = str(template.name)
 
         # If the template matches any of the skip patterns, reload it without cache
+        # Within a single print job, the template is only loaded once
         if any(template_path.startswith(d) for d in skip_cache_dirs):
-            template = BaseLoader.get_template(self, template_name, skip)
+            from report.render import cached
+
+            if skip:
+                template = BaseLoader.get_template(self, template_name, skip)
+            else:
+                template = cached(
+                    'template',
+                    template_name,
+                    lambda: BaseLoader.get_template(self, template_name, skip),
+                )
 
         return template
@@ -454,6 +454,97 @@ class SearchTests(InvenTreeAPITestCase):
         # No results again
         self.assertEqual(response.data['build']['count'], 0)
 
+    def test_search_index(self):
+        """Test that the search index returns the same results as a regular search."""
+        from common.models import SearchDocument
+        from common.search import rebuild_search_index, search
+        from common.settings import set_global_setting
+        from part.models import Part, PartCategory
+
+        self.assignRole('purchase_order.view')
+        self.assignRole('sales_order.view')
+        self.assignRole('stock.view')
+
+        url = reverse('api-search')
+
+        queries = [
+            {'search': 'chair', 'limit': 3, 'part': {}, 'build': {}},
+            {
+                'search': 'r',
+                'limit': 100,
+                'part': {'active': True},
+                'partcategory': {},
+                'stockitem': {'in_stock': True},
+                'supplier': {},
+            },
+            {
+                'search': '01',
+                'limit': 2,
+                'purchaseorder': {'outstanding': True},
+                'salesorder': {},
+            },
+            {'search': 'some note', 'limit': 10, 'search_notes': True, 'build': {}},
+            # Filters which are not supported by the index
+            {
+                'search': 'r',
+                'limit': 2,
+                'part': {'category': 1},
+                'stockitem': {'in_stock': True, 'part_detail': True},
+            },
+        ]
+
+        expected = [self.post(url, query, expected_code=200).data for query in queries]
+
+        set_global_setting('INVENTREE_SEARCH_INDEX', True)
+        rebuild_search_index()
+
+        self.assertGreater(SearchDocument.objects.count(), 0)
+
+        for query, legacy in zip(queries, expected, strict=True):
+            response = self.post(url, query, expected_code=200)
+
+            for key, result in legacy.items():
+                indexed = response.data[key]
+
+                self.assertEqual(indexed['count'], result['count'])
+                self.assertEqual(len(indexed['results']), len(result['results']))
+
+                if result['count'] <= query['limit']:
+                    self.assertEqual(
+                        {row['pk'] for row in indexed['results']},
+                        {row['pk'] for row in result['results']},
+                    )
+
+        # All requested groups are searched with a single query
+        with self.assertNumQueries(1):
+            matches = search('r', {'part': {}, 'stockitem': {}, 'supplier': {}})
+
+        self.assertGreater(matches['part']['count'], 0)
+
+        # Saving an object updates the index
+        part = Part.objects.get(pk=1)
+        part.name = 'Zorkmid'
+        part.save()
+
+        self.assertEqual(search('zork', {'part': {}})['part']['ids'], [1])
+
+        # Saving a related object updates the index for dependent objects
+        category = PartCategory.objects.get(pk=part.category.pk)
+        category.name = 'Gnusto'
+        category.save()
+
+        self.assertIn(1, search('gnusto', {'part': {}})['part']['ids'])
+
+        # Deleting an object removes it from the index
+        part = Part.objects.create(name='Frotz', description='Frotz widget')
+        self.assertEqual(search('frotz', {'part': {}})['part']['ids'], [part.pk])
+
+        part.active = False
+        part.save()
+        part.delete()
+
+        self.assertEqual(search('frotz', {'part': {}})['part']['count'], 0)
+
     def test_permissions(self):
         """Test that users with insufficient permissions are handled correctly."""
         # First, remove all roles
@@ -601,6 +692,61 @@ class GeneralApiTests(InvenTreeAPITestCase):
 
                 self.assertIn('Failed to parse license file', str(log.output))
 
+    def test_instrumentation(self):
+        """Test that request metrics are recorded when instrumentation is enabled."""
+        from django.test import override_settings
+
+        import InvenTree.instrumentation
+
+        url = reverse('api-instrumentation')
+
+        InvenTree.instrumentation.reset_metrics()
+
+        # Instrumentation is disabled by default
+        self.get(reverse('api-license'))
+
+        data = self.get(url).json()
+        self.assertFalse(data['enabled'])
+        self.assertEqual(data['endpoints'], [])
+
+        with override_settings(INSTRUMENTATION_ENABLED=True):
+            for _ in range(3):
+                self.get(reverse('api-license'))
+
+            data = self.get(url).json()
+            self.assertTrue(data['enabled'])
+
+            endpoints = {
+                (entry['method'], entry['endpoint']): entry
+                for entry in data['endpoints']
+            }
+
+            entry = endpoints['GET', '/api/license/']
+            self.assertEqual(entry['requests'], 3)
+            self.assertEqual(entry['latency']['count'], 3)
+            self.assertEqual(entry['latency']['buckets']['+Inf'], 3)
+            self.assertGreater(entry['latency']['sum'], 0)
+
+            # Metrics can also be rendered in the Prometheus text format
+            response = self.get(url, data={'format': 'prometheus'})
+            text = response.content.decode()
+
+            self.assertIn('# TYPE inventree_request_duration_seconds histogram', text)
+            self.assertIn(
+                'inventree_request_duration_seconds_count{method="GET",endpoint="/api/license/"} 3',
+                text,
+            )
+
+            # Metrics can be reset
+            self.delete(url, expected_code=204)
+            self.assertEqual(InvenTree.instrumentation.get_metrics(), [])
+
+            # Only staff users can access the metrics
+            self.user.is_staff = False
+            self.user.save()
+
+            self.get(url, expected_code=403)
+
     def test_info_view(self):
         """Test that we can read the 'info-view' endpoint."""
         from plugin import PluginMixinEnum
@@ -0,0 +1,103 @@
+"""Unit tests for the backend benchmark suite."""
+
+from django.test import TestCase
+
+from build.models import Build
+from InvenTree.benchmark import (
+    BOM_DEPTH,
+    VARIANT_COUNT,
+    BenchmarkDataset,
+    BenchmarkRunner,
+    compare_results,
+)
+from part.models import BomItem, Part
+from stock.models import StockItem
+
+
+class BenchmarkTest(TestCase):
+    """Tests for the benchmark dataset and runner (using a very small dataset)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Generate a small benchmark dataset."""
+        super().setUpTestData()
+
+        cls.dataset = BenchmarkDataset(seed=1, scale=0.0002)
+        cls.dataset.generate()
+
+    def test_dataset(self):
+        """Test the structure of the generated dataset."""
+        self.assertEqual(Part.objects.count(), self.dataset.size('parts'))
+        self.assertEqual(StockItem.objects.count(), self.dataset.size('stock_items'))
+
+        # Variant parts are correctly linked to their template
+        template = Part.objects.filter(is_template=True).first()
+        self.assertEqual(template.get_descendant_count(), VARIANT_COUNT)
+
+        # The BOM for the top-level assembly is BOM_DEPTH levels deep
+        depth = 0
+        parts = {self.dataset.metadata['assembly']}
+
+        while parts:
+            depth += 1
+            parts = set(
+                BomItem.objects.filter(
+                    part__in=parts, sub_part__assembly=True
+                ).values_list('sub_part', flat=True)
+            )
+
+        self.assertEqual(depth, BOM_DEPTH)
+
+        # Build lines were created for the allocation build order
+        build = Build.objects.get(pk=self.dataset.metadata['build'])
+        self.assertTrue(build.build_lines.exists())
+
+        # The dataset metadata can be loaded again
+        dataset = BenchmarkDataset(seed=1, scale=0.0002)
+        self.assertTrue(dataset.load())
+        self.assertEqual(dataset.metadata, self.dataset.metadata)
+
+        self.assertFalse(BenchmarkDataset(seed=2, scale=0.0002).load())
+
+    def test_runner(self):
+        """Test that benchmarks are run, and do not modify the dataset."""
+        n_parts = Part.objects.count()
+
+        runner = BenchmarkRunner(self.dataset, repeat=1)
+        results = runner.run(['pricing', 'tree', 'import', 'api.part.list'])
+
+        self.assertIn('pricing.cascade', results['results'])
+        self.assertNotIn('api.stock.list', results['results'])
+
+        for name, result in results['results'].items():
+            self.assertNotIn('error', result, name)
+            self.assertGreater(result['queries'], 0)
+
+        # Imported parts were rolled back
+        self.assertEqual(Part.objects.count(), n_parts)
+
+    def test_compare(self):
+        """Test comparison of benchmark results against a baseline."""
+        baseline = {
+            'results': {
+                'a': {'time': 1.0, 'queries': 10},
+                'b': {'time': 1.0, 'queries': 10},
+                'c': {'time': 0.001, 'queries': 10},
+            }
+        }
+
+        results = {
+            'results': {
+                'a': {'time': 1.1, 'queries': 10},
+                'b': {'time': 2.0, 'queries': 12},
+                'c': {'time': 0.002, 'queries': 10},
+                'd': {'time': 5.0, 'queries': 100},
+            }
+        }
+
+        regressions = compare_results(results, baseline, tolerance=0.25)
+
+        self.assertEqual(
+            [(r['name'], r['metric']) for r in regressions],
+            [('b', 'queries'), ('b', 'time')],
+        )
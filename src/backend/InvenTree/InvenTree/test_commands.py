@@ -1,11 +1,12 @@
 """Tests for custom InvenTree management commands."""
 
+import json
 import os
 import subprocess
 from pathlib import Path
 
 from django.conf import settings
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, Permission, User
 from django.core.management import call_command
 from django.test import TestCase
 
@@ -256,3 +257,71 @@ class CommandTestCase(TestCase):
         if settings.TRACING_ENABLED:  # pragma: no cover
             print('Re-enabling tracing for backup command test')
             SQLite3Instrumentor().instrument()
+
+    def test_stream_records(self):
+        """Test streamed export and import of database records."""
+        from InvenTree.records import open_stream
+
+        user = User.objects.create_user('stream_user', 'stream@example.org', 'abc')
+        group = Group.objects.create(name='Stream Group')
+        group.permissions.add(Permission.objects.first())
+
+        output_path = get_testfolder_dir().joinpath('records.jsonl.gz').resolve()
+        progress_path = Path(f'{output_path}.progress')
+
+        call_command(
+            'dump_records',
+            str(output_path),
+            exclude=['contenttypes', 'auth.permission', 'sessions'],
+            verbosity=0,
+        )
+
+        with open_stream(output_path) as stream:
+            records = [json.loads(line) for line in stream]
+
+        metadata = records[0]
+        self.assertTrue(metadata['metadata'])
+        self.assertIn('auth.user', metadata['models'])
+        self.assertNotIn('auth.permission', metadata['models'])
+
+        # Permissions are not exported
+        groups = [r for r in records if r.get('model') == 'auth.group']
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]['fields']['permissions'], [])
+
+        # Modified records are restored by the import
+        user.email = 'changed@example.org'
+        user.save()
+        group.delete()
+
+        call_command(
+            'load_records', str(output_path), app=['auth'], phase='auth', verbosity=0
+        )
+
+        user.refresh_from_db()
+        self.assertEqual(user.email, 'stream@example.org')
+
+        group = Group.objects.get(name='Stream Group')
+        self.assertEqual(group.permissions.count(), 0)
+
+        progress = json.loads(progress_path.read_text(encoding='utf-8'))
+        self.assertTrue(progress['auth']['complete'])
+
+        # A completed import phase is skipped when resuming
+        user.email = 'changed@example.org'
+        user.save()
+
+        call_command(
+            'load_records',
+            str(output_path),
+            app=['auth'],
+            phase='auth',
+            resume=True,
+            verbosity=0,
+        )
+
+        user.refresh_from_db()
+        self.assertEqual(user.email, 'changed@example.org')
+
+        output_path.unlink()
+        progress_path.unlink()
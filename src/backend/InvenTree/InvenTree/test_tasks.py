@@ -453,6 +453,165 @@ class InvenTreeTaskTests(PluginRegistryMixin, TestCase):
         # 20 more tasks should have been added
         self.assertEqual(OrmQ.objects.count(), 41)
 
+    def test_task_queue_index(self):
+        """Test that queued tasks are tracked via the task queue index."""
+        from django_q.signals import pre_execute
+
+        from common.models import TaskQueueIndex
+
+        OrmQ.objects.all().delete()
+
+        task_id = InvenTree.tasks.offload_task(
+            'dummy_module.dummy_function', 1, 2, animal='cat', force_async=True
+        )
+
+        self.assertEqual(TaskQueueIndex.objects.count(), 1)
+        self.assertEqual(TaskQueueIndex.objects.first().task_id, task_id)
+
+        # The duplicate check is a single indexed lookup
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                InvenTree.tasks.check_existing_task(
+                    'dummy_module.dummy_function', 'inventree', 1, 2, animal='cat'
+                ),
+                task_id,
+            )
+
+        # The index entry is removed when the worker starts the task
+        pre_execute.send(
+            sender='django_q', func='dummy_module.dummy_function', task={'id': task_id}
+        )
+
+        self.assertEqual(TaskQueueIndex.objects.count(), 0)
+
+        # A new (identical) task can now be queued
+        self.assertNotEqual(
+            InvenTree.tasks.offload_task(
+                'dummy_module.dummy_function', 1, 2, animal='cat', force_async=True
+            ),
+            task_id,
+        )
+
+        self.assertEqual(OrmQ.objects.count(), 2)
+
+        # A task which is started before its ID is recorded is removed by key
+        keys = InvenTree.tasks.register_queued_tasks(
+            'dummy_module.dummy_function', 'inventree', [('', (3,), {})]
+        )
+
+        pre_execute.send(
+            sender='django_q',
+            func='dummy_module.dummy_function',
+            task={
+                'id': 'abc',
+                'func': 'dummy_module.dummy_function',
+                'group': 'inventree',
+                'args': (3,),
+                'kwargs': {},
+            },
+        )
+
+        InvenTree.tasks.update_queued_task(keys, 'abc')
+        self.assertFalse(TaskQueueIndex.objects.filter(key__in=keys).exists())
+
+        # Index entries are also removed when tasks are removed from the queue
+        OrmQ.objects.all().delete()
+        self.assertEqual(TaskQueueIndex.objects.count(), 0)
+
+        # Stale index entries are ignored
+        InvenTree.tasks.offload_task('dummy_module.dummy_function', force_async=True)
+        TaskQueueIndex.objects.update(
+            created=timezone.now() - TaskQueueIndex.STALE_TIMEOUT - timedelta(hours=1)
+        )
+
+        InvenTree.tasks.offload_task('dummy_module.dummy_function', force_async=True)
+        self.assertEqual(OrmQ.objects.count(), 2)
+
+        # Tasks queued in bulk are also indexed
+        InvenTree.tasks.bulk_offload_task(
+            'dummy_module.dummy_function',
+            [((idx,), {}) for idx in range(5)],
+            force_async=True,
+        )
+
+        self.assertEqual(TaskQueueIndex.objects.count(), 6)
+        self.assertIsNotNone(
+            InvenTree.tasks.check_existing_task(
+                'dummy_module.dummy_function', 'inventree', 3
+            )
+        )
+
+    def test_task_queues(self):
+        """Test that tasks are offloaded to separate task queues (if configured)."""
+        from django_q.brokers import get_broker
+
+        from InvenTree.setting.worker import get_worker_config
+
+        default_key = get_broker().list_key
+
+        with patch.dict(os.environ, {'INVENTREE_BACKGROUND_QUEUES': '{"low": 2}'}):
+            config = get_worker_config('postgresql', global_cache=True)
+
+            self.assertEqual(
+                config['ALT_CLUSTERS'],
+                {'InvenTree-low': {'workers': 2, 'scheduler': False}},
+            )
+
+            # Separate clusters are not available with SQLite
+            config = get_worker_config('sqlite3')
+            self.assertNotIn('ALT_CLUSTERS', config)
+
+        OrmQ.objects.all().delete()
+
+        # Without a configured queue, all tasks are offloaded to the main cluster
+        InvenTree.tasks.offload_task(
+            'dummy_module.dummy_function', group='pricing', force_async=True
+        )
+
+        self.assertEqual(OrmQ.objects.first().key, default_key)
+
+        OrmQ.objects.all().delete()
+
+        with self.settings(
+            Q_CLUSTER={
+                **settings.Q_CLUSTER,
+                'ALT_CLUSTERS': {'InvenTree-low': {'workers': 1}},
+            }
+        ):
+            # Pricing tasks are offloaded to the low-priority queue by default
+            InvenTree.tasks.offload_task(
+                'dummy_module.dummy_function', 1, group='pricing', force_async=True
+            )
+
+            # The queue can also be specified explicitly
+            InvenTree.tasks.offload_task(
+                'dummy_module.dummy_function', 2, queue='low', force_async=True
+            )
+
+            InvenTree.tasks.bulk_offload_task(
+                'dummy_module.dummy_function',
+                [((3,), {})],
+                queue='low',
+                force_async=True,
+            )
+
+            # Other tasks are offloaded to the main cluster
+            InvenTree.tasks.offload_task(
+                'dummy_module.dummy_function', 4, force_async=True
+            )
+
+        queued = {task.args()[0]: task.key for task in OrmQ.objects.all()}
+
+        self.assertEqual(
+            queued,
+            {
+                1: 'InvenTree-low',
+                2: 'InvenTree-low',
+                3: 'InvenTree-low',
+                4: default_key,
+            },
+        )
+
     def test_bulk_offload(self):
         """Test the bulk_offload_task function."""
         # Start with a blank slate
@@ -463,8 +622,9 @@ class InvenTreeTaskTests(PluginRegistryMixin, TestCase):
             for idx in range(10)
         ]
 
-        # Queuing all 10 tasks should only take a single database write (bulk_create)
-        with self.assertNumQueries(1):
+        # Queuing all 10 tasks should only take a single database write (bulk_create),
+        # plus a single write to the task queue index
+        with self.assertNumQueries(2):
             result = InvenTree.tasks.bulk_offload_task(
                 'dummy_module.dummy_function', entries, force_async=True
             )
@@ -0,0 +1,232 @@
+"""Deferred, coalesced maintenance of tree (MPTT) models.
+
+Previously, each save which changed the structure of a tree offloaded a separate
+rebuild_model_tree task for each affected tree, and a failed partial rebuild fell back to
+rebuilding the *entire* table. Bulk operations (e.g. moving many stock locations, or importing
+part categories) resulted in a large number of queued rebuild tasks, and occasional full
+rebuilds which locked the table.
+
+Instead:
+
+- Trees which require a rebuild are marked as pending in the TreeRebuild table
+- All pending trees are rebuilt in a single pass, by the rebuild_pending_trees task
+  (which is offloaded when a tree is marked, and also runs periodically as a fallback)
+- Trees which cannot be partially rebuilt (e.g. multiple root nodes) are repaired first,
+  rather than rebuilding the entire table (see InvenTreeTree.repair_tree)
+- Within a deferred_tree_updates() context, per-save MPTT updates are suspended,
+  and each affected tree is marked once, when the context exits
+- The duration of each tree rebuild is recorded in the TreeRebuild table
+  (and reported via InvenTree.instrumentation)
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Optional
+
+from django.apps import apps
+from django.db import DatabaseError, transaction
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+# Trees which require a rebuild, for each model with deferred MPTT updates (keyed by label)
+_deferred: ContextVar[Optional[dict[str, set[int]]]] = ContextVar(
+    'deferred_tree_updates', default=None
+)
+
+
+def is_tree_model(model) -> bool:
+    """Return True if the provided model class is an InvenTreeTree model."""
+    from InvenTree.models import InvenTreeTree
+
+    return isinstance(model, type) and issubclass(model, InvenTreeTree)
+
+
+def is_deferred(model) -> bool:
+    """Return True if MPTT updates are deferred for the provided model (in the current context).
+
+    Note that the MPTT updates are skipped for each save within the current context only
+    (see InvenTreeTree.save), rather than toggling the model-wide disable_mptt_updates flag,
+    so that saves in other threads or requests are not affected.
+    """
+    deferred = _deferred.get()
+
+    return deferred is not None and model._meta.label_lower in deferred
+
+
+@contextmanager
+def deferred_tree_updates(*models):
+    """Suspend per-save MPTT updates for the provided tree models, during a bulk operation.
+
+    Within this context:
+
+    - Saving a node does not update the MPTT fields of any other nodes in the tree
+    - Pathstring values (where applicable) are not updated
+    - Each affected tree is marked for rebuild (once) when the context exits
+
+    The MPTT fields of the affected nodes are not valid until the trees have been rebuilt,
+    so tree queries (e.g. get_descendants) cannot be relied upon within this context.
+    Deleting a node within this context rebuilds the affected trees (of that model) first.
+
+    Models which are not tree models are ignored. Nested contexts are supported.
+
+    Example:
+        with deferred_tree_updates(StockLocation):
+            for location in locations:
+                location.parent = target
+                location.save()
+    """
+    deferred = _deferred.get()
+    token = None
+
+    if deferred is None:
+        deferred = {}
+        token = _deferred.set(deferred)
+
+    models = {
+        model._meta.label_lower: model
+        for model in models
+        if is_tree_model(model) and model._meta.label_lower not in deferred
+    }
+
+    def mark_deferred():
+        # Only the models added by *this* context are marked on exit
+        for label, model in models.items():
+            mark_trees(model, deferred.pop(label, set()))
+
+    try:
+        for label in models:
+            deferred[label] = set()
+
+        yield
+    except BaseException:
+        # Nodes saved before the failure may have been committed, so the trees are
+        # still marked (unless the transaction is no longer usable)
+        with suppress(DatabaseError):
+            mark_deferred()
+
+        raise
+    else:
+        mark_deferred()
+    finally:
+        if token is not None:
+            _deferred.reset(token)
+
+
+def mark_trees(model, tree_ids) -> bool:
+    """Mark the specified trees as requiring a rebuild, and schedule a rebuild pass.
+
+    If MPTT updates are deferred for the model (see deferred_tree_updates),
+    the trees are instead marked when the deferred_tree_updates context exits.
+
+    Arguments:
+        model: The tree model class
+        tree_ids: The IDs of the trees which require a rebuild
+
+    Returns:
+        bool: True if the rebuild pass was performed synchronously (in the calling thread)
+    """
+    from common.models import TreeRebuild
+    from InvenTree.tasks import offload_task
+
+    tree_ids = {tree_id for tree_id in tree_ids if tree_id}
+
+    if not tree_ids:
+        return False
+
+    label = model._meta.label_lower
+
+    if is_deferred(model):
+        _deferred.get()[label].update(tree_ids)
+        return False
+
+    TreeRebuild.mark(label, tree_ids)
+
+    # Identical queued tasks are skipped, so at most one rebuild pass is queued
+    return offload_task('InvenTree.tasks.rebuild_pending_trees') is True
+
+
+def rebuild_deferred_trees(model) -> None:
+    """Immediately rebuild any trees (for the provided model) which are waiting for a deferred rebuild."""
+    if (deferred := _deferred.get()) is None or not (
+        tree_ids := deferred.get(model._meta.label_lower)
+    ):
+        return
+
+    rebuild_trees(model, sorted(tree_ids))
+    tree_ids.clear()
+
+
+def rebuild_trees(model, tree_ids) -> set[int]:
+    """Rebuild the tree structure (and pathstring values) for the specified trees.
+
+    Returns:
+        The IDs of all trees which were rebuilt (including any trees created by a repair)
+    """
+    from InvenTree.models import PathStringMixin
+
+    with transaction.atomic():
+        trees = model.rebuild_trees(tree_ids)
+
+        if trees and issubclass(model, PathStringMixin):
+            model.rebuild_tree_pathstring_values(trees)
+
+    return trees
+
+
+def rebuild_pending_trees() -> int:
+    """Rebuild all trees which are marked as pending, in a single pass.
+
+    Returns:
+        The number of trees which were rebuilt
+    """
+    from common.models import TreeRebuild
+
+    pending = defaultdict(list)
+
+    for pk, label, tree_id, marked in (
+        TreeRebuild.objects
+        .filter(pending=True)
+        .order_by('model', 'tree_id')
+        .values_list('pk', 'model', 'tree_id', 'marked')
+    ):
+        pending[label].append((pk, tree_id, marked))
+
+    count = 0
+
+    for label, entries in pending.items():
+        try:
+            model = apps.get_model(label)
+        except (LookupError, ValueError):
+            model = None
+
+        if not is_tree_model(model):
+            logger.warning("rebuild_pending_trees: '%s' is not a tree model", label)
+            TreeRebuild.objects.filter(model=label).delete()
+            continue
+
+        t_start = time.perf_counter()
+
+        for pk, tree_id, marked in entries:
+            t_tree = time.perf_counter()
+
+            if rebuild_trees(model, [tree_id]):
+                duration = time.perf_counter() - t_tree
+                count += 1
+            else:
+                # The tree no longer exists
+                duration = None
+
+            TreeRebuild.complete(pk, marked, duration)
+
+        logger.info(
+            'Rebuilt %s trees for %s in %.3fs',
+            len(entries),
+            label,
+            time.perf_counter() - t_start,
+        )
+
+    return count
@@ -194,15 +194,29 @@ def findOffloadedTask(
     return task
 
 
+def activateEventPlugin(slug: str = 'sampleevent'):
+    """Activate an event plugin, so that triggered events are offloaded in tests.
+
+    Events are only offloaded to the background worker if an active plugin subscribes
+    to them - the 'sampleevent' plugin subscribes to all events.
+    """
+    from plugin.registry import registry
+
+    registry.set_plugin_state(slug, True)
+
+
 def findOffloadedEvent(
     event_name: str,
     clear_after: bool = False,
     reverse: bool = False,
     matching_kwargs=None,
 ):
-    """Find an offloaded event in the background worker queue."""
+    """Find an offloaded event in the background worker queue.
+
+    Note: Events are only offloaded if an active plugin subscribes to them.
+    """
     return findOffloadedTask(
-        'plugin.base.event.events.register_event',
+        'plugin.base.event.events.process_event',
         matching_args=[str(event_name)],
         matching_kwargs=matching_kwargs,
         clear_after=clear_after,
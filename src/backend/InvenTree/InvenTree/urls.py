@@ -35,6 +35,7 @@ from web.urls import urlpatterns as platform_urls
 from .api import (
     APISearchView,
     InfoView,
+    InstrumentationView,
     LicenseView,
     NotFoundView,
     VersionTextView,
@@ -97,6 +98,7 @@ apipatterns = [
         'version-text', VersionTextView.as_view(), name='api-version-text'
     ),  # version text
     path('version/', VersionView.as_view(), name='api-version'),  # version info
+    path('instrumentation/', InstrumentationView.as_view(), name='api-instrumentation'),
     path('', InfoView.as_view(), name='api-inventree-info'),  # server info
     # Auth API endpoints
     path(
@@ -0,0 +1,438 @@
+"""Set-based auto-allocation engine for build orders.
+
+Auto-allocating stock against a build order previously required a separate set of
+queries for each BuildLine (and, for tracked items, for each build output):
+valid part lookups, location tree queries and Python-side stock filtering.
+
+Instead, the BuildAllocationEngine class:
+
+- Loads the part trees for every referenced part with a single query
+- Loads the candidate stock items for *all* lines in a single query
+- Resolves the outstanding allocated quantity for all candidates in bulk
+- Solves the allocation in memory, decrementing available stock as it is allocated
+- Writes the new BuildItem objects with bulk_create (unless a dry-run is requested)
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+from django.db.models import F, Q
+
+import structlog
+
+import part.models
+import stock.models
+from build.filters import annotate_allocated_quantity, annotate_required_quantity
+from build.models import Build, BuildItem, BuildLine
+from part.pricing import PartTreeIndex
+from stock.status_codes import StockStatusGroups
+
+logger = structlog.get_logger('inventree')
+
+# Allocation priority for a candidate stock item, based on how it matches the BOM line
+PRIORITY_DIRECT = 1
+PRIORITY_VARIANT = 2
+PRIORITY_SUBSTITUTE = 3
+
+
+class BuildAllocationEngine:
+    """Bulk auto-allocation of stock items against a build order.
+
+    Allocations are first calculated in memory (see allocate_untracked and allocate_tracked),
+    and are only written to the database when save() is called.
+
+    Example:
+        engine = BuildAllocationEngine(build, interchangeable=True)
+        engine.allocate_untracked()
+        engine.save()
+    """
+
+    def __init__(
+        self,
+        build: Build,
+        location: Optional[stock.models.StockLocation] = None,
+        exclude_location: Optional[stock.models.StockLocation] = None,
+        interchangeable: bool = False,
+        substitutes: bool = True,
+        optional_items: bool = False,
+        stock_sort_by: str = stock.models.STOCK_SORT_DEFAULT,
+        line_ids: Optional[list[int]] = None,
+    ):
+        """Initialize the allocation engine.
+
+        Arguments:
+            build: The Build instance to allocate stock against
+            location: Only allocate stock from this location (and sub-locations)
+            exclude_location: Do not allocate stock from this location (and sub-locations)
+            interchangeable: If True, allocate from multiple stock items for a single line
+            substitutes: If True, allow allocation of substitute parts
+            optional_items: If True, allocate stock against optional BOM items
+            stock_sort_by: Preferred order in which matching stock items are consumed
+            line_ids: Optional list of BuildLine IDs to limit (untracked) allocation to
+        """
+        self.build = build
+        self.location = location
+        self.exclude_location = exclude_location
+        self.interchangeable = interchangeable
+        self.substitutes = substitutes
+        self.optional_items = optional_items
+        self.stock_sort_by = stock_sort_by
+        self.line_ids = line_ids
+
+        self.tree = PartTreeIndex()
+
+        # Remaining (unallocated) quantity for each candidate stock item
+        self.available: dict[int, Decimal] = {}
+
+        # New allocations (not yet committed to the database)
+        self.allocations: list[BuildItem] = []
+
+    def get_lines(self, tracked: bool) -> list[BuildLine]:
+        """Return the BuildLine objects which are eligible for auto-allocation.
+
+        Each line is annotated with the 'allocated' and 'required' quantities.
+        """
+        lines = (
+            self.build.build_lines
+            .filter(
+                part.models.BomItem.consumable_filter(
+                    consumable=False, prefix='bom_item__'
+                ),
+                bom_item__sub_part__trackable=tracked,
+            )
+            .select_related('bom_item', 'bom_item__sub_part')
+            .prefetch_related('bom_item__substitutes')
+        )
+
+        if not self.optional_items:
+            lines = lines.filter(bom_item__optional=False)
+
+        if tracked:
+            lines = lines.filter(bom_item__sub_part__virtual=False)
+        elif self.line_ids:
+            lines = lines.filter(pk__in=self.line_ids)
+
+        lines = lines.annotate(
+            allocated=annotate_allocated_quantity(),
+            required=annotate_required_quantity(),
+        )
+
+        return list(lines)
+
+    def get_valid_parts(self, line: BuildLine) -> dict[int, int]:
+        """Return the parts which can be allocated against a BuildLine.
+
+        Mirrors BomItem.get_valid_parts_for_allocation(), using the in-memory part tree.
+
+        Returns:
+            A {part_id: priority} dict, where priority indicates the type of match
+        """
+        bom_item = line.bom_item
+        sub_part = bom_item.sub_part
+
+        parts = {sub_part.pk: PRIORITY_DIRECT}
+
+        if bom_item.allow_variants:
+            for pk in self.tree.descendants(sub_part.pk):
+                parts.setdefault(pk, PRIORITY_VARIANT)
+
+        if self.substitutes:
+            for sub in bom_item.substitutes.all():
+                parts.setdefault(sub.part_id, PRIORITY_SUBSTITUTE)
+
+                if bom_item.allow_variants:
+                    for pk in self.tree.descendants(sub.part_id):
+                        parts.setdefault(pk, PRIORITY_SUBSTITUTE)
+
+        valid_parts = {}
+
+        for pk, priority in parts.items():
+            row = self.tree.get(pk)
+
+            if row is None or not row['active']:
+                continue
+
+            # Trackable status must be the same as the sub_part
+            if row['trackable'] != sub_part.trackable:
+                continue
+
+            valid_parts[pk] = priority
+
+        return valid_parts
+
+    def load_parts(self, lines: list[BuildLine]) -> dict[int, dict[int, int]]:
+        """Load the part trees for the provided lines, and return the valid parts for each line."""
+        pks = set()
+
+        for line in lines:
+            pks.add(line.bom_item.sub_part_id)
+
+            if self.substitutes:
+                pks.update(sub.part_id for sub in line.bom_item.substitutes.all())
+
+        self.tree.load(pks)
+
+        return {line.pk: self.get_valid_parts(line) for line in lines}
+
+    def filter_location(self, queryset):
+        """Apply the location include / exclude filters to a StockItem queryset.
+
+        Location trees are filtered via a subquery, rather than a separate lookup.
+        """
+        if self.location:
+            queryset = queryset.filter(
+                location__in=self.location.get_descendants(include_self=True)
+            )
+
+        if self.exclude_location:
+            queryset = queryset.exclude(
+                location__in=self.exclude_location.get_descendants(include_self=True)
+            )
+
+        return queryset
+
+    def load_available(self, items) -> None:
+        """Calculate the available (unallocated) quantity for the provided stock items."""
+        items = [item for item in items if item.pk not in self.available]
+
+        allocated = stock.models.StockItem.bulk_allocation_count(items)
+
+        for item in items:
+            self.available[item.pk] = max(
+                item.quantity - allocated.get(item.pk, Decimal(0)), Decimal(0)
+            )
+
+    def allocate(
+        self,
+        line: BuildLine,
+        stock_item: stock.models.StockItem,
+        quantity: Decimal,
+        output: Optional[stock.models.StockItem] = None,
+    ) -> None:
+        """Record a new allocation, and reduce the available quantity of the stock item."""
+        self.available[stock_item.pk] -= quantity
+
+        self.allocations.append(
+            BuildItem(
+                build_line=line,
+                stock_item=stock_item,
+                quantity=quantity,
+                install_into=output,
+            )
+        )
+
+    def allocate_untracked(self) -> list[BuildItem]:
+        """Allocate untracked stock items against the build order.
+
+        The following rules are applied (see Build.auto_allocate_untracked_stock):
+
+        - Only "untracked" BOM items are considered
+        - Lines which are already fully allocated are skipped
+        - Serialized stock items are not allocated
+        - Stock is allocated in priority order: direct parts, variants, then substitutes
+        - Multiple stock items are only used if they are marked as interchangeable
+
+        Returns:
+            A list of the new (unsaved) BuildItem objects
+        """
+        lines = [
+            line
+            for line in self.get_lines(tracked=False)
+            if line.required > line.allocated
+        ]
+
+        if not lines:
+            return []
+
+        valid_parts = self.load_parts(lines)
+
+        part_ids = set()
+
+        for parts in valid_parts.values():
+            part_ids.update(parts.keys())
+
+        # Fetch all candidate stock items with a single query
+        items = stock.models.StockItem.objects.filter(
+            stock.models.StockItem.IN_STOCK_FILTER,
+            Q(serial=None) | Q(serial=''),
+            part__in=part_ids,
+            part__active=True,
+            part__virtual=False,
+        )
+
+        items = self.filter_location(items)
+
+        if self.stock_sort_by == stock.models.StockSortOrder.EXPIRY_SOONEST:
+            items = items.order_by(F('expiry_date').asc(nulls_last=True), 'pk')
+        else:
+            items = items.order_by(self.stock_sort_by, 'pk')
+
+        items = list(items)
+
+        self.load_available(items)
+
+        # Map each part to its stock items, retaining the queryset ordering
+        stock_by_part = {}
+
+        for idx, item in enumerate(items):
+            stock_by_part.setdefault(item.part_id, []).append((idx, item))
+
+        for line in lines:
+            parts = valid_parts[line.pk]
+
+            candidates = []
+
+            for pk, priority in parts.items():
+                for idx, item in stock_by_part.get(pk, []):
+                    candidates.append((priority, idx, item))
+
+            if len(candidates) != 1 and not self.interchangeable:
+                # Multiple stock items are available, but they are not interchangeable -
+                # the user must manually decide how to allocate them.
+                continue
+
+            # Direct part matches first, then variants, then substitutes.
+            # Within each group, the requested stock ordering is retained.
+            candidates.sort(key=lambda c: (c[0], c[1]))
+
+            remaining = line.required - line.allocated
+
+            for _priority, _idx, item in candidates:
+                quantity = min(remaining, self.available[item.pk])
+
+                if quantity > 0:
+                    self.allocate(line, item, quantity)
+                    remaining -= quantity
+
+                if remaining <= 0:
+                    break
+
+        return self.allocations
+
+    def allocate_tracked(self, outputs=None) -> list[BuildItem]:
+        """Allocate tracked stock items against serialized build outputs.
+
+        A tracked stock item is allocated against a build output if it is the only
+        available stock item which matches the serial number of that output.
+
+        Arguments:
+            outputs: Optional list of build outputs (default = all incomplete outputs)
+
+        Returns:
+            A list of the new (unsaved) BuildItem objects
+        """
+        if outputs is None:
+            outputs = self.build.incomplete_outputs.all()
+
+        outputs = [output for output in outputs if output.serialized]
+
+        if not outputs:
+            return []
+
+        lines = [
+            line
+            for line in self.get_lines(tracked=True)
+            if line.required > line.allocated
+        ]
+
+        if not lines:
+            return []
+
+        valid_parts = self.load_parts(lines)
+
+        part_ids = set()
+
+        for parts in valid_parts.values():
+            part_ids.update(parts.keys())
+
+        # Fetch all candidate stock items with a single query
+        # Note that we can accept "in production" items here
+        items = stock.models.StockItem.objects.filter(
+            quantity__gt=0,
+            sales_order=None,
+            belongs_to=None,
+            customer=None,
+            consumed_by=None,
+            status__in=StockStatusGroups.AVAILABLE_CODES,
+            part__in=part_ids,
+            part__active=True,
+            part__virtual=False,
+            serial__in={output.serial for output in outputs},
+        )
+
+        items = list(self.filter_location(items))
+
+        self.load_available(items)
+
+        stock_by_serial = {}
+
+        for item in items:
+            stock_by_serial.setdefault((item.part_id, item.serial), []).append(item)
+
+        # Existing allocations against each (line, output) pair
+        existing = set(
+            BuildItem.objects.filter(
+                build_line__in=lines, install_into__in=outputs
+            ).values_list('build_line', 'install_into')
+        )
+
+        for output in outputs:
+            for line in lines:
+                if line.allocated >= line.required:
+                    continue
+
+                # If there is already allocated stock against this build output, skip it
+                if (line.pk, output.pk) in existing:
+                    continue
+
+                candidates = []
+
+                for pk in valid_parts[line.pk]:
+                    candidates.extend(stock_by_serial.get((pk, output.serial), []))
+
+                if len(candidates) != 1:
+                    continue
+
+                item = candidates[0]
+
+                if self.available[item.pk] < 1:
+                    continue
+
+                self.allocate(line, item, Decimal(1), output=output)
+                line.allocated += 1
+
+        return self.allocations
+
+    def plan(self) -> list[dict]:
+        """Return the proposed allocations as a list of dicts."""
+        return [
+            {
+                'build_line': item.build_line.pk,
+                'bom_item': item.build_line.bom_item_id,
+                'stock_item': item.stock_item.pk,
+                'part': item.stock_item.part_id,
+                'location': item.stock_item.location_id,
+                'install_into': item.install_into.pk if item.install_into else None,
+                'quantity': item.quantity,
+            }
+            for item in self.allocations
+        ]
+
+    def save(self) -> list[BuildItem]:
+        """Write the proposed allocations to the database."""
+        from part.availability import schedule_availability_update
+
+        BuildItem.objects.bulk_create(self.allocations, batch_size=250)
+
+        # bulk_create does not send post_save signals
+        schedule_availability_update({
+            item.stock_item.part_id for item in self.allocations
+        })
+
+        logger.info(
+            'Auto-allocated %s stock items against build %s',
+            len(self.allocations),
+            self.build.pk,
+        )
+
+        return self.allocations
@@ -10,7 +10,11 @@ from django.utils.translation import gettext_lazy as _
 
 import django_filters.rest_framework.filters as rest_filters
 from django_filters.rest_framework.filterset import FilterSet
-from drf_spectacular.utils import extend_schema, extend_schema_field
+from drf_spectacular.utils import (
+    PolymorphicProxySerializer,
+    extend_schema,
+    extend_schema_field,
+)
 from rest_framework import serializers, status
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
@@ -934,36 +938,61 @@ class BuildAutoAllocate(BuildOrderContextMixin, CreateAPI):
     queryset = Build.objects.none()
     serializer_class = build.serializers.BuildAutoAllocationSerializer
 
-    @extend_schema(responses={200: common.serializers.TaskDetailSerializer})
+    @extend_schema(
+        responses={
+            200: PolymorphicProxySerializer(
+                component_name='BuildAutoAllocateResponse',
+                serializers=[
+                    common.serializers.TaskDetailSerializer,
+                    build.serializers.BuildAutoAllocationPlanSerializer(many=True),
+                ],
+                resource_type_field_name=None,
+            )
+        }
+    )
     def post(self, *args, **kwargs):
         """Override the POST method to handle auto allocation task.
 
         As this is offloaded to the background task,
         we return information about the background task which is performing the auto allocation operation.
+
+        If 'dry_run' is specified, the allocation is calculated immediately,
+        and the proposed allocations are returned (without allocating any stock).
         """
         from build.tasks import auto_allocate_build
         from InvenTree.tasks import offload_task
 
-        build = self.get_build()
+        build_order = self.get_build()
         serializer = self.get_serializer(data=self.request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
         build_lines = data.get('build_lines', [])
 
+        allocation_kwargs = {
+            'location': data.get('location', None),
+            'exclude_location': data.get('exclude_location', None),
+            'interchangeable': data['interchangeable'],
+            'substitutes': data['substitutes'],
+            'optional_items': data['optional_items'],
+            'item_type': data.get('item_type', 'untracked'),
+            'stock_sort_by': data['stock_sort_by'],
+            'line_ids': [line.pk for line in build_lines] if build_lines else None,
+        }
+
+        if data.get('dry_run', False):
+            plan = build_order.auto_allocate_stock(dry_run=True, **allocation_kwargs)
+
+            return Response(
+                build.serializers.BuildAutoAllocationPlanSerializer(
+                    plan, many=True
+                ).data,
+                status=status.HTTP_200_OK,
+            )
+
         # Offload the task to the background worker
         task_id = offload_task(
-            auto_allocate_build,
-            build.pk,
-            location=data.get('location', None),
-            exclude_location=data.get('exclude_location', None),
-            interchangeable=data['interchangeable'],
-            substitutes=data['substitutes'],
-            optional_items=data['optional_items'],
-            item_type=data.get('item_type', 'untracked'),
-            stock_sort_by=data['stock_sort_by'],
-            line_ids=[line.pk for line in build_lines] if build_lines else None,
-            group='build',
+            auto_allocate_build, build_order.pk, **allocation_kwargs, group='build'
         )
 
         response = common.serializers.TaskDetailSerializer.from_task(task_id).data
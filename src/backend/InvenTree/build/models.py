@@ -18,7 +18,6 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from mptt.models import TreeForeignKey
-from rest_framework import serializers
 
 import generic.states
 import InvenTree.fields
@@ -1108,15 +1107,6 @@ class Build(
         Returns:
             A QuerySet of the created output (StockItem) objects.
         """
-        trackable_parts = self.part.get_trackable_parts()
-
-        # Create (and cache) a map of valid parts for allocation
-        valid_parts = {}
-
-        for bom_item in trackable_parts:
-            parts = bom_item.get_valid_parts_for_allocation()
-            valid_parts[bom_item.pk] = [part.pk for part in parts]
-
         user = kwargs.get('user')
         batch = kwargs.get('batch', self.batch)
         location = kwargs.get('location')
@@ -1139,7 +1129,6 @@ class Build(
 
             # Create tracking entries for each item
             tracking = []
-            allocations = []
 
             outputs = stock.models.StockItem._create_serial_numbers(
                 serials,
@@ -1166,18 +1155,16 @@ class Build(
                 ):
                     tracking.append(entry)
 
-                # Auto-allocate stock based on serial number
-                if auto_allocate:
-                    if new_allocations := self.auto_allocate_tracked_output(
-                        output, location=self.take_from
-                    ):
-                        allocations.extend(new_allocations)
-
             # Bulk create tracking entries
             stock.models.StockItemTracking.objects.bulk_create(tracking, batch_size=250)
 
-            # Generate stock allocations
-            BuildItem.objects.bulk_create(allocations, batch_size=250)
+            # Auto-allocate stock based on serial number (for all outputs at once)
+            if auto_allocate:
+                from build.allocation import BuildAllocationEngine
+
+                engine = BuildAllocationEngine(self, location=self.take_from)
+                engine.allocate_tracked(outputs)
+                engine.save()
 
         else:
             """Create a single build output of the given quantity."""
@@ -1626,109 +1613,52 @@ class Build(
 
     @transaction.atomic
     def auto_allocate_stock(
-        self, item_type: str = BuildItemTypes.UNTRACKED, **kwargs
-    ) -> None:
+        self, item_type: str = BuildItemTypes.UNTRACKED, dry_run: bool = False, **kwargs
+    ) -> list:
         """Automatically allocate stock items against this build order.
 
+        Candidate stock for all lines is loaded in bulk, and the allocation is solved in memory
+        (see build.allocation.BuildAllocationEngine).
+
         Arguments:
             item_type: The type of BuildItem to allocate (default = untracked)
-        """
-        if item_type in [self.BuildItemTypes.UNTRACKED, self.BuildItemTypes.ALL]:
-            self.auto_allocate_untracked_stock(**kwargs)
-
-        if item_type in [self.BuildItemTypes.TRACKED, self.BuildItemTypes.ALL]:
-            self.auto_allocate_tracked_stock(**kwargs)
+            dry_run: If True, return the proposed allocations without saving them
 
-    def auto_allocate_tracked_output(self, output, **kwargs):
-        """Auto-allocate tracked stock items against a particular build output.
-
-        This may occur at the time of build output creation, or later when triggered manually.
+        Returns:
+            A list of the proposed allocations (as dicts)
         """
-        location = kwargs.get('location')
-        exclude_location = kwargs.get('exclude_location')
-        substitutes = kwargs.get('substitutes', True)
-        optional_items = kwargs.get('optional_items', False)
-
-        # Newly created allocations (not yet committed to the database)
-        allocations = []
-
-        # Return early if the output should not be auto-allocated
-        if not output.serialized:
-            return allocations
-
-        tracked_line_items = self.tracked_line_items.filter(
-            part.models.BomItem.consumable_filter(
-                consumable=False, prefix='bom_item__'
-            ),
-            bom_item__sub_part__virtual=False,
-        )
+        from build.allocation import BuildAllocationEngine
 
-        for line_item in tracked_line_items:
-            bom_item = line_item.bom_item
+        if not dry_run:
+            # Serialize against other allocation requests for this build
+            Build.objects.select_for_update().get(pk=self.pk)
 
-            if bom_item.is_consumable:
-                # Do not auto-allocate stock to consumable BOM items
-                continue
+        engine = BuildAllocationEngine(self, **kwargs)
 
-            if bom_item.optional and not optional_items:
-                # User has specified that optional_items are to be ignored
-                continue
+        if item_type in [self.BuildItemTypes.UNTRACKED, self.BuildItemTypes.ALL]:
+            engine.allocate_untracked()
 
-            # If the line item is already fully allocated, we can continue
-            if line_item.is_fully_allocated():
-                continue
+        if item_type in [self.BuildItemTypes.TRACKED, self.BuildItemTypes.ALL]:
+            engine.allocate_tracked()
 
-            # If there is already allocated stock against this build output, skip it
-            if line_item.allocated_quantity(output=output) > 0:
-                continue
+        if not dry_run:
+            engine.save()
 
-            # Find available parts (may include variants and substitutes)
-            available_parts = bom_item.get_valid_parts_for_allocation(
-                allow_variants=True, allow_substitutes=substitutes
-            )
+        return engine.plan()
 
-            # Find stock items which match the output serial number
-            available_stock = stock.models.StockItem.objects.filter(
-                part__in=list(available_parts),
-                part__active=True,
-                part__virtual=False,
-                serial=output.serial,
-            ).exclude(Q(serial=None) | Q(serial=''))
-
-            if location:
-                # Filter only stock items located "below" the specified location
-                sublocations = location.get_descendants(include_self=True)
-                available_stock = available_stock.filter(
-                    location__in=list(sublocations)
-                )
+    def auto_allocate_tracked_output(self, output, **kwargs):
+        """Auto-allocate tracked stock items against a particular build output.
 
-            if exclude_location:
-                # Exclude any stock items from the provided location
-                sublocations = exclude_location.get_descendants(include_self=True)
-                available_stock = available_stock.exclude(
-                    location__in=list(sublocations)
-                )
+        This may occur at the time of build output creation, or later when triggered manually.
 
-            # Filter stock items to only those which are in stock
-            # Note that we can accept "in production" items here
-            available_items = list(
-                filter(
-                    lambda item: item.is_in_stock(check_in_production=False),
-                    available_stock,
-                )
-            )
+        Returns:
+            A list of new BuildItem objects (not yet committed to the database)
+        """
+        from build.allocation import BuildAllocationEngine
 
-            if len(available_items) == 1:
-                allocations.append(
-                    BuildItem(
-                        build_line=line_item,
-                        stock_item=available_items[0],
-                        quantity=1,
-                        install_into=output,
-                    )
-                )
+        engine = BuildAllocationEngine(self, **kwargs)
 
-        return allocations
+        return engine.allocate_tracked([output])
 
     def auto_allocate_tracked_stock(self, **kwargs):
         """Automatically allocate tracked stock items against serialized build outputs.
@@ -1740,14 +1670,11 @@ class Build(
         - Only build outputs with serial numbers are considered
         - Unallocated tracked components are allocated against build outputs with matching serial numbers
         """
-        new_items = []
+        from build.allocation import BuildAllocationEngine
 
-        # Select only "tracked" line items
-        for output in self.incomplete_outputs.all():
-            new_items.extend(self.auto_allocate_tracked_output(output, **kwargs))
-
-        # Bulk-create the new BuildItem objects
-        BuildItem.objects.bulk_create(new_items, batch_size=250)
+        engine = BuildAllocationEngine(self, **kwargs)
+        engine.allocate_tracked()
+        engine.save()
 
     def auto_allocate_untracked_stock(self, **kwargs):
         """Automatically allocate untracked stock items against this build order.
@@ -1764,186 +1691,11 @@ class Build(
         - If multiple stock items are found, we *may* be able to allocate:
             - If the calling function has specified that items are interchangeable
         """
-        location = kwargs.get('location')
-        exclude_location = kwargs.get('exclude_location')
-        interchangeable = kwargs.get('interchangeable', False)
-        substitutes = kwargs.get('substitutes', True)
-        optional_items = kwargs.get('optional_items', False)
-        stock_sort_by = kwargs.get('stock_sort_by', stock.models.STOCK_SORT_DEFAULT)
-        line_ids = kwargs.get('line_ids')
-
-        def stock_sort(item, bom_item, variant_parts):
-            if item.part == bom_item.sub_part:
-                return 1
-            elif item.part in variant_parts:
-                return 2
-            return 3
-
-        # Select only "untracked" line items
-        untracked_lines = self.untracked_line_items.all()
-
-        if line_ids:
-            untracked_lines = untracked_lines.filter(pk__in=line_ids)
-
-        untracked_lines = untracked_lines.select_related(
-            'bom_item', 'bom_item__sub_part'
-        ).prefetch_related('bom_item__substitutes__part')
-
-        # Pre-compute the outstanding (unallocated) quantity for every line in a single
-        # query, instead of one aggregate query per line via BuildLine.unallocated_quantity()
-        untracked_lines = untracked_lines.annotate(
-            allocated=annotate_allocated_quantity(),
-            required=annotate_required_quantity(),
-        )
-
-        # First pass: resolve the candidate stock items for each line. We defer the actual
-        # allocation quantity math until every candidate stock item's outstanding allocated
-        # quantity can be resolved in a single bulk query (see below), rather than querying
-        # it (x3) per stock item as each line is processed.
-        line_data = []
-        candidate_stock = {}
-
-        for line_item in untracked_lines:
-            # Find the referenced BomItem
-            bom_item = line_item.bom_item
-
-            if bom_item.is_consumable:
-                # Do not auto-allocate stock to consumable BOM items
-                continue
-
-            if bom_item.optional and not optional_items:
-                # User has specified that optional_items are to be ignored
-                continue
-
-            unallocated_quantity = max(line_item.required - line_item.allocated, 0)
-
-            if unallocated_quantity <= 0:
-                # This BomItem is fully allocated, we can continue
-                continue
-
-            variant_parts = (
-                list(bom_item.sub_part.get_descendants(include_self=False))
-                if bom_item.allow_variants
-                else []
-            )
-
-            # Check which parts we can "use" (may include variants and substitutes)
-            available_parts = bom_item.get_valid_parts_for_allocation(
-                allow_variants=True,
-                allow_inactive=False,
-                allow_substitutes=substitutes,
-                variant_parts=variant_parts,
-            )
-
-            # Look for available stock items
-            # select_related('part') avoids a per-item query in the stock_sort() key
-            # function below, which inspects item.part for every candidate.
-            available_stock = stock.models.StockItem.objects.select_related(
-                'part'
-            ).filter(stock.models.StockItem.IN_STOCK_FILTER)
-
-            # Filter by list of available parts
-            available_stock = available_stock.filter(part__in=list(available_parts))
-
-            # Ensure part is active and not virtual
-            available_stock = available_stock.filter(
-                part__active=True, part__virtual=False
-            )
-
-            # Filter out "serialized" stock items, these cannot be auto-allocated
-            available_stock = available_stock.filter(
-                Q(serial=None) | Q(serial='')
-            ).distinct()
-
-            if location:
-                # Filter only stock items located "below" the specified location
-                sublocations = location.get_descendants(include_self=True)
-                available_stock = available_stock.filter(
-                    location__in=list(sublocations)
-                )
-
-            if exclude_location:
-                # Exclude any stock items from the provided location
-                sublocations = exclude_location.get_descendants(include_self=True)
-                available_stock = available_stock.exclude(
-                    location__in=list(sublocations)
-                )
-
-            # Apply secondary ORM ordering before the Python match-quality stable-sort.
-            if stock_sort_by == stock.models.StockSortOrder.EXPIRY_SOONEST:
-                available_stock = available_stock.order_by(
-                    F('expiry_date').asc(nulls_last=True)
-                )
-            else:
-                available_stock = available_stock.order_by(stock_sort_by)
-
-            """
-            Next, we sort the available stock items with the following priority:
-            1. Direct part matches (+1)
-            2. Variant part matches (+2)
-            3. Substitute part matches (+3)
-
-            This ensures that allocation priority is first given to "direct" parts.
-            Python's stable sort preserves the secondary ORM ordering within each group.
-            """
-            available_stock = sorted(
-                available_stock,
-                key=lambda item, b=bom_item, v=variant_parts: stock_sort(item, b, v),
-            )
-
-            if len(available_stock) != 1 and not interchangeable:
-                # Multiple stock items are available, but they are not interchangeable -
-                # the user must manually decide how to allocate them.
-                continue
-
-            for stock_item in available_stock:
-                candidate_stock[stock_item.pk] = stock_item
-
-            line_data.append((line_item, unallocated_quantity, available_stock))
-
-        # Bulk-resolve the outstanding allocated quantity for every candidate stock item
-        # identified above, in a fixed number of queries rather than 3 queries per item.
-        allocated_by_pk = stock.models.StockItem.bulk_allocation_count(
-            candidate_stock.values()
-        )
-
-        new_items = []
-
-        for line_item, unallocated_quantity, available_stock in line_data:
-            # Either there is only a single stock item available, or all items are
-            # "interchangeable" and we don't care where we take stock from
-            for stock_item in available_stock:
-                # How much of the stock item is "available" for allocation?
-                stock_unallocated = max(
-                    stock_item.quantity - allocated_by_pk.get(stock_item.pk, 0), 0
-                )
-                quantity = min(unallocated_quantity, stock_unallocated)
-
-                if quantity > 0:
-                    try:
-                        new_items.append(
-                            BuildItem(
-                                build_line=line_item,
-                                stock_item=stock_item,
-                                quantity=quantity,
-                            )
-                        )
-
-                        # Subtract the required quantity
-                        unallocated_quantity -= quantity
-
-                    except (ValidationError, serializers.ValidationError) as exc:
-                        # Re-raise with a Django-compatible validation payload
-                        raise ValidationError(
-                            serializers.as_serializer_error(exc)
-                        ) from exc
-
-                if unallocated_quantity <= 0:
-                    # We have now fully-allocated this BomItem - no need to continue!
-                    break
+        from build.allocation import BuildAllocationEngine
 
-        # Bulk-create the new BuildItem objects
-        BuildItem.objects.bulk_create(new_items, batch_size=250)
+        engine = BuildAllocationEngine(self, **kwargs)
+        engine.allocate_untracked()
+        engine.save()
 
     def unallocated_lines(self, tracked: Optional[bool] = None) -> QuerySet:
         """Returns a list of BuildLine objects which have not been fully allocated."""
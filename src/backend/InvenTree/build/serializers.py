@@ -443,9 +443,7 @@ class BuildOutputCreateSerializer(serializers.Serializer):
 
         if serial_numbers:
             try:
-                self.serials = InvenTree.helpers.extract_serial_numbers(
-                    serial_numbers, quantity, part.get_latest_serial_number(), part=part
-                )
+                self.serials = part.extract_serial_numbers(serial_numbers, quantity)
             except DjangoValidationError as e:
                 raise ValidationError({'serial_numbers': e.messages})
 
@@ -468,14 +466,25 @@ class BuildOutputCreateSerializer(serializers.Serializer):
         request = self.context.get('request')
         build = self.get_build()
 
-        return build.create_build_output(
-            data['quantity'],
-            serials=self.serials,
-            batch=data.get('batch_code', ''),
-            location=data.get('location', None),
-            auto_allocate=data.get('auto_allocate', False),
-            user=request.user if request else None,
-        )
+        serials = self.serials
+        serial_numbers = data.get('serial_numbers', '')
+
+        with transaction.atomic():
+            if serials and '~' in serial_numbers:
+                # Reserve the "next" serial numbers, so that concurrent requests
+                # cannot be allocated the same serial numbers
+                serials = self.get_part().extract_serial_numbers(
+                    serial_numbers, data['quantity'], reserve=True
+                )
+
+            return build.create_build_output(
+                data['quantity'],
+                serials=serials,
+                batch=data.get('batch_code', ''),
+                location=data.get('location', None),
+                auto_allocate=data.get('auto_allocate', False),
+                user=request.user if request else None,
+            )
 
 
 class BuildOutputDeleteSerializer(serializers.Serializer):
@@ -1120,6 +1129,28 @@ class BuildAutoAllocationSerializer(serializers.Serializer):
         ),
     )
 
+    dry_run = serializers.BooleanField(
+        default=False,
+        label=_('Dry Run'),
+        help_text=_('Return the proposed allocations without allocating any stock'),
+    )
+
+
+class BuildAutoAllocationPlanSerializer(serializers.Serializer):
+    """Serializer for a single proposed allocation returned by a dry-run auto-allocation."""
+
+    build_line = serializers.IntegerField(read_only=True, label=_('Build Line'))
+    bom_item = serializers.IntegerField(read_only=True, label=_('BOM Item'))
+    stock_item = serializers.IntegerField(read_only=True, label=_('Stock Item'))
+    part = serializers.IntegerField(read_only=True, label=_('Part'))
+    location = serializers.IntegerField(
+        read_only=True, allow_null=True, label=_('Location')
+    )
+    install_into = serializers.IntegerField(
+        read_only=True, allow_null=True, label=_('Install Into')
+    )
+    quantity = InvenTreeDecimalField(read_only=True, label=_('Quantity'))
+
 
 class BuildItemSerializer(
     FilterableSerializerMixin, DataImportExportSerializerMixin, InvenTreeModelSerializer
@@ -12,7 +12,7 @@ from rest_framework import status
 from build.models import Build, BuildItem, BuildLine
 from build.status_codes import BuildStatus
 from common.settings import set_global_setting
-from InvenTree.unit_test import InvenTreeAPITestCase
+from InvenTree.unit_test import InvenTreeAPITestCase, activateEventPlugin
 from part.models import BomItem, BomItemSubstitute, Part, PartTestTemplate
 from stock.events import StockEvents
 from stock.models import StockItem, StockItemTracking, StockLocation, StockSortOrder
@@ -1012,6 +1012,18 @@ class BuildAllocationTest(BuildAPITest):
 
         self.assertEqual(N, BuildItem.objects.count())
 
+        # A dry-run returns the proposed allocation, without allocating any stock
+        response = self.post(
+            url, data={'item_type': 'tracked', 'dry_run': True}, expected_code=200
+        )
+
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['stock_item'], c.pk)
+        self.assertEqual(response.data[0]['install_into'], output['pk'])
+        self.assertEqual(float(response.data[0]['quantity']), 1)
+
+        self.assertEqual(N, BuildItem.objects.count())
+
         # Allocate 'tracked' items - this should allocate our tracked item
         self.post(url, data={'item_type': 'tracked'}, expected_code=200)
 
@@ -2352,6 +2364,7 @@ class BuildConsumeTest(BuildAPITest):
         # Enable plugin events, and queue them (rather than firing synchronously),
         # so we can inspect exactly what was queued once the build is finished
         set_global_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         # Start with a fresh slate for the OrmQ queue, so we can inspect exactly what is queued during the build finish
         OrmQ.objects.all().delete()
@@ -2374,12 +2387,12 @@ class BuildConsumeTest(BuildAPITest):
 
         queued_tasks = list(OrmQ.objects.all())
 
-        # register_event tasks queued for StockEvents.ITEM_SPLIT, one per split component
+        # process_event tasks queued for StockEvents.ITEM_SPLIT, one per split component
         split_event_tasks = [
             task
             for task in queued_tasks
-            if task.func() == 'plugin.base.event.events.register_event'
-            and task.args() == (StockEvents.ITEM_SPLIT,)
+            if task.func() == 'plugin.base.event.events.process_event'
+            and task.args() == ('sampleevent', StockEvents.ITEM_SPLIT)
         ]
         self.assertEqual(len(split_event_tasks), N // 2)
 
@@ -2524,6 +2537,7 @@ class BuildConsumeTest(BuildAPITest):
     def test_consume_tracked_allocations(self):
         """Test consuming of tracked allocations against a BuildOrder."""
         set_global_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         tracked_assembly = Part.objects.create(
             name='Tracked Test Assembly',
@@ -2600,8 +2614,8 @@ class BuildConsumeTest(BuildAPITest):
         install_event_tasks = [
             task
             for task in OrmQ.objects.all()
-            if task.func() == 'plugin.base.event.events.register_event'
-            and task.args() == (StockEvents.ITEM_INSTALLED_INTO_ASSEMBLY,)
+            if task.func() == 'plugin.base.event.events.process_event'
+            and task.args() == ('sampleevent', StockEvents.ITEM_INSTALLED_INTO_ASSEMBLY)
         ]
         self.assertEqual(len(install_event_tasks), len(serials))
 
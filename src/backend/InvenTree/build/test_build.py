@@ -27,6 +27,7 @@ from InvenTree import status_codes as status
 from InvenTree.unit_test import (
     InvenTreeAPITestCase,
     InvenTreeTestCase,
+    activateEventPlugin,
     findOffloadedEvent,
 )
 from order.models import PurchaseOrder, PurchaseOrderLineItem
@@ -1000,6 +1001,7 @@ class BuildTest(BuildTestBase):
         from build.events import BuildEvents
 
         set_global_setting('ENABLE_PLUGINS_EVENTS', True)
+        activateEventPlugin()
 
         OrmQ.objects.all().delete()
 
@@ -1145,6 +1147,68 @@ class AutoAllocationTests(BuildTestBase):
         self.assertEqual(self.line_1.unallocated_quantity(), 0)
         self.assertEqual(self.line_2.unallocated_quantity(), 0)
 
+    def test_dry_run(self):
+        """A dry-run should return the proposed allocations, without creating them."""
+        plan = self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True, dry_run=True
+        )
+
+        self.assertEqual(self.build.allocated_stock.count(), 0)
+
+        self.assertEqual(
+            sum(p['quantity'] for p in plan if p['build_line'] == self.line_1.pk), 50
+        )
+        self.assertEqual(
+            sum(p['quantity'] for p in plan if p['build_line'] == self.line_2.pk), 30
+        )
+
+        # Direct part matches are allocated before substitute parts
+        alt_part = self.bom_item_2.substitutes.first().part
+
+        self.assertEqual(
+            [p['part'] for p in plan if p['build_line'] == self.line_2.pk],
+            [self.sub_part_2.pk] * 5 + [alt_part.pk],
+        )
+
+        # Running the allocation for real should create the same allocations
+        allocated = self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True
+        )
+
+        self.assertEqual(plan, allocated)
+        self.assertEqual(self.build.allocated_stock.count(), len(plan))
+
+        for p in plan:
+            self.assertTrue(
+                BuildItem.objects.filter(
+                    build_line=p['build_line'],
+                    stock_item=p['stock_item'],
+                    quantity=p['quantity'],
+                ).exists()
+            )
+
+    def test_shared_stock(self):
+        """Stock shared between multiple lines must not be over-allocated."""
+        # Both lines can now be allocated from the same substitute stock item
+        alt_part = self.bom_item_2.substitutes.first().part
+        BomItemSubstitute.objects.create(bom_item=self.bom_item_1, part=alt_part)
+
+        StockItem.objects.filter(part__in=[self.sub_part_1, self.sub_part_2]).delete()
+
+        alt_item = StockItem.objects.get(part=alt_part)
+        alt_item.quantity = 60
+        alt_item.save()
+
+        self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True
+        )
+
+        # Only 60 units are available, split across both lines
+        self.assertEqual(
+            self.line_1.allocated_quantity() + self.line_2.allocated_quantity(), 60
+        )
+        self.assertEqual(alt_item.build_allocation_count(), 60)
+
     def test_allocate_consumed(self):
         """Test for auto-allocation against a build which has been fully consumed.
 
@@ -1685,6 +1749,7 @@ class BuildTaskTests(BuildTestBase):
         from build.events import BuildEvents
 
         set_global_setting('ENABLE_PLUGINS_EVENTS', True)
+        activateEventPlugin()
         OrmQ.objects.all().delete()
 
         self._setup_complete_build()
@@ -111,6 +111,44 @@ class BarcodeScanResultAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(common.models.BarcodeIndex)
+class BarcodeIndexAdmin(admin.ModelAdmin):
+    """Admin interface for BarcodeIndex objects - read-only lookup table."""
+
+    list_display = ('barcode_hash', 'model_type', 'model_id')
+
+    list_filter = ('model_type',)
+
+    search_fields = ('barcode_hash',)
+
+    def has_add_permission(self, request):
+        """Prevent addition of new BarcodeIndex objects via the admin interface."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Prevent modification of BarcodeIndex objects via the admin interface."""
+        return False
+
+
+@admin.register(common.models.SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    """Admin interface for SearchDocument objects - read-only search index."""
+
+    list_display = ('search_group', 'model_type', 'model_id', 'flags')
+
+    list_filter = ('search_group',)
+
+    search_fields = ('text',)
+
+    def has_add_permission(self, request):
+        """Prevent addition of new SearchDocument objects via the admin interface."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Prevent modification of SearchDocument objects via the admin interface."""
+        return False
+
+
 @admin.register(common.models.ProjectCode)
 class ProjectCodeAdmin(admin.ModelAdmin):
     """Admin settings for ProjectCode."""
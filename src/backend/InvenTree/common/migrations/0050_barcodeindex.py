@@ -0,0 +1,74 @@
+"""Add a single index table for third-party barcodes, and populate it from existing data."""
+
+from django.db import migrations, models
+
+# Models which support linked (third-party) barcodes
+BARCODE_MODELS = [
+    ('build', 'build'),
+    ('company', 'manufacturerpart'),
+    ('company', 'supplierpart'),
+    ('order', 'purchaseorder'),
+    ('order', 'salesorder'),
+    ('order', 'salesordershipment'),
+    ('order', 'returnorder'),
+    ('order', 'transferorder'),
+    ('part', 'part'),
+    ('stock', 'stocklocation'),
+    ('stock', 'stockitem'),
+]
+
+
+def populate_barcode_index(apps, schema_editor):
+    """Create index entries for all objects which have an assigned barcode."""
+    BarcodeIndex = apps.get_model('common', 'barcodeindex')
+
+    n = 0
+
+    for app_label, model_name in BARCODE_MODELS:
+        model = apps.get_model(app_label, model_name)
+
+        model_type = model._meta.model_name
+
+        entries = [
+            BarcodeIndex(barcode_hash=barcode_hash, model_type=model_type, model_id=pk)
+            for pk, barcode_hash in model.objects.exclude(barcode_hash='').values_list(
+                'pk', 'barcode_hash'
+            )
+        ]
+
+        BarcodeIndex.objects.bulk_create(entries, batch_size=1000)
+        n += len(entries)
+
+    if n > 0:
+        print(f"Created {n} barcode index entries")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0049_notificationentry_charfield_uid'),
+        ('build', '0059_build_tags'),
+        ('company', '0080_company_tags'),
+        ('order', '0121_add_line_item_discount'),
+        ('part', '0154_partavailability'),
+        ('stock', '0127_alter_stockitemtestresult_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BarcodeIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('barcode_hash', models.CharField(db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash')),
+                ('model_type', models.CharField(help_text='Model type of the linked object', max_length=100, verbose_name='Model Type')),
+                ('model_id', models.PositiveIntegerField(help_text='ID of the linked object', verbose_name='Model ID')),
+            ],
+            options={
+                'verbose_name': 'Barcode Index',
+                'unique_together': {('model_type', 'model_id')},
+            },
+        ),
+        migrations.RunPython(
+            populate_barcode_index, reverse_code=migrations.RunPython.noop
+        ),
+    ]
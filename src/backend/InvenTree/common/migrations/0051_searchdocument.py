@@ -0,0 +1,73 @@
+"""Add a denormalized search document table for the global search API."""
+
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    """Create a trigram index for the search text (PostgreSQL only).
+
+    This requires the pg_trgm extension, which may not be available to the database user.
+    If the extension cannot be created, the index is skipped (search still works, but slower).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    try:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute('SAVEPOINT search_trigram_index')
+
+            try:
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS common_searchdocument_text_trgm '
+                    'ON common_searchdocument USING gin (text gin_trgm_ops)'
+                )
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS common_searchdocument_notes_trgm '
+                    'ON common_searchdocument USING gin (notes gin_trgm_ops)'
+                )
+                cursor.execute('RELEASE SAVEPOINT search_trigram_index')
+            except Exception:
+                cursor.execute('ROLLBACK TO SAVEPOINT search_trigram_index')
+                raise
+    except Exception as exc:
+        print(f"Could not create trigram search index: {exc}")
+
+
+def remove_trigram_index(apps, schema_editor):
+    """Remove the trigram index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP INDEX IF EXISTS common_searchdocument_text_trgm')
+        cursor.execute('DROP INDEX IF EXISTS common_searchdocument_notes_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0050_barcodeindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('search_group', models.CharField(db_index=True, help_text='Search group for this document', max_length=50, verbose_name='Search Group')),
+                ('model_type', models.CharField(help_text='Model type of the linked object', max_length=100, verbose_name='Model Type')),
+                ('model_id', models.PositiveIntegerField(help_text='ID of the linked object', verbose_name='Model ID')),
+                ('text', models.TextField(blank=True, help_text='Searchable text', verbose_name='Text')),
+                ('notes', models.TextField(blank=True, help_text='Searchable notes', verbose_name='Notes')),
+                ('flags', models.CharField(blank=True, help_text='Boolean flags for the linked object', max_length=250, verbose_name='Flags')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'unique_together': {('search_group', 'model_id')},
+            },
+        ),
+        migrations.RunPython(
+            create_trigram_index, reverse_code=remove_trigram_index
+        ),
+    ]
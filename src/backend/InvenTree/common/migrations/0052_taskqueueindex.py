@@ -0,0 +1,25 @@
+"""Add an index table for detecting duplicate background tasks."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0051_searchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskQueueIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Hash of the task name, group and arguments', max_length=64, unique=True, verbose_name='Key')),
+                ('task_id', models.CharField(blank=True, db_index=True, help_text='ID of the queued task', max_length=64, verbose_name='Task ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date and time that the task was queued', verbose_name='Created')),
+            ],
+            options={
+                'verbose_name': 'Task Queue Index',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+"""Add a table for recording trees which require a rebuild."""
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0052_taskqueueindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TreeRebuild',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='Label of the tree model', max_length=100, verbose_name='Model')),
+                ('tree_id', models.PositiveIntegerField(help_text='ID of the tree', verbose_name='Tree ID')),
+                ('pending', models.BooleanField(db_index=True, default=True, help_text='Tree is waiting to be rebuilt', verbose_name='Pending')),
+                ('marked', models.DateTimeField(default=django.utils.timezone.now, help_text='Date and time that the tree was last marked for rebuild', verbose_name='Marked')),
+                ('rebuilt', models.DateTimeField(blank=True, help_text='Date and time that the tree was last rebuilt', null=True, verbose_name='Rebuilt')),
+                ('duration', models.FloatField(blank=True, help_text='Duration (in seconds) of the last rebuild', null=True, verbose_name='Duration')),
+            ],
+            options={
+                'verbose_name': 'Tree Rebuild',
+                'unique_together': {('model', 'tree_id')},
+            },
+        ),
+    ]
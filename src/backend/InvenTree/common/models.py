@@ -10,7 +10,7 @@ import json
 import math
 import os
 import uuid
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import timedelta, timezone
 from email.utils import make_msgid
 from enum import Enum
@@ -33,7 +33,7 @@ from django.core.files.utils import validate_file_name
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.mail.utils import DNS_NAME
 from django.core.validators import MinLengthValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connections, models, transaction
 from django.db.models import enums
 from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError, OperationalError, ProgrammingError
@@ -44,7 +44,7 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from anymail.signals import inbound, tracking
-from django_q.signals import post_spawn
+from django_q.signals import post_spawn, pre_execute
 from djmoney.contrib.exchange.exceptions import MissingRate
 from djmoney.contrib.exchange.models import convert_money
 from opentelemetry import trace
@@ -56,6 +56,7 @@ import InvenTree.conversion
 import InvenTree.exceptions
 import InvenTree.fields
 import InvenTree.helpers
+import InvenTree.instrumentation
 import InvenTree.models
 import InvenTree.ready
 import InvenTree.tasks
@@ -63,6 +64,7 @@ import InvenTree.validators
 import users.models
 from common.setting.type import InvenTreeSettingsKeyType, SettingsKeyType
 from common.settings import get_global_setting, global_setting_overrides
+from common.snapshot import MISSING, SettingsSnapshot
 from generic.enums import StringEnum
 from generic.states import ColorEnum
 from generic.states.custom import state_color_mappings
@@ -204,12 +206,15 @@ class BaseInvenTreeSetting(models.Model):
     Attributes:
         SETTINGS: definition of all available settings
         extra_unique_fields: List of extra fields used to be unique, e.g. for PluginConfig -> plugin
+        USE_SNAPSHOT: If True, settings values are read from a typed snapshot of all settings (within a request)
     """
 
     SETTINGS: dict[str, SettingsKeyType] = {}
 
     CHECK_SETTING_KEY = False
 
+    USE_SNAPSHOT = False
+
     extra_unique_fields: list[str] = []
 
     class Meta:
@@ -238,6 +243,11 @@ class BaseInvenTreeSetting(models.Model):
         # Remove the setting from the request cache
         set_session_cache(self.cache_key, None)
 
+        if self.USE_SNAPSHOT:
+            SettingsSnapshot.invalidate(
+                self.__class__, **self.get_filters_for_instance()
+            )
+
         # Execute after_save action
         self._call_settings_function('after_save', args, kwargs)
 
@@ -263,11 +273,25 @@ class BaseInvenTreeSetting(models.Model):
                     ],
                     batch_size=250,
                 )
+
+                if cls.USE_SNAPSHOT:
+                    SettingsSnapshot.invalidate(cls, **cls.get_filters(**kwargs))
         except Exception as exc:
             logger.exception(
                 'Failed to build default values for %s (%s)', cls, type(exc)
             )
 
+    def delete(self, *args, **kwargs):
+        """Remove this setting from the request cache (and settings snapshot) when deleted."""
+        set_session_cache(self.cache_key, None)
+
+        if self.USE_SNAPSHOT:
+            SettingsSnapshot.invalidate(
+                self.__class__, **self.get_filters_for_instance()
+            )
+
+        return super().delete(*args, **kwargs)
+
     def _call_settings_function(self, reference: str, args, kwargs):
         """Call a function associated with a particular setting.
 
@@ -596,6 +620,10 @@ class BaseInvenTreeSetting(models.Model):
                 # First attempt to find the setting object in the cache
                 cached_setting = cache.get(cache_key)
 
+                InvenTree.instrumentation.record_cache_access(
+                    cached_setting is not None
+                )
+
                 if cached_setting is not None:
                     # Store the cached setting into the session cache
 
@@ -672,6 +700,13 @@ class BaseInvenTreeSetting(models.Model):
                 "get_setting: Setting key '%s' is not defined for class %s", key, cls
             )
 
+        # Within a request, read the (already typed) value from the settings snapshot
+        if cls.USE_SNAPSHOT and (snapshot := SettingsSnapshot.get(cls, **kwargs)):
+            value = snapshot.get_value(key)
+
+            if value is not MISSING:
+                return value
+
         # If no backup value is specified, attempt to retrieve a "default" value
         if backup_value is None:
             backup_value = cls.get_setting_default(key, **kwargs)
@@ -1242,6 +1277,8 @@ class InvenTreeSetting(BaseInvenTreeSetting):
 
     CHECK_SETTING_KEY = True
 
+    USE_SNAPSHOT = True
+
     class Meta:
         """Meta options for InvenTreeSetting."""
 
@@ -1333,6 +1370,8 @@ class InvenTreeUserSetting(BaseInvenTreeSetting):
 
     CHECK_SETTING_KEY = True
 
+    USE_SNAPSHOT = True
+
     class Meta:
         """Meta options for InvenTreeUserSetting."""
 
@@ -3161,6 +3200,533 @@ class BarcodeScanResult(InvenTree.models.InvenTreeModel):
     )
 
 
+class BarcodeIndex(models.Model):
+    """Index of third-party barcodes assigned to database objects.
+
+    Maps the hash of each assigned barcode to the model instance it is linked to,
+    so that a scanned barcode can be resolved with a single indexed query,
+    rather than one query for each barcode-enabled model.
+
+    The index is maintained automatically when a barcode is assigned or unassigned,
+    and can be rebuilt with the 'rebuild_barcode_index' management command.
+
+    Attributes:
+        barcode_hash: Hash of the assigned barcode data
+        model_type: Barcode model type of the linked object (e.g. 'stockitem')
+        model_id: Primary key of the linked object
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Barcode Index')
+        unique_together = [['model_type', 'model_id']]
+
+    # Number of index entries written in each bulk operation
+    BULK_SIZE = 1000
+
+    barcode_hash = models.CharField(
+        max_length=128,
+        db_index=True,
+        verbose_name=_('Barcode Hash'),
+        help_text=_('Unique hash of barcode data'),
+    )
+
+    model_type = models.CharField(
+        max_length=100,
+        verbose_name=_('Model Type'),
+        help_text=_('Model type of the linked object'),
+    )
+
+    model_id = models.PositiveIntegerField(
+        verbose_name=_('Model ID'), help_text=_('ID of the linked object')
+    )
+
+    def __str__(self):
+        """Return a string representation of this index entry."""
+        return f'{self.model_type} <{self.model_id}>: {self.barcode_hash}'
+
+    @classmethod
+    def update_instance(cls, instance) -> None:
+        """Update the index entry for the provided model instance."""
+        model_type = instance.barcode_model_type()
+
+        if instance.barcode_hash:
+            cls.objects.update_or_create(
+                model_type=model_type,
+                model_id=instance.pk,
+                defaults={'barcode_hash': instance.barcode_hash},
+            )
+        else:
+            cls.remove_instance(instance)
+
+    @classmethod
+    def update_instances(cls, instances) -> None:
+        """Add index entries for multiple (newly created) model instances.
+
+        This is intended for use after bulk_create(), which bypasses the save() method.
+        """
+        entries = [
+            cls(
+                barcode_hash=instance.barcode_hash,
+                model_type=instance.barcode_model_type(),
+                model_id=instance.pk,
+            )
+            for instance in instances
+            if instance.barcode_hash and instance.pk
+        ]
+
+        cls.objects.bulk_create(entries, batch_size=cls.BULK_SIZE)
+
+    @classmethod
+    def remove_instance(cls, instance) -> None:
+        """Remove the index entry for the provided model instance."""
+        cls.objects.filter(
+            model_type=instance.barcode_model_type(), model_id=instance.pk
+        ).delete()
+
+    @classmethod
+    def lookup(cls, barcode_hash: str):
+        """Find the model instance which is linked to the provided barcode hash.
+
+        Returns:
+            The matching model instance, or None if no match is found
+        """
+        if not barcode_hash:
+            return None
+
+        return cls.lookup_many([barcode_hash]).get(barcode_hash)
+
+    @classmethod
+    def lookup_many(cls, barcode_hashes) -> dict:
+        """Find the model instances which are linked to the provided barcode hashes.
+
+        Requires one query against the index, plus one query for each matched model type.
+
+        Returns:
+            A map of barcode hash -> model instance (unmatched hashes are omitted)
+
+        Where a barcode is linked to multiple model types,
+        the first match (in barcode model order) is returned.
+        """
+        from plugin.base.barcodes.helper import get_supported_barcode_models
+
+        barcode_hashes = {
+            barcode_hash for barcode_hash in barcode_hashes if barcode_hash
+        }
+
+        if not barcode_hashes:
+            return {}
+
+        # Map of model type -> {model ID: barcode hash}
+        entries = defaultdict(dict)
+
+        for barcode_hash, model_type, model_id in cls.objects.filter(
+            barcode_hash__in=barcode_hashes
+        ).values_list('barcode_hash', 'model_type', 'model_id'):
+            entries[model_type][model_id] = barcode_hash
+
+        matches = {}
+
+        for model in get_supported_barcode_models():
+            model_type = model.barcode_model_type()
+
+            if not (model_entries := entries.get(model_type)):
+                continue
+
+            stale = set(model_entries.keys())
+
+            for instance in model.objects.filter(pk__in=model_entries.keys()):
+                barcode_hash = model_entries[instance.pk]
+
+                if instance.barcode_hash != barcode_hash:
+                    continue
+
+                stale.discard(instance.pk)
+                matches.setdefault(barcode_hash, instance)
+
+            if stale:
+                # These index entries no longer match an object - remove them
+                cls.objects.filter(model_type=model_type, model_id__in=stale).delete()
+
+        return matches
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Rebuild the entire barcode index from the barcode-enabled models.
+
+        Returns:
+            The number of index entries created
+        """
+        from plugin.base.barcodes.helper import get_supported_barcode_models
+
+        count = 0
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+
+            for model in get_supported_barcode_models():
+                model_type = model.barcode_model_type()
+
+                rows = (
+                    model.objects
+                    .exclude(barcode_hash='')
+                    .order_by('pk')
+                    .values_list('pk', 'barcode_hash')
+                )
+
+                entries = [
+                    cls(barcode_hash=barcode_hash, model_type=model_type, model_id=pk)
+                    for pk, barcode_hash in rows.iterator(chunk_size=cls.BULK_SIZE)
+                ]
+
+                cls.objects.bulk_create(entries, batch_size=cls.BULK_SIZE)
+                count += len(entries)
+
+        return count
+
+
+class SearchDocument(models.Model):
+    """Denormalized search text for a searchable database object.
+
+    Each document stores the text of the search fields for a single object,
+    so that the global search API can search multiple models with a single query.
+
+    Documents are maintained automatically (if the INVENTREE_SEARCH_INDEX setting is enabled),
+    and can be rebuilt with the 'rebuild_search_index' management command.
+
+    Attributes:
+        search_group: Key of the search group (e.g. 'part' or 'supplier')
+        model_type: Model type of the linked object (e.g. 'part' or 'company')
+        model_id: Primary key of the linked object
+        text: Lowercase text of each search field (one field per line)
+        notes: Lowercase text of the notes field (only searched on request)
+        flags: Space-delimited list of boolean flags which apply to the linked object
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Search Document')
+        unique_together = [['search_group', 'model_id']]
+
+    search_group = models.CharField(
+        max_length=50,
+        db_index=True,
+        verbose_name=_('Search Group'),
+        help_text=_('Search group for this document'),
+    )
+
+    model_type = models.CharField(
+        max_length=100,
+        verbose_name=_('Model Type'),
+        help_text=_('Model type of the linked object'),
+    )
+
+    model_id = models.PositiveIntegerField(
+        verbose_name=_('Model ID'), help_text=_('ID of the linked object')
+    )
+
+    text = models.TextField(
+        blank=True, verbose_name=_('Text'), help_text=_('Searchable text')
+    )
+
+    notes = models.TextField(
+        blank=True, verbose_name=_('Notes'), help_text=_('Searchable notes')
+    )
+
+    flags = models.CharField(
+        max_length=250,
+        blank=True,
+        verbose_name=_('Flags'),
+        help_text=_('Boolean flags for the linked object'),
+    )
+
+    def __str__(self):
+        """Return a string representation of this search document."""
+        return f'{self.search_group} <{self.model_id}>'
+
+
+@receiver(post_save, dispatch_uid='search_document_post_save')
+def after_save_search_document(sender, instance, raw=False, **kwargs):
+    """Update the search index when a searchable object is saved."""
+    import common.search
+
+    if not raw and common.search.index_available(instance):
+        common.search.update_instance(instance)
+
+
+@receiver(post_delete, dispatch_uid='search_document_post_delete')
+def after_delete_search_document(sender, instance, **kwargs):
+    """Update the search index when a searchable object is deleted."""
+    import common.search
+
+    if common.search.index_available():
+        common.search.remove_instance(instance)
+
+
+class TaskQueueIndex(models.Model):
+    """Index of the background tasks which are waiting in the task queue.
+
+    Maps a hash of the task name, group and arguments (see InvenTree.tasks.get_task_key)
+    to the ID of the queued task, so that a duplicate task can be detected with a single
+    indexed query, rather than by unpickling every task in the queue.
+
+    Entries are created (with an empty task ID) *before* a task is offloaded, and the
+    task ID is filled in once the task is queued. Entries are removed (by key) when the
+    task is started by the background worker, or is removed from the queue.
+
+    Attributes:
+        key: Hash of the task name, group and arguments
+        task_id: ID of the queued task
+        created: Date and time that the task was queued
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Task Queue Index')
+
+    # Entries older than this are considered stale (e.g. if a worker signal was missed)
+    STALE_TIMEOUT = timedelta(days=1)
+
+    key = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name=_('Key'),
+        help_text=_('Hash of the task name, group and arguments'),
+    )
+
+    task_id = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        verbose_name=_('Task ID'),
+        help_text=_('ID of the queued task'),
+    )
+
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_('Created'),
+        help_text=_('Date and time that the task was queued'),
+    )
+
+    def __str__(self):
+        """Return a string representation of this index entry."""
+        return f'{self.task_id}: {self.key}'
+
+    @classmethod
+    def lookup(cls, key: str) -> Optional[str]:
+        """Return the ID of the queued task matching the provided key (if any)."""
+        entry = cls.objects.filter(key=key).values_list('task_id', 'created').first()
+
+        if entry is None:
+            return None
+
+        task_id, created = entry
+
+        if created < now() - cls.STALE_TIMEOUT:
+            return None
+
+        return task_id or None
+
+    @classmethod
+    def register(cls, key: str, task_id: str) -> None:
+        """Record a newly queued task against the provided key."""
+        try:
+            cls.objects.update_or_create(
+                key=key, defaults={'task_id': task_id, 'created': now()}
+            )
+        except IntegrityError:
+            # The same task was registered concurrently by another process
+            pass
+
+    @classmethod
+    def assign(cls, keys: list[str], task_id: str) -> None:
+        """Record the ID of a queued task against previously registered (empty) entries.
+
+        Entries which have already been removed (as the task was started) are not recreated.
+        """
+        cls.objects.filter(key__in=keys, task_id='').update(task_id=task_id)
+
+    @classmethod
+    def register_many(cls, entries: list[tuple[str, str]]) -> None:
+        """Record multiple newly queued tasks, as a list of (key, task_id) tuples.
+
+        Existing entries are retained (the earlier task is still queued).
+        """
+        cls.objects.bulk_create(
+            [cls(key=key, task_id=task_id) for key, task_id in entries],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def remove(cls, task: dict, match_key: bool = True) -> None:
+        """Remove the index entry for a (decoded) task which is no longer queued.
+
+        Arguments:
+            task: The decoded task data
+            match_key: If True, the entry is also matched by the task key (as a task
+                may be started before its ID has been recorded in the index)
+        """
+        from InvenTree.tasks import get_task_key
+
+        query = models.Q()
+
+        if task_id := task.get('id'):
+            query |= models.Q(task_id=task_id)
+
+        if match_key and (
+            key := get_task_key(
+                task.get('func'),
+                task.get('group'),
+                task.get('args') or (),
+                task.get('kwargs') or {},
+            )
+        ):
+            query |= models.Q(key=key)
+
+        if not query:
+            return
+
+        try:
+            cls.objects.filter(query).delete()
+        except (OperationalError, ProgrammingError):
+            # The database is not ready yet
+            pass
+
+
+@receiver(pre_execute, dispatch_uid='task_queue_index_pre_execute')
+def before_execute_task(sender, task, **kwargs):
+    """Remove a task from the task queue index when it is started by the background worker."""
+    TaskQueueIndex.remove(task)
+
+
+@receiver(
+    post_delete, sender='django_q.OrmQ', dispatch_uid='task_queue_index_post_delete'
+)
+def after_delete_queued_task(sender, instance, **kwargs):
+    """Remove a task from the task queue index when it is removed from the queue."""
+    try:
+        task = instance.task
+    except Exception:
+        # The task payload could not be decoded
+        return
+
+    # Only the entry for this task is removed (an identical task may have been queued since)
+    if isinstance(task, dict):
+        TaskQueueIndex.remove(task, match_key=False)
+
+
+class TreeRebuild(models.Model):
+    """Rebuild state of a single tree, for a tree (MPTT) model.
+
+    A tree is marked as pending whenever its structure is changed (see InvenTree.trees),
+    and all pending trees are rebuilt together by the rebuild_pending_trees task.
+    The duration of the most recent rebuild is recorded against each tree.
+
+    Attributes:
+        model: Label of the tree model (e.g. 'stock.stocklocation')
+        tree_id: ID of the tree
+        pending: True if the tree is waiting to be rebuilt
+        marked: Date and time that the tree was last marked for rebuild
+        rebuilt: Date and time that the tree was last rebuilt
+        duration: Duration (in seconds) of the last rebuild
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Tree Rebuild')
+        unique_together = [('model', 'tree_id')]
+
+    model = models.CharField(
+        max_length=100, verbose_name=_('Model'), help_text=_('Label of the tree model')
+    )
+
+    tree_id = models.PositiveIntegerField(
+        verbose_name=_('Tree ID'), help_text=_('ID of the tree')
+    )
+
+    pending = models.BooleanField(
+        default=True,
+        db_index=True,
+        verbose_name=_('Pending'),
+        help_text=_('Tree is waiting to be rebuilt'),
+    )
+
+    marked = models.DateTimeField(
+        default=now,
+        verbose_name=_('Marked'),
+        help_text=_('Date and time that the tree was last marked for rebuild'),
+    )
+
+    rebuilt = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_('Rebuilt'),
+        help_text=_('Date and time that the tree was last rebuilt'),
+    )
+
+    duration = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name=_('Duration'),
+        help_text=_('Duration (in seconds) of the last rebuild'),
+    )
+
+    def __str__(self):
+        """Return a string representation of this tree."""
+        return f'{self.model}: {self.tree_id}'
+
+    @classmethod
+    def mark(cls, model: str, tree_ids) -> None:
+        """Mark the specified trees as pending (creating entries as required)."""
+        marked = now()
+        tree_ids = sorted(set(tree_ids))
+
+        entries = [
+            cls(model=model, tree_id=tree_id, pending=True, marked=marked)
+            for tree_id in tree_ids
+        ]
+
+        features = connections[cls.objects.db].features
+
+        if features.supports_update_conflicts_with_target:
+            cls.objects.bulk_create(
+                entries,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['model', 'tree_id'],
+                update_fields=['pending', 'marked'],
+            )
+            return
+
+        # Backends which cannot target an upsert (e.g. MySQL / MariaDB)
+        # create any missing entries, and then mark the existing entries
+        cls.objects.bulk_create(entries, batch_size=1000, ignore_conflicts=True)
+
+        for idx in range(0, len(tree_ids), 1000):
+            cls.objects.filter(
+                model=model, tree_id__in=tree_ids[idx : idx + 1000]
+            ).update(pending=True, marked=marked)
+
+    @classmethod
+    def complete(cls, pk: int, marked, duration: Optional[float]) -> None:
+        """Record a completed rebuild against a tree entry.
+
+        The entry remains pending if the tree was marked again (after the rebuild started).
+        If duration is None, the tree no longer exists and the entry is removed.
+        """
+        entries = cls.objects.filter(pk=pk, marked=marked)
+
+        if duration is None:
+            entries.delete()
+        else:
+            entries.update(pending=False, rebuilt=now(), duration=duration)
+
+
 class DataOutput(models.Model):
     """Model for storing generated data output from various processes.
 
@@ -0,0 +1,511 @@
+"""Search index for the global search API.
+
+Searching across multiple models with the regular API list views requires a separate
+(and often expensive) query for each model, with joins across every related search field.
+
+If the INVENTREE_SEARCH_INDEX setting is enabled, a denormalized SearchDocument is instead
+stored for each searchable object, containing the text of each of its search fields:
+
+- Search groups (and their search fields) are taken from the API views used by the global search
+- Documents are updated when a searchable object (or a related object) is saved or deleted
+- All requested search groups are ranked and paginated with a single database query
+- On PostgreSQL, results are ranked with full-text search functions (and indexed with pg_trgm)
+- On other database backends, a portable ranking expression is used instead
+"""
+
+import functools
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Optional
+
+from django.db import connection, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When, Window
+from django.db.models.functions import RowNumber
+
+import structlog
+
+import InvenTree.ready
+from common.settings import get_global_setting
+from InvenTree.helpers import str2bool
+
+logger = structlog.get_logger('inventree')
+
+# Number of objects processed in each chunk
+SEARCH_CHUNK_SIZE = 500
+
+
+@dataclass
+class SearchGroup:
+    """A group of search results, as returned by the global search API.
+
+    Attributes:
+        key: The key used to identify this group in a search request (e.g. 'supplier')
+        model: The model class for this group
+        search_fields: The search fields used by the API list view for this model
+        filters: Model filters which define the members of this group
+        flags: Map of optional boolean filters (which can be applied to search results)
+    """
+
+    key: str
+    model: type
+    search_fields: list[str]
+    filters: dict = field(default_factory=dict)
+    flags: dict[str, Q] = field(default_factory=dict)
+
+    @property
+    def model_type(self) -> str:
+        """Return the model type for this group."""
+        return self.model._meta.model_name
+
+    @property
+    def has_notes(self) -> bool:
+        """Return True if the model for this group has a 'notes' field."""
+        return any(f.name == 'notes' for f in self.model._meta.get_fields())
+
+    def queryset(self):
+        """Return a queryset of all members of this group."""
+        return self.model.objects.filter(**self.filters)
+
+    def related_lookups(self) -> list[tuple[type, str]]:
+        """Return the related models which contribute to the search text for this group.
+
+        Returns:
+            A list of (model, lookup) tuples, where the lookup filters this group by related object
+        """
+        lookups = []
+
+        for path in self.search_fields:
+            model = self.model
+            names = path.split('__')
+
+            for idx, name in enumerate(names[:-1]):
+                try:
+                    model_field = model._meta.get_field(name)
+                except Exception:
+                    break
+
+                if not model_field.is_relation or not model_field.related_model:
+                    break
+
+                model = model_field.related_model
+                lookup = '__'.join(names[: idx + 1])
+
+                if (model, lookup) not in lookups:
+                    lookups.append((model, lookup))
+
+        return lookups
+
+
+def search_index_enabled() -> bool:
+    """Return True if the search index is enabled."""
+    return bool(get_global_setting('INVENTREE_SEARCH_INDEX', cache=True, create=False))
+
+
+def search_flags() -> dict[str, dict[str, Q]]:
+    """Return the boolean filters which can be applied to each search group.
+
+    These mirror the filters which are used by the search preview in the user interface.
+    """
+    from order.models import PurchaseOrder, ReturnOrder, SalesOrder
+    from stock.models import StockItem
+
+    return {
+        'part': {'active': Q(active=True)},
+        'stockitem': {'in_stock': StockItem.IN_STOCK_FILTER},
+        'purchaseorder': {
+            'outstanding': Q(status__in=PurchaseOrder.get_status_class().OPEN)
+        },
+        'salesorder': {'outstanding': Q(status__in=SalesOrder.get_status_class().OPEN)},
+        'returnorder': {
+            'outstanding': Q(status__in=ReturnOrder.get_status_class().OPEN)
+        },
+    }
+
+
+@functools.cache
+def get_search_groups() -> dict[str, SearchGroup]:
+    """Return the search groups supported by the global search API."""
+    from InvenTree.api import APISearchView
+
+    view = APISearchView()
+    filters = view.get_result_filters()
+    flags = search_flags()
+
+    groups = {}
+
+    for key, cls in view.get_result_types().items():
+        search_fields = [
+            str(f).lstrip('^=@$') for f in getattr(cls, 'search_fields', None) or []
+        ]
+
+        groups[key] = SearchGroup(
+            key=key,
+            model=cls.serializer_class.Meta.model,
+            search_fields=search_fields,
+            filters=filters.get(key, {}),
+            flags=flags.get(key, {}),
+        )
+
+    return groups
+
+
+@functools.cache
+def get_model_groups() -> dict[str, dict]:
+    """Return the search groups which are affected by changes to each model.
+
+    Returns:
+        A map of model label -> {'groups': [group keys], 'related': [(group key, lookup)]}
+    """
+    models = defaultdict(lambda: {'groups': [], 'related': []})
+
+    for key, group in get_search_groups().items():
+        models[group.model._meta.label_lower]['groups'].append(key)
+
+        for model, lookup in group.related_lookups():
+            models[model._meta.label_lower]['related'].append((key, lookup))
+
+    return dict(models)
+
+
+def build_documents(group: SearchGroup, pks: Iterable[int]) -> list:
+    """Construct (unsaved) search documents for the provided objects.
+
+    Requires one query for each search field, plus one query for each flag.
+
+    Arguments:
+        group: The search group for which to construct documents
+        pks: Primary keys of the objects to construct documents for
+
+    Returns:
+        A list of SearchDocument instances (objects which are not members of the group are skipped)
+    """
+    from common.models import SearchDocument
+
+    queryset = group.queryset().filter(pk__in=list(pks)).order_by()
+
+    values = defaultdict(list)
+    flags = defaultdict(list)
+    notes = {}
+
+    ids = list(queryset.values_list('pk', flat=True))
+
+    if not ids:
+        return []
+
+    for path in group.search_fields:
+        for pk, value in queryset.values_list('pk', path):
+            if value is not None and str(value) != '':
+                values[pk].append(str(value).lower())
+
+    if group.has_notes:
+        notes = {
+            pk: str(value).lower()
+            for pk, value in queryset.values_list('pk', 'notes')
+            if value
+        }
+
+    for name, flag in group.flags.items():
+        for pk in queryset.filter(flag).values_list('pk', flat=True):
+            flags[pk].append(name)
+
+    return [
+        SearchDocument(
+            search_group=group.key,
+            model_type=group.model_type,
+            model_id=pk,
+            text='\n'.join(dict.fromkeys(values[pk])),
+            notes=notes.get(pk, ''),
+            flags=f' {" ".join(sorted(set(flags[pk])))} ' if flags[pk] else '',
+        )
+        for pk in ids
+    ]
+
+
+def update_documents(group: SearchGroup, pks: Iterable[int]) -> int:
+    """Update the search documents for the provided objects.
+
+    Returns:
+        The number of documents created
+    """
+    from common.models import SearchDocument
+
+    count = 0
+
+    for chunk in batched(sorted(set(pks)), SEARCH_CHUNK_SIZE):
+        documents = build_documents(group, chunk)
+
+        with transaction.atomic():
+            SearchDocument.objects.filter(
+                search_group=group.key, model_id__in=chunk
+            ).delete()
+            SearchDocument.objects.bulk_create(documents)
+
+        count += len(documents)
+
+    return count
+
+
+def update_related_documents(key: str, lookup: str, pks: list[int]) -> None:
+    """Update the search documents which depend on the provided related objects.
+
+    Arguments:
+        key: The search group to update
+        lookup: Lookup which relates the group model to the related objects (e.g. 'part')
+        pks: Primary keys of the related objects
+    """
+    if not (group := get_search_groups().get(key)):
+        return
+
+    ids = (
+        group
+        .queryset()
+        .filter(**{f'{lookup}__in': pks})
+        .order_by()
+        .values_list('pk', flat=True)
+        .distinct()
+    )
+
+    update_documents(group, ids)
+
+
+def update_instance(instance) -> None:
+    """Update the search index after the provided object has been saved.
+
+    - Documents for the object itself are updated immediately
+    - Documents for any dependent objects are updated by the background worker
+    """
+    update_instances(instance._meta.model, [instance.pk])
+
+
+def update_instances(model, pks: list[int]) -> None:
+    """Update the search index after multiple objects (of the same model) have been saved.
+
+    See update_instance() - documents for all of the provided objects are updated together.
+    """
+    from common import tasks as common_tasks
+    from InvenTree.tasks import offload_task
+
+    entry = get_model_groups().get(model._meta.label_lower)
+
+    if not entry or not pks:
+        return
+
+    groups = get_search_groups()
+
+    for key in entry['groups']:
+        update_documents(groups[key], pks)
+
+    for key, lookup in entry['related']:
+        offload_task(
+            common_tasks.update_search_documents, key, lookup, list(pks), group='search'
+        )
+
+
+def remove_instance(instance) -> None:
+    """Remove the search documents for the provided (deleted) object."""
+    from common.models import SearchDocument
+
+    entry = get_model_groups().get(instance._meta.label_lower)
+
+    if entry and entry['groups']:
+        SearchDocument.objects.filter(
+            search_group__in=entry['groups'], model_id=instance.pk
+        ).delete()
+
+
+def index_available(instance=None) -> bool:
+    """Return True if the search index should be updated for the provided object."""
+    if not InvenTree.ready.canAppAccessDatabase(allow_test=True, allow_shell=True):
+        return False
+
+    if instance is not None and instance.pk is None:
+        return False
+
+    return search_index_enabled()
+
+
+def rebuild_search_index(progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """Rebuild the search documents for all searchable objects.
+
+    Arguments:
+        progress: Optional callback function, called with (completed, total) after each chunk
+
+    Returns:
+        The number of documents created
+    """
+    from common.models import SearchDocument
+
+    groups = get_search_groups()
+
+    logger.info('Rebuilding search index for %s search groups', len(groups))
+
+    # Remove any documents for search groups which no longer exist
+    SearchDocument.objects.exclude(search_group__in=groups.keys()).delete()
+
+    group_ids = {
+        key: list(group.queryset().order_by('pk').values_list('pk', flat=True))
+        for key, group in groups.items()
+    }
+
+    total = sum(len(ids) for ids in group_ids.values())
+    completed = 0
+    count = 0
+
+    for key, group in groups.items():
+        ids = group_ids[key]
+
+        # Remove any documents for objects which no longer belong to this group
+        SearchDocument.objects.filter(search_group=key).exclude(
+            model_id__in=group.queryset().values('pk')
+        ).delete()
+
+        for chunk in batched(ids, SEARCH_CHUNK_SIZE):
+            count += update_documents(group, chunk)
+            completed += len(chunk)
+
+            if progress:
+                progress(completed, total)
+
+    return count
+
+
+def search_rank(terms: list[str]):
+    """Return an expression which ranks search documents against the provided terms.
+
+    - Documents which start with the first search term are ranked highest
+    - Followed by documents where a word (or field) starts with the first search term
+    - On PostgreSQL, ties are broken by the full-text search rank
+    """
+    term = terms[0]
+
+    rank = Case(
+        When(text__startswith=term, then=Value(300)),
+        When(
+            Q(text__contains=f'\n{term}') | Q(text__contains=f' {term}'),
+            then=Value(200),
+        ),
+        When(text__contains=term, then=Value(100)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+    ordering = [F('rank').desc()]
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        ordering.append(
+            SearchRank(
+                SearchVector('text', config='simple'),
+                SearchQuery(' '.join(terms), config='simple'),
+            ).desc()
+        )
+
+    ordering.append(F('model_id').asc())
+
+    return rank, ordering
+
+
+def search_terms(text: str) -> list[str]:
+    """Split the provided search text into (lowercase) search terms.
+
+    Terms are split in the same way as the search filter for the API list views.
+    """
+    from rest_framework.filters import search_smart_split
+
+    return [term.strip().lower() for term in search_smart_split(text) if term.strip()]
+
+
+def search(
+    text: str,
+    groups: dict[str, dict],
+    notes: bool = False,
+    limit: int = 1,
+    offset: int = 0,
+) -> dict[str, dict]:
+    """Search the index for documents which match the provided text.
+
+    All requested groups are searched (and ranked, counted and paginated) with a single query.
+
+    Arguments:
+        text: The search text (each search term must match at least one search field)
+        groups: Map of group key -> request parameters (used for boolean flag filters)
+        notes: If True, also search the 'notes' field for each object
+        limit: Maximum number of results to return for each group
+        offset: Number of results to skip for each group
+
+    Returns:
+        A map of group key -> {'count': total matches, 'ids': ranked primary keys}
+    """
+    from common.models import SearchDocument
+
+    search_groups = get_search_groups()
+    results = {key: {'count': 0, 'ids': []} for key in groups}
+
+    limit = max(int(limit or 0), 0)
+    offset = max(int(offset or 0), 0)
+
+    group_filter = Q()
+
+    for key, params in groups.items():
+        if not (group := search_groups.get(key)):
+            continue
+
+        query = Q(search_group=key)
+
+        for name in group.flags:
+            value = params.get(name) if type(params) is dict else None
+
+            if value is None or value == '':
+                continue
+
+            if str2bool(value):
+                query &= Q(flags__contains=f' {name} ')
+            else:
+                query &= ~Q(flags__contains=f' {name} ')
+
+        group_filter |= query
+
+    if not group_filter:
+        return results
+
+    queryset = SearchDocument.objects.filter(group_filter)
+
+    terms = search_terms(text)
+
+    for term in terms:
+        if notes:
+            queryset = queryset.filter(Q(text__contains=term) | Q(notes__contains=term))
+        else:
+            queryset = queryset.filter(text__contains=term)
+
+    if terms:
+        rank, ordering = search_rank(terms)
+    else:
+        rank, ordering = Value(0), [F('model_id').asc()]
+
+    queryset = (
+        queryset
+        .annotate(rank=rank)
+        .annotate(
+            row=Window(
+                RowNumber(), partition_by=[F('search_group')], order_by=ordering
+            ),
+            total=Window(Count('pk'), partition_by=[F('search_group')]),
+        )
+        # Always return the first row, so that the total is known for each group
+        .filter(Q(row=1) | Q(row__gt=offset, row__lte=offset + limit))
+        .order_by('search_group', 'row')
+    )
+
+    for key, model_id, row, total in queryset.values_list(
+        'search_group', 'model_id', 'row', 'total'
+    ):
+        results[key]['count'] = total
+
+        if offset < row <= offset + limit:
+            results[key]['ids'].append(model_id)
+
+    return results
@@ -107,6 +107,42 @@ def reload_plugin_registry(setting):
     registry.reload_plugins(full_reload=True, force_reload=True, collect=True)
 
 
+def rebuild_part_availability(setting):
+    """When the part availability cache is enabled, rebuild the cached data for all parts."""
+    import InvenTree.ready
+    import InvenTree.tasks
+
+    if not setting.value or InvenTree.ready.isImportingData():
+        return
+
+    if not InvenTree.ready.canAppAccessDatabase():
+        return
+
+    from part import tasks as part_tasks
+
+    InvenTree.tasks.offload_task(
+        part_tasks.rebuild_part_availability, force_async=True, group='part'
+    )
+
+
+def rebuild_search_index(setting):
+    """When the search index is enabled, rebuild the index for all searchable models."""
+    import InvenTree.ready
+    import InvenTree.tasks
+
+    if not setting.value or InvenTree.ready.isImportingData():
+        return
+
+    if not InvenTree.ready.canAppAccessDatabase():
+        return
+
+    from common import tasks as common_tasks
+
+    InvenTree.tasks.offload_task(
+        common_tasks.rebuild_search_index, force_async=True, group='search'
+    )
+
+
 def enforce_mfa(setting):
     """Enforce multifactor authentication for all users."""
     from allauth.usersessions.models import UserSession
@@ -299,6 +335,15 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'validator': bool,
         'default': True,
     },
+    'INVENTREE_SEARCH_INDEX': {
+        'name': _('Search Index'),
+        'description': _(
+            'Maintain a search index for the global search, rather than searching each model separately'
+        ),
+        'default': False,
+        'validator': bool,
+        'after_save': rebuild_search_index,
+    },
     'INVENTREE_UPDATE_CHECK_INTERVAL': {
         'name': _('Update Check Interval'),
         'description': _('How often to check for updates (set to zero to disable)'),
@@ -541,6 +586,15 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'default': '',
         'validator': common.validators.validate_icon,
     },
+    'PART_AVAILABILITY_CACHE': {
+        'name': _('Cache Part Availability'),
+        'description': _(
+            'Store stock availability and buildable quantity for each part, rather than calculating it on every request'
+        ),
+        'default': False,
+        'validator': bool,
+        'after_save': rebuild_part_availability,
+    },
     'PRICING_DECIMAL_PLACES_MIN': {
         'name': _('Minimum Pricing Decimal Places'),
         'description': _(
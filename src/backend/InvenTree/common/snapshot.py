@@ -0,0 +1,237 @@
+"""Typed snapshots of the global and user settings.
+
+Previously, each call to get_setting() resolved a single setting object (via the request
+cache, the global cache and then the database), and converted the stored value to a
+native type on every call. A single API request may access dozens of settings.
+
+Instead, the SettingsSnapshot class:
+
+- Loads the values of *all* settings (for a settings model and user) with a single query
+- Converts each value to its native type once, when the snapshot is loaded
+- Stores the snapshot in the request cache, and (if enabled) in the global cache
+- Is invalidated whenever a setting is saved, via a version token stored in the global cache
+
+Snapshots are only used within a request. Outside of a request (e.g. in the background
+worker), settings are resolved individually as before.
+"""
+
+import uuid
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.utils import OperationalError, ProgrammingError
+
+import structlog
+
+import InvenTree.helpers
+import InvenTree.instrumentation
+import InvenTree.ready
+from InvenTree.cache import (
+    get_session_cache,
+    is_session_cache_active,
+    set_session_cache,
+)
+
+logger = structlog.get_logger('inventree')
+
+# Cached snapshots are retained for one hour (unless invalidated earlier)
+CACHE_TIMEOUT = 3600
+
+# Marker for settings which are not available in the snapshot
+MISSING = object()
+
+
+class SettingsSnapshot:
+    """Snapshot of the native values of all settings for a settings model.
+
+    Example:
+        snapshot = SettingsSnapshot.get(InvenTreeUserSetting, user=user)
+        value = snapshot.get_value('SEARCH_PREVIEW_RESULTS')
+    """
+
+    def __init__(self, model, **filters):
+        """Initialize the snapshot.
+
+        Arguments:
+            model: The settings model class (e.g. InvenTreeSetting)
+            filters: Extra unique fields for the settings model (e.g. user)
+        """
+        self.model = model
+
+        # Related objects are referenced by their primary key
+        self.filters = {
+            key: getattr(value, 'pk', value) for key, value in filters.items()
+        }
+
+        self.values: dict[str, Any] = {}
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of this snapshot."""
+        return self.model.create_cache_key('snapshot', **self.filters)
+
+    @property
+    def cache_key(self) -> str:
+        """Return the cache key for the snapshot data."""
+        return f'settings_snapshot:{self.name}'
+
+    @property
+    def version_key(self) -> str:
+        """Return the cache key for the snapshot version token."""
+        return f'settings_version:{self.name}'
+
+    @classmethod
+    def get(cls, model, **kwargs) -> Optional['SettingsSnapshot']:
+        """Return the settings snapshot for the current request.
+
+        Arguments:
+            model: The settings model class (e.g. InvenTreeSetting)
+            kwargs: Keyword arguments passed to get_setting (e.g. user, cache)
+
+        Returns:
+            The snapshot, or None if a snapshot cannot be used
+        """
+        if not is_session_cache_active():
+            return None
+
+        snapshot = cls(model, **model.get_filters(**kwargs))
+
+        # All extra unique fields must be specified (e.g. an unsaved user is not valid)
+        if set(snapshot.filters.keys()) != set(model.extra_unique_fields) or any(
+            value is None for value in snapshot.filters.values()
+        ):
+            return None
+
+        if cached := get_session_cache(snapshot.cache_key):
+            return cached
+
+        if (
+            InvenTree.ready.isImportingData()
+            or InvenTree.ready.isRunningMigrations()
+            or InvenTree.ready.isRebuildingData()
+            or InvenTree.ready.isRunningBackup()
+        ):  # pragma: no cover
+            return None
+
+        # The global cache is only used if it is shared between all processes
+        use_cache = settings.GLOBAL_CACHE_ENABLED and kwargs.get('cache', True)
+
+        if not snapshot.load(use_cache=use_cache):
+            return None
+
+        set_session_cache(snapshot.cache_key, snapshot)
+
+        return snapshot
+
+    @classmethod
+    def invalidate(cls, model, **filters) -> None:
+        """Invalidate the settings snapshot for a settings model (e.g. after a setting is saved)."""
+        snapshot = cls(model, **filters)
+
+        set_session_cache(snapshot.cache_key, None)
+
+        if settings.GLOBAL_CACHE_ENABLED:
+            snapshot.bump()
+
+            # Snapshots loaded before the transaction is committed are also discarded
+            transaction.on_commit(snapshot.bump)
+
+    def bump(self) -> None:
+        """Replace the version token, discarding any cached snapshot data."""
+        try:
+            cache.set(self.version_key, uuid.uuid4().hex, timeout=None)
+        except Exception:
+            logger.warning("Failed to update settings version for '%s'", self.name)
+
+    def get_version(self, data: dict) -> Optional[str]:
+        """Return the current version token (creating a new token if none exists)."""
+        if version := data.get(self.version_key):
+            return version
+
+        try:
+            cache.add(self.version_key, uuid.uuid4().hex, timeout=None)
+            return cache.get(self.version_key)
+        except Exception:
+            return None
+
+    def load(self, use_cache: bool = True) -> bool:
+        """Load the snapshot, from the global cache if it is still valid.
+
+        Returns:
+            True if the snapshot was loaded successfully
+        """
+        version = None
+
+        if use_cache:
+            try:
+                data = cache.get_many([self.version_key, self.cache_key])
+            except Exception:
+                data = {}
+                use_cache = False
+
+            version = self.get_version(data)
+            cached = data.get(self.cache_key)
+
+            valid = bool(version and cached and cached['version'] == version)
+
+            InvenTree.instrumentation.record_cache_access(valid)
+
+            if valid:
+                self.values = cached['values']
+                return True
+
+        try:
+            self.values = self.load_values()
+        except (OperationalError, ProgrammingError):
+            # The database is not ready yet
+            return False
+
+        # The snapshot is tagged with the version token read *before* the data was loaded
+        if use_cache and version:
+            try:
+                cache.set(
+                    self.cache_key,
+                    {'version': version, 'values': self.values},
+                    timeout=CACHE_TIMEOUT,
+                )
+            except Exception:
+                logger.warning("Failed to cache settings snapshot '%s'", self.name)
+
+        return True
+
+    def load_values(self) -> dict[str, Any]:
+        """Load the native values of all settings from the database."""
+        values = {}
+
+        for key, value in self.model.objects.filter(**self.filters).values_list(
+            'key', 'value'
+        ):
+            key = str(key).upper()
+            value = self.to_native(key, value)
+
+            if value is not MISSING:
+                values[key] = value
+
+        return values
+
+    def to_native(self, key: str, value: Any) -> Any:
+        """Convert a stored setting value to its native type (see BaseInvenTreeSetting.get_setting)."""
+        validator = self.model.get_setting_validator(key, **self.filters)
+
+        if self.model.validator_is_bool(validator):
+            value = InvenTree.helpers.str2bool(value)
+
+        if self.model.validator_is_int(validator):
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                # Resolved individually (falling back to the default value)
+                return MISSING
+
+        return value
+
+    def get_value(self, key: str) -> Any:
+        """Return the native value of a setting (or MISSING if it is not available)."""
+        return self.values.get(str(key).strip().upper(), MISSING)
@@ -222,3 +222,39 @@ def rebuild_attachment(attachment_id: int):
     attachment.is_image = attachment.check_is_image()
     attachment.generate_thumbnail()
     attachment.save(rebuild=False)
+
+
+@tracer.start_as_current_span('update_search_documents')
+def update_search_documents(key: str, lookup: str, pks: list[int]):
+    """Update the search documents which depend on a set of related objects.
+
+    Arguments:
+        key: The search group to update
+        lookup: Lookup which relates the group model to the related objects
+        pks: Primary keys of the related objects which have changed
+    """
+    from common.search import search_index_enabled, update_related_documents
+
+    if not search_index_enabled():
+        return
+
+    update_related_documents(key, lookup, pks)
+
+
+@tracer.start_as_current_span('rebuild_search_index')
+@scheduled_task(ScheduledTask.DAILY)
+def rebuild_search_index():
+    """Rebuild the search index for all searchable objects.
+
+    Incremental updates are performed whenever searchable data changes,
+    but a periodic full rebuild ensures that the index remains consistent
+    (e.g. after bulk operations which do not trigger model signals).
+    """
+    from common.search import rebuild_search_index, search_index_enabled
+
+    if not search_index_enabled():
+        return
+
+    count = rebuild_search_index()
+
+    logger.info('Rebuilt search index - %s documents', count)
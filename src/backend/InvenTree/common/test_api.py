@@ -15,7 +15,11 @@ from taggit.models import Tag
 import common.models
 from common.models import SelectionList, SelectionListEntry
 from common.settings import set_global_setting
-from InvenTree.unit_test import InvenTreeAPITestCase, findOffloadedEvent
+from InvenTree.unit_test import (
+    InvenTreeAPITestCase,
+    activateEventPlugin,
+    findOffloadedEvent,
+)
 
 
 class DataOutputAPITests(InvenTreeAPITestCase):
@@ -592,6 +596,7 @@ class ParameterAPITests(InvenTreeAPITestCase):
         OrmQ.objects.all().delete()
 
         set_global_setting('ENABLE_PLUGINS_EVENTS', True)
+        activateEventPlugin()
 
         template = common.models.ParameterTemplate.objects.create(
             name='Test Parameter',
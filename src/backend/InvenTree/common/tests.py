@@ -17,13 +17,14 @@ from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
 
 from PIL import Image
 
 import common.validators
+import InvenTree.cache
 from common.notifications import trigger_notification
 from common.settings import get_global_setting, set_global_setting
 from InvenTree.helpers import str2bool
@@ -574,6 +575,58 @@ class SettingsTest(InvenTreeTestCase):
             value = InvenTreeUserSetting.get_setting(key, user=user)
             self.assertEqual(value, user.pk)
 
+    def test_settings_snapshot(self):
+        """Test that settings are read from a typed snapshot within a request."""
+        InvenTreeSetting.build_default_values()
+        InvenTreeUserSetting.build_default_values(user=self.user)
+
+        keys = [
+            'INVENTREE_INSTANCE',
+            'PART_ENABLE_REVISION',
+            'PART_NAME_FORMAT',
+            'STOCK_STALE_DAYS',
+        ]
+
+        # Values resolved individually (outside of a request)
+        expected = {key: get_global_setting(key) for key in keys}
+
+        InvenTree.cache.create_session_cache(RequestFactory().get('/'))
+
+        try:
+            # All global settings are loaded with a single query
+            with self.assertNumQueries(1):
+                values = {key: get_global_setting(key) for key in keys}
+
+            self.assertEqual(values, expected)
+            self.assertIsInstance(values['PART_ENABLE_REVISION'], bool)
+            self.assertIsInstance(values['STOCK_STALE_DAYS'], int)
+
+            # Saving a setting invalidates the snapshot
+            set_global_setting('STOCK_STALE_DAYS', 42, change_user=None)
+            self.assertEqual(get_global_setting('STOCK_STALE_DAYS'), 42)
+
+            # User settings are loaded separately for each user
+            with self.assertNumQueries(1):
+                InvenTreeUserSetting.get_setting(
+                    'SEARCH_PREVIEW_RESULTS', user=self.user
+                )
+                InvenTreeUserSetting.get_setting(
+                    'SEARCH_HIDE_INACTIVE_PARTS', user=self.user
+                )
+
+            InvenTreeUserSetting.set_setting(
+                'SEARCH_PREVIEW_RESULTS', 7, None, user=self.user
+            )
+
+            self.assertEqual(
+                InvenTreeUserSetting.get_setting(
+                    'SEARCH_PREVIEW_RESULTS', user=self.user
+                ),
+                7,
+            )
+        finally:
+            InvenTree.cache.delete_session_cache()
+
     def test_set_global_warning(self):
         """Test set_global_warning function."""
         from common.setting.system import SystemSetId
@@ -1,20 +1,22 @@
 """Mixin classes for the exporter app."""
 
+import tempfile
 from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.utils.translation import gettext_lazy as _
 
 import structlog
-import tablib
 from rest_framework import serializers
 from rest_framework.response import Response
 from taggit.serializers import TagListSerializerField
 
 import data_exporter.serializers
 import data_exporter.tasks
+import data_exporter.writers
 import InvenTree.exceptions
 import InvenTree.serializers
 from common.models import DataOutput
@@ -199,28 +201,27 @@ class DataExportSerializerMixin:
 
         return headers
 
-    def export_to_file(self, data, headers: OrderedDict, file_format):
-        """Export the queryset to a file in the specified format.
+    def export_to_file(self, data, headers: OrderedDict, file_format, file) -> int:
+        """Export the provided data to a file in the specified format.
+
+        Rows are written to the file one at a time, so the provided data may be a generator.
 
         Arguments:
-            queryset: The queryset to export
-            data: The serialized dataset to export
+            data: The serialized dataset to export (an iterable of dict objects)
             headers: The headers to use for the exported data {field: label}
             file_format: The file format to export to
+            file: The (binary) file object to write the exported data to
 
         Returns:
-            File object containing the exported data
+            The number of rows written to the file
         """
         field_names = list(headers.keys())
-        field_headers = list(headers.values())
-
-        # Create a new dataset with the provided header labels
-        dataset = tablib.Dataset(headers=field_headers)
 
-        for row in data:
-            dataset.append([self.get_nested_value(row, f) for f in field_names])
+        rows = ([self.get_nested_value(row, f) for f in field_names] for row in data)
 
-        return dataset.export(file_format)
+        return data_exporter.writers.write_rows(
+            file, list(headers.values()), rows, file_format
+        )
 
 
 class DataExportViewMixin:
@@ -384,7 +385,8 @@ class DataExportViewMixin:
             raise ValidationError(export_error)
 
         # The provided plugin is responsible for exporting the data
-        # The returned data *must* be a list of dict objects
+        # The returned data *must* be an iterable of dict objects
+        # Note: If a generator is returned, rows are exported as they are generated
         try:
             data = export_plugin.export_data(
                 queryset,
@@ -403,7 +405,7 @@ class DataExportViewMixin:
 
             raise ValidationError(export_error)
 
-        if not isinstance(data, list):
+        if isinstance(data, (str, bytes, dict)) or not isinstance(data, Iterable):
             raise ValidationError(
                 _('Data export plugin returned incorrect data format')
             )
@@ -422,15 +424,21 @@ class DataExportViewMixin:
                 raise ValidationError(export_error)
 
         # Now, export the data to file
-        try:
-            datafile = serializer.export_to_file(data, headers, export_format)
-        except Exception as e:
-            InvenTree.exceptions.log_error('export_to_file', plugin=export_plugin.slug)
-            output.mark_failure(error=str(e))
-            raise ValidationError(_('Error occurred during data export'))
+        # Data is streamed to a temporary file, rather than being held in memory
+        with tempfile.TemporaryFile() as datafile:
+            try:
+                serializer.export_to_file(data, headers, export_format, datafile)
+            except Exception as e:
+                InvenTree.exceptions.log_error(
+                    'export_to_file', plugin=export_plugin.slug
+                )
+                output.mark_failure(error=str(e))
+                raise ValidationError(_('Error occurred during data export'))
+
+            datafile.seek(0)
 
-        # Update the output object with the exported data
-        output.mark_complete(output=ContentFile(datafile, filename))
+            # Update the output object with the exported data
+            output.mark_complete(output=File(datafile, filename))
 
     def list(self, request, *args, **kwargs):
         """Override the list method to determine export options."""
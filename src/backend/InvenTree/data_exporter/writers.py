@@ -0,0 +1,152 @@
+"""File writers for the exporter app.
+
+Exported data is written to file one row at a time,
+so that the entire dataset does not need to be held in memory.
+"""
+
+import csv
+import io
+from collections.abc import Iterable
+from typing import IO
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import KNOWN_TYPES
+from openpyxl.styles import Alignment, Font
+
+
+class ExportWriter:
+    """Base class for writing exported data to a file.
+
+    Attributes:
+        file: The (binary) file object to write to
+    """
+
+    def __init__(self, file: IO[bytes]):
+        """Initialize the writer for the provided file."""
+        self.file = file
+
+    def write_headers(self, headers: list) -> None:
+        """Write the header row to the file."""
+        self.write_row(headers)
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the file."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finalize the file once all rows have been written."""
+
+
+class CSVWriter(ExportWriter):
+    """Write exported data to a delimited text file (e.g. CSV or TSV)."""
+
+    def __init__(self, file: IO[bytes], delimiter: str = ','):
+        """Initialize the writer with the provided delimiter."""
+        super().__init__(file)
+
+        self.text = io.TextIOWrapper(file, encoding='utf-8', newline='')
+        self.writer = csv.writer(self.text, delimiter=delimiter)
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the file."""
+        self.writer.writerow(row)
+
+    def close(self) -> None:
+        """Flush the text buffer, and release the underlying file."""
+        self.text.flush()
+        self.text.detach()
+
+
+class XLSXWriter(ExportWriter):
+    """Write exported data to an Excel file.
+
+    The workbook is created in 'write-only' mode, so rows are not retained in memory.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        """Initialize an empty (write-only) workbook."""
+        super().__init__(file)
+
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(title='InvenTree Export')
+        self.wrap_text = Alignment(wrap_text=True)
+
+    def cell(self, value):
+        """Return a cell value which can be written to the worksheet."""
+        if value is not None and not isinstance(value, KNOWN_TYPES):
+            value = str(value)
+
+        if isinstance(value, str) and '\n' in value:
+            cell = WriteOnlyCell(self.sheet, value=value)
+            cell.alignment = self.wrap_text
+            return cell
+
+        return value
+
+    def write_headers(self, headers: list) -> None:
+        """Write the header row (in bold), and freeze it in place."""
+        bold = Font(bold=True)
+
+        cells = []
+
+        for header in headers:
+            cell = WriteOnlyCell(self.sheet, value=str(header))
+            cell.font = bold
+            cells.append(cell)
+
+        self.sheet.freeze_panes = 'A2'
+        self.sheet.append(cells)
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the worksheet."""
+        self.sheet.append([self.cell(value) for value in row])
+
+    def close(self) -> None:
+        """Save the workbook to the file."""
+        self.workbook.save(self.file)
+
+
+def get_writer(file: IO[bytes], file_format: str) -> ExportWriter:
+    """Return a writer for the specified file format.
+
+    Raises:
+        ValueError: If the file format is not supported
+    """
+    match str(file_format).lower():
+        case 'csv':
+            return CSVWriter(file)
+        case 'tsv':
+            return CSVWriter(file, delimiter='\t')
+        case 'xlsx':
+            return XLSXWriter(file)
+
+    raise ValueError(f'Unsupported export format: {file_format}')
+
+
+def write_rows(
+    file: IO[bytes], headers: list, rows: Iterable[list], file_format: str
+) -> int:
+    """Write the provided rows to file, in the specified format.
+
+    Arguments:
+        file: The (binary) file object to write to
+        headers: The header labels for the exported data
+        rows: An iterable of rows (each row is a list of values)
+        file_format: The file format to export to
+
+    Returns:
+        The number of rows written (excluding the header row)
+    """
+    writer = get_writer(file, file_format)
+    writer.write_headers(headers)
+
+    count = 0
+
+    for row in rows:
+        writer.write_row(row)
+        count += 1
+
+    writer.close()
+
+    return count
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('importer', '0008_alter_dataimportrow_data_alter_dataimportrow_errors_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataimportsession',
+            name='progress',
+            field=models.PositiveIntegerField(default=0, help_text='Number of rows which have been validated', verbose_name='Progress'),
+        ),
+    ]
@@ -3,6 +3,7 @@
 import json
 from collections import OrderedDict
 from datetime import datetime
+from itertools import batched
 from typing import Optional
 
 from django.contrib.auth.models import User
@@ -45,6 +46,9 @@ class DataImportSession(models.Model):
 
     ID_FIELD_LABEL = 'id'
 
+    # Number of rows processed in each chunk
+    IMPORT_CHUNK_SIZE = 500
+
     class ModelChoices(RenderChoices):
         """Model choices for data import sessions."""
 
@@ -135,6 +139,12 @@ class DataImportSession(models.Model):
         help_text=_('If enabled, existing records will be updated with new data'),
     )
 
+    progress = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Progress'),
+        help_text=_('Number of rows which have been validated'),
+    )
+
     @property
     def field_mapping(self) -> dict:
         """Construct a dict of field mappings for this import session.
@@ -343,7 +353,16 @@ class DataImportSession(models.Model):
         offload_task(importer.tasks.import_data, self.pk, group='importer')
 
     def import_data(self) -> None:
-        """Perform the data import process for this session."""
+        """Perform the data import process for this session.
+
+        - Rows are extracted from the data file in chunks
+        - Related field values are resolved in bulk, once per chunk
+        - Extracted rows are written to the database with bulk inserts
+        - Rows are then validated in chunks, which may be split across background tasks
+        """
+        from InvenTree.status import is_worker_running
+        from InvenTree.tasks import offload_task
+
         # Clear any existing data rows
         self.rows.all().delete()
 
@@ -356,36 +375,119 @@ class DataImportSession(models.Model):
 
         headers = importer.operations.normalize_headers(df.headers)
 
-        imported_rows = []
-
         field_mapping = self.field_mapping
         available_fields = self.available_fields()
+        field_lookup_mapping = self.field_lookup_mapping
 
-        # Iterate through each "row" in the data file, and create a new DataImportRow object
-        for idx, row in enumerate(df):
-            row_data = dict(zip(headers, row, strict=False))
+        resolver = importer.operations.RelatedFieldResolver(
+            self, field_mapping, available_fields
+        )
 
-            # Skip completely empty rows
-            if not any(row_data.values()):
-                continue
+        self.progress = 0
+        self.save()
+
+        file_rows = (
+            (idx, dict(zip(headers, row, strict=False))) for idx, row in enumerate(df)
+        )
+
+        # Skip completely empty rows
+        file_rows = (
+            (idx, row_data) for idx, row_data in file_rows if any(row_data.values())
+        )
+
+        # Extract data for each "row" in the data file, one chunk at a time
+        for chunk in batched(file_rows, self.IMPORT_CHUNK_SIZE):
+            resolver.load([row_data for _idx, row_data in chunk])
+
+            imported_rows = []
+
+            for idx, row_data in chunk:
+                row = DataImportRow(session=self, row_data=row_data, row_index=idx)
+
+                row.extract_data(
+                    field_mapping=field_mapping,
+                    available_fields=available_fields,
+                    field_lookup_mapping=field_lookup_mapping,
+                    resolver=resolver,
+                    commit=False,
+                )
+
+                imported_rows.append(row)
+
+            # Perform database writes as a single operation
+            DataImportRow.objects.bulk_create(imported_rows, batch_size=250)
+
+        row_ids = list(self.rows.order_by('row_index').values_list('pk', flat=True))
+
+        if not row_ids:
+            # No rows to validate - mark the import task as "PROCESSING"
+            self.status = DataImportStatusCode.PROCESSING.value
+            self.save()
+            return
 
-            row = DataImportRow(session=self, row_data=row_data, row_index=idx)
+        chunks = list(batched(row_ids, self.IMPORT_CHUNK_SIZE))
 
-            row.extract_data(
-                field_mapping=field_mapping,
-                available_fields=available_fields,
-                commit=False,
+        if len(chunks) > 1 and is_worker_running():
+            # Split row validation across multiple background tasks
+            logger.info(
+                'Validating %s import rows in %s chunks', len(row_ids), len(chunks)
             )
 
-            row.valid = row.validate(commit=False)
-            imported_rows.append(row)
+            for chunk in chunks:
+                offload_task(
+                    importer.tasks.validate_rows,
+                    self.pk,
+                    list(chunk),
+                    force_async=True,
+                    group='importer',
+                )
+        else:
+            for chunk in chunks:
+                self.validate_rows(list(chunk))
 
-        # Perform database writes as a single operation
-        DataImportRow.objects.bulk_create(imported_rows, batch_size=250)
+    def validate_rows(self, row_ids: list[int]) -> None:
+        """Validate a chunk of rows for this import session.
 
-        # Mark the import task as "PROCESSING"
-        self.status = DataImportStatusCode.PROCESSING.value
-        self.save()
+        Once all rows have been validated, the session is marked as "PROCESSING".
+
+        Arguments:
+            row_ids: The primary keys of the rows to validate
+        """
+        rows = list(self.rows.filter(pk__in=row_ids).order_by('row_index'))
+
+        for row in rows:
+            # Share the session instance (and cached field data) between rows
+            row.session = self
+
+            try:
+                row.valid = row.validate(commit=False)
+            except DjangoValidationError as exc:
+                row.errors = {'non_field_errors': '; '.join(exc.messages)}
+                row.valid = False
+
+        DataImportRow.objects.bulk_update(rows, ['valid', 'errors'], batch_size=250)
+
+        self.update_progress(len(row_ids))
+
+    def update_progress(self, count: int) -> None:
+        """Record the validation of the provided number of rows.
+
+        The progress is incremented and read back within a single transaction,
+        so that exactly one chunk observes the completion of the validation process.
+        """
+        with transaction.atomic():
+            DataImportSession.objects.filter(pk=self.pk).update(
+                progress=models.F('progress') + count
+            )
+
+            self.progress = DataImportSession.objects.values_list(
+                'progress', flat=True
+            ).get(pk=self.pk)
+
+        if self.progress >= self.row_count:
+            # Mark the import task as "PROCESSING"
+            self.status = DataImportStatusCode.PROCESSING.value
+            self.save()
 
     def check_complete(self) -> bool:
         """Check if the import session is complete.
@@ -724,9 +826,19 @@ class DataImportRow(models.Model):
         self,
         available_fields: Optional[dict] = None,
         field_mapping: Optional[dict] = None,
+        field_lookup_mapping: Optional[dict] = None,
+        resolver: Optional[importer.operations.RelatedFieldResolver] = None,
         commit=True,
     ):
-        """Extract row data from the provided data dictionary."""
+        """Extract row data from the provided data dictionary.
+
+        Arguments:
+            available_fields: The available field definitions for the import session
+            field_mapping: The field -> column mapping for the import session
+            field_lookup_mapping: The field -> lookup_field mapping for the import session
+            resolver: Optional RelatedFieldResolver containing pre-resolved related field values
+            commit: If True, save the row to the database
+        """
         if not field_mapping:
             field_mapping = self.session.field_mapping
 
@@ -740,8 +852,10 @@ class DataImportRow(models.Model):
         extract_errors = {}
 
         self.related_field_map = {}
+        self.related_field_resolver = resolver
 
-        field_lookup_mapping = self.session.field_lookup_mapping
+        if field_lookup_mapping is None:
+            field_lookup_mapping = self.session.field_lookup_mapping
 
         # We have mapped column (file) to field (serializer) already
         for field, col in field_mapping.items():
@@ -870,6 +984,12 @@ class DataImportRow(models.Model):
         if field_name is None or field_name == '':
             return value
 
+        # Use the pre-resolved value, if available
+        resolver = getattr(self, 'related_field_resolver', None)
+
+        if resolver and resolver.is_resolved(field_name, value):
+            return resolver.get(field_name, value)
+
         if field_name in self.related_field_map:
             model = self.related_field_map[field_name]
         else:
@@ -994,7 +1114,7 @@ class DataImportRow(models.Model):
 
         return None
 
-    def _process_serializer(self, serializer, commit) -> bool:
+    def _process_serializer(self, serializer, commit, check_complete=True) -> bool:
         """Run is_valid() against the provided serializer, and save it if requested."""
         if not serializer:
             self.errors = {
@@ -1022,16 +1142,19 @@ class DataImportRow(models.Model):
                     result = False
 
                 self.save()
-                self.session.check_complete()
+
+                if check_complete:
+                    self.session.check_complete()
 
         return result
 
-    def validate(self, commit=False, request=None) -> bool:
+    def validate(self, commit=False, request=None, check_complete=True) -> bool:
         """Validate the data in this row against the linked serializer.
 
         Arguments:
             commit: If True, the data is saved to the database (if validation passes)
             request: The request object (if available) for extracting user information
+            check_complete: If True, check if the import session is complete after saving
 
         Returns:
             True if the data is valid, False otherwise
@@ -1078,7 +1201,9 @@ class DataImportRow(models.Model):
                     serializer = self.construct_serializer(
                         instance=instance, request=request
                     )
-                    return self._process_serializer(serializer, commit)
+                    return self._process_serializer(
+                        serializer, commit, check_complete=check_complete
+                    )
 
             instance = self._get_update_instance(instance_id, queryset)
 
@@ -1090,4 +1215,6 @@ class DataImportRow(models.Model):
         else:
             serializer = self.construct_serializer(request=request)
 
-        return self._process_serializer(serializer, commit)
+        return self._process_serializer(
+            serializer, commit, check_complete=check_complete
+        )
@@ -1,8 +1,9 @@
 """Data import operational functions."""
 
+from itertools import batched
 from typing import Optional
 
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
 from django.utils.translation import gettext_lazy as _
 
 import tablib
@@ -130,3 +131,176 @@ def get_field_label(field) -> Optional[str]:
     # TODO: Check if the field is a model field
 
     return None
+
+
+class RelatedFieldResolver:
+    """Resolve the values for related (foreign-key) fields in bulk.
+
+    Rather than querying the database separately for each row,
+    the distinct values for each related field are looked up together,
+    with a single query per lookup field.
+
+    Values are resolved using the same rules as DataImportRow.lookup_related_field:
+
+    - If a lookup field is specified, the value must match exactly one instance
+    - Otherwise, the value is checked against the 'pk' and any IMPORT_ID_FIELDS of the related model
+    - If the value matches different instances for different lookup fields, it is ambiguous
+    - If no match is found, the original value is retained (and reported by the serializer)
+    """
+
+    # Maximum number of values included in a single database query
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, session, field_mapping: dict, available_fields: dict):
+        """Initialize the resolver for the provided import session.
+
+        Arguments:
+            session: The DataImportSession object
+            field_mapping: The field -> column mapping for the import session
+            available_fields: The available field definitions for the import session
+        """
+        self.session = session
+        self.lookup_mapping = session.field_lookup_mapping
+        self.field_filters = session.field_filters or {}
+
+        overrides = session.field_overrides or {}
+
+        # Map of related field -> data column
+        self.columns = {
+            field: column
+            for field, column in field_mapping.items()
+            if column
+            and field not in overrides
+            and available_fields.get(field, {}).get('type') == 'related field'
+        }
+
+        # Map of related field -> {value: result}
+        self.results: dict[str, dict] = {field: {} for field in self.columns}
+
+    def load(self, rows: list[dict]) -> None:
+        """Resolve the related field values for the provided rows.
+
+        Arguments:
+            rows: A list of row data dicts (column -> value)
+        """
+        for field, column in self.columns.items():
+            results = self.results[field]
+
+            values = {
+                value
+                for row in rows
+                if (value := row.get(column)) not in [None, ''] and value not in results
+            }
+
+            if values:
+                results.update(self.resolve(field, values))
+
+    def is_resolved(self, field: str, value) -> bool:
+        """Return True if a result is available for the provided value."""
+        try:
+            return value in self.results.get(field, {})
+        except TypeError:
+            return False
+
+    def get(self, field: str, value):
+        """Return the resolved value for the provided field.
+
+        Raises:
+            ValidationError: If the value matches multiple instances
+        """
+        result = self.results[field][value]
+
+        if isinstance(result, ValidationError):
+            raise result
+
+        return result
+
+    def resolve(self, field: str, values: set) -> dict:
+        """Resolve a set of values for a single related field.
+
+        Returns:
+            A dict of value -> result (for each value which could be resolved)
+        """
+        model = self.session.get_related_model(field)
+
+        if not model:
+            # Fall back to the per-row lookup, which reports the error
+            return {}
+
+        lookup_field = self.lookup_mapping.get(field)
+
+        if lookup_field and type(lookup_field) is str:
+            id_fields = [lookup_field]
+        else:
+            lookup_field = None
+            id_fields = ['pk', *getattr(model, 'IMPORT_ID_FIELDS', [])]
+
+        # Map of value -> list of matching primary keys (one entry for each lookup field)
+        matches = {value: [] for value in values}
+
+        for id_field in id_fields:
+            try:
+                field_matches = self.match_values(model, field, id_field, values)
+            except (FieldDoesNotExist, FieldError, ValueError):
+                # Unable to perform bulk lookup - fall back to the per-row lookup
+                return {}
+
+            for value, pks in field_matches.items():
+                matches[value].append(pks)
+
+        results = {}
+
+        for value, value_matches in matches.items():
+            # Only lookup fields which match exactly one instance are considered
+            valid_items = {pks[0] for pks in value_matches if len(pks) == 1}
+
+            if lookup_field:
+                results[value] = valid_items.pop() if valid_items else value
+            elif len(valid_items) == 1:
+                results[value] = valid_items.pop()
+            elif len(valid_items) > 1:
+                results[value] = ValidationError(
+                    _(
+                        'Multiple matches found for value - please ensure the value is unique, or select a specific lookup field'
+                    )
+                )
+            else:
+                results[value] = value
+
+        return results
+
+    def match_values(self, model, field: str, id_field: str, values: set) -> dict:
+        """Find the instances which match each value against a single lookup field.
+
+        Returns:
+            A dict of value -> list of matching primary keys
+        """
+        model_field = (
+            model._meta.pk if id_field == 'pk' else model._meta.get_field(id_field)
+        )
+
+        # Convert each value to the field type, to match against the database value
+        keys = {}
+
+        for value in values:
+            try:
+                keys.setdefault(model_field.to_python(value), []).append(value)
+            except (ValidationError, TypeError, ValueError):
+                # Value cannot be matched against this field
+                continue
+
+        matches = {}
+
+        if not keys:
+            return matches
+
+        queryset = model.objects.filter(**self.field_filters.get(field, {}))
+
+        for chunk in batched(keys.keys(), self.QUERY_CHUNK_SIZE):
+            for key, pk in queryset.filter(**{f'{id_field}__in': chunk}).values_list(
+                id_field, 'pk'
+            ):
+                for value in keys.get(key, []):
+                    matches.setdefault(value, []).append(pk)
+
+        return matches
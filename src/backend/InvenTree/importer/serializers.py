@@ -9,6 +9,7 @@ from rest_framework import serializers
 
 import importer.models
 import importer.registry
+import InvenTree.trees
 from InvenTree.serializers import (
     InvenTreeAttachmentSerializerField,
     InvenTreeModelSerializer,
@@ -62,10 +63,11 @@ class DataImportSessionSerializer(InvenTreeModelSerializer):
             'field_filters',
             'row_count',
             'completed_row_count',
+            'progress',
             'completed_row_count_history',
             'row_count_history',
         ]
-        read_only_fields = ['pk', 'user', 'status', 'columns']
+        read_only_fields = ['pk', 'user', 'status', 'columns', 'progress']
 
     def __init__(self, *args, **kwargs):
         """Override the constructor for the DataImportSession serializer."""
@@ -232,7 +234,7 @@ class DataImportAcceptRowSerializer(serializers.Serializer):
             raise ValidationError(_('No rows provided'))
 
         for row in rows:
-            if row.session != session:
+            if session is None or row.session_id != session.pk:
                 raise ValidationError(_('Row does not belong to this session'))
 
             if not row.valid:
@@ -248,11 +250,21 @@ class DataImportAcceptRowSerializer(serializers.Serializer):
         rows = self.validated_data['rows']
 
         request = self.context.get('request', None)
+        session = self.context.get('session', None)
 
-        for row in rows:
-            row.validate(commit=True, request=request)
+        model_class = session.model_class if session else None
+
+        # Tree models are rebuilt once, after all rows have been processed
+        with InvenTree.trees.deferred_tree_updates(model_class):
+            for row in rows:
+                # Share the session instance (and cached field data) between rows
+                if session:
+                    row.session = session
+
+                # Session completion is checked once, after all rows have been processed
+                row.validate(commit=True, request=request, check_complete=False)
 
-        if session := self.context.get('session', None):
+        if session:
             # ensure current state is available
             session.refresh_from_db()
             session.check_complete()
@@ -26,6 +26,22 @@ def import_data(session_id: int):
         return
 
 
+def validate_rows(session_id: int, row_ids: list[int]):
+    """Validate a chunk of rows for the provided import session.
+
+    Large import sessions are split into chunks, which are validated in parallel.
+    """
+    import importer.models
+
+    try:
+        session = importer.models.DataImportSession.objects.get(pk=session_id)
+    except (ValueError, importer.models.DataImportSession.DoesNotExist):
+        logger.error("Data import session with ID '%s' does not exist", session_id)
+        return
+
+    session.validate_rows(row_ids)
+
+
 @InvenTree.tasks.scheduled_task(InvenTree.tasks.ScheduledTask.DAILY)
 def cleanup_import_sessions():
     """Periodically remove old import sessions.
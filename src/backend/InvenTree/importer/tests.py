@@ -370,6 +370,88 @@ class ImporterTest(ImporterMixin, InvenTreeTestCase):
         result = row.lookup_related_field('part', 'AMBIG-001', lookup_field='name')
         self.assertNotEqual(result, part_a.pk)
 
+    def test_related_field_resolver(self):
+        """Test that related field values are resolved in bulk, matching the per-row lookup."""
+        from django.core.exceptions import ValidationError as DjangoValidationError
+
+        from importer.operations import RelatedFieldResolver
+        from part.models import Part, PartCategory
+
+        category = PartCategory.objects.create(
+            name='Resolver Category', description='Test category'
+        )
+
+        part_a = Part.objects.create(
+            category=category, name='Widget', description='desc', IPN='AMBIG-001'
+        )
+        part_b = Part.objects.create(
+            category=category, name='AMBIG-001', description='desc', IPN='WIDGET-002'
+        )
+
+        session = DataImportSession.objects.create(
+            data_file=self.helper_file('companies.csv'), model_type='stockitem'
+        )
+
+        resolver = RelatedFieldResolver(
+            session, {'part': 'Part'}, {'part': {'type': 'related field'}}
+        )
+
+        values = ['AMBIG-001', 'Widget', 'WIDGET-002', str(part_a.pk), 'missing']
+
+        # All values are resolved with a fixed number of queries
+        with self.assertNumQueriesLessThan(5):
+            resolver.load([{'Part': value} for value in values])
+
+        self.assertEqual(resolver.get('part', 'Widget'), part_a.pk)
+        self.assertEqual(resolver.get('part', 'WIDGET-002'), part_b.pk)
+        self.assertEqual(resolver.get('part', str(part_a.pk)), part_a.pk)
+        self.assertEqual(resolver.get('part', 'missing'), 'missing')
+
+        # The resolved values match the per-row lookup
+        row = DataImportRow(session=session)
+        row.related_field_map = {}
+
+        for value in values[1:]:
+            self.assertEqual(
+                resolver.get('part', value), row.lookup_related_field('part', value)
+            )
+
+        # Ambiguous values raise an error, as per the per-row lookup
+        row.related_field_resolver = resolver
+
+        with self.assertRaises(DjangoValidationError):
+            row.lookup_related_field('part', 'AMBIG-001')
+
+    @mock.patch.object(DataImportSession, 'IMPORT_CHUNK_SIZE', 5)
+    def test_chunked_import(self):
+        """Test that rows are imported and validated in chunks."""
+        from importer.status_codes import DataImportStatusCode
+
+        session = DataImportSession.objects.create(
+            data_file=self.helper_file('companies.csv'), model_type='company'
+        )
+
+        session.extract_columns()
+
+        with mock.patch.object(
+            DataImportSession,
+            'validate_rows',
+            autospec=True,
+            side_effect=DataImportSession.validate_rows,
+        ) as validate_rows:
+            session.import_data()
+
+        # 12 rows, validated in chunks of 5 rows
+        self.assertEqual(validate_rows.call_count, 3)
+
+        session.refresh_from_db()
+        self.assertEqual(session.rows.count(), 12)
+        self.assertEqual(session.progress, 12)
+        self.assertEqual(session.status, DataImportStatusCode.PROCESSING.value)
+
+        for row in session.rows.all():
+            self.assertTrue(row.valid)
+
     def test_extract_data_related_field_validation_error(self):
         """Test that extract_data() handles a dict-constructed ValidationError.
 
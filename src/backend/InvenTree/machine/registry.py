@@ -4,6 +4,7 @@ import functools
 from typing import Any, Optional, cast
 from uuid import UUID
 
+from django.db import transaction
 from django.db.utils import IntegrityError, OperationalError, ProgrammingError
 
 import structlog
@@ -12,6 +13,7 @@ import InvenTree.cache
 from common.settings import get_global_setting, set_global_setting
 from InvenTree.exceptions import log_error
 from InvenTree.helpers_mixin import get_shared_class_instance_state_mixin
+from InvenTree.invalidation import RegistryGeneration
 from machine.machine_type import BaseDriver, BaseMachineType
 
 logger = structlog.get_logger('inventree')
@@ -53,7 +55,6 @@ def machine_registry_entrypoint(
 
             elif not getattr(self, '__checking_reload', False):
                 # Avoid recursive reloads
-                do_reload = True
                 self.__checking_reload = True
 
                 if check_reload:
@@ -63,10 +64,11 @@ def machine_registry_entrypoint(
                             'Plugin registry changed - reloading machine registry'
                         )
                         self.reload_machines()
+                        do_reload = True
 
                     else:
                         # Check if the machine registry needs to be reloaded
-                        self._check_reload()
+                        do_reload = self._check_reload()
 
                 self.__checking_reload = False
 
@@ -113,6 +115,9 @@ class MachineRegistry(
         # Keep an internal hash of the machine registry state
         self._hash = None
 
+        # Shared generation counter, used to detect changes made by other processes
+        self.generation = RegistryGeneration('machine')
+
     @property
     def errors(self) -> list[str | Exception]:
         """List of registry errors."""
@@ -282,6 +287,9 @@ class MachineRegistry(
 
         self.set_shared_state('errors', [])
 
+        # Record the shared generation *before* loading, so that no changes are missed
+        self.generation.mark_current(self.generation.start_load())
+
         self.discover_machine_types()
         self.discover_drivers()
         self.load_machines(main=main)
@@ -439,7 +447,12 @@ class MachineRegistry(
         return str(data.hexdigest())
 
     def _check_reload(self):
-        """Check if the registry needs to be reloaded, and reload it."""
+        """Check if the registry needs to be reloaded, and reload it.
+
+        The registry hash is only compared against the database if the shared
+        generation counter indicates that another process has changed the registry
+        (or, if the global cache is not enabled, once every REGISTRY_POLL_INTERVAL seconds).
+        """
         from plugin import registry as plg_registry
 
         do_reload: bool = False
@@ -448,18 +461,23 @@ class MachineRegistry(
         if plugin_registry_hash != plg_registry.registry_hash:
             do_reload = True
 
-        if not self._hash:
-            self._hash = self._calculate_registry_hash()
+        elif self.generation.should_check():
+            if not self._hash:
+                self._hash = self._calculate_registry_hash()
 
-        try:
-            reg_hash = get_global_setting('_MACHINE_REGISTRY_HASH', '', create=False)
-        except Exception as exc:
-            logger.exception('Failed to get machine registry hash: %s', exc)
-            return False
+            try:
+                reg_hash = get_global_setting(
+                    '_MACHINE_REGISTRY_HASH', '', create=False
+                )
+            except Exception as exc:
+                logger.exception('Failed to get machine registry hash: %s', exc)
+                return False
 
-        if reg_hash and reg_hash != self._hash:
-            logger.info('Machine registry has changed - reloading machines')
-            do_reload = True
+            if reg_hash and reg_hash != self._hash:
+                logger.info('Machine registry has changed - reloading machines')
+                do_reload = True
+            else:
+                self.generation.mark_current()
 
         if do_reload:
             self.reload_machines()
@@ -482,6 +500,10 @@ class MachineRegistry(
             try:
                 logger.info('Updating machine registry hash: %s', self._hash)
                 set_global_setting('_MACHINE_REGISTRY_HASH', self._hash)
+
+                # Notify other processes that the registry has changed
+                # (once the new hash is visible to them)
+                transaction.on_commit(self.generation.bump)
             except (IntegrityError, OperationalError, ProgrammingError):
                 pass
             except Exception as exc:
@@ -1257,6 +1257,9 @@ class PurchaseOrder(TotalPriceMixin, Order):
                 bulk_create_and_fetch(stock.models.StockItem, bulk_create_items)
             )
 
+            # bulk_create() also bypasses the barcode index update
+            common_models.BarcodeIndex.update_instances(new_items)
+
             stock_items.extend(new_items)
 
         # Generate a new tracking entry for each stock item
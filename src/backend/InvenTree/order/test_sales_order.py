@@ -23,6 +23,7 @@ from InvenTree import status_codes as status
 from InvenTree.unit_test import (
     InvenTreeAPITestCase,
     InvenTreeTestCase,
+    activateEventPlugin,
     addUserPermission,
 )
 from order.models import (
@@ -586,6 +587,7 @@ class SalesOrderTest(InvenTreeAPITestCase):
         # Enable plugin events, and queue them (rather than firing synchronously),
         # so we can inspect exactly what was queued once the shipment is completed
         set_global_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         # Start with a fresh slate for the OrmQ queue
         OrmQ.objects.all().delete()
@@ -627,21 +629,21 @@ class SalesOrderTest(InvenTreeAPITestCase):
 
         queued_tasks = list(OrmQ.objects.all())
 
-        # register_event tasks queued for StockEvents.ITEM_SPLIT, one per split item
+        # process_event tasks queued for StockEvents.ITEM_SPLIT, one per split item
         split_event_tasks = [
             task
             for task in queued_tasks
-            if task.func() == 'plugin.base.event.events.register_event'
-            and task.args() == (StockEvents.ITEM_SPLIT,)
+            if task.func() == 'plugin.base.event.events.process_event'
+            and task.args() == ('sampleevent', StockEvents.ITEM_SPLIT)
         ]
         self.assertEqual(len(split_event_tasks), len(split_pks))
 
-        # register_event tasks queued for StockEvents.ITEM_ASSIGNED_TO_CUSTOMER, one per item
+        # process_event tasks queued for StockEvents.ITEM_ASSIGNED_TO_CUSTOMER, one per item
         customer_event_tasks = [
             task
             for task in queued_tasks
-            if task.func() == 'plugin.base.event.events.register_event'
-            and task.args() == (StockEvents.ITEM_ASSIGNED_TO_CUSTOMER,)
+            if task.func() == 'plugin.base.event.events.process_event'
+            and task.args() == ('sampleevent', StockEvents.ITEM_ASSIGNED_TO_CUSTOMER)
         ]
         self.assertEqual(len(customer_event_tasks), N_ITEMS)
 
@@ -43,6 +43,17 @@ class PartPricingAdmin(admin.ModelAdmin):
     autocomplete_fields = ['part']
 
 
+@admin.register(models.PartAvailability)
+class PartAvailabilityAdmin(admin.ModelAdmin):
+    """Admin class for PartAvailability model."""
+
+    list_display = ('part', 'in_stock', 'can_build', 'updated')
+
+    search_fields = ['part__name', 'part__IPN', 'part__description']
+
+    autocomplete_fields = ['part']
+
+
 @admin.register(models.PartStocktake)
 class PartStocktakeAdmin(admin.ModelAdmin):
     """Admin class for PartStocktake model."""
@@ -8,7 +8,7 @@ import django_filters.rest_framework.filters as rest_filters
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters.rest_framework.filterset import FilterSet
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import extend_schema, extend_schema_field
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_field
 from rest_framework import serializers
 from rest_framework.response import Response
 
@@ -47,6 +47,7 @@ from InvenTree.mixins import (
     UpdateAPI,
 )
 from InvenTree.tasks import offload_task
+from part.availability import use_cached_availability
 from stock.models import StockLocation
 
 from . import serializers as part_serializers
@@ -562,11 +563,28 @@ class PartRequirements(RetrieveAPI):
     - How many of this part can be assembled with available stock
 
     As this data is somewhat complex to calculate, is it not included in the default API
+
+    If the part availability cache is enabled, the 'can build' quantity is read from the cache,
+    unless the 'live' query parameter is provided.
     """
 
     queryset = Part.objects.all()
     serializer_class = part_serializers.PartRequirementsSerializer
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='live',
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description='Calculate availability data live (ignoring any cached values)',
+            )
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        """Return the requirements data for the specified part."""
+        return super().get(request, *args, **kwargs)
+
 
 class PartPricingDetail(RetrieveUpdateAPI):
     """API endpoint for viewing part pricing data."""
@@ -587,6 +605,58 @@ class PartPricingDetail(RetrieveUpdateAPI):
         return self.serializer_class(**kwargs)
 
 
+class PartBomExplosion(RetrieveAPI):
+    """API endpoint for returning the exploded (multi-level) BOM for a particular part.
+
+    Returns a flattened list of all BOM lines, at all levels of the BOM,
+    with the total quantity of each line rolled up to the top-level assembly.
+    """
+
+    queryset = Part.objects.all()
+    serializer_class = part_serializers.BomExplosionSerializer
+    role_required = 'bom'
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='levels',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Maximum number of BOM levels to return (zero = all levels)',
+            )
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        """Return the exploded BOM for the specified part."""
+        from part.bom import BomExplosion
+
+        part = self.get_object()
+
+        try:
+            levels = max(int(request.query_params.get('levels', 0)), 0)
+        except (TypeError, ValueError):
+            levels = 0
+
+        explosion = BomExplosion(part)
+
+        rows = explosion.get_rows(levels=levels)
+        alternatives = explosion.alternatives(rows)
+
+        data = {
+            'part': part.pk,
+            'levels': max([row['level'] for row in rows], default=0),
+            'rows': [{**row, **alternatives[row['bom_item']]} for row in rows],
+            'totals': [
+                {'part': pk, 'quantity': quantity}
+                for pk, quantity in explosion.totals(levels=levels).items()
+            ],
+        }
+
+        serializer = self.get_serializer(data)
+
+        return Response(serializer.data)
+
+
 class PartSerialNumberDetail(RetrieveAPI):
     """API endpoint for returning extra serial number information about a particular part."""
 
@@ -1041,6 +1111,22 @@ class PartFilter(FilterSet):
         children = category.getUniqueChildren()
         return queryset.filter(category__in=children)
 
+    live = rest_filters.BooleanFilter(
+        method='filter_live',
+        label=_('Live Availability'),
+        help_text=_(
+            'If true, calculate stock availability data live (ignoring any cached values)'
+        ),
+    )
+
+    def filter_live(self, queryset, name, value):
+        """Dummy filter method for 'live'.
+
+        - Ensures 'live' appears in API documentation
+        - Does NOT actually filter the queryset directly
+        """
+        return queryset
+
 
 class PartMixin(SerializerContextMixin):
     """Mixin class for Part API endpoints."""
@@ -1057,7 +1143,9 @@ class PartMixin(SerializerContextMixin):
         """Return an annotated queryset object for the PartDetail endpoint."""
         queryset = super().get_queryset(*args, **kwargs)
 
-        queryset = part_serializers.PartSerializer.annotate_queryset(queryset)
+        queryset = part_serializers.PartSerializer.annotate_queryset(
+            queryset, cached=use_cached_availability(self.request)
+        )
 
         return queryset
 
@@ -1722,6 +1810,12 @@ part_api_urls = [
             ),
             # Endpoint for duplicating a BOM for the specific Part
             path('bom-copy/', PartCopyBOM.as_view(), name='api-part-bom-copy'),
+            # Endpoint for the exploded (multi-level) BOM for the specific Part
+            path(
+                'bom-explosion/',
+                PartBomExplosion.as_view(),
+                name='api-part-bom-explosion',
+            ),
             # Endpoint for validating a BOM for the specific Part
             path(
                 'bom-validate/', PartValidateBOM.as_view(), name='api-part-bom-validate'
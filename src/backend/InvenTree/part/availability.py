@@ -0,0 +1,554 @@
+"""Materialized stock availability data for parts.
+
+Calculating the stock availability for a part (and in particular, the "can build"
+quantity for an assembly) requires a large number of subqueries, which must be
+evaluated for every part (and every BOM line) on every request.
+
+If the PART_AVAILABILITY_CACHE setting is enabled, these values are instead stored in
+the PartAvailability table, and updated incrementally whenever the underlying data changes:
+
+- Changes to stock items, stock allocations, BOM lines and the variant tree schedule an update
+  for the affected parts
+- Any templates and assemblies which depend on the affected parts are updated at the same time
+- All values for each affected part are calculated with a fixed number of bulk queries
+
+The calculations here mirror the "live" annotations provided in part.filters
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from itertools import batched
+from typing import Optional
+
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+import structlog
+
+import InvenTree.ready
+from build.models import BuildItem
+from build.status_codes import BuildStatusGroups
+from common.settings import get_global_setting
+from InvenTree.helpers import str2bool
+from order.models import (
+    PurchaseOrderLineItem,
+    SalesOrderAllocation,
+    TransferOrderAllocation,
+)
+from order.status_codes import (
+    PurchaseOrderStatusGroups,
+    SalesOrderStatusGroups,
+    TransferOrderStatusGroups,
+)
+from part.models import BomItem, BomItemSubstitute, Part, PartAvailability
+from part.pricing import QUERY_CHUNK_SIZE, PartTreeIndex, part_ids
+from stock.models import StockItem
+
+logger = structlog.get_logger('inventree')
+
+# Fields which are stored in the PartAvailability table
+AVAILABILITY_FIELDS = [
+    'in_stock',
+    'variant_stock',
+    'allocated_to_build_orders',
+    'allocated_to_sales_orders',
+    'allocated_to_transfer_orders',
+    'on_order',
+    'can_build',
+]
+
+
+def availability_cache_enabled() -> bool:
+    """Return True if the part availability cache is enabled."""
+    return bool(get_global_setting('PART_AVAILABILITY_CACHE', cache=True))
+
+
+def use_cached_availability(request=None) -> bool:
+    """Return True if cached availability data should be used for the provided API request.
+
+    The cache can be bypassed for a particular request with the 'live' query parameter.
+    """
+    if not availability_cache_enabled():
+        return False
+
+    if request is not None:
+        return not str2bool(request.query_params.get('live', False))
+
+    return True
+
+
+def schedule_availability_update(parts: Iterable) -> None:
+    """Schedule an update of the cached availability data for the provided parts.
+
+    No action is taken if the PART_AVAILABILITY_CACHE setting is disabled.
+    """
+    from InvenTree.tasks import offload_task
+    from part import tasks as part_tasks
+
+    if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+        return
+
+    if not InvenTree.ready.canAppAccessDatabase(allow_test=True):
+        return
+
+    if not availability_cache_enabled():
+        return
+
+    pks = sorted(pk for pk in part_ids(p for p in parts if p is not None) if pk)
+
+    if not pks:
+        return
+
+    offload_task(part_tasks.update_part_availability, pks, group='part')
+
+
+def sum_by_part(queryset, part_field: str, value) -> dict[int, Decimal]:
+    """Aggregate a queryset into a map of part ID -> summed value."""
+    results = (
+        queryset
+        .order_by()
+        .values(part_field)
+        .annotate(total=Sum(value))
+        .values_list(part_field, 'total')
+    )
+
+    return {pk: Decimal(total or 0) for pk, total in results}
+
+
+class AvailabilityCalculator:
+    """Bulk calculation of stock availability data for a set of parts.
+
+    Stock quantities are loaded for all required parts with a fixed number of queries,
+    and then combined (in memory) to produce the availability data for each part.
+    """
+
+    def __init__(self, progress: Optional[Callable[[int, int], None]] = None):
+        """Initialize the calculator.
+
+        Arguments:
+            progress: Optional callback function, called as progress(completed, total)
+        """
+        self.progress = progress
+        self.tree = PartTreeIndex()
+        self.quantities: dict[int, dict[str, Decimal]] = {}
+
+    def quantity(self, pk: int, field: str) -> Decimal:
+        """Return a loaded quantity value for the specified part."""
+        return self.quantities.get(pk, {}).get(field, Decimal(0))
+
+    def variant_quantity(self, pk: int, field: str) -> Decimal:
+        """Return the sum of a loaded quantity value for all variants of the specified part."""
+        return sum(
+            (self.quantity(v, field) for v in self.tree.descendants(pk)), Decimal(0)
+        )
+
+    def load_quantities(self, pks: Iterable[int]) -> None:
+        """Load stock quantity data for the provided parts (and any of their variants)."""
+        pks = set(pks)
+        self.tree.load(pks)
+
+        for pk in list(pks):
+            pks.update(self.tree.descendants(pk))
+
+        missing = pks - self.quantities.keys()
+
+        for chunk in batched(missing, QUERY_CHUNK_SIZE):
+            for pk in chunk:
+                self.quantities[pk] = {}
+
+            in_stock = StockItem.objects.filter(StockItem.IN_STOCK_FILTER).filter(
+                part__in=chunk
+            )
+
+            values = {
+                'in_stock': sum_by_part(in_stock, 'part', 'quantity'),
+                # Total allocations against in-stock items (used for variant stock calculations)
+                'stock_build_allocations': sum_by_part(
+                    in_stock, 'part', 'allocations__quantity'
+                ),
+                'stock_sales_allocations': sum_by_part(
+                    in_stock, 'part', 'sales_order_allocations__quantity'
+                ),
+                'allocated_to_build_orders': sum_by_part(
+                    BuildItem.objects.filter(
+                        build_line__build__status__in=BuildStatusGroups.ACTIVE_CODES,
+                        stock_item__part__in=chunk,
+                    ),
+                    'stock_item__part',
+                    'quantity',
+                ),
+                'allocated_to_sales_orders': sum_by_part(
+                    SalesOrderAllocation.objects.filter(
+                        line__order__status__in=SalesOrderStatusGroups.OPEN,
+                        shipment__shipment_date=None,
+                        item__part__in=chunk,
+                    ),
+                    'item__part',
+                    'quantity',
+                ),
+                'allocated_to_transfer_orders': sum_by_part(
+                    TransferOrderAllocation.objects.filter(
+                        line__order__status__in=TransferOrderStatusGroups.OPEN,
+                        item__part__in=chunk,
+                    ),
+                    'item__part',
+                    'quantity',
+                ),
+                'on_order': sum_by_part(
+                    PurchaseOrderLineItem.objects.filter(
+                        order__status__in=PurchaseOrderStatusGroups.OPEN,
+                        quantity__gt=F('received'),
+                        part__part__in=chunk,
+                    ),
+                    'part__part',
+                    ExpressionWrapper(
+                        (F('quantity') - F('received'))
+                        * F('part__pack_quantity_native'),
+                        output_field=DecimalField(),
+                    ),
+                ),
+            }
+
+            for field, totals in values.items():
+                for pk, total in totals.items():
+                    self.quantities[pk][field] = total
+
+    def find_dependents(self, pks: set[int]) -> set[int]:
+        """Find the parts whose availability data depends on the stock of the provided parts.
+
+        - Template parts depend on the stock of their variants
+        - Assemblies depend on the stock of the parts in their BOM (including variants and substitutes)
+
+        Returns:
+            The set of dependent parts (not including the provided parts)
+        """
+        self.tree.load(pks)
+
+        ancestors = set()
+
+        for pk in pks:
+            ancestors.update(self.tree.ancestors(pk))
+
+        # The "can build" calculation includes variant stock for every BOM line
+        sub_parts = pks | ancestors
+
+        assemblies = set()
+        inherited = set()
+
+        for chunk in batched(sub_parts, QUERY_CHUNK_SIZE):
+            for assembly, is_inherited in BomItem.objects.filter(
+                sub_part__in=chunk
+            ).values_list('part', 'inherited'):
+                assemblies.add(assembly)
+
+                if is_inherited:
+                    inherited.add(assembly)
+
+        for chunk in batched(pks, QUERY_CHUNK_SIZE):
+            for assembly, is_inherited in BomItemSubstitute.objects.filter(
+                part__in=chunk
+            ).values_list('bom_item__part', 'bom_item__inherited'):
+                assemblies.add(assembly)
+
+                if is_inherited:
+                    inherited.add(assembly)
+
+        # Inherited BOM lines also affect any variants of the assembly
+        self.tree.load(inherited)
+
+        for pk in inherited:
+            assemblies.update(self.tree.descendants(pk))
+
+        return (ancestors | assemblies) - pks
+
+    def load_bom_lines(self, pks: set[int]) -> dict[int, list[dict]]:
+        """Load the BOM lines which contribute to the "can build" quantity for each part.
+
+        Mirrors Part.can_build - virtual parts and consumable items are ignored.
+        """
+        self.tree.load(pks)
+
+        # Map of (template) part -> parts which inherit BOM lines from it
+        inheritors = defaultdict(set)
+
+        for pk in pks:
+            for ancestor in self.tree.ancestors(pk):
+                inheritors[ancestor].add(pk)
+
+        fields = [
+            'pk',
+            'part',
+            'sub_part',
+            'inherited',
+            'quantity',
+            'setup_quantity',
+            'attrition',
+        ]
+
+        lines = defaultdict(list)
+        rows = {}
+
+        for chunk in batched(pks | inheritors.keys(), QUERY_CHUNK_SIZE):
+            queryset = (
+                BomItem.objects
+                .filter(part__in=chunk, sub_part__virtual=False)
+                .filter(BomItem.consumable_filter(consumable=False))
+                .values(*fields)
+            )
+
+            for row in queryset:
+                row['substitutes'] = []
+                rows[row['pk']] = row
+
+                if row['part'] in pks:
+                    lines[row['part']].append(row)
+
+                if row['inherited']:
+                    for pk in inheritors.get(row['part'], []):
+                        lines[pk].append(row)
+
+        for chunk in batched(rows.keys(), QUERY_CHUNK_SIZE):
+            for bom_item, sub_part in BomItemSubstitute.objects.filter(
+                bom_item__in=chunk
+            ).values_list('bom_item', 'part'):
+                rows[bom_item]['substitutes'].append(sub_part)
+
+        return lines
+
+    def line_can_build(self, line: dict) -> Decimal:
+        """Calculate the number of assemblies which can be built from a single BOM line.
+
+        Mirrors part.filters.annotate_bom_item_can_build
+        """
+        if not line['quantity']:
+            return Decimal(0)
+
+        sub_part = line['sub_part']
+
+        available = max(
+            self.quantity(sub_part, 'in_stock')
+            - self.quantity(sub_part, 'allocated_to_sales_orders')
+            - self.quantity(sub_part, 'allocated_to_build_orders'),
+            Decimal(0),
+        )
+
+        available += max(
+            self.variant_quantity(sub_part, 'in_stock')
+            - self.variant_quantity(sub_part, 'stock_build_allocations')
+            - self.variant_quantity(sub_part, 'stock_sales_allocations'),
+            Decimal(0),
+        )
+
+        substitutes = line['substitutes']
+
+        available += max(
+            sum(
+                (
+                    self.quantity(pk, 'in_stock')
+                    - self.quantity(pk, 'allocated_to_build_orders')
+                    - self.quantity(pk, 'allocated_to_sales_orders')
+                    for pk in substitutes
+                ),
+                Decimal(0),
+            ),
+            Decimal(0),
+        )
+
+        quantity = Decimal(line['quantity']) * (
+            1 + Decimal(line['attrition'] or 0) / 100
+        )
+
+        return max(
+            (available - Decimal(line['setup_quantity'] or 0)) / quantity, Decimal(0)
+        )
+
+    def calculate(self, pks: Iterable[int]) -> dict[int, dict[str, Decimal]]:
+        """Calculate the availability data for the provided parts.
+
+        Returns:
+            A map of part ID -> availability data
+        """
+        pks = part_ids(pks)
+        self.tree.load(pks)
+
+        # Ignore any parts which do not exist (any more)
+        pks = {pk for pk in pks if self.tree.get(pk)}
+
+        bom_lines = self.load_bom_lines(pks)
+
+        required = set(pks)
+
+        for lines in bom_lines.values():
+            for line in lines:
+                required.add(line['sub_part'])
+                required.update(line['substitutes'])
+
+        self.load_quantities(required)
+
+        results = {}
+        total = len(pks)
+
+        for idx, pk in enumerate(sorted(pks)):
+            lines = bom_lines.get(pk, [])
+
+            can_build = min(self.line_can_build(line) for line in lines) if lines else 0
+
+            results[pk] = {
+                'in_stock': self.quantity(pk, 'in_stock'),
+                'variant_stock': self.variant_quantity(pk, 'in_stock'),
+                'allocated_to_build_orders': self.quantity(
+                    pk, 'allocated_to_build_orders'
+                ),
+                'allocated_to_sales_orders': self.quantity(
+                    pk, 'allocated_to_sales_orders'
+                ),
+                'allocated_to_transfer_orders': self.quantity(
+                    pk, 'allocated_to_transfer_orders'
+                ),
+                'on_order': self.quantity(pk, 'on_order'),
+                'can_build': Decimal(int(max(can_build, 0))),
+            }
+
+            if self.progress:
+                self.progress(idx + 1, total)
+
+        return results
+
+
+def normalize(value) -> Decimal:
+    """Normalize a quantity value to the precision stored in the PartAvailability table."""
+    return Decimal(value or 0).quantize(Decimal('0.00001'))
+
+
+def compare_availability(
+    results: dict[int, dict[str, Decimal]],
+) -> dict[int, list[str]]:
+    """Compare calculated availability data against the cached values.
+
+    Returns:
+        A map of part ID -> list of fields which do not match the cached data
+    """
+    mismatches = {}
+
+    for chunk in batched(results.keys(), QUERY_CHUNK_SIZE):
+        cached = {
+            row['part']: row
+            for row in PartAvailability.objects.filter(part__in=chunk).values(
+                'part', *AVAILABILITY_FIELDS
+            )
+        }
+
+        for pk in chunk:
+            # Parts without cached data fall back to the live calculation
+            if pk not in cached:
+                continue
+
+            if fields := [
+                field
+                for field in AVAILABILITY_FIELDS
+                if normalize(cached[pk][field]) != normalize(results[pk][field])
+            ]:
+                mismatches[pk] = fields
+
+    return mismatches
+
+
+def save_availability(results: dict[int, dict[str, Decimal]]) -> None:
+    """Write calculated availability data to the PartAvailability table."""
+    now = timezone.now()
+
+    for chunk in batched(results.keys(), QUERY_CHUNK_SIZE):
+        PartAvailability.objects.bulk_create(
+            [PartAvailability(part_id=pk) for pk in chunk], ignore_conflicts=True
+        )
+
+        instances = list(PartAvailability.objects.filter(part__in=chunk))
+
+        for instance in instances:
+            for field, value in results[instance.part_id].items():
+                setattr(instance, field, normalize(value))
+
+            instance.updated = now
+
+        PartAvailability.objects.bulk_update(
+            instances, [*AVAILABILITY_FIELDS, 'updated']
+        )
+
+
+def update_availability(parts: Iterable, cascade: bool = True) -> int:
+    """Recalculate the cached availability data for the provided parts.
+
+    Arguments:
+        parts: The parts (or part IDs) for which stock data has changed
+        cascade: If True, also update any templates and assemblies which depend on the provided parts
+
+    Returns:
+        The number of PartAvailability entries which were updated
+    """
+    if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+        return 0
+
+    calculator = AvailabilityCalculator()
+
+    pks = part_ids(parts)
+    calculator.tree.load(pks)
+
+    # Ignore any parts which do not exist (any more)
+    pks = {pk for pk in pks if calculator.tree.get(pk)}
+
+    if cascade:
+        pks |= calculator.find_dependents(pks)
+
+    results = calculator.calculate(pks)
+    save_availability(results)
+
+    logger.debug('Updated availability data for %s parts', len(results))
+
+    return len(results)
+
+
+def rebuild_availability(
+    check: bool = False, progress: Optional[Callable[[int, int], None]] = None
+) -> dict[int, list[str]]:
+    """Recalculate the availability data for all parts.
+
+    Arguments:
+        check: If True, only compare the calculated data against the cached data (no changes are saved)
+        progress: Optional callback function, called as progress(completed, total)
+
+    Returns:
+        A map of part ID -> list of fields for which the cached data was incorrect
+    """
+    calculator = AvailabilityCalculator(progress=progress)
+
+    results = calculator.calculate(Part.objects.values_list('pk', flat=True))
+
+    mismatches = compare_availability(results)
+
+    if not check:
+        save_availability(results)
+
+        # Remove any entries which are no longer required
+        PartAvailability.objects.exclude(part__in=Part.objects.all()).delete()
+
+    return mismatches
+
+
+def cached_availability(field: str, live, reference: str = '', output_field=None):
+    """Return a query expression which reads a cached availability value for a part.
+
+    If no cached data exists for a particular part, the live calculation is used instead.
+
+    Arguments:
+        field: The name of the PartAvailability field
+        live: The query expression used to calculate the value "live"
+        reference: Reference to the part from the current queryset (default = '')
+        output_field: Output field type for the expression (default = DecimalField)
+    """
+    return Coalesce(
+        F(f'{reference}availability_data__{field}'),
+        live,
+        output_field=output_field or DecimalField(),
+    )
@@ -0,0 +1,373 @@
+"""Multi-level BOM explosion service.
+
+Walking a multi-level BOM recursively requires a separate query for the BOM lines of
+each assembly at each level (plus additional queries for inherited lines).
+
+Instead, the BomExplosion class:
+
+- Loads the BOM lines for *all* assemblies at a given BOM level with a single query
+- Resolves inherited BOM lines using the in-memory part tree
+- Rolls up the total quantity of each BOM line through all levels of the BOM
+- Caches the exploded BOM, keyed against the stored BOM hash of each assembly in the tree
+
+As the BOM hash for an assembly is cleared whenever its BOM is edited, a cached explosion
+is discarded as soon as the BOM of any assembly (at any level) has changed.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+from itertools import batched
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Q
+
+import structlog
+
+from part.models import BomItem, BomItemSubstitute, Part
+from part.pricing import QUERY_CHUNK_SIZE, PartTreeIndex
+
+logger = structlog.get_logger('inventree')
+
+# Cached BOM explosions are retained for one day (unless invalidated earlier)
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Maximum number of BOM levels which will be exploded (guards against recursive BOMs)
+MAX_DEPTH = 50
+
+# Fields loaded for each BOM line
+BOM_FIELDS = ['pk', 'part_id', 'sub_part_id', 'quantity', 'allow_variants', 'inherited']
+
+
+class BomExplosion:
+    """Flattened, quantity-rolled-up representation of a multi-level BOM.
+
+    Each row of the exploded BOM is a dict containing:
+
+    - bom_item: The ID of the BomItem
+    - assembly: The ID of the assembly which the line belongs to (at this level)
+    - part: The ID of the part against which the BomItem is defined
+    - sub_part: The ID of the component part
+    - level: The BOM level (starting at 1 for the top-level BOM)
+    - parent: The index of the parent row (None for top-level rows)
+    - quantity: The quantity of the component required per assembly
+    - multiplier: The number of assemblies required at this level
+    - total_quantity: The total quantity of the component required for the top-level part
+    - inherited: True if the line is inherited from a template part
+    - allow_variants: True if variants of the component can be used
+
+    Example:
+        explosion = BomExplosion(part)
+        rows = explosion.get_rows(levels=2)
+    """
+
+    def __init__(self, part: Part, use_cache: bool = True):
+        """Initialize the BOM explosion.
+
+        Arguments:
+            part: The top-level assembly
+            use_cache: If True, use (and update) the cached BOM explosion
+        """
+        self.part = part
+        self.use_cache = use_cache
+
+        self.tree = PartTreeIndex()
+
+        # BOM lines for each exploded assembly
+        self.lines: dict[int, list[dict]] = {}
+
+        # BOM hash for each exploded assembly (at the time the lines were loaded)
+        self.hashes: dict[int, str] = {}
+
+        self.rows: Optional[list[dict]] = None
+
+    @property
+    def cache_key(self) -> str:
+        """Return the cache key for this BOM explosion."""
+        return f'bom_explosion_{self.part.pk}'
+
+    def get_rows(self, levels: int = 0) -> list[dict]:
+        """Return the rows of the exploded BOM.
+
+        Arguments:
+            levels: Maximum number of BOM levels to return (zero = all levels)
+        """
+        if self.rows is None:
+            self.rows = self.load()
+
+        if levels > 0:
+            return [row for row in self.rows if row['level'] <= levels]
+
+        return self.rows
+
+    def load(self) -> list[dict]:
+        """Load the exploded BOM, from the cache if it is still valid."""
+        if self.use_cache:
+            try:
+                data = cache.get(self.cache_key)
+            except Exception:
+                data = None
+
+            if data and self.check_cache(data):
+                return data['rows']
+
+        rows = self.explode()
+
+        if self.use_cache:
+            try:
+                cache.set(
+                    self.cache_key,
+                    {'rows': rows, 'hashes': self.hashes, 'leaves': self.leaves()},
+                    timeout=CACHE_TIMEOUT,
+                )
+            except Exception:
+                logger.warning(
+                    'Failed to cache BOM explosion for part %s', self.part.pk
+                )
+
+        return rows
+
+    def leaves(self) -> list[int]:
+        """Return the component parts which were not exploded (i.e. not assemblies)."""
+        leaves = set()
+
+        for lines in self.lines.values():
+            for line in lines:
+                if line['sub_part_id'] not in self.lines:
+                    leaves.add(line['sub_part_id'])
+
+        return sorted(leaves)
+
+    def check_cache(self, data: dict) -> bool:
+        """Determine if the cached BOM explosion is still valid.
+
+        The cached data is valid if:
+
+        - The stored BOM hash of each exploded assembly has not changed
+        - None of the non-exploded component parts have since been marked as assemblies
+        - All of the referenced BOM items still exist (BOM line hashes do not include the ID)
+        """
+        hashes = data['hashes']
+        leaves = set(data['leaves'])
+
+        pks = set(hashes.keys()) | leaves
+        found = 0
+
+        for chunk in batched(pks, QUERY_CHUNK_SIZE):
+            for pk, assembly, bom_hash in Part.objects.filter(pk__in=chunk).values_list(
+                'pk', 'assembly', 'bom_hash'
+            ):
+                found += 1
+
+                if pk in hashes:
+                    if not bom_hash or bom_hash != hashes[pk]:
+                        return False
+                elif assembly:
+                    return False
+
+        if found != len(pks):
+            return False
+
+        bom_items = {row['bom_item'] for row in data['rows']}
+        found = 0
+
+        for chunk in batched(bom_items, QUERY_CHUNK_SIZE):
+            found += BomItem.objects.filter(pk__in=chunk).count()
+
+        return found == len(bom_items)
+
+    def explode(self) -> list[dict]:
+        """Explode the BOM, loading BOM lines one level at a time."""
+        frontier = {self.part.pk}
+        depth = 0
+
+        while frontier and depth < MAX_DEPTH:
+            self.load_lines(frontier)
+
+            assemblies, frontier = frontier, set()
+
+            for pk in assemblies:
+                for line in self.lines[pk]:
+                    sub_part = self.tree.get(line['sub_part_id'])
+
+                    if (
+                        sub_part
+                        and sub_part['assembly']
+                        and sub_part['pk'] not in self.lines
+                    ):
+                        frontier.add(sub_part['pk'])
+
+            depth += 1
+
+        if frontier:
+            logger.warning(
+                'BOM explosion for part %s exceeded maximum depth', self.part.pk
+            )
+
+        rows = []
+        self.flatten(rows, self.part.pk, 1, Decimal(1), None, {self.part.pk})
+
+        return rows
+
+    def load_lines(self, assemblies: set[int]) -> None:
+        """Load the BOM lines (including inherited lines) for a set of assemblies."""
+        self.tree.load(assemblies)
+
+        self.load_hashes(assemblies)
+
+        ancestors = {pk: self.tree.ancestors(pk) for pk in assemblies}
+
+        templates = set()
+
+        for pks in ancestors.values():
+            templates |= set(pks)
+
+        direct = defaultdict(list)
+        inherited = defaultdict(list)
+
+        for chunk in batched(assemblies | templates, QUERY_CHUNK_SIZE):
+            for row in BomItem.objects.filter(
+                Q(part__in=[pk for pk in chunk if pk in assemblies])
+                | Q(part__in=[pk for pk in chunk if pk in templates], inherited=True)
+            ).values(*BOM_FIELDS):
+                if row['part_id'] in assemblies:
+                    direct[row['part_id']].append(row)
+
+                if row['inherited'] and row['part_id'] in templates:
+                    inherited[row['part_id']].append(row)
+
+        sub_parts = set()
+
+        for pk in assemblies:
+            lines = list(direct[pk])
+
+            for template in ancestors[pk]:
+                lines += inherited[template]
+
+            # BOM lines are ordered consistently, regardless of where they are defined
+            self.lines[pk] = sorted(lines, key=lambda line: line['pk'])
+
+            sub_parts |= {line['sub_part_id'] for line in lines}
+
+        self.tree.load(sub_parts)
+
+    def load_hashes(self, assemblies: set[int]) -> None:
+        """Record the current BOM hash for each of the provided assemblies.
+
+        Any missing BOM hashes are calculated (and stored) first.
+        """
+        for chunk in batched(assemblies, QUERY_CHUNK_SIZE):
+            parts = list(
+                Part.objects.filter(pk__in=chunk).only(
+                    'pk',
+                    'tree_id',
+                    'lft',
+                    'rght',
+                    'bom_hash',
+                    'bom_checksum',
+                    'bom_checked_date',
+                    'bom_validated',
+                )
+            )
+
+            Part.check_bom_hashes([part for part in parts if not part.bom_hash])
+
+            for part in parts:
+                self.hashes[part.pk] = part.bom_hash
+
+    def flatten(
+        self,
+        rows: list[dict],
+        assembly: int,
+        level: int,
+        multiplier: Decimal,
+        parent: Optional[int],
+        path: set[int],
+    ) -> None:
+        """Append the (depth-first) rows for the specified assembly."""
+        for line in self.lines.get(assembly, []):
+            quantity = Decimal(line['quantity'])
+            sub_part = line['sub_part_id']
+
+            rows.append({
+                'bom_item': line['pk'],
+                'assembly': assembly,
+                'part': line['part_id'],
+                'sub_part': sub_part,
+                'level': level,
+                'parent': parent,
+                'quantity': quantity,
+                'multiplier': multiplier,
+                'total_quantity': quantity * multiplier,
+                'inherited': line['part_id'] != assembly,
+                'allow_variants': line['allow_variants'],
+            })
+
+            if sub_part in self.lines and sub_part not in path:
+                self.flatten(
+                    rows,
+                    sub_part,
+                    level + 1,
+                    quantity * multiplier,
+                    len(rows) - 1,
+                    path | {sub_part},
+                )
+
+    def required_parts(self) -> set[int]:
+        """Return the IDs of all component parts required (at any level)."""
+        return {row['sub_part'] for row in self.get_rows()}
+
+    def totals(self, levels: int = 0) -> dict[int, Decimal]:
+        """Return the total quantity of each component part, summed over the exploded BOM.
+
+        Arguments:
+            levels: Maximum number of BOM levels to include (zero = all levels)
+        """
+        totals = defaultdict(Decimal)
+
+        for row in self.get_rows(levels=levels):
+            totals[row['sub_part']] += row['total_quantity']
+
+        return dict(totals)
+
+    def alternatives(self, rows: list[dict]) -> dict[int, dict]:
+        """Return the substitute and variant parts which can be used for each BOM line.
+
+        Substitutes and variants are not cached, as they can change without
+        affecting the BOM hash.
+
+        Returns:
+            A dict of {bom_item: {'substitutes': [...], 'variants': [...]}}
+        """
+        substitutes = defaultdict(list)
+
+        for chunk in batched({row['bom_item'] for row in rows}, QUERY_CHUNK_SIZE):
+            for bom_item, part_id in (
+                BomItemSubstitute.objects
+                .filter(bom_item__in=chunk)
+                .values_list('bom_item_id', 'part_id')
+                .order_by('pk')
+            ):
+                substitutes[bom_item].append(part_id)
+
+        self.tree.load({row['sub_part'] for row in rows})
+
+        result = {}
+
+        for row in rows:
+            variants = []
+
+            if row['allow_variants'] and (sub_part := self.tree.get(row['sub_part'])):
+                # Trackable status must be the same as the sub_part
+                variants = [
+                    pk
+                    for pk in self.tree.descendants(row['sub_part'])
+                    if self.tree.get(pk)['trackable'] == sub_part['trackable']
+                ]
+
+            result[row['bom_item']] = {
+                'substitutes': substitutes[row['bom_item']],
+                'variants': variants,
+            }
+
+        return result
@@ -0,0 +1,119 @@
+"""Add PartAvailability model, for caching stock availability data."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0153_bomitem_piece_count_bomitem_piece_size'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartAvailability',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'updated',
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text='Timestamp of last update',
+                        null=True,
+                        verbose_name='Updated',
+                    ),
+                ),
+                (
+                    'in_stock',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Total stock quantity for this part',
+                        max_digits=15,
+                        verbose_name='In Stock',
+                    ),
+                ),
+                (
+                    'variant_stock',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Total stock quantity for any variants of this part',
+                        max_digits=15,
+                        verbose_name='Variant Stock',
+                    ),
+                ),
+                (
+                    'allocated_to_build_orders',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Stock quantity allocated to active build orders',
+                        max_digits=15,
+                        verbose_name='Allocated to Build Orders',
+                    ),
+                ),
+                (
+                    'allocated_to_sales_orders',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Stock quantity allocated to open sales orders',
+                        max_digits=15,
+                        verbose_name='Allocated to Sales Orders',
+                    ),
+                ),
+                (
+                    'allocated_to_transfer_orders',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Stock quantity allocated to open transfer orders',
+                        max_digits=15,
+                        verbose_name='Allocated to Transfer Orders',
+                    ),
+                ),
+                (
+                    'on_order',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Quantity on order from open purchase orders',
+                        max_digits=15,
+                        verbose_name='On Order',
+                    ),
+                ),
+                (
+                    'can_build',
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        help_text='Number of units which can be built from available stock',
+                        max_digits=15,
+                        verbose_name='Can Build',
+                    ),
+                ),
+                (
+                    'part',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='availability_data',
+                        to='part.part',
+                        verbose_name='Part',
+                    ),
+                ),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
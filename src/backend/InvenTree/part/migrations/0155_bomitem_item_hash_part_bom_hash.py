@@ -0,0 +1,35 @@
+"""Add stored BOM hash fields to the Part and BomItem models."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0154_partavailability'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='part',
+            name='bom_hash',
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text='Calculated BOM checksum',
+                max_length=128,
+                verbose_name='BOM hash',
+            ),
+        ),
+        migrations.AddField(
+            model_name='bomitem',
+            name='item_hash',
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text='Calculated BOM line checksum',
+                max_length=128,
+                verbose_name='Item hash',
+            ),
+        ),
+    ]
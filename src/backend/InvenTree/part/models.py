@@ -513,6 +513,7 @@ class Part(
 
     BOM (Bill of Materials) related attributes:
         bom_checksum: Checksum for the BOM of this part
+        bom_hash: Calculated checksum for the current BOM of this part
         bom_validated: Boolean field indicating if the BOM is valid (checksum matches)
         bom_checked_by: User who last checked the BOM for this part
         bom_checked_date: Date when the BOM was last checked
@@ -549,6 +550,11 @@ class Part(
         """Return API query filters for limiting field results against this instance."""
         return {'variant_of': {'exclude_tree': self.pk}}
 
+    @classmethod
+    def after_tree_ids_changed(cls) -> None:
+        """Part tree IDs have changed - serial number index must be recalculated."""
+        StockModels.SerialNumberIndex.invalidate()
+
     @classmethod
     def barcode_model_type_code(cls):
         """Return the associated barcode model type code for this model."""
@@ -610,10 +616,29 @@ class Part(
         If not, it is considered "orphaned" and will be deleted.
         """
         _new = False
+        _tree_changed = False
+        _name_changed = False
+        _availability_parts = []
+
         if self.pk:
             try:
                 previous = Part.objects.get(pk=self.pk)
 
+                _tree_changed = previous.variant_of_id != self.variant_of_id
+
+                # Cached availability data depends on the variant tree and part type
+                if _tree_changed or any(
+                    getattr(previous, field) != getattr(self, field)
+                    for field in ['active', 'virtual']
+                ):
+                    _availability_parts = [self.pk, previous.variant_of_id]
+
+                # BOM line hashes include the string representation of the part
+                _name_changed = str(previous) != str(self)
+
+                # The calculated BOM hash is maintained by BOM changes, not by saving the part
+                self.bom_hash = previous.bom_hash
+
                 # Image has been changed
                 if previous.image is not None and self.image != previous.image:
                     # Are there any (other) parts which reference the image?
@@ -636,6 +661,25 @@ class Part(
 
         super().save(*args, **kwargs)
 
+        if _tree_changed:
+            # Part tree IDs may have changed - serial number index must be recalculated
+            StockModels.SerialNumberIndex.invalidate()
+
+            # Inherited BOM items may have changed for this part (and any variants)
+            Part.invalidate_bom_hash(
+                self.get_descendants(include_self=True).values_list('pk', flat=True)
+            )
+
+        if _name_changed:
+            BomItem.refresh_item_hashes(
+                BomItem.objects.filter(Q(part=self) | Q(sub_part=self))
+            )
+
+        if _availability_parts:
+            from part.availability import schedule_availability_update
+
+            schedule_availability_update(_availability_parts)
+
         if _new:
             # Only run if the check was not run previously (due to not existing in the database)
             self.ensure_trackable()
@@ -916,6 +960,66 @@ class Part(
             # This serial number is perfectly valid
             return True
 
+    def validate_serial_numbers(self, serials: list) -> dict:
+        """Validate multiple serial numbers against any loaded validation plugins.
+
+        Each plugin is called once for the entire batch of serial numbers,
+        via the ValidationMixin.validate_serial_numbers() method.
+        By default, this calls the plugin's validate_serial_number() method for each serial.
+
+        Note: This function does not check for duplicate serial numbers in the database.
+
+        Arguments:
+            serials: The list of proposed serial numbers
+
+        Returns:
+            A dict of {serial: error message} for each serial number which is invalid
+        """
+        from plugin import PluginMixinEnum, registry
+
+        errors = {}
+
+        if InvenTree.ready.isReadOnlyCommand():
+            return errors
+
+        # Serial numbers which are still subject to validation
+        pending = [str(serial).strip() for serial in serials]
+
+        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+            if not pending:
+                break
+
+            try:
+                results = plugin.validate_serial_numbers(pending, self)
+            except ValidationError as exc:
+                # The entire batch was rejected
+                for serial in pending:
+                    errors[serial] = '; '.join(exc.messages)
+                break
+            except Exception:
+                log_error('validate_serial_numbers', plugin=plugin.slug)
+                continue
+
+            if not results:
+                continue
+
+            remaining = []
+
+            for serial in pending:
+                result = results.get(serial)
+
+                if result is True:
+                    # Serial number accepted - skip any further validation
+                    continue
+                elif result:
+                    errors[serial] = str(result)
+                else:
+                    remaining.append(serial)
+
+            pending = remaining
+
+        return errors
+
     def find_conflicting_serial_numbers(self, serials: list) -> list:
         """For a provided list of serials, return a list of those which are conflicting."""
         # from part.models import Part
@@ -926,27 +1030,26 @@ class Part(
         # First, check for raw conflicts based on efficient database queries
         if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
             # Serial number must be unique across *all* parts
-            parts = Part.objects.all()
+            items = StockItem.objects.all()
         else:
             # Serial number must only be unique across this part "tree"
-            parts = Part.objects.filter(tree_id=self.tree_id)
+            items = StockItem.objects.filter(part__tree_id=self.tree_id)
 
-        items = StockItem.objects.filter(part__in=parts, serial__in=serials)
+        items = items.filter(serial__in=serials)
         items = items.order_by('serial_int', 'serial')
 
         for item in items:
             conflicts.append(item.serial)
 
-        for serial in serials:
-            if serial in conflicts:
-                # Already found a conflict, no need to check further
-                continue
+        # Validate the remaining serial numbers with a single call to each plugin
+        remaining = [
+            serial for serial in serials if str(serial).strip() not in conflicts
+        ]
 
-            try:
-                self.validate_serial_number(
-                    serial, raise_error=True, check_duplicates=False
-                )
-            except ValidationError:
+        errors = self.validate_serial_numbers(remaining)
+
+        for serial in remaining:
+            if str(serial).strip() in errors:
                 # Serial number is invalid (as determined by plugin)
                 conflicts.append(serial)
 
@@ -978,25 +1081,8 @@ class Part(
                 except Exception:
                     log_error('get_latest_serial_number', plugin=plugin.slug)
 
-        # No plugin returned a result, so we will run the default query
-        stock = (
-            StockModels.StockItem.objects.all().exclude(serial=None).exclude(serial='')
-        )
-
-        # Generate a query for any stock items for this part variant tree with non-empty serial numbers
-        if not get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
-            # Serial numbers are unique across part trees
-            stock = stock.filter(part__tree_id=self.tree_id)
-
-        # There are no matching StockItem objects (skip further tests)
-        if not stock.exists():
-            return None
-
-        # Sort in descending order
-        stock = stock.order_by('-serial_int', '-serial', '-pk')
-
-        # Return the first serial value
-        return stock[0].serial
+        # No plugin returned a result, so we read the latest serial from the index
+        return StockModels.SerialNumberIndex.latest_serial(self)
 
     def get_next_serial_number(self):
         """Return the 'next' serial number in sequence."""
@@ -1004,6 +1090,47 @@ class Part(
 
         return InvenTree.helpers.increment_serial_number(sn, self)
 
+    def reserve_serial_numbers(self, quantity: int) -> list[str]:
+        """Atomically reserve a contiguous range of new serial numbers for this Part.
+
+        The reserved serial numbers will not be returned by subsequent calls,
+        even if no stock items are (yet) created with these serial numbers.
+
+        Arguments:
+            quantity: The number of serial numbers to reserve
+
+        Returns:
+            A list of reserved serial numbers
+        """
+        return StockModels.SerialNumberIndex.reserve(self, quantity)
+
+    def extract_serial_numbers(
+        self, serial_numbers: str, quantity: int, reserve: bool = False
+    ) -> list[str]:
+        """Extract a list of serial numbers for this Part from the provided input string.
+
+        Arguments:
+            serial_numbers: Serial number string (see InvenTree.helpers.extract_serial_numbers)
+            quantity: The number of serial numbers expected
+            reserve: If True, "next" serial numbers (~) are reserved (see reserve_serial_numbers)
+
+        Returns:
+            A list of serial numbers
+        """
+        if not reserve:
+            return InvenTree.helpers.extract_serial_numbers(
+                serial_numbers, quantity, self.get_latest_serial_number(), part=self
+            )
+
+        count = str(serial_numbers or '').count('~')
+
+        return InvenTree.helpers.extract_serial_numbers(
+            serial_numbers,
+            quantity,
+            part=self,
+            next_serials=self.reserve_serial_numbers(count) if count else [],
+        )
+
     @property
     @report.mixins.report_attribute()
     def full_name(self) -> str:
@@ -1341,6 +1468,14 @@ class Part(
         help_text=_('Stored BOM checksum'),
     )
 
+    bom_hash = models.CharField(
+        max_length=128,
+        blank=True,
+        editable=False,
+        verbose_name=_('BOM hash'),
+        help_text=_('Calculated BOM checksum'),
+    )
+
     bom_checked_by = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -2015,7 +2150,7 @@ class Part(
         # Grab a queryset of all BomItem objects which "require" this part
         bom_items = BomItem.objects.filter(
             self.get_used_in_bom_item_filter(include_substitutes=include_substitutes)
-        )
+        ).select_related('part')
 
         # Iterate through the returned items and construct a set of
         parts = set()
@@ -2069,28 +2204,147 @@ class Part(
         """Return the number of part BOMs that this part appears in."""
         return len(self.get_used_in())
 
+    @staticmethod
+    def calculate_bom_hash(part_id: int, item_hashes: list[str]) -> str:
+        """Combine the provided BOM line hashes into a checksum for an assembly.
+
+        Arguments:
+            part_id: The ID of the assembly part
+            item_hashes: The BOM line hashes, ordered by BomItem ID
+        """
+        result_hash = hashlib.md5(str(part_id).encode())
+
+        for item_hash in item_hashes:
+            result_hash.update(str(item_hash).encode())
+
+        return str(result_hash.digest())
+
     def get_bom_hash(self) -> str:
         """Return a checksum hash for the BOM for this part.
 
         Used to determine if the BOM has changed (and needs to be signed off!)
-        The hash is calculated by hashing each line item in the BOM. Returns a string representation of a hash object which can be compared with a stored value
+        The hash is calculated by combining the stored hash of each line item in the BOM.
+        Returns a string representation of a hash object which can be compared with a stored value
         """
-        result_hash = hashlib.md5(str(self.id).encode())
-
         # List *all* BOM items (including inherited ones!)
+        hashes = dict(
+            self.get_bom_items().prefetch_related(None).values_list('pk', 'item_hash')
+        )
+
+        BomItem.fill_item_hashes(hashes)
+
         # Note: We must order the BOM items in a consistent way, otherwise the hash will change if the order of the items changes
-        bom_items = (
-            self
-            .get_bom_items()
-            .all()
-            .prefetch_related('part', 'sub_part')
-            .order_by('pk')
+        return self.calculate_bom_hash(
+            self.pk, [hashes[pk] for pk in sorted(hashes.keys())]
         )
 
-        for item in bom_items:
-            result_hash.update(str(item.get_item_hash()).encode())
+    def update_bom_hash(self) -> str:
+        """Recalculate and store the BOM hash for this part."""
+        self.bom_hash = self.get_bom_hash()
 
-        return str(result_hash.digest())
+        Part.objects.filter(pk=self.pk).update(bom_hash=self.bom_hash)
+
+        return self.bom_hash
+
+    @classmethod
+    def invalidate_bom_hash(cls, part_ids) -> None:
+        """Clear the stored BOM hash for the specified assemblies.
+
+        The BOM hash will be recalculated (on demand) the next time it is required,
+        and a background task is scheduled to recheck the BOM for each assembly.
+
+        Arguments:
+            part_ids: Iterable of Part IDs for which the BOM has changed
+        """
+        import part.tasks as part_tasks
+
+        part_ids = sorted(set(part_ids))
+
+        if not part_ids:
+            return
+
+        cls.objects.filter(pk__in=part_ids).update(bom_hash='')
+
+        InvenTree.tasks.offload_task(
+            part_tasks.check_bom_valid_bulk, part_ids, group='part'
+        )
+
+    @classmethod
+    def check_bom_hashes(cls, parts) -> int:
+        """Recalculate the BOM hash and validation status for multiple assemblies.
+
+        A fixed number of queries is required, regardless of the number of assemblies:
+
+        - All BOM items for the assemblies (and their template parts) are loaded at once
+        - Inherited BOM items are resolved in memory, using the MPTT tree fields
+        - Stored line hashes are used (any missing line hashes are calculated once)
+        - Modified assemblies are updated with a single bulk_update query
+
+        Arguments:
+            parts: Iterable of Part instances
+
+        Returns:
+            The number of assemblies which were updated
+        """
+        parts = list(parts)
+
+        if not parts:
+            return 0
+
+        rows = BomItem.objects.filter(
+            Q(part__in=[part.pk for part in parts])
+            | Q(inherited=True, part__tree_id__in={part.tree_id for part in parts})
+        ).values_list(
+            'pk',
+            'part_id',
+            'part__tree_id',
+            'part__lft',
+            'part__rght',
+            'inherited',
+            'item_hash',
+        )
+
+        hashes = {}
+        direct = {}
+        inherited = {}
+
+        for pk, part_id, tree_id, lft, rght, is_inherited, item_hash in rows:
+            hashes[pk] = item_hash
+            direct.setdefault(part_id, []).append(pk)
+
+            if is_inherited:
+                inherited.setdefault(tree_id, []).append((pk, lft, rght))
+
+        BomItem.fill_item_hashes(hashes)
+
+        updated = []
+
+        for part in parts:
+            pks = set(direct.get(part.pk, []))
+
+            # Include BOM items inherited from any parent (template) parts
+            for pk, lft, rght in inherited.get(part.tree_id, []):
+                if lft < part.lft and rght > part.rght:
+                    pks.add(pk)
+
+            bom_hash = cls.calculate_bom_hash(
+                part.pk, [hashes[pk] for pk in sorted(pks)]
+            )
+
+            valid = bool(
+                part.bom_checksum
+                and part.bom_checked_date
+                and bom_hash == part.bom_checksum
+            )
+
+            if bom_hash != part.bom_hash or valid != part.bom_validated:
+                part.bom_hash = bom_hash
+                part.bom_validated = valid
+                updated.append(part)
+
+        cls.objects.bulk_update(updated, ['bom_hash', 'bom_validated'], batch_size=250)
+
+        return len(updated)
 
     def is_bom_valid(self) -> bool:
         """Check if the BOM is 'valid'.
@@ -2106,7 +2360,11 @@ class Part(
             # If there is no BOM checksum, then the BOM is not valid
             return False
 
-        return self.get_bom_hash() == self.bom_checksum
+        if not self.bom_hash:
+            # The BOM has changed since the hash was last calculated
+            self.update_bom_hash()
+
+        return self.bom_hash == self.bom_checksum
 
     @transaction.atomic
     def validate_bom(self, user, valid: bool = True):
@@ -2119,17 +2377,27 @@ class Part(
         - Calculates and stores the hash for the BOM
         - Saves the current date and the checking user
         """
-        # Validate each line item, ignoring inherited ones
-        bom_items = self.get_bom_items(include_inherited=False).prefetch_related(
-            'part', 'sub_part'
-        )
-
         if valid:
-            for item in bom_items:
-                item.validate_hash(valid=True)
+            # Validate each line item, ignoring inherited ones
+            items = list(
+                self.get_bom_items(include_inherited=False).select_related(
+                    'part', 'sub_part'
+                )
+            )
+
+            for item in items:
+                item.item_hash = item.get_item_hash()
+                item.checksum = item.item_hash
+                item.validated = True
+
+            BomItem.objects.bulk_update(
+                items, ['item_hash', 'checksum', 'validated'], batch_size=250
+            )
+
+        self.update_bom_hash()
 
         self.bom_validated = valid
-        self.bom_checksum = self.get_bom_hash() if valid else ''
+        self.bom_checksum = self.bom_hash if valid else ''
         self.bom_checked_by = user
         self.bom_checked_date = InvenTree.helpers.current_date()
 
@@ -2141,12 +2409,12 @@ class Part(
 
         Note: Does *NOT* delete inherited BOM items!
         """
-        import part.tasks as part_tasks
-
         self.bom_items.all().delete()
 
-        # Offload task to re-validate the BOM for this assembly
-        InvenTree.tasks.offload_task(part_tasks.check_bom_valid, self.pk, group='part')
+        # Re-validate the BOM for this assembly (and any variants which inherit it)
+        Part.invalidate_bom_hash(
+            self.get_descendants(include_self=True).values_list('pk', flat=True)
+        )
 
     def getRequiredParts(self, recursive=False, parts=None):
         """Return a list of parts required to make this part (i.e. BOM items).
@@ -2158,16 +2426,20 @@ class Part(
         if parts is None:
             parts = set()
 
-        bom_items = self.get_bom_items().prefetch_related('sub_part')
+        if recursive:
+            from part.bom import BomExplosion
 
-        for bom_item in bom_items:
-            sub_part = bom_item.sub_part
+            # Explode the entire BOM, rather than walking each sub-assembly in turn
+            required = BomExplosion(self).required_parts() - {p.pk for p in parts}
 
-            if sub_part not in parts:
-                parts.add(sub_part)
+            parts.update(Part.objects.filter(pk__in=required))
 
-                if recursive:
-                    sub_part.getRequiredParts(recursive=True, parts=parts)
+            return parts
+
+        bom_items = self.get_bom_items().prefetch_related('sub_part')
+
+        for bom_item in bom_items:
+            parts.add(bom_item.sub_part)
 
         return parts
 
@@ -2649,11 +2921,10 @@ class PartPricing(common.models.MetaMixin):
 
         return result
 
-    def schedule_for_update(self, counter: int = 0, refresh: bool = True):
+    def schedule_for_update(self, refresh: bool = True):
         """Schedule this pricing to be updated.
 
         Arguments:
-            counter: Recursion counter (used to prevent infinite recursion)
             refresh: If specified, the PartPricing object will be refreshed from the database
 
         Note:
@@ -2669,11 +2940,11 @@ class PartPricing(common.models.MetaMixin):
             return
 
         try:
-            self._schedule_for_update(counter=counter, refresh=refresh)
+            self._schedule_for_update(refresh=refresh)
         finally:
             set_session_cache(cache_key, True)
 
-    def _schedule_for_update(self, counter: int = 0, refresh: bool = True):
+    def _schedule_for_update(self, refresh: bool = True):
         """Implementation of schedule_for_update(), without the request-scoped cache guard."""
         import InvenTree.ready
 
@@ -2721,13 +2992,6 @@ class PartPricing(common.models.MetaMixin):
             logger.debug('Pricing for %s already scheduled for update - skipping', p)
             return
 
-        if counter > self.MAX_PRICING_DEPTH:
-            # Prevent infinite recursion / stack depth issues
-            logger.debug(
-                counter, f'Skipping pricing update for {p} - maximum depth exceeded'
-            )
-            return
-
         try:
             self.scheduled_for_update = True
             self.save()
@@ -2749,22 +3013,16 @@ class PartPricing(common.models.MetaMixin):
         InvenTree.tasks.offload_task(
             part_tasks.update_part_pricing,
             self,
-            counter=counter,
             force_async=background,
             group='pricing',
         )
 
     def update_pricing(
-        self,
-        counter: int = 0,
-        cascade: bool = True,
-        previous_min=None,
-        previous_max=None,
+        self, cascade: bool = True, previous_min=None, previous_max=None
     ):
         """Recalculate all cost data for the referenced Part instance.
 
         Arguments:
-            counter: Recursion counter (used to prevent infinite recursion)
             cascade: If True, update pricing for all assemblies and templates which use this part
             previous_min: Previous minimum price (used to prevent further updates if unchanged)
             previous_max: Previous maximum price (used to prevent further updates if unchanged)
@@ -2811,24 +3069,25 @@ class PartPricing(common.models.MetaMixin):
 
         # Update parent assemblies and templates
         if pricing_changed and cascade:
-            self.update_assemblies(counter)
-            self.update_templates(counter)
-
-    def update_assemblies(self, counter: int = 0):
-        """Schedule updates for any assemblies which use this part."""
-        # If the linked Part is used in any assemblies, schedule a pricing update for those assemblies
+            self.schedule_cascade()
 
-        used_in_parts = self.part.get_used_in()
+    def schedule_cascade(self):
+        """Schedule a pricing update for any assemblies and templates which depend on this part.
 
-        for p in used_in_parts:
-            p.pricing.schedule_for_update(counter=counter + 1)
+        Rather than scheduling a separate update for each parent part,
+        a single background task recalculates the pricing for the entire
+        set of dependent parts (see part.pricing.PricingEngine)
+        """
+        import part.tasks as part_tasks
 
-    def update_templates(self, counter: int = 0):
-        """Schedule updates for any template parts above this part."""
-        templates = self.part.get_ancestors(include_self=False)
+        background = not settings.TESTING or not settings.TESTING_PRICING
 
-        for p in templates:
-            p.pricing.schedule_for_update(counter + 1)
+        InvenTree.tasks.offload_task(
+            part_tasks.recalculate_part_pricing,
+            changed_part_ids=[self.part_id],
+            force_async=background,
+            group='pricing',
+        )
 
     def save(self, *args, **kwargs):
         """Whenever pricing model is saved, automatically update overall prices."""
@@ -3353,6 +3612,311 @@ class PartPricing(common.models.MetaMixin):
     )
 
 
+class PartAvailability(common.models.MetaMixin):
+    """Model for caching stock availability information for a particular Part.
+
+    Calculating stock availability (and in particular the "can build" quantity
+    for an assembly) requires a large number of subqueries for each part.
+    If the PART_AVAILABILITY_CACHE setting is enabled, these values are pre-calculated
+    and stored, and are updated whenever the underlying stock or allocation data changes.
+
+    Availability information is cached for:
+
+    - Stock quantity (for the part itself, and for any variants)
+    - Stock allocated to build orders, sales orders and transfer orders
+    - Quantity on order (from open purchase orders)
+    - The number of units which can be built from available stock
+    """
+
+    part = models.OneToOneField(
+        Part,
+        on_delete=models.CASCADE,
+        related_name='availability_data',
+        verbose_name=_('Part'),
+    )
+
+    in_stock = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('In Stock'),
+        help_text=_('Total stock quantity for this part'),
+    )
+
+    variant_stock = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Variant Stock'),
+        help_text=_('Total stock quantity for any variants of this part'),
+    )
+
+    allocated_to_build_orders = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Build Orders'),
+        help_text=_('Stock quantity allocated to active build orders'),
+    )
+
+    allocated_to_sales_orders = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Sales Orders'),
+        help_text=_('Stock quantity allocated to open sales orders'),
+    )
+
+    allocated_to_transfer_orders = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Transfer Orders'),
+        help_text=_('Stock quantity allocated to open transfer orders'),
+    )
+
+    on_order = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('On Order'),
+        help_text=_('Quantity on order from open purchase orders'),
+    )
+
+    can_build = models.DecimalField(
+        max_digits=15,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Can Build'),
+        help_text=_('Number of units which can be built from available stock'),
+    )
+
+
+@receiver(
+    post_save, sender='stock.StockItem', dispatch_uid='stock_item_availability_save'
+)
+@receiver(
+    post_delete, sender='stock.StockItem', dispatch_uid='stock_item_availability_delete'
+)
+def update_availability_after_stock_change(sender, instance, **kwargs):
+    """Update cached availability data when a StockItem is created, updated or deleted.
+
+    If the StockItem has been re-assigned to a different part,
+    the previous part is also updated.
+    """
+    from part.availability import schedule_availability_update
+
+    schedule_availability_update([
+        instance.part_id,
+        getattr(instance, '_previous_part_id', None),
+    ])
+
+
+@receiver(
+    post_save, sender='build.BuildItem', dispatch_uid='build_item_availability_save'
+)
+@receiver(
+    post_delete, sender='build.BuildItem', dispatch_uid='build_item_availability_delete'
+)
+@receiver(
+    post_save,
+    sender='order.SalesOrderAllocation',
+    dispatch_uid='so_allocation_availability_save',
+)
+@receiver(
+    post_delete,
+    sender='order.SalesOrderAllocation',
+    dispatch_uid='so_allocation_availability_delete',
+)
+@receiver(
+    post_save,
+    sender='order.TransferOrderAllocation',
+    dispatch_uid='to_allocation_availability_save',
+)
+@receiver(
+    post_delete,
+    sender='order.TransferOrderAllocation',
+    dispatch_uid='to_allocation_availability_delete',
+)
+def update_availability_after_allocation_change(sender, instance, **kwargs):
+    """Update cached availability data when a stock allocation is created, updated or deleted."""
+    from part.availability import schedule_availability_update
+
+    item_id = getattr(instance, 'stock_item_id', None) or getattr(
+        instance, 'item_id', None
+    )
+
+    schedule_availability_update(
+        StockModels.StockItem.objects.filter(pk=item_id).values_list('part', flat=True)
+    )
+
+
+@receiver(
+    post_save,
+    sender='order.PurchaseOrderLineItem',
+    dispatch_uid='po_line_availability_save',
+)
+@receiver(
+    post_delete,
+    sender='order.PurchaseOrderLineItem',
+    dispatch_uid='po_line_availability_delete',
+)
+def update_availability_after_po_line_change(sender, instance, **kwargs):
+    """Update cached availability data when a purchase order line item changes."""
+    from part.availability import schedule_availability_update
+
+    schedule_availability_update(
+        company.models.SupplierPart.objects.filter(pk=instance.part_id).values_list(
+            'part', flat=True
+        )
+    )
+
+
+@receiver(post_save, sender='build.Build', dispatch_uid='build_availability_save')
+@receiver(post_save, sender='order.SalesOrder', dispatch_uid='so_availability_save')
+@receiver(
+    post_save,
+    sender='order.SalesOrderShipment',
+    dispatch_uid='so_shipment_availability_save',
+)
+@receiver(post_save, sender='order.PurchaseOrder', dispatch_uid='po_availability_save')
+@receiver(post_save, sender='order.TransferOrder', dispatch_uid='to_availability_save')
+def update_availability_after_order_change(sender, instance, created, **kwargs):
+    """Update cached availability data when the status of an order changes.
+
+    Allocated (and on order) quantities only count against open orders,
+    so any parts referenced by the order must be updated.
+    """
+    from part.availability import (
+        availability_cache_enabled,
+        schedule_availability_update,
+    )
+
+    if created or not availability_cache_enabled():
+        return
+
+    if isinstance(instance, BuildModels.Build):
+        parts = BuildModels.BuildItem.objects.filter(
+            build_line__build=instance
+        ).values_list('stock_item__part', flat=True)
+    elif isinstance(instance, OrderModels.SalesOrder):
+        parts = OrderModels.SalesOrderAllocation.objects.filter(
+            line__order=instance
+        ).values_list('item__part', flat=True)
+    elif isinstance(instance, OrderModels.SalesOrderShipment):
+        parts = OrderModels.SalesOrderAllocation.objects.filter(
+            shipment=instance
+        ).values_list('item__part', flat=True)
+    elif isinstance(instance, OrderModels.PurchaseOrder):
+        parts = OrderModels.PurchaseOrderLineItem.objects.filter(
+            order=instance
+        ).values_list('part__part', flat=True)
+    elif isinstance(instance, OrderModels.TransferOrder):
+        parts = OrderModels.TransferOrderAllocation.objects.filter(
+            line__order=instance
+        ).values_list('item__part', flat=True)
+    else:
+        return
+
+    schedule_availability_update(set(parts))
+
+
+@receiver(post_delete, sender='part.Part', dispatch_uid='part_availability_delete')
+def update_availability_after_part_delete(sender, instance, **kwargs):
+    """Update cached availability data for the template of a deleted part."""
+    from part.availability import schedule_availability_update
+
+    schedule_availability_update([instance.variant_of_id])
+
+
+@receiver(post_save, sender='part.BomItem', dispatch_uid='bom_item_availability_save')
+@receiver(
+    post_delete, sender='part.BomItem', dispatch_uid='bom_item_availability_delete'
+)
+@receiver(
+    post_save,
+    sender='part.BomItemSubstitute',
+    dispatch_uid='bom_substitute_availability_save',
+)
+@receiver(
+    post_delete,
+    sender='part.BomItemSubstitute',
+    dispatch_uid='bom_substitute_availability_delete',
+)
+def update_availability_after_bom_change(sender, instance, **kwargs):
+    """Update cached availability data when a BOM line (or substitute part) changes.
+
+    The "can build" quantity must be recalculated for the assembly,
+    and for any variants which inherit the BOM line.
+    """
+    from part.availability import (
+        availability_cache_enabled,
+        schedule_availability_update,
+    )
+
+    if not availability_cache_enabled():
+        return
+
+    if isinstance(instance, BomItemSubstitute):
+        bom_item = (
+            BomItem.objects
+            .filter(pk=instance.bom_item_id)
+            .values_list('part', 'inherited')
+            .first()
+        )
+
+        # The BOM line itself has been deleted
+        if bom_item is None:
+            return
+
+        assembly, inherited = bom_item
+    else:
+        assembly, inherited = instance.part_id, instance.inherited
+
+    parts = Part.objects.filter(pk=assembly)
+
+    if inherited:
+        parts = parts.get_descendants(include_self=True)
+
+    schedule_availability_update(parts.values_list('pk', flat=True))
+
+
+@receiver(
+    post_save, sender='build.BuildLine', dispatch_uid='build_line_availability_save'
+)
+@receiver(
+    post_delete, sender='build.BuildLine', dispatch_uid='build_line_availability_delete'
+)
+@receiver(
+    post_save,
+    sender='order.SalesOrderLineItem',
+    dispatch_uid='so_line_availability_save',
+)
+@receiver(
+    post_delete,
+    sender='order.SalesOrderLineItem',
+    dispatch_uid='so_line_availability_delete',
+)
+def update_availability_after_requirement_change(sender, instance, **kwargs):
+    """Update cached availability data when a build or sales order requirement changes."""
+    from part.availability import (
+        availability_cache_enabled,
+        schedule_availability_update,
+    )
+
+    if not availability_cache_enabled():
+        return
+
+    if isinstance(instance, BuildModels.BuildLine):
+        parts = BomItem.objects.filter(pk=instance.bom_item_id).values_list(
+            'sub_part', flat=True
+        )
+    else:
+        parts = [instance.part_id]
+
+    schedule_availability_update(parts)
+
+
 class PartStocktake(models.Model):
     """Model representing a 'stock history' entry for a particular Part.
 
@@ -3694,6 +4258,7 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
             Total material = quantity x piece_count.
         note: Note field for this BOM item
         checksum: Validation checksum for the particular BOM line item
+        item_hash: Calculated checksum for the current state of the BOM line item
         validated: Boolean field indicating if this BOM item is valid (checksum matches)
         inherited: This BomItem can be inherited by the BOMs of variant parts
         allow_variants: Stock for part variants can be substituted for this BomItem
@@ -3849,23 +4414,16 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
 
     def delete(self):
         """Check if this item can be deleted."""
-        import part.tasks as part_tasks
-
         self.check_part_lock(self.part)
 
         assemblies = self.get_assemblies()
         super().delete()
 
-        for assembly in assemblies:
-            # Offload task to update the checksum for this assembly
-            InvenTree.tasks.offload_task(
-                part_tasks.check_bom_valid, assembly.pk, group='part'
-            )
+        # Update the checksum for each assembly
+        Part.invalidate_bom_hash(assembly.pk for assembly in assemblies)
 
     def save(self, *args, **kwargs):
         """Enforce 'clean' operation when saving a BomItem instance."""
-        import part.tasks as part_tasks
-
         self.clean()
 
         check_lock = kwargs.pop('check_lock', True)
@@ -3882,13 +4440,14 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
             if check_lock:
                 self.check_part_lock(old_part)
 
-        # Update the 'validated' field based on checksum calculation
-        self.validated = self.is_line_valid
+        # Update the stored line hash, and the 'validated' field based on checksum calculation
+        self.item_hash = self.get_item_hash()
+        self.validated = bool(self.checksum) and self.item_hash == self.checksum
 
         super().save(*args, **kwargs)
 
         # Do we need to recalculate the BOM hash for assemblies?
-        if not db_instance or any(f in deltas for f in self.hash_fields()):
+        if not db_instance or db_instance.item_hash != self.item_hash:
             # If this is a new BomItem, or if any of the fields used to calculate the hash have changed,
             # then we need to recalculate the BOM checksum for all assemblies which use this BomItem
 
@@ -3901,11 +4460,7 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
             # Update the set of assemblies to include those which use this BomItem *after* we save
             assemblies.update(self.get_assemblies())
 
-            for assembly in assemblies:
-                # Offload task to update the checksum for this assembly
-                InvenTree.tasks.offload_task(
-                    part_tasks.check_bom_valid, assembly.pk, group='part'
-                )
+            Part.invalidate_bom_hash(assembly.pk for assembly in assemblies)
 
     def check_part_lock(self, assembly):
         """When editing or deleting a BOM item, check if the assembly is locked.
@@ -4049,6 +4604,14 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
         help_text=_('BOM line checksum'),
     )
 
+    item_hash = models.CharField(
+        max_length=128,
+        blank=True,
+        editable=False,
+        verbose_name=_('Item hash'),
+        help_text=_('Calculated BOM line checksum'),
+    )
+
     validated = models.BooleanField(
         default=False,
         verbose_name=_('Validated'),
@@ -4124,6 +4687,56 @@ class BomItem(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
 
         return str(result_hash.digest())
 
+    @classmethod
+    def fill_item_hashes(cls, hashes: dict[int, str]) -> dict[int, str]:
+        """Calculate any missing line hashes in the provided {pk: item_hash} dict.
+
+        BOM items which were created before line hashes were stored (or in bulk) may not
+        have a stored hash - these are calculated and saved, so they are only calculated once.
+        """
+        missing = [pk for pk, item_hash in hashes.items() if not item_hash]
+
+        if missing:
+            items = list(
+                cls.objects.filter(pk__in=missing).select_related('part', 'sub_part')
+            )
+
+            for item in items:
+                item.item_hash = item.get_item_hash()
+                hashes[item.pk] = item.item_hash
+
+            cls.objects.bulk_update(items, ['item_hash'], batch_size=250)
+
+        return hashes
+
+    @classmethod
+    def refresh_item_hashes(cls, queryset) -> None:
+        """Recalculate the stored line hash for each BomItem in the provided queryset.
+
+        Any assemblies which are affected by a changed line hash are marked for recheck.
+        """
+        updated = []
+
+        for item in queryset.select_related('part', 'sub_part'):
+            item_hash = item.get_item_hash()
+
+            if item_hash != item.item_hash:
+                item.item_hash = item_hash
+                item.validated = bool(item.checksum) and item_hash == item.checksum
+                updated.append(item)
+
+        if not updated:
+            return
+
+        cls.objects.bulk_update(updated, ['item_hash', 'validated'], batch_size=250)
+
+        assemblies = set()
+
+        for item in updated:
+            assemblies.update(assembly.pk for assembly in item.get_assemblies())
+
+        Part.invalidate_bom_hash(assemblies)
+
     def validate_hash(self, valid=True):
         """Mark this item as 'valid' (store the checksum hash).
 
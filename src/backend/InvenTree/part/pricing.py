@@ -0,0 +1,749 @@
+"""Batched recalculation engine for cached part pricing data.
+
+When the pricing for a part changes, the cached pricing for every assembly which uses
+that part (and every template part above it) must also be recalculated.
+
+Scheduling a separate background task for each affected assembly results in the same
+upper-level assemblies being recalculated many times over, once for each path through
+the BOM graph. Instead, the PricingEngine class:
+
+- Collects a set of "dirty" parts
+- Walks up through the BOM / variant graph to find every affected part
+- Sorts the affected parts topologically (components before assemblies, variants before templates)
+- Recalculates each affected PartPricing instance exactly once, using bulk queries
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from itertools import batched
+from typing import Optional
+
+from django.db.models import Model
+from django.utils import timezone
+
+import structlog
+from djmoney.money import Money
+
+import InvenTree.ready
+from common.currency import currency_code_default
+from common.settings import get_global_setting
+from InvenTree.exceptions import log_error
+from part.models import BomItem, BomItemSubstitute, Part, PartPricing
+
+logger = structlog.get_logger('inventree')
+
+# Maximum number of primary keys passed to a single "IN" query
+QUERY_CHUNK_SIZE = 500
+
+# PartPricing fields which depend on the pricing of *other* parts
+CASCADE_PRICING_FIELDS = [
+    'bom_cost_min',
+    'bom_cost_max',
+    'variant_cost_min',
+    'variant_cost_max',
+    'overall_min',
+    'overall_max',
+]
+
+# PartPricing fields which depend only on data for the part itself
+PART_PRICING_FIELDS = [
+    'purchase_cost_min',
+    'purchase_cost_max',
+    'internal_cost_min',
+    'internal_cost_max',
+    'supplier_price_min',
+    'supplier_price_max',
+    'sale_price_min',
+    'sale_price_max',
+    'sale_history_min',
+    'sale_history_max',
+]
+
+
+def money_field_names(fields: list[str]) -> list[str]:
+    """Return the database field names for a list of money fields (amount and currency)."""
+    names = []
+
+    for field in fields:
+        names += [field, f'{field}_currency']
+
+    return names
+
+
+def part_ids(parts: Iterable) -> set[int]:
+    """Return a set of primary keys from an iterable of Part instances (or primary keys)."""
+    return {p.pk if isinstance(p, Model) else int(p) for p in parts}
+
+
+class PartTreeIndex:
+    """In-memory index of the Part tree structure.
+
+    Loads entire part trees (i.e. templates and all of their variants) with a single query,
+    so that ancestor / descendant lookups do not require additional database hits.
+    """
+
+    FIELDS = [
+        'pk',
+        'tree_id',
+        'lft',
+        'rght',
+        'active',
+        'trackable',
+        'assembly',
+        'is_template',
+    ]
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.parts: dict[int, dict] = {}
+        self.trees: dict[int, list[dict]] = defaultdict(list)
+
+    def load(self, pks: Iterable[int]) -> None:
+        """Load the part trees which contain the provided parts."""
+        missing = {pk for pk in pks if pk not in self.parts}
+
+        for chunk in batched(missing, QUERY_CHUNK_SIZE):
+            tree_ids = set(
+                Part.objects.filter(pk__in=chunk).values_list('tree_id', flat=True)
+            )
+
+            tree_ids -= self.trees.keys()
+
+            for tree_chunk in batched(tree_ids, QUERY_CHUNK_SIZE):
+                for row in Part.objects.filter(tree_id__in=tree_chunk).values(
+                    *self.FIELDS
+                ):
+                    self.parts[row['pk']] = row
+                    self.trees[row['tree_id']].append(row)
+
+    def get(self, pk: int) -> Optional[dict]:
+        """Return the cached row for the specified part (if it exists)."""
+        return self.parts.get(pk)
+
+    def ancestors(self, pk: int) -> list[int]:
+        """Return the primary keys of all ancestors of the specified part."""
+        if not (row := self.parts.get(pk)):
+            return []
+
+        return [
+            node['pk']
+            for node in self.trees[row['tree_id']]
+            if node['lft'] < row['lft'] and node['rght'] > row['rght']
+        ]
+
+    def descendants(self, pk: int) -> list[int]:
+        """Return the primary keys of all descendants of the specified part."""
+        if not (row := self.parts.get(pk)):
+            return []
+
+        return [
+            node['pk']
+            for node in self.trees[row['tree_id']]
+            if node['lft'] > row['lft'] and node['rght'] < row['rght']
+        ]
+
+
+class PricingEngine:
+    """Incremental, batched recalculation of cached PartPricing data.
+
+    Parts can be added to the engine in one of two ways:
+
+    - add_parts(): The part pricing is recalculated in full
+    - add_changed(): The part pricing has already been updated, only the dependent parts are recalculated
+
+    Calling run() then determines the full set of affected parts,
+    and recalculates each of them exactly once, in dependency order.
+
+    Example:
+        engine = PricingEngine()
+        engine.add_changed([resistor])
+        engine.run()
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """Initialize the pricing engine.
+
+        Arguments:
+            max_depth: Maximum number of levels to cascade (default = PartPricing.MAX_PRICING_DEPTH)
+            progress: Optional callback function, called as progress(completed, total)
+        """
+        self.max_depth = (
+            PartPricing.MAX_PRICING_DEPTH if max_depth is None else max_depth
+        )
+        self.progress = progress
+
+        # Parts which require a full recalculation
+        self.dirty: set[int] = set()
+
+        # Parts which have already been updated (only dependents are recalculated)
+        self.changed: set[int] = set()
+
+        # Map of part -> set of parts which it depends on
+        self.dependencies: dict[int, set[int]] = defaultdict(set)
+
+        self.tree = PartTreeIndex()
+
+        # BOM data for assemblies, loaded in bulk
+        self.bom_lines: dict[int, list[dict]] = defaultdict(list)
+
+        # Cached PartPricing instances, indexed by part ID
+        self.pricing: dict[int, PartPricing] = {}
+
+        # Dummy instance used for currency conversion
+        self.converter = PartPricing()
+
+    def add_parts(self, parts: Iterable) -> None:
+        """Mark the provided parts (or part IDs) for full pricing recalculation."""
+        self.dirty |= part_ids(parts)
+
+    def add_changed(self, parts: Iterable) -> None:
+        """Mark the provided parts (or part IDs) as having changed pricing.
+
+        The pricing for these parts is not recalculated, only for any parts which depend on them.
+        """
+        self.changed |= part_ids(parts)
+
+    def run(self, cascade: bool = True) -> set[int]:
+        """Recalculate pricing for all affected parts.
+
+        Arguments:
+            cascade: If True, recalculate pricing for all parts which depend on the provided parts
+
+        Returns:
+            The set of part IDs for which the overall pricing changed
+        """
+        if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+            return set()
+
+        sources = self.dirty | self.changed
+
+        if not sources:
+            return set()
+
+        self.tree.load(sources)
+
+        # Ignore any parts which do not exist (any more)
+        self.dirty = {pk for pk in self.dirty if self.tree.get(pk)}
+        self.changed = {pk for pk in self.changed if self.tree.get(pk)}
+
+        nodes = set(self.dirty)
+
+        if cascade:
+            nodes |= self.expand(self.dirty | self.changed)
+
+        if not nodes:
+            return set()
+
+        order = self.sort(nodes)
+
+        logger.info('Recalculating pricing for %s parts', len(order))
+
+        self.load_pricing(nodes)
+        self.load_reference_pricing(self.load_bom_lines(nodes))
+
+        return self.calculate(order)
+
+    def expand(self, sources: set[int]) -> set[int]:
+        """Find all parts which (directly or indirectly) depend on the provided parts.
+
+        The BOM / variant graph is walked one level at a time,
+        with a fixed number of bulk queries per level.
+
+        Returns:
+            The set of dependent parts (not including the source parts)
+        """
+        visited = set(sources)
+        frontier = set(sources)
+        depth = 0
+
+        while frontier and depth < self.max_depth:
+            new_nodes = set()
+
+            for parent, children in self.find_dependents(frontier).items():
+                self.dependencies[parent] |= children
+
+                if parent not in visited:
+                    visited.add(parent)
+                    new_nodes.add(parent)
+
+            frontier = new_nodes
+            depth += 1
+
+        if frontier:
+            logger.warning(
+                'Pricing cascade exceeded maximum depth of %s levels', self.max_depth
+            )
+
+        return visited - sources
+
+    def find_dependents(self, frontier: set[int]) -> dict[int, set[int]]:
+        """Find the parts which directly depend on the pricing of the provided parts.
+
+        A part depends on another part if:
+
+        - It is a template part, and the other part is one of its variants
+        - It is an assembly, and the other part can be allocated against one of its BOM lines
+          (directly, as a variant of the BOM line part, or as a substitute)
+
+        Returns:
+            A map of parent part -> set of (frontier) parts which it depends on
+        """
+        self.tree.load(frontier)
+
+        dependents = defaultdict(set)
+
+        # Map of ancestor -> frontier parts which are variants of that ancestor
+        variants_of = defaultdict(set)
+
+        for pk in frontier:
+            for ancestor in self.tree.ancestors(pk):
+                variants_of[ancestor].add(pk)
+
+                # Template parts depend on the pricing of their variants
+                dependents[ancestor].add(pk)
+
+        # Map of BomItem -> set of frontier parts used in that BomItem
+        bom_item_parts = defaultdict(set)
+        bom_items = {}
+
+        def add_bom_item(row, sub_part_id):
+            bom_items[row['pk']] = row
+
+            if sub_part_id in frontier:
+                bom_item_parts[row['pk']].add(sub_part_id)
+
+            if row['allow_variants']:
+                bom_item_parts[row['pk']] |= variants_of.get(sub_part_id, set())
+
+        bom_fields = ['pk', 'part_id', 'sub_part_id', 'allow_variants', 'inherited']
+
+        # BOM items which reference these parts (or their templates) directly
+        for chunk in batched(frontier, QUERY_CHUNK_SIZE):
+            for row in BomItem.objects.filter(sub_part__in=chunk).values(*bom_fields):
+                add_bom_item(row, row['sub_part_id'])
+
+        for chunk in batched(variants_of.keys(), QUERY_CHUNK_SIZE):
+            for row in BomItem.objects.filter(
+                sub_part__in=chunk, allow_variants=True
+            ).values(*bom_fields):
+                add_bom_item(row, row['sub_part_id'])
+
+        # BOM items for which these parts (or their templates) are substitutes
+        substitute_parts = set(frontier) | set(variants_of.keys())
+
+        for chunk in batched(substitute_parts, QUERY_CHUNK_SIZE):
+            for substitute_id, *values in BomItemSubstitute.objects.filter(
+                part__in=chunk
+            ).values_list(
+                'part_id',
+                'bom_item_id',
+                'bom_item__part_id',
+                'bom_item__sub_part_id',
+                'bom_item__allow_variants',
+                'bom_item__inherited',
+            ):
+                row = dict(zip(bom_fields, values, strict=True))
+
+                if substitute_id in frontier or row['allow_variants']:
+                    add_bom_item(row, substitute_id)
+
+        # Inherited BOM items also affect the variants of the assembly
+        self.tree.load({row['part_id'] for row in bom_items.values()})
+
+        for bom_item_id, children in bom_item_parts.items():
+            row = bom_items[bom_item_id]
+
+            assemblies = [row['part_id']]
+
+            if row['inherited']:
+                assemblies += self.tree.descendants(row['part_id'])
+
+            for assembly in assemblies:
+                dependents[assembly] |= children
+
+        return dependents
+
+    def sort(self, nodes: set[int]) -> list[int]:
+        """Sort the provided parts topologically, so that each part follows its dependencies.
+
+        Any parts which form a dependency cycle are appended at the end, in arbitrary order.
+        """
+        # Count the number of (unprocessed) dependencies for each node
+        pending = {
+            node: len(self.dependencies.get(node, set()) & nodes) for node in nodes
+        }
+
+        # Reverse map of dependency -> dependents
+        dependents = defaultdict(set)
+
+        for node in nodes:
+            for dependency in self.dependencies.get(node, set()) & nodes:
+                dependents[dependency].add(node)
+
+        ready = [node for node, count in pending.items() if count == 0]
+        order = []
+
+        while ready:
+            node = ready.pop()
+            order.append(node)
+
+            for dependent in dependents[node]:
+                pending[dependent] -= 1
+
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(nodes):
+            remaining = nodes - set(order)
+
+            logger.warning(
+                'Circular pricing dependency detected for %s parts', len(remaining)
+            )
+
+            order += sorted(remaining)
+
+        return order
+
+    def load_pricing(self, nodes: set[int]) -> None:
+        """Load (or create) the PartPricing instances for the provided parts."""
+        existing = set()
+
+        for chunk in batched(nodes, QUERY_CHUNK_SIZE):
+            existing |= set(
+                PartPricing.objects.filter(part__in=chunk).values_list(
+                    'part_id', flat=True
+                )
+            )
+
+        if missing := nodes - existing:
+            PartPricing.objects.bulk_create(
+                [PartPricing(part_id=pk) for pk in missing],
+                batch_size=250,
+                ignore_conflicts=True,
+            )
+
+        for chunk in batched(nodes, QUERY_CHUNK_SIZE):
+            for pricing in PartPricing.objects.filter(part__in=chunk).select_related(
+                'part'
+            ):
+                self.pricing[pricing.part_id] = pricing
+
+    def load_bom_lines(self, nodes: set[int]) -> set[int]:
+        """Load the BOM data required to calculate pricing for the provided parts.
+
+        For each BOM line (including inherited lines), the set of parts which
+        can be allocated against that line is determined, mirroring
+        BomItem.get_valid_parts_for_allocation()
+
+        Returns:
+            The set of parts which can be allocated against any of the loaded BOM lines
+        """
+        assemblies = {pk for pk in nodes if self.tree.get(pk)['assembly']}
+
+        if not assemblies:
+            return set()
+
+        ancestors = {pk: self.tree.ancestors(pk) for pk in assemblies}
+
+        inherited_from = set()
+
+        for pk in assemblies:
+            inherited_from |= set(ancestors[pk])
+
+        bom_fields = ['pk', 'part_id', 'sub_part_id', 'quantity', 'allow_variants']
+
+        lines_by_part = defaultdict(dict)
+
+        for chunk in batched(assemblies, QUERY_CHUNK_SIZE):
+            for row in BomItem.objects.filter(part__in=chunk).values(*bom_fields):
+                lines_by_part[row['part_id']][row['pk']] = row
+
+        inherited_lines = defaultdict(dict)
+
+        for chunk in batched(inherited_from, QUERY_CHUNK_SIZE):
+            for row in BomItem.objects.filter(part__in=chunk, inherited=True).values(
+                *bom_fields
+            ):
+                inherited_lines[row['part_id']][row['pk']] = row
+
+        lines = {}
+
+        for rows in [*lines_by_part.values(), *inherited_lines.values()]:
+            lines.update(rows)
+
+        # Substitute parts for each BOM line
+        substitutes = defaultdict(set)
+
+        for chunk in batched(lines.keys(), QUERY_CHUNK_SIZE):
+            for bom_item_id, part_id in BomItemSubstitute.objects.filter(
+                bom_item__in=chunk
+            ).values_list('bom_item_id', 'part_id'):
+                substitutes[bom_item_id].add(part_id)
+
+        referenced = {row['sub_part_id'] for row in lines.values()}
+
+        for parts in substitutes.values():
+            referenced |= parts
+
+        self.tree.load(referenced)
+
+        # Determine the valid parts for each BOM line
+        referenced = set()
+
+        for row in lines.values():
+            sub_part = self.tree.get(row['sub_part_id'])
+
+            if sub_part is None:
+                row['parts'] = []
+                continue
+
+            candidates = {row['sub_part_id']} | substitutes[row['pk']]
+
+            if row['allow_variants']:
+                for pk in list(candidates):
+                    candidates |= set(self.tree.descendants(pk))
+
+            valid = []
+
+            for pk in candidates:
+                candidate = self.tree.get(pk)
+
+                # Trackable status must be the same as the sub_part
+                if candidate is None or candidate['trackable'] != sub_part['trackable']:
+                    continue
+
+                # Inactive parts are ignored, unless they are the sub_part itself
+                if pk != row['sub_part_id'] and not candidate['active']:
+                    continue
+
+                valid.append(pk)
+
+            row['parts'] = valid
+            referenced |= set(valid)
+
+        for pk in assemblies:
+            self.bom_lines[pk] = list(lines_by_part[pk].values())
+
+            for ancestor in ancestors[pk]:
+                self.bom_lines[pk] += list(inherited_lines[ancestor].values())
+
+        return referenced
+
+    def template_nodes(self, nodes: set[int]) -> set[int]:
+        """Return the subset of provided parts which are templates."""
+        return {pk for pk in nodes if self.tree.get(pk)['is_template']}
+
+    def load_reference_pricing(self, parts: set[int]) -> None:
+        """Load PartPricing data for parts which are referenced (but not recalculated).
+
+        Arguments:
+            parts: Set of referenced parts (variants of template parts are added automatically)
+        """
+        for pk in self.template_nodes(set(self.pricing.keys())):
+            parts |= set(self.tree.descendants(pk))
+
+        missing = parts - self.pricing.keys()
+
+        for chunk in batched(missing, QUERY_CHUNK_SIZE):
+            for pricing in PartPricing.objects.filter(part__in=chunk).only(
+                'part_id', 'overall_min', 'overall_max'
+            ):
+                self.pricing[pricing.part_id] = pricing
+
+    def convert(self, money):
+        """Convert a money value to the default currency."""
+        return self.converter.convert(money)
+
+    def calculate_bom_cost(self, pk: int) -> tuple:
+        """Calculate the min / max BOM cost for the specified part.
+
+        Mirrors the logic of PartPricing.update_bom_cost(),
+        using the pre-loaded BOM and pricing data.
+        """
+        if not self.tree.get(pk)['assembly']:
+            return None, None
+
+        currency_code = currency_code_default()
+
+        cumulative_min = Money(0, currency_code)
+        cumulative_max = Money(0, currency_code)
+
+        any_min_elements = False
+        any_max_elements = False
+
+        for line in self.bom_lines.get(pk, []):
+            line_min = None
+            line_max = None
+
+            for sub_part in line['parts']:
+                if not (pricing := self.pricing.get(sub_part)):
+                    continue
+
+                sub_part_min = self.convert(pricing.overall_min)
+                sub_part_max = self.convert(pricing.overall_max)
+
+                if sub_part_min is not None:
+                    if line_min is None or sub_part_min < line_min:
+                        line_min = sub_part_min
+
+                if sub_part_max is not None:
+                    if line_max is None or sub_part_max > line_max:
+                        line_max = sub_part_max
+
+            if line_min is not None:
+                cumulative_min += self.convert(line_min * line['quantity'])
+                any_min_elements = True
+
+            if line_max is not None:
+                cumulative_max += self.convert(line_max * line['quantity'])
+                any_max_elements = True
+
+        return (
+            cumulative_min if any_min_elements else None,
+            cumulative_max if any_max_elements else None,
+        )
+
+    def calculate_variant_cost(self, pk: int) -> tuple:
+        """Calculate the min / max variant cost for the specified part.
+
+        Mirrors the logic of PartPricing.update_variant_cost(),
+        using the pre-loaded pricing data.
+        """
+        if not self.tree.get(pk)['is_template']:
+            return None, None
+
+        active_only = get_global_setting('PRICING_ACTIVE_VARIANTS', False)
+
+        variant_min = None
+        variant_max = None
+
+        for variant in self.tree.descendants(pk):
+            if active_only and not self.tree.get(variant)['active']:
+                continue
+
+            if not (pricing := self.pricing.get(variant)):
+                continue
+
+            v_min = self.convert(pricing.overall_min)
+            v_max = self.convert(pricing.overall_max)
+
+            if v_min is not None:
+                if variant_min is None or v_min < variant_min:
+                    variant_min = v_min
+
+            if v_max is not None:
+                if variant_max is None or v_max > variant_max:
+                    variant_max = v_max
+
+        return variant_min, variant_max
+
+    def calculate(self, order: list[int]) -> set[int]:
+        """Recalculate pricing for each part, in the provided order.
+
+        A part is only recalculated if it is marked as dirty,
+        or if the pricing for any of its dependencies has changed.
+
+        Returns:
+            The set of part IDs for which the overall pricing changed
+        """
+        changed = set(self.changed)
+
+        full_updates = []
+        cascade_updates = []
+
+        total = len(order)
+
+        for idx, pk in enumerate(order):
+            full = pk in self.dirty
+
+            if full or self.dependencies.get(pk, set()) & changed:
+                pricing = self.recalculate(pk, full=full)
+
+                if pricing is not None:
+                    if full:
+                        full_updates.append(pricing)
+                    else:
+                        cascade_updates.append(pricing)
+
+                    if pricing.pricing_changed:
+                        changed.add(pk)
+
+            if len(full_updates) + len(cascade_updates) >= QUERY_CHUNK_SIZE:
+                self.save(full_updates, cascade_updates)
+                full_updates, cascade_updates = [], []
+
+            if self.progress:
+                self.progress(idx + 1, total)
+
+        self.save(full_updates, cascade_updates)
+
+        return changed - self.changed
+
+    def recalculate(self, pk: int, full: bool = False) -> Optional[PartPricing]:
+        """Recalculate the pricing for a single part, using the pre-loaded data.
+
+        Arguments:
+            pk: The ID of the part to recalculate
+            full: If True, also recalculate pricing data which depends only on the part itself
+
+        Returns:
+            The updated PartPricing instance (not yet saved), or None if the calculation failed
+        """
+        if not (pricing := self.pricing.get(pk)):
+            return None
+
+        previous_min = pricing.overall_min
+        previous_max = pricing.overall_max
+
+        try:
+            if full:
+                pricing.update_purchase_cost(save=False)
+                pricing.update_internal_cost(save=False)
+                pricing.update_supplier_cost(save=False)
+                pricing.update_sale_cost(save=False)
+                pricing.scheduled_for_update = False
+
+            pricing.bom_cost_min, pricing.bom_cost_max = self.calculate_bom_cost(pk)
+            pricing.variant_cost_min, pricing.variant_cost_max = (
+                self.calculate_variant_cost(pk)
+            )
+
+            pricing.update_overall_cost()
+        except Exception:
+            log_error('PricingEngine.recalculate')
+            return None
+
+        pricing.currency = currency_code_default()
+        pricing.updated = timezone.now()
+
+        pricing.pricing_changed = (
+            previous_min != pricing.overall_min or previous_max != pricing.overall_max
+        )
+
+        return pricing
+
+    def save(self, full_updates: list, cascade_updates: list) -> None:
+        """Write the recalculated pricing data to the database."""
+        common_fields = ['currency', 'updated']
+
+        if full_updates:
+            PartPricing.objects.bulk_update(
+                full_updates,
+                [
+                    *money_field_names(PART_PRICING_FIELDS + CASCADE_PRICING_FIELDS),
+                    *common_fields,
+                    'scheduled_for_update',
+                ],
+                batch_size=250,
+            )
+
+        if cascade_updates:
+            PartPricing.objects.bulk_update(
+                cascade_updates,
+                [*money_field_names(CASCADE_PRICING_FIELDS), *common_fields],
+                batch_size=250,
+            )
@@ -40,6 +40,7 @@ from .models import (
     BomItem,
     BomItemSubstitute,
     Part,
+    PartAvailability,
     PartCategory,
     PartCategoryParameterTemplate,
     PartInternalPriceBreak,
@@ -661,11 +662,23 @@ class PartSerializer(
         return fields
 
     @staticmethod
-    def annotate_queryset(queryset):
+    def annotate_queryset(queryset, cached: bool = False):
         """Add some extra annotations to the queryset.
 
         Performing database queries as efficiently as possible, to reduce database trips.
+
+        Arguments:
+            queryset: The Part queryset to annotate
+            cached: If True, read stock availability data from the PartAvailability table (where available)
         """
+        from part.availability import cached_availability
+
+        def availability(field, live, output_field=None):
+            """Return the cached value for an availability field, or the live calculation."""
+            if cached:
+                return cached_availability(field, live, output_field=output_field)
+            return live
+
         # Annotate with the total number of revisions
         queryset = queryset.annotate(revision_count=SubqueryCount('revisions'))
 
@@ -676,8 +689,12 @@ class PartSerializer(
         variant_query = part_filters.variant_stock_query()
 
         queryset = queryset.annotate(
-            variant_stock=part_filters.annotate_variant_quantity(
-                variant_query, reference='quantity'
+            variant_stock=availability(
+                'variant_stock',
+                part_filters.annotate_variant_quantity(
+                    variant_query, reference='quantity'
+                ),
+                output_field=models.FloatField(),
             )
         )
 
@@ -691,12 +708,20 @@ class PartSerializer(
         )
 
         queryset = queryset.annotate(
-            ordering=part_filters.annotate_on_order_quantity(),
-            in_stock=part_filters.annotate_total_stock(),
-            allocated_to_sales_orders=part_filters.annotate_sales_order_allocations(),
+            ordering=availability(
+                'on_order', part_filters.annotate_on_order_quantity()
+            ),
+            in_stock=availability('in_stock', part_filters.annotate_total_stock()),
+            allocated_to_sales_orders=availability(
+                'allocated_to_sales_orders',
+                part_filters.annotate_sales_order_allocations(),
+            ),
             # NOTE: for now, decided that allocations to Transfer Orders don't reduce available stock
             # allocated_to_transfer_orders=part_filters.annotate_transfer_order_allocations(),
-            allocated_to_build_orders=part_filters.annotate_build_order_allocations(),
+            allocated_to_build_orders=availability(
+                'allocated_to_build_orders',
+                part_filters.annotate_build_order_allocations(),
+            ),
         )
 
         # Annotate the queryset with the 'total_in_stock' quantity
@@ -1193,7 +1218,7 @@ class PartRequirementsSerializer(InvenTree.serializers.InvenTreeModelSerializer)
         source='available_stock', read_only=True, label=_('Available Stock')
     )
 
-    can_build = serializers.FloatField(read_only=True, label=_('Can Build'))
+    can_build = serializers.SerializerMethodField(label=_('Can Build'))
 
     ordering = serializers.FloatField(
         source='on_order', read_only=True, label=_('On Order')
@@ -1233,6 +1258,26 @@ class PartRequirementsSerializer(InvenTree.serializers.InvenTreeModelSerializer)
         """Return the allocated sales order quantity."""
         return part.sales_order_allocation_count(include_variants=True, pending=True)
 
+    def get_can_build(self, part) -> float:
+        """Return the number of units which can be built from available stock.
+
+        If the part availability cache is enabled, the cached value is returned.
+        """
+        from part.availability import use_cached_availability
+
+        if use_cached_availability(self.context.get('request')):
+            cached = (
+                PartAvailability.objects
+                .filter(part=part)
+                .values_list('can_build', flat=True)
+                .first()
+            )
+
+            if cached is not None:
+                return float(cached)
+
+        return float(part.can_build)
+
 
 class PartStocktakeSerializer(
     InvenTree.serializers.FilterableSerializerMixin,
@@ -1597,6 +1642,58 @@ class PartSerialNumberSerializer(InvenTree.serializers.InvenTreeModelSerializer)
     next = serializers.CharField(source='get_next_serial_number', read_only=True)
 
 
+class BomExplosionRowSerializer(serializers.Serializer):
+    """Serializer for a single row of an exploded (multi-level) BOM."""
+
+    bom_item = serializers.IntegerField(read_only=True, label=_('BOM Item'))
+    assembly = serializers.IntegerField(read_only=True, label=_('Assembly'))
+    part = serializers.IntegerField(
+        read_only=True,
+        label=_('Part'),
+        help_text=_('Part against which the BOM item is defined'),
+    )
+    sub_part = serializers.IntegerField(read_only=True, label=_('Component'))
+    level = serializers.IntegerField(read_only=True, label=_('BOM Level'))
+    parent = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        label=_('Parent'),
+        help_text=_('Index of the parent row'),
+    )
+    quantity = InvenTree.serializers.InvenTreeDecimalField(
+        read_only=True, label=_('Quantity')
+    )
+    total_quantity = InvenTree.serializers.InvenTreeDecimalField(
+        read_only=True, label=_('Total Quantity')
+    )
+    inherited = serializers.BooleanField(read_only=True, label=_('Inherited'))
+    allow_variants = serializers.BooleanField(read_only=True, label=_('Allow Variants'))
+    substitutes = serializers.ListField(
+        child=serializers.IntegerField(), read_only=True, label=_('Substitutes')
+    )
+    variants = serializers.ListField(
+        child=serializers.IntegerField(), read_only=True, label=_('Variants')
+    )
+
+
+class BomExplosionTotalSerializer(serializers.Serializer):
+    """Serializer for the total quantity of a component in an exploded BOM."""
+
+    part = serializers.IntegerField(read_only=True, label=_('Part'))
+    quantity = InvenTree.serializers.InvenTreeDecimalField(
+        read_only=True, label=_('Total Quantity')
+    )
+
+
+class BomExplosionSerializer(serializers.Serializer):
+    """Serializer for a flattened, multi-level BOM."""
+
+    part = serializers.IntegerField(read_only=True, label=_('Part'))
+    levels = serializers.IntegerField(read_only=True, label=_('Levels'))
+    rows = BomExplosionRowSerializer(many=True, read_only=True)
+    totals = BomExplosionTotalSerializer(many=True, read_only=True)
+
+
 class PartRelationSerializer(InvenTree.serializers.InvenTreeModelSerializer):
     """Serializer for a PartRelated model."""
 
@@ -1,11 +1,25 @@
-"""Stock history functionality."""
-
+"""Stock history functionality.
+
+Stocktake entries are generated in bulk, one chunk of parts at a time:
+
+- Stock quantities and values are aggregated per part (and per purchase currency) in the database
+- Currency conversion is performed once per currency, rather than once per stock item
+- New stocktake entries are written with a single bulk_create() call per chunk
+- The stocktake report is streamed to a temporary file as each chunk is processed
+"""
+
+import csv
+import io
+import tempfile
+from collections import defaultdict
+from decimal import Decimal
+from itertools import batched
 from typing import Optional
 
-from django.core.files.base import ContentFile
+from django.core.files.base import File
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Q, Sum
 
 import structlog
-import tablib
 from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 
@@ -14,6 +28,204 @@ from InvenTree.helpers import current_date
 
 logger = structlog.get_logger('inventree')
 
+# Number of parts processed in each chunk
+STOCKTAKE_CHUNK_SIZE = 250
+
+
+class CurrencyConverter:
+    """Convert currency amounts to a single target currency.
+
+    The exchange rate for each currency is looked up only once.
+    """
+
+    def __init__(self, currency: str):
+        """Initialize the converter for the provided target currency."""
+        self.currency = currency
+        self.rates: dict[str, Optional[Decimal]] = {currency: Decimal(1)}
+
+    def rate(self, currency: str) -> Optional[Decimal]:
+        """Return the exchange rate for the provided currency (or None if not available)."""
+        if currency not in self.rates:
+            try:
+                self.rates[currency] = convert_money(
+                    Money(1, currency), self.currency
+                ).amount
+            except Exception:
+                logger.warning(
+                    'No currency conversion rate available for %s -> %s',
+                    currency,
+                    self.currency,
+                )
+                self.rates[currency] = None
+
+        return self.rates[currency]
+
+    def convert(self, amount, currency: str) -> Decimal:
+        """Convert an amount to the target currency (zero if conversion is not possible)."""
+        if amount is None or not currency:
+            return Decimal(0)
+
+        rate = self.rate(str(currency))
+
+        if rate is None:
+            return Decimal(0)
+
+        return Decimal(amount) * rate
+
+
+def stock_totals(part_ids, stock_filter: Q) -> dict[int, list[dict]]:
+    """Aggregate the stock quantity and purchase value for the provided parts.
+
+    Arguments:
+        part_ids: The parts for which to aggregate stock data
+        stock_filter: Q object which defines how to filter the stock items
+
+    Returns:
+        A map of part ID -> list of aggregated rows (one row per purchase price currency)
+    """
+    import stock.models as stock_models
+
+    has_price = Q(purchase_price__isnull=False)
+
+    queryset = (
+        stock_models.StockItem.objects
+        .filter(stock_filter)
+        .filter(part__in=part_ids)
+        .order_by()
+        .values('part', 'purchase_price_currency')
+        .annotate(
+            item_count=Count('pk'),
+            total_quantity=Sum('quantity'),
+            priced_value=Sum(
+                ExpressionWrapper(
+                    F('quantity') * F('purchase_price'), output_field=DecimalField()
+                ),
+                filter=has_price,
+            ),
+            unpriced_quantity=Sum('quantity', filter=~has_price),
+        )
+    )
+
+    totals = defaultdict(list)
+
+    for row in queryset:
+        totals[row['part']].append(row)
+
+    return totals
+
+
+def pricing_totals(part_ids, converter: CurrencyConverter) -> dict[int, tuple]:
+    """Return the (min, max) unit cost for the provided parts, in the base currency.
+
+    Cost information is taken from the cached PartPricing data for each part.
+    """
+    import part.models as part_models
+
+    pricing = {}
+
+    for row in part_models.PartPricing.objects.filter(part__in=part_ids).values(
+        'part',
+        'overall_min',
+        'overall_min_currency',
+        'overall_max',
+        'overall_max_currency',
+    ):
+        cost_min = (row['overall_min'], row['overall_min_currency'])
+        cost_max = (row['overall_max'], row['overall_max_currency'])
+
+        if cost_min[0] is None:
+            cost_min = cost_max
+
+        if cost_max[0] is None:
+            cost_max = cost_min
+
+        if cost_min[0] is None:
+            # No pricing information available
+            continue
+
+        pricing[row['part']] = (
+            converter.convert(*cost_min),
+            converter.convert(*cost_max),
+        )
+
+    return pricing
+
+
+def stocktake_entries(
+    part_ids: list[int],
+    stock_filter: Q,
+    converter: CurrencyConverter,
+    skip_empty: bool = False,
+):
+    """Generate (unsaved) stocktake entries for the provided parts, one chunk at a time.
+
+    Arguments:
+        part_ids: The parts for which to generate stocktake entries
+        stock_filter: Q object which defines which stock items are included
+        converter: CurrencyConverter used to convert stock values to the base currency
+        skip_empty: If True, parts without any matching stock items are skipped
+
+    Yields:
+        A tuple of (part IDs, PartStocktake instances) for each chunk of parts
+    """
+    import part.models as part_models
+    from part.pricing import PartTreeIndex
+
+    tree = PartTreeIndex()
+
+    for chunk in batched(part_ids, STOCKTAKE_CHUNK_SIZE):
+        tree.load(chunk)
+
+        # Stock for each part includes any variant stock
+        members = {pk: [pk, *tree.descendants(pk)] for pk in chunk}
+
+        totals = stock_totals(
+            {pk for pks in members.values() for pk in pks}, stock_filter
+        )
+
+        pricing = pricing_totals(chunk, converter)
+
+        history_entries = []
+
+        for pk in chunk:
+            unit_min, unit_max = pricing.get(pk, (Decimal(0), Decimal(0)))
+
+            items_count = 0
+            total_quantity = Decimal(0)
+            total_cost_min = Decimal(0)
+            total_cost_max = Decimal(0)
+
+            for member in members[pk]:
+                for row in totals.get(member, []):
+                    items_count += row['item_count']
+                    total_quantity += row['total_quantity'] or 0
+
+                    # Stock items with a purchase price are valued at that price
+                    value = converter.convert(
+                        row['priced_value'], row['purchase_price_currency']
+                    )
+
+                    # Otherwise, value based on the pricing data for the part
+                    unpriced = row['unpriced_quantity'] or 0
+
+                    total_cost_min += value + unpriced * unit_min
+                    total_cost_max += value + unpriced * unit_max
+
+            if skip_empty and items_count == 0:
+                continue
+
+            history_entries.append(
+                part_models.PartStocktake(
+                    part_id=pk,
+                    item_count=items_count,
+                    quantity=total_quantity,
+                    cost_min=Money(total_cost_min, converter.currency),
+                    cost_max=Money(total_cost_max, converter.currency),
+                )
+            )
+
+        yield chunk, history_entries
+
 
 def perform_stocktake(
     part_id: Optional[int] = None,
@@ -38,8 +250,11 @@ def perform_stocktake(
 
     Alternatively, the scope of the stocktake can be limited by providing a queryset of parts,
     or by providing a category ID or location ID to filter the parts/stock items.
+
+    The stock for each part includes stock for any variant parts.
+    Stock items with a purchase price are valued at that price,
+    otherwise the cached pricing data for the part is used.
     """
-    import InvenTree.helpers
     import part.models as part_models
     import part.serializers as part_serializers
     import stock.models as stock_models
@@ -70,9 +285,6 @@ def perform_stocktake(
     # Only use active parts
     parts = parts.filter(active=True)
 
-    # Prefetch related pricing information
-    parts = parts.prefetch_related('pricing_data', 'stock_items')
-
     # Filter part queryset by category, if provided
     if category_id is not None:
         # Filter parts by category (including subcategories)
@@ -97,13 +309,32 @@ def perform_stocktake(
         # Location limited, so we will disable saving of stocktake entries
         generate_entry = False
 
-    # New history entries to be created
-    history_entries = []
+    # Construct the filter for stock items which are included in the stocktake
+    stock_filter = stock_models.StockItem.IN_STOCK_FILTER
+
+    if exclude_external:
+        stock_filter &= Q(location__external=False)
+
+    if location:
+        stock_filter &= Q(location__in=location.get_descendants(include_self=True))
 
     base_currency = currency_code_default()
-    today = InvenTree.helpers.current_date()
+    converter = CurrencyConverter(base_currency)
+    today = current_date()
+
+    part_ids = list(parts.order_by('pk').values_list('pk', flat=True))
+
+    logger.info('Creating new stock history entries for %s parts', len(part_ids))
+
+    if generate_entry:
+        # Ignore any parts which already have a recent stock history record
+        existing = set(
+            part_models.PartStocktake.objects.filter(date__gte=today).values_list(
+                'part', flat=True
+            )
+        )
 
-    logger.info('Creating new stock history entries for %s parts', parts.count())
+        part_ids = [pk for pk in part_ids if pk not in existing]
 
     # Fetch report output object if provided
     if report_output_id is not None:
@@ -116,121 +347,54 @@ def perform_stocktake(
 
     if report_output:
         # Initialize progress on the report output
-        report_output.total = parts.count()
+        report_output.total = len(part_ids)
         report_output.progress = 0
         report_output.complete = False
         report_output.save()
 
-    for part in parts:
-        # Is there a recent stock history record for this part?
-        if (
-            generate_entry
-            and part_models.PartStocktake.objects.filter(
-                part=part, date__gte=today
-            ).exists()
-        ):
-            continue
+    entries = stocktake_entries(
+        part_ids, stock_filter, converter, skip_empty=location is not None
+    )
 
-        try:
-            pricing = part.pricing_data
-        except Exception:
-            pricing = None
-
-        # Fetch all 'in stock' items for this part
-        stock_items = part.stock_entries(
-            location=location,
-            in_stock=True,
-            include_external=not exclude_external,
-            include_variants=True,
-        )
+    if not report_output:
+        for _chunk, history_entries in entries:
+            if generate_entry:
+                part_models.PartStocktake.objects.bulk_create(history_entries)
 
-        total_cost_min = Money(0, base_currency)
-        total_cost_max = Money(0, base_currency)
+        return
 
-        total_quantity = 0
-        items_count = 0
+    serializer = part_serializers.PartStocktakeSerializer(exclude_pk=True)
+    headers = serializer.generate_headers()
+    header_keys = list(headers.keys())
 
-        if stock_items.count() == 0:
-            # No stock items - skip this part if location is specified
-            if location:
-                continue
+    # Stream the report data to a temporary file, rather than holding it in memory
+    with tempfile.TemporaryFile() as report_file:
+        report_text = io.TextIOWrapper(report_file, encoding='utf-8', newline='')
+        writer = csv.writer(report_text)
+        writer.writerow(list(headers.values()))
 
-        for item in stock_items:
-            # Extract cost information
+        for chunk, history_entries in entries:
+            if generate_entry:
+                part_models.PartStocktake.objects.bulk_create(history_entries)
 
-            entry_cost_min = (
-                (pricing.overall_min or pricing.overall_max) if pricing else None
-            )
-            entry_cost_max = (
-                (pricing.overall_max or pricing.overall_min) if pricing else None
-            )
-
-            if item.purchase_price is not None:
-                entry_cost_min = item.purchase_price
-                entry_cost_max = item.purchase_price
+            # Attach part information for the report
+            part_data = part_models.Part.objects.in_bulk([
+                entry.part_id for entry in history_entries
+            ])
 
-            try:
-                entry_cost_min = entry_cost_min * item.quantity
-                entry_cost_max = entry_cost_max * item.quantity
+            for entry in history_entries:
+                entry.part = part_data[entry.part_id]
+                entry.date = today
+                row = serializer.to_representation(entry)
+                writer.writerow([row.get(header, '') for header in header_keys])
 
-                if entry_cost_min.currency != base_currency:
-                    entry_cost_min = convert_money(entry_cost_min, base_currency)
+            # Update report progress once per chunk, to avoid excessive database writes
+            report_output.progress += len(chunk)
+            report_output.save()
 
-                if entry_cost_max.currency != base_currency:
-                    entry_cost_max = convert_money(entry_cost_max, base_currency)
-            except Exception:
-                entry_cost_min = Money(0, base_currency)
-                entry_cost_max = Money(0, base_currency)
-
-            # Update total quantities
-            items_count += 1
-            total_quantity += item.quantity
-            total_cost_min += entry_cost_min
-            total_cost_max += entry_cost_max
-
-        if report_output:
-            report_output.progress += 1
-
-            # Update report progress every few items, to avoid excessive database writes
-            if report_output.progress % 50 == 0:
-                report_output.save()
-
-        # Add a new stocktake entry for this part
-        history_entries.append(
-            part_models.PartStocktake(
-                part=part,
-                item_count=items_count,
-                quantity=total_quantity,
-                cost_min=total_cost_min,
-                cost_max=total_cost_max,
-            )
-        )
-
-    if generate_entry:
-        # Bulk-create PartStocktake entries
-        part_models.PartStocktake.objects.bulk_create(history_entries, batch_size=250)
-
-    if report_output:
         # Save report data, and mark as complete
+        report_text.flush()
+        report_text.detach()
+        report_file.seek(0)
 
-        today = current_date()
-
-        serializer = part_serializers.PartStocktakeSerializer(exclude_pk=True)
-
-        headers = serializer.generate_headers()
-
-        # Export the data to a file
-        dataset = tablib.Dataset(headers=list(headers.values()))
-
-        header_keys = list(headers.keys())
-
-        for entry in history_entries:
-            entry.date = today
-            row = serializer.to_representation(entry)
-            dataset.append([row.get(header, '') for header in header_keys])
-
-        datafile = dataset.export('csv')
-
-        report_output.mark_complete(
-            output=ContentFile(datafile, 'stocktake_report.csv')
-        )
+        report_output.mark_complete(output=File(report_file, 'stocktake_report.csv'))
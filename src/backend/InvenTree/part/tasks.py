@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db.models import Model
 from django.utils.translation import gettext_lazy as _
@@ -17,7 +18,6 @@ import InvenTree.helpers_model
 from common.settings import get_global_setting
 from InvenTree.tasks import (
     ScheduledTask,
-    batch_offload_tasks,
     check_daily_holdoff,
     offload_task,
     record_task_success,
@@ -228,20 +228,60 @@ def check_stale_stock():
 
 
 @tracer.start_as_current_span('update_part_pricing')
-def update_part_pricing(pricing: Model, counter: int = 0):
+def update_part_pricing(pricing: Model):
     """Update cached pricing data for the specified PartPricing instance.
 
     Arguments:
         pricing: The target PartPricing instance to be updated
-        counter: How many times this function has been called in sequence
     """
+    from part.models import PartPricing
+
     logger.info('Updating part pricing for %s', pricing.part)
 
-    pricing.update_pricing(
-        counter=counter,
-        previous_min=pricing.overall_min,
-        previous_max=pricing.overall_max,
-    )
+    try:
+        pricing.update_pricing(
+            previous_min=pricing.overall_min, previous_max=pricing.overall_max
+        )
+    finally:
+        # Ensure the pricing can be scheduled again, even if the update failed
+        PartPricing.objects.filter(pk=pricing.pk, scheduled_for_update=True).update(
+            scheduled_for_update=False
+        )
+
+
+@tracer.start_as_current_span('recalculate_part_pricing')
+def recalculate_part_pricing(
+    part_ids: Optional[list[int]] = None,
+    changed_part_ids: Optional[list[int]] = None,
+    cascade: bool = True,
+):
+    """Recalculate cached pricing data for a set of parts, in a single pass.
+
+    Any assemblies and templates which depend on the provided parts are also updated,
+    with each affected PartPricing instance recalculated exactly once.
+
+    Arguments:
+        part_ids: List of part IDs for which pricing should be fully recalculated
+        changed_part_ids: List of part IDs for which pricing has already been updated (only dependents are recalculated)
+        cascade: If True, update pricing for all assemblies and templates which depend on the provided parts
+    """
+    from part.models import PartPricing
+    from part.pricing import PricingEngine
+
+    engine = PricingEngine()
+    engine.add_parts(part_ids or [])
+    engine.add_changed(changed_part_ids or [])
+
+    try:
+        changed = engine.run(cascade=cascade)
+    finally:
+        # Ensure the pricing can be scheduled again, even if the update failed
+        # (e.g. for parts scheduled by check_missing_pricing)
+        PartPricing.objects.filter(
+            part__in=part_ids or [], scheduled_for_update=True
+        ).update(scheduled_for_update=False)
+
+    logger.info('Pricing changed for %s parts', len(changed))
 
 
 @tracer.start_as_current_span('check_missing_pricing')
@@ -254,6 +294,9 @@ def check_missing_pricing(limit=250):
     - Pricing information is "old"
     - Pricing information is in the wrong currency
 
+    All parts found are recalculated in a single background task,
+    so that any shared assemblies are only updated once.
+
     Arguments:
         limit: Maximum number of parts to process at once
     """
@@ -266,51 +309,98 @@ def check_missing_pricing(limit=250):
         # Task does not run if the interval is zero
         return
 
-    # Scheduling each part's pricing update calls offload_task(), which (outside of a batch)
-    # checks the entire task queue for duplicates on every call. Batching collapses all of
-    # this run's scheduling into a single bulk write instead, avoiding that per-call scan.
-    with batch_offload_tasks():
-        # Find parts for which pricing information has never been updated
-        results = PartPricing.objects.filter(updated=None)[:limit]
+    # Ignore any pricing entries which are already scheduled for update
+    pricing = PartPricing.objects.filter(scheduled_for_update=False)
 
-        if results.count() > 0:
-            logger.info('Found %s parts with empty pricing', results.count())
+    part_ids = set()
 
-            for pp in results:
-                pp.schedule_for_update()
+    # Find parts for which pricing information has never been updated
+    results = pricing.filter(updated=None)[:limit]
 
-        stale_date = datetime.now().date() - timedelta(days=days)
+    if results.count() > 0:
+        logger.info('Found %s parts with empty pricing', results.count())
+        part_ids |= set(results.values_list('part_id', flat=True))
 
-        results = PartPricing.objects.filter(updated__lte=stale_date)[:limit]
+    stale_date = datetime.now().date() - timedelta(days=days)
 
-        if results.count() > 0:
-            logger.info('Found %s stale pricing entries', results.count())
+    results = pricing.filter(updated__lte=stale_date)[:limit]
 
-            for pp in results:
-                pp.schedule_for_update()
+    if results.count() > 0:
+        logger.info('Found %s stale pricing entries', results.count())
+        part_ids |= set(results.values_list('part_id', flat=True))
 
-        # Find any pricing data which is in the wrong currency
-        currency = common.currency.currency_code_default()
-        results = PartPricing.objects.exclude(currency=currency)[:limit]
+    # Find any pricing data which is in the wrong currency
+    currency = common.currency.currency_code_default()
+    results = pricing.exclude(currency=currency)[:limit]
 
-        if results.count() > 0:
-            logger.info(
-                'Found %s pricing entries in the wrong currency', results.count()
-            )
+    if results.count() > 0:
+        logger.info('Found %s pricing entries in the wrong currency', results.count())
+        part_ids |= set(results.values_list('part_id', flat=True))
+
+    # Find any parts which do not have pricing information
+    results = Part.objects.filter(pricing_data=None)[:limit]
+
+    if results.count() > 0:
+        logger.info('Found %s parts without pricing', results.count())
+
+        missing = list(results.values_list('pk', flat=True))
+
+        PartPricing.objects.bulk_create(
+            [PartPricing(part_id=pk) for pk in missing],
+            batch_size=250,
+            ignore_conflicts=True,
+        )
+
+        part_ids |= set(missing)
 
-            for pp in results:
-                pp.schedule_for_update()
+    if not part_ids:
+        return
 
-        # Find any parts which do not have pricing information
-        results = Part.objects.filter(pricing_data=None)[:limit]
+    PartPricing.objects.filter(part__in=part_ids).update(scheduled_for_update=True)
 
-        if results.count() > 0:
-            logger.info('Found %s parts without pricing', results.count())
+    # Pricing calculations are performed in the background,
+    # unless the TESTING_PRICING flag is set
+    background = not settings.TESTING or not settings.TESTING_PRICING
 
-            for p in results:
-                pricing = p.pricing
-                pricing.save()
-                pricing.schedule_for_update()
+    offload_task(
+        recalculate_part_pricing,
+        part_ids=sorted(part_ids),
+        force_async=background,
+        check_duplicates=False,
+        group='pricing',
+    )
+
+
+@tracer.start_as_current_span('update_part_availability')
+def update_part_availability(part_ids: list[int], cascade: bool = True):
+    """Recalculate the cached availability data for a set of parts.
+
+    Arguments:
+        part_ids: List of part IDs for which stock data has changed
+        cascade: If True, also update any templates and assemblies which depend on the provided parts
+    """
+    from part.availability import update_availability
+
+    update_availability(part_ids, cascade=cascade)
+
+
+@tracer.start_as_current_span('rebuild_part_availability')
+@scheduled_task(ScheduledTask.DAILY)
+def rebuild_part_availability():
+    """Rebuild the cached availability data for all parts.
+
+    Incremental updates are performed whenever stock data changes,
+    but a periodic full rebuild ensures that the cache remains consistent.
+    """
+    from part.availability import availability_cache_enabled, rebuild_availability
+
+    if not availability_cache_enabled():
+        return
+
+    mismatches = rebuild_availability()
+
+    if mismatches:
+        logger.info('Corrected availability data for %s parts', len(mismatches))
 
 
 @tracer.start_as_current_span('scheduled_stocktake_reports')
@@ -396,24 +486,56 @@ def rebuild_supplier_parts(part_id: int):
 
 @tracer.start_as_current_span('check_bom_valid')
 def check_bom_valid(part_id: int):
-    """Recalculate the BOM checksum for all assemblies which include the specified Part.
+    """Recalculate the BOM checksum for the specified assembly.
 
     Arguments:
         part_id: The ID of the part for which to recalculate the BOM checksum.
     """
+    check_bom_valid_bulk([part_id])
+
+
+@tracer.start_as_current_span('check_bom_valid_bulk')
+def check_bom_valid_bulk(part_ids: Optional[list[int]] = None, batch_size: int = 500):
+    """Recalculate the BOM checksum for multiple assemblies.
+
+    Assemblies are checked in batches, with a fixed number of queries per batch.
+
+    Arguments:
+        part_ids: List of Part IDs to check (default = all assemblies)
+        batch_size: Number of assemblies to check in each batch
+    """
     from part.models import Part
 
-    try:
-        part = Part.objects.get(pk=part_id)
-    except Part.DoesNotExist:
-        logger.warning('check_bom_valid: Part with ID %s does not exist', part_id)
-        return
+    parts = Part.objects.only(
+        'pk',
+        'tree_id',
+        'lft',
+        'rght',
+        'bom_hash',
+        'bom_checksum',
+        'bom_checked_date',
+        'bom_validated',
+    ).order_by('pk')
+
+    if part_ids is None:
+        parts = parts.filter(assembly=True)
+    else:
+        parts = parts.filter(pk__in=part_ids)
+
+    n = 0
+    batch = []
 
-    valid = part.is_bom_valid()
+    for part in parts.iterator(chunk_size=batch_size):
+        batch.append(part)
 
-    if valid != part.bom_validated:
-        part.bom_validated = valid
-        part.save()
+        if len(batch) >= batch_size:
+            n += Part.check_bom_hashes(batch)
+            batch = []
+
+    n += Part.check_bom_hashes(batch)
+
+    if n > 0:
+        logger.info('Updated BOM checksum for %s assemblies', n)
 
 
 @tracer.start_as_current_span('validate_bom')
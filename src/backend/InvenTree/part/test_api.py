@@ -25,6 +25,7 @@ from InvenTree.config import get_testfolder_dir
 from InvenTree.unit_test import (
     InvenTreeAPIPerformanceTestCase,
     InvenTreeAPITestCase,
+    activateEventPlugin,
     findOffloadedEvent,
     findOffloadedTask,
 )
@@ -33,6 +34,7 @@ from part.models import (
     BomItem,
     BomItemSubstitute,
     Part,
+    PartAvailability,
     PartCategory,
     PartCategoryParameterTemplate,
     PartRelated,
@@ -1531,6 +1533,7 @@ class PartAPITest(PartAPITestBase):
         self.assignRole('part.change')
 
         set_global_setting('ENABLE_PLUGINS_EVENTS', True)
+        activateEventPlugin()
 
         # Create a bunch of parts
         parts = [
@@ -2309,6 +2312,41 @@ class PartDetailTests(PartImageTestMixin, PartAPITestBase):
         for field in expected_fields:
             self.assertIn(field, response.data)
 
+    def test_part_requirements_cached(self):
+        """Test that cached availability data is returned when enabled."""
+        from part.availability import rebuild_availability
+
+        part = Part.objects.get(pk=100)
+        url = reverse('api-part-requirements', kwargs={'pk': part.pk})
+
+        can_build = self.get(url, expected_code=200).data['can_build']
+
+        set_global_setting('PART_AVAILABILITY_CACHE', True)
+        rebuild_availability()
+
+        self.assertEqual(self.get(url, expected_code=200).data['can_build'], can_build)
+
+        # Cached data is returned, unless live data is requested
+        PartAvailability.objects.filter(part=part).update(can_build=12345)
+
+        self.assertEqual(self.get(url, expected_code=200).data['can_build'], 12345)
+        self.assertEqual(
+            self.get(url, {'live': True}, expected_code=200).data['can_build'],
+            can_build,
+        )
+
+        url = reverse('api-part-detail', kwargs={'pk': part.pk})
+        in_stock = self.get(url, {'live': True}, expected_code=200).data['in_stock']
+
+        PartAvailability.objects.filter(part=part).update(in_stock=999)
+
+        self.assertEqual(self.get(url, expected_code=200).data['in_stock'], 999)
+        self.assertEqual(
+            self.get(url, {'live': True}, expected_code=200).data['in_stock'], in_stock
+        )
+
+        set_global_setting('PART_AVAILABILITY_CACHE', False)
+
 
 class PartListTests(PartAPITestBase):
     """Unit tests for the Part List API endpoint."""
@@ -3466,6 +3504,40 @@ class BomItemTest(InvenTreeAPITestCase):
                 self.assertEqual(str(row['Assembly']), '100')
                 self.assertEqual(str(row['BOM Level']), '1')
 
+    def test_bom_explosion(self):
+        """Test the multi-level BOM explosion API endpoint."""
+        self.assignRole('bom.view')
+
+        # Part 101 uses 10 x part 100, which has its own BOM
+        url = reverse('api-part-bom-explosion', kwargs={'pk': 101})
+
+        data = self.get(url, expected_code=200).data
+
+        self.assertEqual(data['part'], 101)
+        self.assertEqual(data['levels'], 2)
+
+        rows = data['rows']
+        self.assertEqual(len(rows), 5)
+
+        self.assertEqual(rows[0]['bom_item'], 6)
+        self.assertEqual(rows[0]['level'], 1)
+        self.assertEqual(rows[0]['substitutes'], [5])
+
+        for row in rows[1:]:
+            self.assertEqual(row['assembly'], 100)
+            self.assertEqual(row['level'], 2)
+            self.assertEqual(row['parent'], 0)
+            self.assertEqual(row['total_quantity'], 10 * row['quantity'])
+
+        totals = {row['part']: row['quantity'] for row in data['totals']}
+        self.assertEqual(totals[100], 10)
+        self.assertEqual(totals[3], 400)
+
+        # Limit the number of levels
+        data = self.get(url, {'levels': 1}, expected_code=200).data
+        self.assertEqual(len(data['rows']), 1)
+        self.assertEqual(len(data['totals']), 1)
+
     def test_can_build(self):
         """Test that the 'can_build' annotation works as expected."""
         # Create an assembly part
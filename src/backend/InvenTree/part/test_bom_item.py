@@ -277,6 +277,90 @@ class BomItemTest(TestCase):
         # A BomItem which is consumable via its part does not alter the can_build calculation
         self.assertEqual(assembly.can_build, 20)
 
+    def test_availability_cache(self):
+        """Test that cached availability data matches the live calculation."""
+        from part.availability import rebuild_availability
+
+        from .models import PartAvailability
+
+        set_global_setting('PART_AVAILABILITY_CACHE', True)
+
+        assembly = Part.objects.create(
+            name='Cached assembly', description='Made with parts', assembly=True
+        )
+
+        template = Part.objects.create(
+            name='Template', description='A template part', is_template=True
+        )
+
+        variant = Part.objects.create(
+            name='Variant', description='A variant part', variant_of=template
+        )
+
+        component = Part.objects.create(name='Component', description='A component')
+        substitute = Part.objects.create(name='Sub', description='A substitute')
+
+        BomItem.objects.create(part=assembly, sub_part=template, quantity=5)
+        bom_item = BomItem.objects.create(
+            part=assembly, sub_part=component, quantity=10, setup_quantity=4
+        )
+        BomItemSubstitute.objects.create(bom_item=bom_item, part=substitute)
+
+        # Stock changes are reflected in the cache
+        stock.models.StockItem.objects.create(part=variant, quantity=100)
+        stock.models.StockItem.objects.create(part=component, quantity=150)
+        item = stock.models.StockItem.objects.create(part=substitute, quantity=50)
+
+        self.assertEqual(assembly.can_build, 19)
+        self.assertEqual(assembly.availability_data.can_build, 19)
+        self.assertEqual(template.availability_data.variant_stock, 100)
+        self.assertEqual(component.availability_data.in_stock, 150)
+
+        item.quantity = 10
+        item.save()
+
+        assembly.availability_data.refresh_from_db()
+        self.assertEqual(assembly.can_build, 15)
+        self.assertEqual(assembly.availability_data.can_build, 15)
+
+        # Re-assigning stock to a different part updates both parts
+        item.part = component
+        item.save()
+
+        substitute.availability_data.refresh_from_db()
+        component.availability_data.refresh_from_db()
+        self.assertEqual(substitute.availability_data.in_stock, 0)
+        self.assertEqual(component.availability_data.in_stock, 160)
+
+        item.part = substitute
+        item.save()
+
+        # BOM changes are reflected in the cache
+        bom_item.quantity = 20
+        bom_item.save()
+
+        assembly.availability_data.refresh_from_db()
+        self.assertEqual(assembly.availability_data.can_build, 7)
+
+        # Changes to the variant tree are reflected in the cache
+        variant.variant_of = None
+        variant.save()
+
+        template.availability_data.refresh_from_db()
+        assembly.availability_data.refresh_from_db()
+        self.assertEqual(template.availability_data.variant_stock, 0)
+        self.assertEqual(assembly.availability_data.can_build, 0)
+
+        # Incremental updates leave the cache consistent
+        self.assertEqual(rebuild_availability(check=True), {})
+
+        # Inconsistent data is detected and corrected
+        PartAvailability.objects.filter(part=assembly).update(can_build=1000)
+
+        self.assertEqual(rebuild_availability(check=True), {assembly.pk: ['can_build']})
+        self.assertEqual(rebuild_availability(), {assembly.pk: ['can_build']})
+        self.assertEqual(rebuild_availability(check=True), {})
+
     def test_consumable_filter(self):
         """Tests for the BomItem.consumable_filter() helper method."""
         assembly = Part.objects.create(
@@ -596,6 +680,142 @@ class BomItemTest(TestCase):
 
         self.assertIsNotNone(assembly.bom_checked_date)
 
+    def test_stored_bom_hash(self):
+        """Test that the stored BOM hash is kept up to date with BOM changes."""
+        from part.tasks import check_bom_valid_bulk, validate_bom
+
+        template = Part.objects.create(
+            name='TemplateAssembly',
+            description='A template assembly',
+            assembly=True,
+            is_template=True,
+        )
+
+        variant = Part.objects.create(
+            name='VariantAssembly',
+            description='A variant assembly',
+            assembly=True,
+            variant_of=template,
+        )
+
+        sub_part = Part.objects.create(
+            name='HashSubPart', description='A sub-part', component=True
+        )
+
+        item = BomItem.objects.create(
+            part=template, sub_part=sub_part, quantity=2, inherited=True
+        )
+
+        # The line hash is stored when the item is saved
+        self.assertEqual(item.item_hash, item.get_item_hash())
+
+        for assembly in [template, variant]:
+            validate_bom(assembly.pk, True)
+            assembly.refresh_from_db()
+
+            self.assertTrue(assembly.bom_validated)
+            self.assertEqual(assembly.bom_hash, assembly.get_bom_hash())
+            self.assertEqual(assembly.bom_checksum, assembly.bom_hash)
+
+            # No database queries are required to check the BOM
+            with self.assertNumQueries(0):
+                self.assertTrue(assembly.is_bom_valid())
+
+        # Changing the inherited item invalidates both assemblies
+        item.quantity = 3
+        item.save()
+
+        for assembly in [template, variant]:
+            assembly.refresh_from_db()
+            self.assertFalse(assembly.bom_validated)
+            self.assertFalse(assembly.is_bom_valid())
+            self.assertEqual(assembly.bom_hash, assembly.get_bom_hash())
+
+        # Missing line hashes (e.g. for existing data) are calculated on demand
+        item.quantity = 2
+        item.save()
+        BomItem.objects.filter(pk=item.pk).update(item_hash='')
+        Part.objects.filter(pk__in=[template.pk, variant.pk]).update(bom_hash='')
+
+        check_bom_valid_bulk()
+
+        for assembly in [template, variant]:
+            assembly.refresh_from_db()
+            self.assertTrue(assembly.bom_validated)
+            self.assertEqual(assembly.bom_hash, assembly.bom_checksum)
+
+        item.refresh_from_db()
+        self.assertEqual(item.item_hash, item.get_item_hash())
+
+        # Renaming the sub-part changes the line hash
+        sub_part.name = 'RenamedSubPart'
+        sub_part.save()
+
+        item.refresh_from_db()
+        self.assertEqual(item.item_hash, item.get_item_hash())
+        self.assertFalse(item.validated)
+
+        for assembly in [template, variant]:
+            assembly.refresh_from_db()
+            self.assertFalse(assembly.bom_validated)
+
+    def test_bom_explosion(self):
+        """Test the multi-level BOM explosion service."""
+        from part.bom import BomExplosion
+
+        assembly = Part.objects.create(
+            name='TopAssembly', description='Top level assembly', assembly=True
+        )
+
+        sub_assembly = Part.objects.create(
+            name='SubAssembly',
+            description='A sub-assembly',
+            assembly=True,
+            component=True,
+        )
+
+        c1 = Part.objects.create(name='C1', description='Component', component=True)
+        c2 = Part.objects.create(name='C2', description='Component', component=True)
+
+        BomItem.objects.create(part=assembly, sub_part=sub_assembly, quantity=2)
+        line = BomItem.objects.create(part=sub_assembly, sub_part=c1, quantity=3)
+        BomItem.objects.create(part=sub_assembly, sub_part=c2, quantity=4)
+        BomItem.objects.create(part=assembly, sub_part=c1, quantity=1)
+
+        explosion = BomExplosion(assembly)
+        rows = explosion.get_rows()
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual([row['level'] for row in rows], [1, 2, 2, 1])
+        self.assertEqual(rows[1]['parent'], 0)
+        self.assertEqual(rows[1]['total_quantity'], 6)
+        self.assertEqual(rows[2]['total_quantity'], 8)
+
+        self.assertEqual(explosion.totals(), {sub_assembly.pk: 2, c1.pk: 7, c2.pk: 8})
+        self.assertEqual(explosion.totals(levels=1), {sub_assembly.pk: 2, c1.pk: 1})
+
+        self.assertEqual(
+            assembly.getRequiredParts(recursive=True), {sub_assembly, c1, c2}
+        )
+
+        # A second explosion is loaded from the cache
+        with self.assertNumQueries(2):
+            self.assertEqual(BomExplosion(assembly).get_rows(), rows)
+
+        # Editing the BOM of the sub-assembly invalidates the cached explosion
+        line.quantity = 5
+        line.save()
+
+        rows = BomExplosion(assembly).get_rows()
+        self.assertEqual(rows[1]['total_quantity'], 10)
+
+        # Deleting a BOM line also invalidates the cached explosion
+        line.delete()
+
+        rows = BomExplosion(assembly).get_rows()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(BomExplosion(assembly).totals()[c1.pk], 1)
+
     def test_piece_count_default(self):
         """Test that piece_count defaults to 1 and does not change existing behavior."""
         item = BomItem.objects.get(part=100, sub_part=50)
@@ -1,8 +1,13 @@
 """Unit tests for the PartCategory model."""
 
+import contextvars
+from unittest import mock
+
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
 
+import InvenTree.instrumentation
 from common.models import InvenTreeSetting, Parameter, ParameterTemplate
 
 from .models import Part, PartCategory
@@ -460,6 +465,143 @@ class CategoryTest(TestCase):
         with self.assertRaises(ValidationError):
             B3.delete()
 
+    def test_deferred_tree_updates(self):
+        """Test that tree updates are deferred (and coalesced) within a bulk operation."""
+        from common.models import TreeRebuild
+        from InvenTree.trees import deferred_tree_updates, is_deferred
+
+        A = PartCategory.objects.create(name='A', description='Top level category')
+        B = PartCategory.objects.create(name='B', description='Top level category')
+
+        with deferred_tree_updates(PartCategory):
+            children = [
+                PartCategory.objects.create(name=f'C{idx}', parent=A)
+                for idx in range(5)
+            ]
+
+            # Move some of the new categories to a different tree
+            for child in children[:2]:
+                child.parent = B
+                child.save()
+
+            # Move a category to the top level
+            children[4].parent = None
+            children[4].save()
+
+            # Rename a top-level category
+            A.name = 'AA'
+            A.save()
+
+            # Trees are not rebuilt (or marked) until the context exits
+            self.assertFalse(TreeRebuild.objects.filter(pending=True).exists())
+
+            # MPTT updates are only deferred within this context (e.g. not for other requests)
+            self.assertTrue(PartCategory._mptt_updates_enabled)
+            self.assertTrue(is_deferred(PartCategory))
+
+            context = contextvars.Context()
+            self.assertFalse(context.run(is_deferred, PartCategory))
+
+            D = context.run(PartCategory.objects.create, name='D')
+            E = context.run(PartCategory.objects.create, name='E', parent=D)
+
+            D.refresh_from_db()
+            self.assertEqual(E.level, 1)
+            self.assertEqual(D.get_descendant_count(), 1)
+
+        for category in [A, B, *children]:
+            category.refresh_from_db()
+
+        self.assertEqual(B.get_descendant_count(), 2)
+        self.assertEqual(A.get_descendant_count(), 2)
+
+        for child in children[:2]:
+            self.assertEqual(child.tree_id, B.tree_id)
+            self.assertEqual(child.level, 1)
+            self.assertEqual(child.pathstring, f'B/{child.name}')
+
+        for child in children[2:4]:
+            self.assertEqual(child.tree_id, A.tree_id)
+            self.assertEqual(child.pathstring, f'AA/{child.name}')
+
+        self.assertTrue(children[4].is_root_node())
+        self.assertNotIn(children[4].tree_id, [A.tree_id, B.tree_id])
+        self.assertEqual(children[4].pathstring, 'C4')
+
+        # All trees have been rebuilt, and the rebuild duration recorded
+        entries = TreeRebuild.objects.filter(model='part.partcategory')
+        self.assertTrue(entries.exists())
+        self.assertFalse(entries.filter(pending=True).exists())
+        self.assertFalse(entries.filter(duration=None).exists())
+
+        # Rebuild durations are reported from the recorded data
+        metrics = {
+            entry['model']: entry
+            for entry in InvenTree.instrumentation.get_tree_metrics()
+        }
+
+        self.assertEqual(metrics['part.partcategory']['count'], entries.count())
+        self.assertEqual(metrics['part.partcategory']['pending'], 0)
+
+        # Recursive structures are still prevented
+        with deferred_tree_updates(PartCategory), self.assertRaises(ValidationError):
+            A.parent = children[2]
+            A.save()
+
+    def test_repair_tree(self):
+        """Test that a tree with multiple root nodes is repaired (without a full rebuild)."""
+        A = PartCategory.objects.create(name='A', description='Top level category')
+        B = PartCategory.objects.create(name='B', description='Top level category')
+        C = PartCategory.objects.create(name='C', parent=B)
+
+        # Corrupt the tree structure, so that A and B share a tree
+        PartCategory.objects.filter(pk__in=[B.pk, C.pk]).update(tree_id=A.tree_id)
+
+        trees = PartCategory.rebuild_trees([A.tree_id])
+
+        self.assertEqual(len(trees), 2)
+
+        for category in [A, B, C]:
+            category.refresh_from_db()
+
+        self.assertNotEqual(A.tree_id, B.tree_id)
+        self.assertEqual(B.tree_id, C.tree_id)
+        self.assertEqual(B.get_descendant_count(), 1)
+        self.assertEqual(A.get_descendant_count(), 0)
+
+    def test_mark_trees(self):
+        """Test that trees are (re)marked for rebuild, with and without upsert support."""
+        from common.models import TreeRebuild
+
+        features = connection.features
+
+        for upsert in [features.supports_update_conflicts_with_target, False]:
+            TreeRebuild.objects.all().delete()
+
+            with mock.patch.object(
+                features, 'supports_update_conflicts_with_target', upsert
+            ):
+                TreeRebuild.mark('part.partcategory', [1, 2, 2])
+
+                entries = TreeRebuild.objects.filter(model='part.partcategory')
+                self.assertEqual(entries.count(), 2)
+
+                # Mark an existing tree as complete
+                first = entries.get(tree_id=1)
+                TreeRebuild.complete(first.pk, first.marked, 0.5)
+                self.assertFalse(entries.get(tree_id=1).pending)
+
+                # Marking again updates the existing entries
+                TreeRebuild.mark('part.partcategory', [1, 3])
+
+                self.assertEqual(entries.count(), 3)
+                self.assertEqual(entries.filter(pending=True).count(), 3)
+
+                first.refresh_from_db()
+                self.assertTrue(first.pending)
+                self.assertEqual(first.duration, 0.5)
+                self.assertEqual(first.marked, entries.get(tree_id=3).marked)
+
     def test_icon(self):
         """Test the category icon."""
         # No default icon set
@@ -1029,3 +1029,59 @@ class PartStockHistoryTest(InvenTreeTestCase):
         N_STOCKTAKE = PartStocktake.objects.count()
         perform_stocktake()
         self.assertEqual(PartStocktake.objects.count(), N_STOCKTAKE)
+
+    def test_stocktake_values(self):
+        """Test the quantity and value calculations for stocktake entries."""
+        from djmoney.money import Money
+
+        from common.models import DataOutput
+        from part.models import PartPricing, PartStocktake
+        from part.stocktake import perform_stocktake
+        from stock.models import StockItem
+
+        set_global_setting('STOCKTAKE_ENABLE', True)
+
+        template = Part.objects.create(
+            name='Stocktake template', description='A template', is_template=True
+        )
+        variant = Part.objects.create(
+            name='Stocktake variant', description='A variant', variant_of=template
+        )
+
+        PartPricing.objects.update_or_create(
+            part=template,
+            defaults={'overall_min': Money(2, 'USD'), 'overall_max': Money(3, 'USD')},
+        )
+
+        # Valued using the pricing data for the template part
+        StockItem.objects.create(part=template, quantity=10)
+        StockItem.objects.create(part=variant, quantity=5)
+
+        # Valued using the purchase price
+        StockItem.objects.create(
+            part=variant, quantity=4, purchase_price=Money(10, 'USD')
+        )
+
+        output = DataOutput.objects.create(output_type='stocktake')
+
+        perform_stocktake(part_id=template.pk, report_output_id=output.pk)
+
+        entry = PartStocktake.objects.get(part=template)
+
+        self.assertEqual(entry.item_count, 3)
+        self.assertEqual(entry.quantity, 19)
+        self.assertEqual(entry.cost_min, Money(70, 'USD'))
+        self.assertEqual(entry.cost_max, Money(85, 'USD'))
+
+        entry = PartStocktake.objects.get(part=variant)
+
+        self.assertEqual(entry.item_count, 2)
+        self.assertEqual(entry.quantity, 9)
+
+        output.refresh_from_db()
+        self.assertTrue(output.complete)
+        self.assertEqual(output.total, 2)
+
+        lines = output.output.read().decode().strip().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn('Stocktake template', lines[1])
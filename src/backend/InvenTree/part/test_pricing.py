@@ -466,6 +466,27 @@ class PartPricingTests(InvenTreeTestCase):
         # Check that PartPricing objects have been created
         self.assertEqual(part.models.PartPricing.objects.count(), 101)
 
+    def test_recalculate_pricing_failure(self):
+        """Test that pricing is not left scheduled for update if the recalculation fails."""
+        from part.pricing import PricingEngine
+        from part.tasks import recalculate_part_pricing
+
+        pricing = self.part.pricing
+        pricing.save()
+
+        part.models.PartPricing.objects.filter(pk=pricing.pk).update(
+            scheduled_for_update=True
+        )
+
+        with (
+            mock.patch.object(PricingEngine, 'run', side_effect=ValueError('error')),
+            self.assertRaises(ValueError),
+        ):
+            recalculate_part_pricing(part_ids=[self.part.pk])
+
+        pricing.refresh_from_db()
+        self.assertFalse(pricing.scheduled_for_update)
+
     def test_check_missing_pricing_batches_scheduling(self):
         """check_missing_pricing() must batch its scheduling calls, not scan the task queue per part.
 
@@ -612,3 +633,115 @@ class PartPricingTests(InvenTreeTestCase):
 
         self.assertEqual(A1.pricing.overall_min, Money(a_min, 'USD'))
         self.assertEqual(A1.pricing.overall_max, Money(a_max, 'USD'))
+
+    @override_settings(TESTING_PRICING=True)
+    def test_pricing_engine(self):
+        """Test that the PricingEngine recalculates each affected part exactly once."""
+        from part.pricing import PricingEngine
+
+        # Create a "diamond" BOM structure:
+        # TOP uses SUB_1 and SUB_2, both of which use the common component R1
+        R1 = part.models.Part.objects.create(
+            name='R1', description='Resistor', component=True
+        )
+        SUB_1 = part.models.Part.objects.create(
+            name='SUB_1', description='Sub assembly', assembly=True, component=True
+        )
+        SUB_2 = part.models.Part.objects.create(
+            name='SUB_2', description='Sub assembly', assembly=True, component=True
+        )
+        TOP = part.models.Part.objects.create(
+            name='TOP', description='Top assembly', assembly=True
+        )
+
+        part.models.BomItem.objects.create(part=SUB_1, sub_part=R1, quantity=2)
+        part.models.BomItem.objects.create(part=SUB_2, sub_part=R1, quantity=3)
+        part.models.BomItem.objects.create(part=TOP, sub_part=SUB_1, quantity=1)
+        part.models.BomItem.objects.create(part=TOP, sub_part=SUB_2, quantity=4)
+
+        # Variant of the top assembly (inherits the BOM)
+        TOP.is_template = True
+        TOP.save()
+
+        for item in TOP.bom_items.all():
+            item.inherited = True
+            item.save()
+
+        VARIANT = part.models.Part.objects.create(
+            name='TOP_V', description='Variant', assembly=True, variant_of=TOP
+        )
+
+        # Update the component pricing, without triggering a cascade
+        pricing = R1.pricing
+        pricing.override_min = Money(1, 'USD')
+        pricing.override_max = Money(2, 'USD')
+        pricing.save()
+
+        engine = PricingEngine()
+        engine.add_changed([R1])
+
+        with mock.patch.object(
+            PricingEngine,
+            'recalculate',
+            autospec=True,
+            side_effect=PricingEngine.recalculate,
+        ) as mock_recalculate:
+            changed = engine.run()
+
+        # Each dependent part is recalculated exactly once
+        recalculated = [call.args[1] for call in mock_recalculate.call_args_list]
+        self.assertEqual(len(recalculated), 4)
+        self.assertEqual(set(recalculated), {SUB_1.pk, SUB_2.pk, TOP.pk, VARIANT.pk})
+
+        # Components are calculated before the assemblies which use them
+        self.assertLess(recalculated.index(SUB_1.pk), recalculated.index(TOP.pk))
+        self.assertLess(recalculated.index(SUB_2.pk), recalculated.index(TOP.pk))
+        self.assertLess(recalculated.index(VARIANT.pk), recalculated.index(TOP.pk))
+
+        self.assertEqual(changed, {SUB_1.pk, SUB_2.pk, TOP.pk, VARIANT.pk})
+
+        self.assertEqual(SUB_1.pricing.overall_min, Money(2, 'USD'))
+        self.assertEqual(SUB_2.pricing.overall_max, Money(6, 'USD'))
+
+        # TOP = 1 x SUB_1 + 4 x SUB_2
+        self.assertEqual(VARIANT.pricing.bom_cost_min, Money(14, 'USD'))
+        self.assertEqual(VARIANT.pricing.bom_cost_max, Money(28, 'USD'))
+        self.assertEqual(TOP.pricing.bom_cost_min, Money(14, 'USD'))
+        self.assertEqual(TOP.pricing.variant_cost_max, Money(28, 'USD'))
+
+        # Running again, nothing changes
+        engine = PricingEngine()
+        engine.add_parts([R1])
+        self.assertEqual(engine.run(), set())
+
+    @override_settings(TESTING_PRICING=True)
+    def test_rebuild_pricing_command(self):
+        """Test the 'rebuild_pricing' management command."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        sub_part = part.models.Part.objects.create(
+            name='Sub', description='Sub part', component=True
+        )
+
+        part.models.BomItem.objects.create(
+            part=self.part, sub_part=sub_part, quantity=10
+        )
+
+        part.models.PartInternalPriceBreak.objects.create(
+            part=sub_part, quantity=1, price=Money(3, 'USD')
+        )
+
+        set_global_setting('PART_INTERNAL_PRICE', True)
+
+        # Remove all pricing data
+        part.models.PartPricing.objects.all().delete()
+
+        output = StringIO()
+        call_command('rebuild_pricing', stdout=output)
+
+        self.assertIn('Progress: 2 / 2 (100%)', output.getvalue())
+
+        self.assertEqual(sub_part.pricing.overall_min, Money(3, 'USD'))
+        self.assertEqual(self.part.pricing.bom_cost_min, Money(30, 'USD'))
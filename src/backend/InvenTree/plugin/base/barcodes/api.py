@@ -1,5 +1,7 @@
 """API endpoints for barcode plugins."""
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from django.db.models import F
 from django.urls import include, path
 from django.utils.translation import gettext_lazy as _
@@ -45,46 +47,48 @@ class BarcodeView(CreateAPIView):
             response: Optional response data
             result: Boolean indicating success or failure of the scan
         """
-        from common.models import BarcodeScanResult
-
         # Extract context data from the request
         context = {**request.GET.dict(), **request.POST.dict(), **request.data}
 
         barcode = context.pop('barcode', '')
 
+        self.log_scans(request, [(barcode, context, response, result)])
+
+    def log_scans(self, request, scans: list[tuple]):
+        """Log multiple barcode scans to the database, with a single bulk insert.
+
+        Arguments:
+            request: HTTP request object
+            scans: List of (barcode, context, response, result) tuples
+        """
+        from common.models import BarcodeScanResult
+
         # Exit if storing barcode scans is disabled
         if not get_global_setting('BARCODE_STORE_RESULTS', backup=False, create=False):
             return
 
-        # Ensure that the response data is stringified first, otherwise cannot be JSON encoded
-        if isinstance(response, dict):
-            response = {key: str(value) for key, value in response.items()}
-        elif response is None:
-            pass
-        else:
-            response = str(response)
-
-        # Ensure that the context data is stringified first, otherwise cannot be JSON encoded
-        if isinstance(context, dict):
-            context = {key: str(value) for key, value in context.items()}
-        elif context is None:
-            pass
-        else:
-            context = str(context)
-
-        # Ensure data is not too long
-        if len(barcode) > BarcodeScanResult.BARCODE_SCAN_MAX_LEN:
-            barcode = barcode[: BarcodeScanResult.BARCODE_SCAN_MAX_LEN]
+        def stringify(data):
+            """Ensure that the data is stringified first, otherwise cannot be JSON encoded."""
+            if isinstance(data, dict):
+                return {key: str(value) for key, value in data.items()}
+            elif data is None:
+                return None
+            else:
+                return str(data)
 
         try:
-            BarcodeScanResult.objects.create(
-                data=barcode,
-                user=request.user,
-                endpoint=request.path,
-                response=response,
-                result=result,
-                context=context,
-            )
+            BarcodeScanResult.objects.bulk_create([
+                BarcodeScanResult(
+                    # Ensure data is not too long
+                    data=str(barcode)[: BarcodeScanResult.BARCODE_SCAN_MAX_LEN],
+                    user=request.user,
+                    endpoint=request.path,
+                    response=stringify(response),
+                    result=result,
+                    context=stringify(context),
+                )
+                for barcode, context, response, result in scans
+            ])
 
             # Ensure that we do not store too many scans
             max_scans = int(get_global_setting('BARCODE_RESULTS_MAX_NUM', create=False))
@@ -187,6 +191,140 @@ class BarcodeView(CreateAPIView):
 
         return response
 
+    def scan_barcodes(self, barcodes: list[str], request, **kwargs) -> dict:
+        """Perform a generic 'scan' of multiple barcodes.
+
+        Each loaded plugin is passed all of the barcodes which have not yet been matched,
+        so that the plugin can resolve them in bulk.
+
+        Returns:
+            A map of barcode -> response (in the same format as scan_barcode)
+        """
+        plugins = registry.with_mixin(PluginMixinEnum.BARCODE)
+
+        responses = {barcode: {} for barcode in barcodes}
+        matched_plugins = {}
+
+        for current_plugin in plugins:
+            # Barcodes which have not yet been successfully matched
+            pending = [
+                barcode
+                for barcode, response in responses.items()
+                if not response or 'error' in response
+            ]
+
+            if not pending:
+                break
+
+            try:
+                results = current_plugin.scan_batch(
+                    pending, user=request.user, **kwargs
+                )
+            except Exception:
+                log_error('BarcodeView.scan_barcodes', plugin=current_plugin.slug)
+                continue
+
+            for barcode, result in (results or {}).items():
+                if barcode not in responses or not result:
+                    continue
+
+                if 'error' in result:
+                    logger.info(
+                        '%s.scan_batch(...) returned an error: %s',
+                        current_plugin.__class__.__name__,
+                        result['error'],
+                    )
+
+                    if responses[barcode]:
+                        continue
+
+                matched_plugins[barcode] = current_plugin
+                responses[barcode] = result
+
+        for barcode, response in responses.items():
+            plugin = matched_plugins.get(barcode)
+
+            response['plugin'] = plugin.name if plugin else None
+            response['barcode_data'] = barcode
+            response['barcode_hash'] = hash_barcode(barcode)
+
+        return responses
+
+
+class BarcodeBatchView(BarcodeView):
+    """Custom view class for handling multiple barcodes in a single request.
+
+    The request is authenticated and validated once,
+    and scan results are logged to the database with a single bulk insert.
+    """
+
+    serializer_class = barcode_serializers.BarcodeBatchSerializer
+
+    def create(self, request, *args, **kwargs):
+        """Handle create method - override default create."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        barcodes = [str(barcode).strip() for barcode in data.pop('barcodes')]
+
+        responses = self.handle_barcodes(barcodes, request, **data)
+
+        # Extract context data from the request (excluding the barcode data)
+        context = {
+            key: value for key, value in request.data.items() if key != 'barcodes'
+        }
+
+        self.log_scans(
+            request,
+            [
+                (barcode, context, response, 'success' in response)
+                for barcode, response in zip(barcodes, responses, strict=True)
+            ],
+        )
+
+        return Response({'results': responses})
+
+    def handle_barcodes(self, barcodes: list[str], request, **kwargs) -> list[dict]:
+        """Handle multiple barcodes.
+
+        Arguments:
+            barcodes: List of raw barcode values
+            request: HTTP request object
+
+        kwargs:
+            Any custom fields passed by the specific serializer
+
+        Returns:
+            A list of response dicts, one for each provided barcode (in the same order)
+        """
+        raise NotImplementedError(
+            f'handle_barcodes not implemented for {self.__class__}'
+        )
+
+
+class BarcodeScanBatch(BarcodeBatchView):
+    """Endpoint for scanning multiple barcodes in a single request.
+
+    Each barcode is resolved against the loaded barcode plugins,
+    and a result is returned for each barcode (in the order provided).
+    Unlike the single barcode scan endpoint, a barcode which does not match
+    is reported as an error in the results, rather than failing the request.
+    """
+
+    def handle_barcodes(self, barcodes: list[str], request, **kwargs) -> list[dict]:
+        """Perform barcode scan action for multiple barcodes."""
+        responses = self.scan_barcodes(list(dict.fromkeys(barcodes)), request, **kwargs)
+
+        for response in responses.values():
+            if response['plugin'] is None:
+                response['error'] = _('No match found for barcode data')
+            elif 'error' not in response:
+                response['success'] = _('Match found for barcode data')
+
+        return [responses[barcode] for barcode in barcodes]
+
 
 class BarcodeScan(BarcodeView):
     """Endpoint for handling generic barcode scan requests.
@@ -529,9 +667,6 @@ class BarcodePOReceive(BarcodeView):
 
         plugins = registry.with_mixin(PluginMixinEnum.BARCODE)
 
-        # Look for a barcode plugin which knows how to deal with this barcode
-        plugin = None
-
         response = {'barcode_data': barcode, 'barcode_hash': hash_barcode(barcode)}
 
         internal_barcode_plugin = next(
@@ -544,7 +679,47 @@ class BarcodePOReceive(BarcodeView):
                 self.log_scan(request, response, False)
                 raise ValidationError(response)
 
-        # Now, look just for "supplier-barcode" plugins
+        response = self.scan_supplier_barcode(
+            barcode,
+            request,
+            supplier=supplier,
+            purchase_order=purchase_order,
+            location=location,
+            line_item=line_item,
+            auto_allocate=auto_allocate,
+        )[0]
+
+        self.log_scan(request, response, 'success' in response)
+
+        if 'error' in response:
+            raise ValidationError(response)
+
+        return Response(response)
+
+    def scan_supplier_barcode(
+        self, barcode: str, request, receive: bool = True, **kwargs
+    ) -> tuple[dict, dict | None]:
+        """Match a barcode against the loaded supplier barcode plugins.
+
+        Arguments:
+            barcode: Raw barcode value
+            request: HTTP request object
+            receive: If True, a matched line item is received immediately (via scan_receive_item),
+                otherwise the line item is returned to the caller (via match_receive_item)
+
+        kwargs:
+            supplier, purchase_order, location, line_item and auto_allocate values
+
+        Returns:
+            A tuple of (response, item) where 'item' is the line item data to receive (if not already received)
+        """
+        response = {'barcode_data': barcode, 'barcode_hash': hash_barcode(barcode)}
+
+        plugin = None
+
+        item = None
+
+        # Look just for "supplier-barcode" plugins
         plugins = registry.with_mixin(PluginMixinEnum.SUPPLIER_BARCODE)
 
         plugin_slug = None
@@ -561,21 +736,31 @@ class BarcodePOReceive(BarcodeView):
 
         supplier_part = None
 
+        receive_kwargs = {
+            'supplier': kwargs.get('supplier'),
+            'purchase_order': kwargs.get('purchase_order'),
+            'location': kwargs.get('location'),
+            'line_item': kwargs.get('line_item'),
+            'auto_allocate': kwargs.get('auto_allocate', True),
+        }
+
         for current_plugin in plugins:
             try:
                 # Will either Output Debugresponse if No_Match is True or return the regular response if No_Match is False
-                result = current_plugin.scan_receive_item(
-                    barcode,
-                    request.user,
-                    supplier=supplier,
-                    purchase_order=purchase_order,
-                    location=location,
-                    line_item=line_item,
-                    auto_allocate=auto_allocate,
-                )
+                if receive:
+                    result = current_plugin.scan_receive_item(
+                        barcode, request.user, **receive_kwargs
+                    )
+                    match = None
+                else:
+                    result, match = current_plugin.match_receive_item(
+                        barcode, request.user, **receive_kwargs
+                    )
 
             except Exception:
-                log_error('BarcodePOReceive.handle_barcode', plugin=current_plugin.slug)
+                log_error(
+                    'BarcodePOReceive.scan_supplier_barcode', plugin=current_plugin.slug
+                )
                 continue
 
             no_match = result.get('no_match', True)
@@ -591,7 +776,7 @@ class BarcodePOReceive(BarcodeView):
                     supplier_part = result.get('supplier_part')
                 except KeyError as e:
                     log_error(
-                        f'BarcodePOReceive.handle_barcode debugresponse: KeyError {e}'
+                        f'BarcodePOReceive.scan_supplier_barcode debugresponse: KeyError {e}'
                     )
                     continue
 
@@ -638,6 +823,7 @@ class BarcodePOReceive(BarcodeView):
             else:
                 plugin = current_plugin
                 plugin_response = result
+                item = match
                 break
 
         response['plugin'] = plugin.name if plugin else None
@@ -656,12 +842,135 @@ class BarcodePOReceive(BarcodeView):
         elif plugin_error:
             response['error'] = plugin_error
 
-        self.log_scan(request, response, 'success' in response)
+        return response, item
 
-        if 'error' in response:
-            raise ValidationError(response)
 
-        return Response(response)
+class BarcodePOReceiveBatch(BarcodeBatchView, BarcodePOReceive):
+    """Endpoint for receiving multiple purchase order items by scanning their barcodes.
+
+    Each barcode is matched against the loaded supplier barcode plugins,
+    and all matched line items are then received in a single database transaction.
+    If any of the matched line items cannot be received, no items are received.
+
+    The following parameters are available:
+
+    - barcodes: List of raw barcode data (required)
+    - supplier: The supplier to receive items from (optional)
+    - purchase_order: The purchase order containing the items to receive (optional)
+    - location: The destination location for the received items (optional)
+    """
+
+    serializer_class = barcode_serializers.BarcodePOReceiveBatchSerializer
+
+    def handle_barcodes(self, barcodes: list[str], request, **kwargs) -> list[dict]:
+        """Handle multiple barcode scans for purchase order items."""
+        if not check_user_permission(request.user, order.models.PurchaseOrder, 'add'):
+            raise PermissionDenied({
+                'error': _(
+                    'You do not have the required permissions for purchase orders'
+                )
+            })
+
+        logger.debug('BarcodePOReceiveBatch: scanned %s barcodes', len(barcodes))
+
+        # Extract location from PurchaseOrder, if available
+        purchase_order = kwargs.get('purchase_order')
+
+        if not kwargs.get('location') and purchase_order and purchase_order.destination:
+            kwargs['location'] = purchase_order.destination
+
+        unique_barcodes = list(dict.fromkeys(barcodes))
+
+        # Barcodes which match an existing stock item have already been received
+        internal_barcode_plugin = registry.get_plugin('inventreebarcode')
+
+        if internal_barcode_plugin:
+            existing = internal_barcode_plugin.scan_batch(
+                unique_barcodes, user=request.user
+            )
+        else:
+            existing = {}
+
+        responses = {}
+
+        # Line items which can be received, keyed by barcode
+        items = {}
+
+        for barcode in unique_barcodes:
+            if 'stockitem' in existing.get(barcode, {}):
+                responses[barcode] = {
+                    'barcode_data': barcode,
+                    'barcode_hash': hash_barcode(barcode),
+                    'error': _('Item has already been received'),
+                }
+                continue
+
+            response, item = self.scan_supplier_barcode(
+                barcode, request, receive=False, **kwargs
+            )
+
+            responses[barcode] = response
+
+            if item is not None and 'error' not in response:
+                items[barcode] = item
+
+        if items:
+            self.receive_items(items, responses, request.user)
+
+        results = []
+        scanned = set()
+
+        for barcode in barcodes:
+            if barcode in scanned:
+                results.append({
+                    'barcode_data': barcode,
+                    'barcode_hash': hash_barcode(barcode),
+                    'error': _('Duplicate barcode'),
+                })
+            else:
+                results.append(responses[barcode])
+                scanned.add(barcode)
+
+        return results
+
+    def receive_items(self, items: dict, responses: dict, user):
+        """Receive all of the matched line items, in a single database transaction.
+
+        Arguments:
+            items: Map of barcode -> line item data (from match_receive_item)
+            responses: Map of barcode -> response, updated with the result for each item
+            user: The User performing the action
+        """
+        # Group the line items by purchase order
+        orders = {}
+
+        for item in items.values():
+            purchase_order = item['purchase_order']
+
+            orders.setdefault(purchase_order.pk, (purchase_order, []))[1].append({
+                'line_item': item['line_item'],
+                'quantity': item['quantity'],
+                'location': item['location'],
+                'barcode': item['barcode'],
+            })
+
+        error = None
+
+        try:
+            with transaction.atomic():
+                for purchase_order, lines in orders.values():
+                    purchase_order.receive_line_items(None, lines, user)
+        except DjangoValidationError as e:
+            error = '; '.join(e.messages)
+        except Exception:
+            log_error('BarcodePOReceiveBatch.receive_items', scope='barcode')
+            error = _('Failed to receive line item')
+
+        for barcode in items:
+            if error:
+                responses[barcode]['error'] = error
+            else:
+                responses[barcode]['success'] = _('Received purchase order line item')
 
 
 class BarcodeSOAllocate(BarcodeView):
@@ -912,12 +1221,20 @@ barcode_api_urls = [
     path('link/', BarcodeAssign.as_view(), name='api-barcode-link'),
     # Unlink a third-party barcode from an item
     path('unlink/', BarcodeUnassign.as_view(), name='api-barcode-unlink'),
+    # Receive multiple purchase order items by scanning their barcodes
+    path(
+        'po-receive/batch/',
+        BarcodePOReceiveBatch.as_view(),
+        name='api-barcode-po-receive-batch',
+    ),
     # Receive a purchase order item by scanning its barcode
     path('po-receive/', BarcodePOReceive.as_view(), name='api-barcode-po-receive'),
     # Allocate parts to a purchase order by scanning their barcode
     path('po-allocate/', BarcodePOAllocate.as_view(), name='api-barcode-po-allocate'),
     # Allocate stock to a sales order by scanning barcode
     path('so-allocate/', BarcodeSOAllocate.as_view(), name='api-barcode-so-allocate'),
+    # Scan multiple barcodes in a single request
+    path('batch/', BarcodeScanBatch.as_view(), name='api-barcode-scan-batch'),
     # Catch-all performs barcode 'scan'
     path('', BarcodeScan.as_view(), name='api-barcode-scan'),
 ]
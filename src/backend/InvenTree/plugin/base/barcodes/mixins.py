@@ -7,6 +7,7 @@ from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 import structlog
+from rest_framework.exceptions import PermissionDenied
 
 from company.models import Company, ManufacturerPart, SupplierPart
 from InvenTree.exceptions import log_error
@@ -55,6 +56,32 @@ class BarcodeMixin:
         """
         return None
 
+    def scan_batch(self, barcodes: list[str], user, **kwargs) -> dict[str, dict]:
+        """Scan multiple barcodes against this plugin.
+
+        This method is called from the batch /scan/batch/ API endpoint.
+        The default implementation calls scan() for each barcode in turn,
+        plugins which can resolve barcodes more efficiently in bulk should override this method.
+
+        Returns:
+            A map of barcode -> result dict, for each barcode which matches this plugin
+        """
+        results = {}
+
+        for barcode in barcodes:
+            try:
+                result = self.scan(barcode, user, **kwargs)
+            except PermissionDenied as exc:
+                result = {'error': str(exc.detail)}
+            except Exception:
+                log_error(f'{self.__class__.__name__}.scan_batch', plugin=self.slug)
+                continue
+
+            if result:
+                results[barcode] = result
+
+        return results
+
     @property
     def has_barcode_generation(self):
         """Does this plugin support barcode generation."""
@@ -337,6 +364,59 @@ class SupplierBarcodeMixin(BarcodeMixin):
 
         The more "context" data that can be provided, the better the chances of a successful match.
         """
+        response, item = self.match_receive_item(
+            barcode_data,
+            user,
+            supplier=supplier,
+            line_item=line_item,
+            purchase_order=purchase_order,
+            location=location,
+            auto_allocate=auto_allocate,
+        )
+
+        if item is None:
+            return response
+
+        # Use the information we have to attempt to receive the item into stock
+        try:
+            item['purchase_order'].receive_line_item(
+                item['line_item'],
+                item['location'],
+                item['quantity'],
+                user,
+                barcode=item['barcode'],
+            )
+            response['success'] = _('Received purchase order line item')
+        except ValidationError as e:
+            # Pass a ValidationError back to the client
+            response['error'] = e.message
+        except Exception:
+            # Handle any other exceptions
+            log_error('scan_receive_item', plugin=self.slug)
+            response['error'] = _('Failed to receive line item')
+
+        return response
+
+    def match_receive_item(
+        self,
+        barcode_data: str,
+        user,
+        supplier=None,
+        line_item=None,
+        purchase_order=None,
+        location=None,
+        auto_allocate: bool = True,
+        **kwargs,
+    ) -> tuple[dict, dict | None]:
+        """Match a scanned barcode against a PurchaseOrder line item, without receiving it.
+
+        Arguments are the same as for scan_receive_item()
+
+        Returns:
+            A tuple of (response, item), where 'item' is None unless the line item can be received
+            without further information. Otherwise, 'item' is a dict containing the
+            purchase_order, line_item, location, quantity and barcode to receive.
+        """
         barcode_data = str(barcode_data).strip()
 
         self.barcode_fields = self.extract_barcode_fields(barcode_data)
@@ -387,19 +467,22 @@ class SupplierBarcodeMixin(BarcodeMixin):
         # If Purchase Order or Supplier Part does not exist, throw debug response
         if debug_response['PO'] is None or debug_response['supplier_part'] is None:
             debug_response['no_match'] = True
-            return debug_response
+            return debug_response, None
 
         if not line_item or not line_item.part:
-            return {'error': _('No matching line item found'), 'no_match': False}
+            return {'error': _('No matching line item found'), 'no_match': False}, None
 
         if line_item.part != supplier_part:
             return {
                 'error': _('Supplier part does not match line item'),
                 'no_match': False,
-            }
+            }, None
 
         if line_item.is_completed():
-            return {'error': _('Line item is already completed'), 'no_match': False}
+            return {
+                'error': _('Line item is already completed'),
+                'no_match': False,
+            }, None
 
         # Extract location information for the line item
         location = (
@@ -439,22 +522,15 @@ class SupplierBarcodeMixin(BarcodeMixin):
             response['action_required'] = _(
                 'Further information required to receive line item'
             )
-        else:
-            # Use the information we have to attempt to receive the item into stock
-            try:
-                purchase_order.receive_line_item(
-                    line_item, location, quantity, user, barcode=barcode_data
-                )
-                response['success'] = _('Received purchase order line item')
-            except ValidationError as e:
-                # Pass a ValidationError back to the client
-                response['error'] = e.message
-            except Exception:
-                # Handle any other exceptions
-                log_error('scan_receive_item', plugin=self.slug)
-                response['error'] = _('Failed to receive line item')
-
-        return response
+            return response, None
+
+        return response, {
+            'purchase_order': purchase_order,
+            'line_item': line_item,
+            'location': location,
+            'quantity': quantity,
+            'barcode': barcode_data,
+        }
 
     def get_supplier(self, cache: bool = False) -> Company | None:
         """Get the supplier for the SUPPLIER_ID set in the plugin settings.
@@ -55,6 +55,20 @@ class BarcodeSerializer(serializers.Serializer):
     )
 
 
+class BarcodeBatchSerializer(serializers.Serializer):
+    """Generic serializer for receiving multiple barcodes in a single request."""
+
+    MAX_BATCH_SIZE = 250
+
+    barcodes = serializers.ListField(
+        child=serializers.CharField(max_length=BarcodeSerializer.MAX_BARCODE_LENGTH),
+        required=True,
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE,
+        help_text=_('List of scanned barcode data'),
+    )
+
+
 class BarcodeGenerateSerializer(serializers.Serializer):
     """Serializer for generating a barcode."""
 
@@ -145,11 +159,12 @@ class BarcodePOAllocateSerializer(BarcodeSerializer):
         return order
 
 
-class BarcodePOReceiveSerializer(BarcodeSerializer):
-    """Serializer for receiving items against a purchase order.
+class BarcodePOReceiveMixin(serializers.Serializer):
+    """Serializer fields for receiving items against a purchase order.
 
     The following additional fields may be specified:
 
+    - supplier: Supplier to receive items from
     - purchase_order: PurchaseOrder object to receive items against
     - location: Location to receive items into
     """
@@ -189,6 +204,10 @@ class BarcodePOReceiveSerializer(BarcodeSerializer):
 
         return location
 
+
+class BarcodePOReceiveSerializer(BarcodePOReceiveMixin, BarcodeSerializer):
+    """Serializer for receiving an item against a purchase order."""
+
     line_item = serializers.PrimaryKeyRelatedField(
         queryset=order.models.PurchaseOrderLineItem.objects.all(),
         required=False,
@@ -203,6 +222,10 @@ class BarcodePOReceiveSerializer(BarcodeSerializer):
     )
 
 
+class BarcodePOReceiveBatchSerializer(BarcodePOReceiveMixin, BarcodeBatchSerializer):
+    """Serializer for receiving multiple items against purchase orders."""
+
+
 class BarcodeSOAllocateSerializer(BarcodeSerializer):
     """Serializr for allocating stock items to a sales order.
 
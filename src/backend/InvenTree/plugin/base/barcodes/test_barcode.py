@@ -174,6 +174,51 @@ class BarcodeAPITest(InvenTreeAPITestCase):
 
         self.assertEqual(pk, item.pk)
 
+    def test_barcode_scan_batch(self):
+        """Test scanning multiple barcodes in a single request."""
+        url = reverse('api-barcode-scan-batch')
+
+        # Save barcode scan results to database
+        set_global_setting('BARCODE_STORE_RESULTS', True)
+
+        n = BarcodeScanResult.objects.count()
+
+        item = StockItem.objects.get(pk=522)
+        item.assign_barcode(barcode_data='batch-barcode')
+
+        barcodes = [
+            item.format_barcode(),
+            '{"stocklocation": 1}',
+            'batch-barcode',
+            'unknown-barcode',
+        ]
+
+        response = self.post(url, data={'barcodes': barcodes}, expected_code=200)
+
+        results = response.data['results']
+        self.assertEqual(len(results), 4)
+
+        self.assertEqual(results[0]['stockitem']['pk'], 522)
+        self.assertEqual(results[1]['stocklocation']['pk'], 1)
+        self.assertEqual(results[2]['stockitem']['pk'], 522)
+
+        for result in results[:3]:
+            self.assertIn('success', result)
+            self.assertEqual(result['plugin'], 'InvenTreeBarcode')
+
+        self.assertIn('error', results[3])
+        self.assertIsNone(results[3]['plugin'])
+
+        for result, barcode in zip(results, barcodes, strict=True):
+            self.assertEqual(result['barcode_data'], barcode)
+
+        # Each scan has been logged
+        self.assertEqual(BarcodeScanResult.objects.count(), n + 4)
+
+        # Empty and invalid requests
+        self.post(url, data={'barcodes': []}, expected_code=400)
+        self.post(url, data={'barcode': 'abc'}, expected_code=400)
+
     def test_barcode_generation(self):
         """Test that a barcode can be generated for a StockItem."""
         item = StockItem.objects.get(pk=522)
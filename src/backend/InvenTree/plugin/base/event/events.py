@@ -3,6 +3,8 @@
 import contextvars
 from collections import defaultdict
 from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from typing import Optional
 
 from django.conf import settings
 from django.db import transaction
@@ -89,6 +91,112 @@ def batch_events():
         transaction.on_commit(batch.flush)
 
 
+class EventSubscriptionIndex:
+    """Index of the events which each loaded event plugin subscribes to.
+
+    Event plugins declare the events they respond to via EventMixin.SUBSCRIBED_EVENTS
+    (event names, or fnmatch style patterns). Plugins which do not declare their
+    subscriptions are candidates for *every* event.
+
+    The index is built once from the loaded plugins (and rebuilt whenever the plugin
+    registry changes), and the candidate plugins for each event name are memoized.
+    This allows events which no plugin subscribes to be discarded without any
+    database access, and without queuing any background tasks.
+
+    Note that the index does not consider the 'active' state of each plugin,
+    which is checked separately (see get_event_subscribers).
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.key: Optional[tuple] = None
+        self.subscriptions: list[tuple[str, Optional[list[str]]]] = []
+        self.matches: dict[str, list[str]] = {}
+
+    def get_key(self) -> tuple:
+        """Return a key which identifies the current state of the plugin registry."""
+        return (registry.registry_hash, tuple(registry.plugins.keys()))
+
+    def build(self) -> None:
+        """Build the index from the currently loaded event plugins."""
+        subscriptions = [
+            (plugin.slug, plugin.get_subscribed_events())
+            for plugin in registry.get_mixin_plugins(PluginMixinEnum.EVENTS)
+        ]
+
+        logger.debug('Built event subscription index: %s plugins', len(subscriptions))
+
+        self.matches = {}
+        self.subscriptions = subscriptions
+        self.key = self.get_key()
+
+    def clear(self) -> None:
+        """Clear the index, so that it is rebuilt on next access."""
+        self.key = None
+        self.subscriptions = []
+        self.matches = {}
+
+    def candidates(self, event: str) -> list[str]:
+        """Return the slugs of the plugins which subscribe to the provided event."""
+        if self.key != self.get_key():
+            self.build()
+
+        if (matches := self.matches.get(event)) is None:
+            matches = [
+                slug
+                for slug, patterns in self.subscriptions
+                if patterns is None
+                or any(fnmatchcase(event, pattern) for pattern in patterns)
+            ]
+
+            self.matches[event] = matches
+
+        return matches
+
+
+subscription_index = EventSubscriptionIndex()
+
+
+def get_event_subscribers(event: str) -> list[str]:
+    """Return the slugs of the active plugins which want to process the provided event.
+
+    Candidate plugins are determined from the subscription index,
+    and each active candidate is then asked (in-process) via wants_process_event().
+    """
+    # Check if the plugin registry needs to be reloaded
+    registry.check_reload()
+
+    candidates = subscription_index.candidates(event)
+
+    if not candidates:
+        return []
+
+    # Pre-fetch (and cache) the PluginConfig objects, to avoid a query per candidate
+    configs = registry.get_plugin_configs()
+
+    if configs is None:
+        # The database is not ready yet
+        return []
+
+    subscribers = []
+
+    for slug in candidates:
+        plugin = registry.plugins.get(slug)
+        config = registry.get_plugin_config(slug, configs=configs)
+
+        if plugin is None or not config or not config.is_active():
+            continue
+
+        try:
+            # Let the plugin decide if it wants to process this event
+            if plugin.wants_process_event(event):
+                subscribers.append(slug)
+        except Exception:
+            InvenTree.exceptions.log_error('get_event_subscribers', plugin=slug)
+
+    return subscribers
+
+
 @tracer.start_as_current_span('trigger_event')
 def trigger_event(event: str, *args, **kwargs) -> None:
     """Trigger an event with optional arguments.
@@ -98,7 +206,9 @@ def trigger_event(event: str, *args, **kwargs) -> None:
         *args: Additional arguments to pass to the event handler
         **kwargs: Additional keyword arguments to pass to the event handler
 
-    This event will be stored in the database, and the worker will respond to it later on.
+    A separate process_event task is offloaded to the background worker for each
+    active plugin which subscribes to this event. If no plugin subscribes to the
+    event, nothing is offloaded.
     """
     if not get_global_setting('ENABLE_PLUGINS_EVENTS', False):
         # Do nothing if plugin events are not enabled
@@ -115,6 +225,10 @@ def trigger_event(event: str, *args, **kwargs) -> None:
         logger.debug("Ignoring triggered event '%s' - database not ready", event)
         return
 
+    if registry.ready and not subscription_index.candidates(event):
+        logger.debug("Ignoring triggered event '%s' - no subscribed plugins", event)
+        return
+
     if (batch := _event_batch.get()) is not None:
         # A batch_events() context is active - queue this event rather than firing it now
         batch.add(event, *args, **kwargs)
@@ -128,9 +242,31 @@ def trigger_event(event: str, *args, **kwargs) -> None:
     if settings.PLUGIN_TESTING_EVENTS:
         force_async = settings.PLUGIN_TESTING_EVENTS_ASYNC
 
-    kwargs['force_async'] = force_async
+    if not registry.ready:
+        # The plugins are not yet loaded - defer to the background worker
+        offload_task(
+            register_event,
+            event,
+            *args,
+            group='plugin',
+            force_async=force_async,
+            **kwargs,
+        )
+        return
 
-    offload_task(register_event, event, *args, group='plugin', **kwargs)
+    for slug in get_event_subscribers(event):
+        logger.debug("Offloading event '%s' for plugin '%s'", event, slug)
+
+        # Offload a separate task for each plugin
+        offload_task(
+            process_event,
+            slug,
+            event,
+            *args,
+            group='plugin',
+            force_async=force_async,
+            **kwargs,
+        )
 
 
 @tracer.start_as_current_span('bulk_trigger_event')
@@ -138,8 +274,9 @@ def bulk_trigger_event(event: str, entries: list) -> None:
     """Trigger the same event multiple times, in a single bulk database write.
 
     Equivalent to calling trigger_event(event, *args, **kwargs) once per (args, kwargs)
-    pair in 'entries', but queues all of the resulting background tasks via a single
-    bulk_offload_task() call, rather than one INSERT per event.
+    pair in 'entries', but queues all of the resulting background tasks (one per
+    subscribed plugin, per entry) via a single bulk_offload_task() call, rather than
+    one INSERT per event.
 
     Arguments:
         event: The event to trigger
@@ -165,49 +302,59 @@ def bulk_trigger_event(event: str, entries: list) -> None:
         logger.debug("Ignoring bulk triggered event '%s' - database not ready", event)
         return
 
-    logger.debug("Bulk event triggered: '%s' (%s entries)", event, len(entries))
-
     force_async = True
 
     # If we are running in testing mode, we can enable or disable async processing
     if settings.PLUGIN_TESTING_EVENTS:
         force_async = settings.PLUGIN_TESTING_EVENTS_ASYNC
 
+    if registry.ready:
+        subscribers = get_event_subscribers(event)
+
+        if not subscribers:
+            logger.debug(
+                "Ignoring bulk triggered event '%s' - no subscribed plugins", event
+            )
+            return
+
+        func = process_event
+        prefixes = [(slug, event) for slug in subscribers]
+    else:
+        # The plugins are not yet loaded - defer to the background worker
+        func = register_event
+        prefixes = [(event,)]
+
+    logger.debug("Bulk event triggered: '%s' (%s entries)", event, len(entries))
+
     task_entries = []
 
-    for args, kwargs in entries:
-        kwargs = dict(kwargs)
-        # 'force_async' is a bulk_offload_task() control flag, not event data - it is
-        # resolved once for the whole batch above, so strip any per-entry override
-        kwargs.pop('force_async', None)
-        task_entries.append(((event, *args), kwargs))
+    for prefix in prefixes:
+        for args, kwargs in entries:
+            kwargs = dict(kwargs)
+            # 'force_async' is a bulk_offload_task() control flag, not event data - it is
+            # resolved once for the whole batch above, so strip any per-entry override
+            kwargs.pop('force_async', None)
+            task_entries.append(((*prefix, *args), kwargs))
 
-    bulk_offload_task(
-        register_event, task_entries, group='plugin', force_async=force_async
-    )
+    bulk_offload_task(func, task_entries, group='plugin', force_async=force_async)
 
 
 @tracer.start_as_current_span('register_event')
 def register_event(event, *args, **kwargs):
     """Register the event with any interested plugins.
 
-    Note: This function is processed by the background worker,
-    as it performs multiple database access operations.
+    Note: This function is processed by the background worker. Events are usually
+    dispatched directly to the subscribed plugins by trigger_event(); this task is only
+    offloaded when an event is triggered before the plugin registry is ready
+    (and to process any tasks which were queued by previous versions).
     """
     logger.debug("Registering triggered event: '%s'", event)
 
     # Determine if there are any plugins which are interested in responding
     if settings.PLUGIN_TESTING or get_global_setting('ENABLE_PLUGINS_EVENTS'):
-        # Check if the plugin registry needs to be reloaded
-        registry.check_reload()
-
         with transaction.atomic():
-            for plugin in registry.with_mixin(PluginMixinEnum.EVENTS, active=True):
-                # Let the plugin decide if it wants to process this event
-                if not plugin.wants_process_event(event):
-                    continue
-
-                logger.debug("Registering callback for plugin '%s'", plugin.slug)
+            for slug in get_event_subscribers(event):
+                logger.debug("Registering callback for plugin '%s'", slug)
 
                 # This task *must* be processed by the background worker,
                 # unless we are running CI tests
@@ -216,7 +363,7 @@ def register_event(event, *args, **kwargs):
 
                 # Offload a separate task for each plugin
                 offload_task(
-                    process_event, plugin.slug, event, *args, group='plugin', **kwargs
+                    process_event, slug, event, *args, group='plugin', **kwargs
                 )
 
 
@@ -1,5 +1,8 @@
 """Plugin mixin class for events."""
 
+from fnmatch import fnmatchcase
+from typing import Optional
+
 from plugin import PluginMixinEnum
 from plugin.helpers import MixinNotImplementedError
 
@@ -8,15 +11,39 @@ class EventMixin:
     """Mixin that provides support for responding to triggered events.
 
     Implementing classes must provide a "process_event" function:
+
+    Implementing classes may also declare the events they respond to via SUBSCRIBED_EVENTS,
+    a list of event names or (fnmatch style) patterns, e.g. ['part_part.*', 'build.issued'].
+    Events which no active plugin subscribes to are not offloaded to the background worker.
     """
 
+    # List of event names (or patterns) which this plugin subscribes to (None = all events)
+    SUBSCRIBED_EVENTS: Optional[list[str]] = None
+
+    def get_subscribed_events(self) -> Optional[list[str]]:
+        """Return the list of event names (or patterns) which this plugin subscribes to.
+
+        Returns None if the plugin does not declare its subscriptions (i.e. all events).
+        """
+        events = getattr(self, 'SUBSCRIBED_EVENTS', None)
+
+        if events is None:
+            return None
+
+        return [str(event).strip() for event in events]
+
     def wants_process_event(self, event: str) -> bool:
         """Function to subscribe to events.
 
         Return true if you're interested in the given event, false if not.
         """
+        patterns = self.get_subscribed_events()
+
         # Default implementation always returns true (backwards compatibility)
-        return True
+        if patterns is None:
+            return True
+
+        return any(fnmatchcase(event, pattern) for pattern in patterns)
 
     def process_event(self, event: str, *args, **kwargs) -> None:
         """Function to handle events.
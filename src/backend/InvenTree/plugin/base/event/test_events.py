@@ -6,7 +6,15 @@ from django.test import TestCase
 from django_q.models import OrmQ
 
 from common.models import InvenTreeSetting
-from plugin.base.event.events import batch_events, bulk_trigger_event, trigger_event
+from InvenTree.unit_test import activateEventPlugin
+from plugin import registry
+from plugin.base.event.events import (
+    batch_events,
+    bulk_trigger_event,
+    get_event_subscribers,
+    subscription_index,
+    trigger_event,
+)
 
 
 class BulkEventTriggerTests(TestCase):
@@ -15,6 +23,7 @@ class BulkEventTriggerTests(TestCase):
     def test_bulk_trigger_event(self):
         """Test that bulk_trigger_event queues events in a single bulk database write."""
         InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         entries = [
             ((idx, idx + 1), {'animal': f'animal_{idx}', 'count': idx})
@@ -27,9 +36,11 @@ class BulkEventTriggerTests(TestCase):
             # Start with a blank slate
             OrmQ.objects.all().delete()
 
-            # Queuing all 10 events should only take two database queries:
-            # one to check the 'ENABLE_PLUGINS_EVENTS' setting, and one bulk_create
-            with self.assertNumQueries(2):
+            # Queuing all 10 events should only take four database queries:
+            # one to check the 'ENABLE_PLUGINS_EVENTS' setting,
+            # one to check the plugin configuration, and one bulk_create
+            # for each of the task queue and the task queue index
+            with self.assertNumQueries(4):
                 bulk_trigger_event('test.event', entries)
 
         self.assertEqual(OrmQ.objects.count(), 10)
@@ -38,9 +49,9 @@ class BulkEventTriggerTests(TestCase):
         queued_tasks = OrmQ.objects.all().order_by('id')
 
         for task, (args, kwargs) in zip(queued_tasks, entries, strict=True):
-            self.assertEqual(task.func(), 'plugin.base.event.events.register_event')
+            self.assertEqual(task.func(), 'plugin.base.event.events.process_event')
             self.assertEqual(task.group(), 'plugin')
-            self.assertEqual(task.args(), ('test.event', *args))
+            self.assertEqual(task.args(), ('sampleevent', 'test.event', *args))
             self.assertEqual(task.kwargs(), kwargs)
 
 
@@ -51,6 +62,7 @@ class BatchEventsTests(TestCase):
         """Enable plugin events for all tests in this class."""
         super().setUp()
         InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
         OrmQ.objects.all().delete()
 
     def test_events_queued_and_flushed_on_commit(self):
@@ -71,7 +83,7 @@ class BatchEventsTests(TestCase):
         queued_tasks = OrmQ.objects.all().order_by('id')
 
         for idx, task in enumerate(queued_tasks):
-            self.assertEqual(task.args(), ('test.event',))
+            self.assertEqual(task.args(), ('sampleevent', 'test.event'))
             self.assertEqual(task.kwargs(), {'id': idx, 'value': f'v{idx}'})
 
     def test_events_grouped_by_name(self):
@@ -88,10 +100,20 @@ class BatchEventsTests(TestCase):
 
         self.assertEqual(OrmQ.objects.count(), 8)
         self.assertEqual(
-            sum(1 for task in OrmQ.objects.all() if task.args() == ('event.a',)), 5
+            sum(
+                1
+                for task in OrmQ.objects.all()
+                if task.args() == ('sampleevent', 'event.a')
+            ),
+            5,
         )
         self.assertEqual(
-            sum(1 for task in OrmQ.objects.all() if task.args() == ('event.b',)), 3
+            sum(
+                1
+                for task in OrmQ.objects.all()
+                if task.args() == ('sampleevent', 'event.b')
+            ),
+            3,
         )
 
     def test_events_discarded_on_rollback(self):
@@ -132,3 +154,80 @@ class BatchEventsTests(TestCase):
                     self.assertEqual(OrmQ.objects.count(), 0)
 
         self.assertEqual(OrmQ.objects.count(), 2)
+
+
+class EventSubscriptionTests(TestCase):
+    """Unit tests for the event subscription index."""
+
+    def setUp(self):
+        """Enable plugin events for all tests in this class."""
+        super().setUp()
+        InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        OrmQ.objects.all().delete()
+
+    def test_no_subscribers(self):
+        """Events which no active plugin subscribes to are not offloaded."""
+        registry.set_plugin_state('sampleevent', False)
+        registry.set_plugin_state('filteredsampleevent', True)
+
+        with self.settings(
+            PLUGIN_TESTING_EVENTS=True, PLUGIN_TESTING_EVENTS_ASYNC=True
+        ):
+            trigger_event('some.other.event', id=1)
+            bulk_trigger_event('some.other.event', [((), {'id': 2})])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic(), batch_events():
+                    trigger_event('some.other.event', id=3)
+
+        self.assertEqual(OrmQ.objects.count(), 0)
+
+        # The filtered plugin subscribes to 'test.event' only
+        self.assertEqual(get_event_subscribers('test.event'), ['filteredsampleevent'])
+        self.assertEqual(get_event_subscribers('some.other.event'), [])
+
+        with self.settings(
+            PLUGIN_TESTING_EVENTS=True, PLUGIN_TESTING_EVENTS_ASYNC=True
+        ):
+            trigger_event('test.event', id=4)
+
+        self.assertEqual(OrmQ.objects.count(), 1)
+
+        task = OrmQ.objects.first()
+        self.assertEqual(task.func(), 'plugin.base.event.events.process_event')
+        self.assertEqual(task.args(), ('filteredsampleevent', 'test.event'))
+        self.assertEqual(task.kwargs(), {'id': 4})
+
+    def test_subscription_patterns(self):
+        """Plugins can subscribe to events by name or by pattern."""
+        plugin = registry.get_plugin('filteredsampleevent', active=None)
+
+        self.assertTrue(plugin.wants_process_event('test.event'))
+        self.assertFalse(plugin.wants_process_event('test.event.other'))
+
+        plugin.SUBSCRIBED_EVENTS = ['part_part.*', 'build.issued']
+
+        try:
+            self.assertTrue(plugin.wants_process_event('part_part.saved'))
+            self.assertTrue(plugin.wants_process_event('build.issued'))
+            self.assertFalse(plugin.wants_process_event('part_partcategory.saved'))
+            self.assertFalse(plugin.wants_process_event('test.event'))
+        finally:
+            del plugin.SUBSCRIBED_EVENTS
+
+        # Plugins which do not declare subscriptions receive all events
+        plugin = registry.get_plugin('sampleevent', active=None)
+        self.assertIsNone(plugin.get_subscribed_events())
+        self.assertTrue(plugin.wants_process_event('any.event'))
+
+        # The index only lists candidate plugins which match the event name
+        subscription_index.clear()
+
+        candidates = subscription_index.candidates('test.event')
+        self.assertIn('filteredsampleevent', candidates)
+        self.assertIn('sampleevent', candidates)
+
+        candidates = subscription_index.candidates('part_part.saved')
+        self.assertNotIn('filteredsampleevent', candidates)
+        self.assertIn('sampleevent', candidates)
+        self.assertIn('partnotificationsplugin', candidates)
@@ -1,6 +1,8 @@
 """Plugin class for custom data exporting."""
 
 from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import batched
 from typing import Optional
 
 from django.contrib.auth.models import User
@@ -95,7 +97,7 @@ class DataExportMixin:
         output: DataOutput,
         serializer_context: Optional[dict] = None,
         **kwargs,
-    ) -> list:
+    ) -> Iterable[dict]:
         """Export data from the queryset.
 
         This method should be implemented by the plugin to provide
@@ -109,32 +111,32 @@ class DataExportMixin:
             context: Any custom context for the export (provided by the plugin serializer)
             output: The DataOutput object for the export
 
-        Returns: The exported data (a list of dict objects)
-        """
-        output.refresh_from_db()
-        N = queryset.count()
+        Yields:
+            The exported data (one dict object for each row)
 
-        rows = []
+        The default implementation is a generator, which fetches and serializes
+        the queryset one chunk at a time. Rows are written to the output file
+        as they are generated, so the entire dataset is never held in memory.
 
-        offset = 0
+        Note: If the returned data is a generator, the update_headers method is
+        called *before* any rows are generated. Plugins which determine the export
+        headers based on the exported data must return a list instead.
+        """
+        output.refresh_from_db()
 
-        while offset < N:
-            chunk = queryset[offset : offset + self.EXPORT_CHUNK_SIZE]
+        rows = queryset.iterator(chunk_size=self.EXPORT_CHUNK_SIZE)
 
+        for chunk in batched(rows, self.EXPORT_CHUNK_SIZE):
             chunk_rows = serializer_class(
                 chunk, many=True, exporting=True, context=serializer_context or {}
             ).data
 
-            rows.extend(chunk_rows)
-
-            offset += self.EXPORT_CHUNK_SIZE
+            yield from chunk_rows
 
             # Update the export progress
             output.progress += len(chunk_rows)
             output.save()
 
-        return rows
-
     def get_export_options_serializer(self, **kwargs) -> serializers.Serializer | None:
         """Return a serializer class with dynamic export options for this plugin.
 
@@ -1,5 +1,6 @@
 """Validation mixin class definition."""
 
+import inspect
 from typing import Optional
 
 from django.core.exceptions import ValidationError
@@ -172,6 +173,45 @@ class ValidationMixin:
         """
         return None
 
+    def validate_serial_numbers(
+        self, serials: list[str], part: part.models.Part, **kwargs
+    ) -> Optional[dict]:
+        """Validate a batch of proposed serial numbers.
+
+        This method is called when multiple serial numbers are validated at once
+        (e.g. when creating serialized stock items), and allows a plugin to validate
+        the entire batch in a single call (e.g. with a single database query or API request).
+
+        The default implementation calls validate_serial_number() for each serial number,
+        so plugins which only implement validate_serial_number() are still supported.
+
+        Arguments:
+            serials: The list of proposed serial numbers (strings)
+            part: The Part instance for which the serial numbers are being validated
+
+        Returns:
+            None (if all serial numbers are acceptable), or a dict of {serial: result}, where result is:
+            - True if the serial number is acceptable, and no further plugins should be checked
+            - An error message (string) if the serial number is objectionable
+            - None if the serial number is acceptable, and other plugins should be checked
+
+        Raises:
+            ValidationError: If the entire batch of serial numbers is objectionable
+        """
+        results = {}
+
+        # 2024-08-21: New method signature accepts a 'stock_item' parameter
+        signature = inspect.signature(self.validate_serial_number)
+        kwargs = {'stock_item': None} if 'stock_item' in signature.parameters else {}
+
+        for serial in serials:
+            try:
+                results[serial] = self.validate_serial_number(serial, part, **kwargs)
+            except ValidationError as exc:
+                results[serial] = '; '.join(exc.messages)
+
+        return results
+
     def convert_serial_to_int(self, serial: str) -> Optional[int]:
         """Convert a serial number (string) into an integer representation.
 
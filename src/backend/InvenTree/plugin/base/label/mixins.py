@@ -48,9 +48,14 @@ class LabelPrintingMixin:
             instance: The model instance to render
             request: The HTTP request object which triggered this print job (optional, may be None)
             user: The user who triggered this print job (optional, may be None)
+
+        Keyword Arguments:
+            context: The template context for the label (if already generated)
         """
         try:
-            return label.render(instance, request=request, user=user)
+            return label.render(
+                instance, request=request, user=user, context=kwargs.get('context')
+            )
         except Exception:
             log_error('render_to_pdf', plugin=self.slug)
             raise ValidationError(_('Error rendering label to PDF'))
@@ -159,7 +164,9 @@ class LabelPrintingMixin:
         for item in items:
             context = label.get_context(item, request, user=user)
             filename = label.generate_filename(context)
-            pdf_data = self.render_to_pdf(label, item, request, user=user, **kwargs)
+            pdf_data = self.render_to_pdf(
+                label, item, request, user=user, context=context, **kwargs
+            )
             png_file = self.render_to_png(
                 label, item, request, pdf_data=pdf_data, user=user, **kwargs
             )
@@ -9,10 +9,12 @@ references model objects actually exist in the database.
 
 import json
 import re
-from typing import cast
+from typing import Optional, cast
 
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import PermissionDenied
+
 import plugin.base.barcodes.helper
 from InvenTree.helpers import hash_barcode
 from InvenTree.models import InvenTreeBarcodeMixin
@@ -57,9 +59,79 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
 
         Here we are looking for a dict object which contains a reference to a particular InvenTree database object
         """
+        from common.models import BarcodeIndex
+
+        result = self.scan_internal(barcode_data, user)
+
+        if result is not None:
+            return result or None
+
+        # External Barcodes (Linked barcodes)
+        # Create hash from raw barcode data
+        barcode_hash = hash_barcode(barcode_data)
+
+        # If no "direct" hits are found, look for assigned third-party barcodes
+        # A single indexed lookup covers all supported models
+        instance = BarcodeIndex.lookup(barcode_hash)
+
+        if instance is not None:
+            return self.format_linked_response(instance, user)
+
+    def scan_batch(self, barcodes, user, **kwargs):
+        """Scan multiple barcodes against this plugin.
+
+        Internal barcodes are matched individually,
+        and all linked (third-party) barcodes are resolved with a single bulk index lookup.
+        """
+        from common.models import BarcodeIndex
+
+        prefix = cast(str, self.get_setting('SHORT_BARCODE_PREFIX'))
+
+        results = {}
+
+        # Map of barcode hash -> barcode data, for any linked barcodes
+        linked = {}
+
+        for barcode in barcodes:
+            try:
+                result = self.scan_internal(barcode, user, prefix=prefix)
+            except PermissionDenied as exc:
+                results[barcode] = {'error': str(exc.detail)}
+                continue
+
+            if result is None:
+                linked[hash_barcode(barcode)] = barcode
+            elif result:
+                results[barcode] = result
+
+        for barcode_hash, instance in BarcodeIndex.lookup_many(linked.keys()).items():
+            barcode = linked[barcode_hash]
+
+            try:
+                results[barcode] = self.format_linked_response(instance, user)
+            except PermissionDenied as exc:
+                results[barcode] = {'error': str(exc.detail)}
+
+        return results
+
+    def scan_internal(self, barcode_data, user, prefix: Optional[str] = None):
+        """Scan a barcode against the internal InvenTree barcode formats.
+
+        Arguments:
+            barcode_data: The barcode data to scan
+            user: The user performing the scan
+            prefix: The short barcode prefix (if not provided, read from the plugin settings)
+
+        Returns:
+            A result dict if the barcode matches a database object,
+            an empty dict if the barcode cannot match any object,
+            or None if the barcode should be checked against linked barcodes
+        """
         # Internal Barcodes - Short Format
         # Attempt to match the barcode data against the short barcode format
-        prefix = cast(str, self.get_setting('SHORT_BARCODE_PREFIX'))
+        if prefix is None:
+            prefix = cast(str, self.get_setting('SHORT_BARCODE_PREFIX'))
+
         if type(barcode_data) is str and (
             m := re.match(
                 f'^{re.escape(prefix)}([0-9A-Z $%*+-.\\/:]{"{2}"})(\\d+)$', barcode_data
@@ -73,7 +145,7 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
             model = supported_models_map.get(model_type_code, None)
 
             if model is None:
-                return None
+                return {}
 
             label = model.barcode_model_type()
 
@@ -98,8 +170,6 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
 
         supported_models = plugin.base.barcodes.helper.get_supported_barcode_models()
 
-        succcess_message = _('Found matching item')
-
         if barcode_dict is not None and type(barcode_dict) is dict:
             # Look for various matches. First good match will be returned
             for model in supported_models:
@@ -114,26 +184,23 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
                             **self.format_matched_response(
                                 label, model, instance, user=user
                             ),
-                            'success': succcess_message,
+                            'success': _('Found matching item'),
                         }
                     except (ValueError, model.DoesNotExist):
                         pass
 
-        # External Barcodes (Linked barcodes)
-        # Create hash from raw barcode data
-        barcode_hash = hash_barcode(barcode_data)
+        return None
 
-        # If no "direct" hits are found, look for assigned third-party barcodes
-        for model in supported_models:
-            label = model.barcode_model_type()
+    def format_linked_response(self, instance, user):
+        """Format a response for a matched third-party (linked) barcode."""
+        model = instance.__class__
 
-            instance = model.lookup_barcode(barcode_hash)
-
-            if instance is not None:
-                return {
-                    **self.format_matched_response(label, model, instance, user=user),
-                    'success': succcess_message,
-                }
+        return {
+            **self.format_matched_response(
+                model.barcode_model_type(), model, instance, user=user
+            ),
+            'success': _('Found matching item'),
+        }
 
     def generate(self, model_instance: InvenTreeBarcodeMixin):
         """Generate a barcode for a given model instance."""
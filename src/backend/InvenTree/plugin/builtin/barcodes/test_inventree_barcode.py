@@ -4,6 +4,7 @@ from django.urls import reverse
 
 import part.models
 import stock.models
+from InvenTree.helpers import hash_barcode
 from InvenTree.unit_test import InvenTreeAPITestCase
 
 
@@ -268,6 +269,52 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
             self.assertIn('success', response.data)
             self.assertEqual(response.data['stockitem']['pk'], 1)
 
+    def test_barcode_index(self):
+        """Test that assigned barcodes are resolved via the barcode index."""
+        from django.core.management import call_command
+
+        from common.models import BarcodeIndex
+
+        # Barcode data from fixture files is indexed
+        hash_1 = hash_barcode('blbla=10004')
+        self.assertTrue(BarcodeIndex.objects.filter(barcode_hash=hash_1).exists())
+
+        # An unknown barcode is resolved with a single query, regardless of model count
+        with self.assertNumQueries(1):
+            self.assertIsNone(BarcodeIndex.lookup(hash_barcode('unknown-barcode')))
+
+        # A known barcode requires one additional query to fetch the instance
+        with self.assertNumQueries(2):
+            instance = BarcodeIndex.lookup(hash_1)
+
+        self.assertIsInstance(instance, stock.models.StockItem)
+
+        # Assigning and unassigning a barcode updates the index
+        prt = part.models.Part.objects.get(pk=1)
+        prt.assign_barcode(barcode_data='index-test')
+
+        hash_2 = hash_barcode('index-test')
+        self.assertEqual(BarcodeIndex.lookup(hash_2), prt)
+
+        prt.unassign_barcode()
+        self.assertIsNone(BarcodeIndex.lookup(hash_2))
+        self.assertFalse(BarcodeIndex.objects.filter(barcode_hash=hash_2).exists())
+
+        # Stale index entries are removed on lookup
+        BarcodeIndex.objects.create(
+            barcode_hash=hash_2, model_type='stockitem', model_id=99999
+        )
+        self.assertIsNone(BarcodeIndex.lookup(hash_2))
+        self.assertFalse(BarcodeIndex.objects.filter(barcode_hash=hash_2).exists())
+
+        # Rebuild the index from scratch
+        BarcodeIndex.objects.all().delete()
+        call_command('rebuild_barcode_index', verbosity=0)
+
+        n = stock.models.StockItem.objects.exclude(barcode_hash='').count()
+        self.assertGreater(n, 0)
+        self.assertEqual(BarcodeIndex.objects.count(), n)
+
     def test_scan_inventree_json(self):
         """Test scanning of first-party json barcodes."""
         # Scan a StockItem object (which does not exist)
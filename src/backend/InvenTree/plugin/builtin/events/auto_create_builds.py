@@ -32,9 +32,7 @@ class AutoCreateBuildsPlugin(EventMixin, InvenTreePlugin):
     DESCRIPTION = _('Automatically create build orders for assemblies')
     VERSION = '1.1.0'
 
-    def wants_process_event(self, event) -> bool:
-        """Return whether given event should be processed or not."""
-        return event in [BuildEvents.ISSUED]
+    SUBSCRIBED_EVENTS = [BuildEvents.ISSUED]
 
     def process_event(self, event, *args, **kwargs):
         """Process the triggered event."""
@@ -1,6 +1,7 @@
 """Multi-level BOM exporter plugin."""
 
 from decimal import Decimal
+from itertools import batched
 from typing import Optional
 
 from django.utils.translation import gettext_lazy as _
@@ -8,7 +9,9 @@ from django.utils.translation import gettext_lazy as _
 import rest_framework.serializers as serializers
 
 from InvenTree.helpers import normalize
+from part.bom import BomExplosion
 from part.models import BomItem
+from part.pricing import QUERY_CHUNK_SIZE
 from part.serializers import BomItemSerializer
 from plugin import InvenTreePlugin
 from plugin.mixins import DataExportMixin
@@ -202,12 +205,58 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
 
         self.bom_data = []
 
+        # Cache of BomItem instances for sub-assembly rows
+        self.bom_items = {}
+
         # Run through each item in the queryset
         for bom_item in queryset:
             self.process_bom_row(bom_item, 1, **kwargs)
+            self.process_sub_assembly(bom_item, **kwargs)
 
         return self.bom_data
 
+    def process_sub_assembly(self, bom_item, **kwargs) -> None:
+        """Append the rows for the (multi-level) BOM of a sub-assembly.
+
+        The BOM of the sub-assembly is exploded in a single pass,
+        rather than querying the BOM of each sub-assembly at each level.
+
+        Arguments:
+            bom_item: The top-level BomItem object
+        """
+        if not bom_item.sub_part.assembly:
+            return
+
+        # If we have reached the maximum export level, return just this bom item
+        if self.export_levels == 1:
+            return
+
+        levels = self.export_levels - 1 if self.export_levels > 0 else 0
+
+        rows = BomExplosion(bom_item.sub_part).get_rows(levels=levels)
+
+        self.load_bom_items(rows)
+
+        for row in rows:
+            self.process_bom_row(
+                self.bom_items[row['bom_item']],
+                level=row['level'] + 1,
+                multiplier=bom_item.quantity * row['multiplier'],
+                **kwargs,
+            )
+
+    def load_bom_items(self, rows: list) -> None:
+        """Load (and annotate) the BomItem objects for the provided exploded BOM rows."""
+        missing = {row['bom_item'] for row in rows} - self.bom_items.keys()
+
+        for chunk in batched(missing, QUERY_CHUNK_SIZE):
+            items = BomItem.objects.filter(pk__in=chunk)
+            items = self.prefetch_queryset(items)
+            items = BomItemSerializer.annotate_queryset(items)
+
+            for item in items:
+                self.bom_items[item.pk] = item
+
     def process_bom_row(
         self, bom_item, level: int = 1, multiplier: Optional[Decimal] = None, **kwargs
     ) -> list:
@@ -216,7 +265,7 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         Arguments:
             bom_item: The BomItem object to process
             level: The current level of export
-            multiplier: The multiplier for the quantity (used for recursive calls)
+            multiplier: The multiplier for the quantity (used for sub-assembly rows)
         """
         # Add this row to the output dataset
         row = self.serializer_class(bom_item, exporting=True).data
@@ -246,22 +295,6 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
 
         self.bom_data.append(row)
 
-        # If we have reached the maximum export level, return just this bom item
-        if bom_item.sub_part.assembly and (
-            self.export_levels <= 0 or level < self.export_levels
-        ):
-            sub_items = bom_item.sub_part.get_bom_items()
-            sub_items = self.prefetch_queryset(sub_items)
-            sub_items = BomItemSerializer.annotate_queryset(sub_items)
-
-            for item in sub_items.all():
-                self.process_bom_row(
-                    item,
-                    level=level + 1,
-                    multiplier=multiplier * bom_item.quantity,
-                    **kwargs,
-                )
-
     def get_substitute_data(self, bom_item: BomItem) -> dict:
         """Return substitute part data for a BomItem."""
         substitute_part_data = {}
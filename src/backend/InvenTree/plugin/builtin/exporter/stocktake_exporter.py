@@ -129,19 +129,23 @@ class PartStocktakeExporter(DataExportMixin, InvenTreePlugin):
     def export_data(
         self, queryset, serializer_class, headers, context, output, **kwargs
     ):
-        """Export the data for the given queryset."""
+        """Export the data for the given queryset.
+
+        Rows are generated one at a time, as they are fetched from the database.
+
+        Yields:
+            The stocktake data for each part (one dict object for each row)
+        """
         export_pricing_data = context.get('export_pricing_data', True)
         include_external_items = context.get('export_include_external_items', False)
         include_variant_items = context.get('export_include_variant_items', False)
         exclude_zero_stock = context.get('export_exclude_zero_stock_entries', False)
 
-        data = super().export_data(
+        rows = super().export_data(
             queryset, serializer_class, headers, context, output, **kwargs
         )
 
-        output_data = []
-
-        for row in data:
+        for row in rows:
             quantity = Decimal(row.get('total_in_stock', 0))
 
             if not include_external_items:
@@ -179,6 +183,4 @@ class PartStocktakeExporter(DataExportMixin, InvenTreePlugin):
                         pricing_max * quantity, rounding=10
                     )
 
-            output_data.append(row)
-
-        return output_data
+            yield row
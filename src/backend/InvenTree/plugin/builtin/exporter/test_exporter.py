@@ -1,11 +1,54 @@
 """Unit test for the exporter plugins."""
 
+from unittest import mock
+
 from django.urls import reverse
 
+import tablib
+
+from common.models import DataOutput
 from InvenTree.unit_test import InvenTreeAPITestCase
+from plugin.base.integration.DataExport import DataExportMixin
 from plugin.registry import registry
 
 
+class StreamingExportTest(InvenTreeAPITestCase):
+    """Test that exported data is streamed to file in chunks."""
+
+    fixtures = ['category', 'part', 'location', 'stock']
+    roles = ['stock.view']
+
+    @mock.patch.object(DataExportMixin, 'EXPORT_CHUNK_SIZE', 3)
+    def test_streaming_export(self):
+        """Export stock data in each supported format, using a small chunk size."""
+        from stock.models import StockItem
+
+        url = reverse('api-stock-list')
+        N = StockItem.objects.count()
+
+        self.assertGreater(N, DataExportMixin.EXPORT_CHUNK_SIZE)
+
+        for fmt in ['csv', 'tsv', 'xlsx']:
+            with self.export_data(url, export_format=fmt, decode=False) as data_file:
+                data = data_file.read()
+
+            if fmt != 'xlsx':
+                data = data.decode('utf-8')
+
+            dataset = tablib.Dataset().load(data, format=fmt)
+
+            self.assertEqual(len(dataset), N)
+            self.assertIn('Quantity', dataset.headers)
+            self.assertEqual(
+                sorted(int(pk) for pk in dataset['ID']),
+                sorted(StockItem.objects.values_list('pk', flat=True)),
+            )
+
+            output = DataOutput.objects.order_by('-pk').first()
+            self.assertTrue(output.complete)
+            self.assertEqual(output.total, N)
+
+
 class StocktakeExporterTest(InvenTreeAPITestCase):
     """Test the stocktake exporter plugin."""
 
@@ -31,9 +31,7 @@ class PartNotificationsPlugin(SettingsMixin, EventMixin, InvenTreePlugin):
         }
     }
 
-    def wants_process_event(self, event):
-        """Return whether given event should be processed or not."""
-        return event.startswith('part_part.')
+    SUBSCRIBED_EVENTS = ['part_part.*']
 
     def process_event(self, event, *args, **kwargs):
         """Custom event processing."""
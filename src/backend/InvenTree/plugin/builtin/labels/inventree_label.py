@@ -1,15 +1,11 @@
 """Default label printing plugin (supports PDF generation)."""
 
-import io
-
-from django.core.files.base import ContentFile
 from django.utils.translation import gettext_lazy as _
 
-from pypdf import PdfWriter
-
 from InvenTree.helpers import str2bool
 from plugin import InvenTreePlugin
 from plugin.mixins import LabelPrintingMixin, SettingsMixin
+from report.render import OutputMerger
 
 
 class InvenTreeLabelPlugin(LabelPrintingMixin, SettingsMixin, InvenTreePlugin):
@@ -37,50 +33,44 @@ class InvenTreeLabelPlugin(LabelPrintingMixin, SettingsMixin, InvenTreePlugin):
         }
     }
 
-    # Keep track of individual label outputs
-    # These will be stitched together at the end of printing
-    outputs = []
+    # Individual label outputs are merged into a single output as they are printed
+    merger = None
 
     def before_printing(self):
-        """Reset the list of label outputs."""
-        self.outputs = []
+        """Reset the merged label output."""
+        self.merger = OutputMerger(debug_mode=str2bool(self.get_setting('DEBUG')))
 
     def print_label(self, **kwargs):
         """Print a single label."""
         label = kwargs['label_instance']
         instance = kwargs['item_instance']
 
-        if str2bool(self.get_setting('DEBUG')):
+        if self.merger is None:
+            self.before_printing()
+
+        if self.merger.debug_mode:
             # In debug mode, return raw HTML output
             output = self.render_to_html(label, instance, None, **kwargs)
         else:
             # Output is already provided
             output = kwargs.get('pdf_data')
 
-        self.outputs.append(output)
+        self.merger.append(output)
 
     def get_generated_file(self, **kwargs):
         """Return the generated file, by stitching together the individual label outputs."""
-        if len(self.outputs) == 0:
+        if self.merger is None or self.merger.count == 0:
             return None
 
-        if str2bool(self.get_setting('DEBUG')):
-            # Simple HTML output
-            data = '\n'.join(self.outputs)
+        if self.merger.debug_mode:
             filename = 'labels.html'
         else:
-            # Stitch together the PDF outputs
-            pdf_writer = PdfWriter()
-
-            for output in self.outputs:
-                output_file = io.BytesIO(output)
-                pdf_writer.append(output_file)
-
-            pdf_file = io.BytesIO()
-            pdf_writer.write(pdf_file)
-            data = pdf_file.getvalue()
-            pdf_file.close()
-
             filename = kwargs.get('filename', 'labels.pdf')
 
-        return ContentFile(data, name=filename)
+        return self.merger.get_file(filename)
+
+    def after_printing(self):
+        """Release the merged label output."""
+        if self.merger is not None:
+            self.merger.close()
+            self.merger = None
@@ -321,6 +321,55 @@ class SupplierBarcodePOReceiveTests(InvenTreeAPITestCase):
         self.assertEqual(item['purchase_order'], self.purchase_order1.pk)
         self.assertEqual(item['location'], self.loc_2.pk)
 
+    def test_receive_batch(self):
+        """Test receiving multiple items with a single batch request."""
+        url = reverse('api-barcode-po-receive-batch')
+        self.purchase_order1.place_order()
+
+        barcodes = [DIGIKEY_BARCODE, MOUSER_BARCODE, DIGIKEY_BARCODE, 'abc-123']
+
+        response = self.post(url, data={'barcodes': barcodes}, expected_code=200)
+
+        results = response.data['results']
+        self.assertEqual(len(results), 4)
+
+        self.assertIn('success', results[0])
+        self.assertIn('success', results[1])
+        self.assertEqual(results[2]['error'], 'Duplicate barcode')
+        self.assertIn('error', results[3])
+
+        # Both matched line items have been received
+        items = StockItem.objects.filter(part__name='Test Part')
+        self.assertEqual(items.count(), 2)
+
+        self.assertEqual(
+            set(items.values_list('barcode_data', flat=True)),
+            {DIGIKEY_BARCODE, MOUSER_BARCODE},
+        )
+
+        # Scanning the same barcodes again - items have already been received
+        response = self.post(url, data={'barcodes': barcodes[:2]}, expected_code=200)
+
+        for result in response.data['results']:
+            self.assertEqual(result['error'], 'Item has already been received')
+
+        self.assertEqual(items.count(), 2)
+
+    def test_receive_batch_rollback(self):
+        """Matched items are received in a single transaction."""
+        url = reverse('api-barcode-po-receive-batch')
+
+        # purchase_order1 has not been placed, so the DigiKey item cannot be received
+        response = self.post(
+            url, data={'barcodes': [MOUSER_BARCODE, DIGIKEY_BARCODE]}, expected_code=200
+        )
+
+        for result in response.data['results']:
+            self.assertIn('received against an order marked as', result['error'])
+
+        # The Mouser item (against a placed order) has not been received either
+        self.assertFalse(StockItem.objects.filter(part__name='Test Part').exists())
+
     def test_receive_custom_order_number(self):
         """Test receiving an item from a barcode with a custom order number."""
         url = reverse('api-barcode-po-receive')
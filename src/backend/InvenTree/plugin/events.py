@@ -4,6 +4,7 @@ from generic.events import BaseEventEnum
 from plugin.base.event.events import (
     batch_events,
     bulk_trigger_event,
+    get_event_subscribers,
     process_event,
     register_event,
     trigger_event,
@@ -21,6 +22,7 @@ __all__ = [
     'PluginEvents',
     'batch_events',
     'bulk_trigger_event',
+    'get_event_subscribers',
     'process_event',
     'register_event',
     'trigger_event',
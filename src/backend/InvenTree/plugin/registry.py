@@ -19,6 +19,7 @@ from typing import Any, Optional
 from django.apps import apps
 from django.conf import settings
 from django.contrib import admin
+from django.db import transaction
 from django.db.utils import IntegrityError, OperationalError, ProgrammingError
 from django.urls import clear_url_caches, path
 from django.utils.text import slugify
@@ -31,6 +32,7 @@ import InvenTree.ready
 from common.settings import get_global_setting, set_global_setting
 from InvenTree.config import get_plugin_dir
 from InvenTree.exceptions import log_error
+from InvenTree.invalidation import RegistryGeneration
 
 from .helpers import (
     IntegrationPluginError,
@@ -123,6 +125,13 @@ class PluginsRegistry:
         # Keep an internal hash of the plugin registry state
         self.registry_hash: Optional[str] = None
 
+        # Shared generation counter, used to detect changes made by other processes
+        self.generation = RegistryGeneration('plugin')
+
+        # Index of loaded plugins for each mixin (see get_mixin_plugins)
+        self.mixin_index: dict[str, list[InvenTreePlugin]] = {}
+        self.mixin_index_key: Optional[tuple] = None
+
         self.plugin_modules: list[InvenTreePlugin] = []  # Holds all discovered plugins
         self.mixin_modules: dict[str, Any] = {}  # Holds all discovered mixins
 
@@ -353,11 +362,49 @@ class PluginsRegistry:
     # region registry functions
 
     @registry_entrypoint(default_value=[])
+    def get_mixin_plugins(self, mixin: str) -> list[InvenTreePlugin]:
+        """Return all loaded plugins which have a specified mixin enabled.
+
+        The result is cached in the mixin index, which is rebuilt whenever
+        the set of loaded plugins (or the registry hash) changes.
+
+        Note: The 'active' status of each plugin is *not* checked here.
+
+        Args:
+            mixin (str): Mixin name
+        """
+        mixin = str(mixin).lower().strip()
+
+        key = (self.registry_hash, id(self.plugins), len(self.plugins))
+
+        if key != self.mixin_index_key:
+            self.mixin_index = {}
+            self.mixin_index_key = key
+
+        plugins = self.mixin_index.get(mixin)
+
+        if plugins is None:
+            plugins = []
+
+            for plugin in self.plugins.values():
+                try:
+                    if plugin.mixin_enabled(mixin):
+                        plugins.append(plugin)
+                except MixinNotImplementedError:
+                    continue
+
+            self.mixin_index[mixin] = plugins
+
+        return plugins
+
     def with_mixin(
         self, mixin: str, active: Optional[bool] = True, builtin: Optional[bool] = None
     ) -> list[InvenTreePlugin]:
         """Returns reference to all plugins that have a specified mixin enabled.
 
+        The filtered list of plugins is cached for the duration of the current request,
+        so that repeated lookups (e.g. validation hooks for each model instance) are free.
+
         Args:
             mixin (str): Mixin name
             active (bool, optional): Filter by 'active' status of plugin. Defaults to True.
@@ -375,15 +422,15 @@ class PluginsRegistry:
 
         mixin = str(mixin).lower().strip()
 
-        plugins = []
+        # As we have already checked the registry hash, this is a valid cache key
+        cache_key = f'plugin_mixin:{self.registry_hash}:{mixin}:{active}:{builtin}'
 
-        for plugin in self.plugins.values():
-            try:
-                if not plugin.mixin_enabled(mixin):
-                    continue
-            except MixinNotImplementedError:
-                continue
+        if (plugins := InvenTree.cache.get_session_cache(cache_key)) is not None:
+            return list(plugins)
 
+        plugins = []
+
+        for plugin in self.get_mixin_plugins(mixin):
             config = self.get_plugin_config(plugin.slug, configs=configs)
 
             # No config - cannot use this plugin
@@ -398,7 +445,9 @@ class PluginsRegistry:
 
             plugins.append(plugin)
 
-        return plugins
+        InvenTree.cache.set_session_cache(cache_key, plugins)
+
+        return list(plugins)
 
     # endregion
 
@@ -484,6 +533,9 @@ class PluginsRegistry:
         if clear_errors:
             self.errors = {}
 
+        # Record the shared generation *before* loading, so that no changes are missed
+        generation = self.generation.start_load()
+
         try:
             plugin_on_startup = get_global_setting(
                 'PLUGIN_ON_STARTUP', create=False, cache=False
@@ -511,6 +563,8 @@ class PluginsRegistry:
             self.plugins_loaded = False
             self._unload_plugins(force_reload=force_reload)
             self.plugins_loaded = True
+            self.generation.mark_current(generation)
+
             self._load_plugins(full_reload=full_reload, _internal=_internal)
 
             self.update_plugin_hash()
@@ -987,6 +1041,9 @@ class PluginsRegistry:
         self.plugins_inactive: dict[str, InvenTreePlugin] = {}
         self.plugins_full: dict[str, InvenTreePlugin] = {}
 
+        self.mixin_index = {}
+        self.mixin_index_key = None
+
     def _update_urls(self):
         """Due to the order in which plugins are loaded, the patterns in urls.py may be out of date.
 
@@ -1036,6 +1093,10 @@ class PluginsRegistry:
                 set_global_setting(
                     '_PLUGIN_REGISTRY_HASH', self.registry_hash, change_user=None
                 )
+
+                # Notify other processes that the registry has changed
+                # (once the new hash is visible to them)
+                transaction.on_commit(self.generation.bump)
             except (OperationalError, ProgrammingError):
                 # Exception if the database has not been migrated yet, or is not ready
                 pass
@@ -1098,6 +1159,10 @@ class PluginsRegistry:
     def check_reload(self):
         """Determine if the registry needs to be reloaded.
 
+        The registry hash is only compared against the database if the shared
+        generation counter indicates that another process has changed the registry
+        (or, if the global cache is not enabled, once every REGISTRY_POLL_INTERVAL seconds).
+
         Returns True if the registry has changed and was reloaded.
         """
         if settings.TESTING and not settings.PLUGIN_TESTING_RELOAD:
@@ -1116,6 +1181,10 @@ class PluginsRegistry:
 
         InvenTree.cache.set_session_cache('plugin_registry_checked', True)
 
+        if not self.generation.should_check():
+            # The registry has not been changed by another process
+            return False
+
         logger.debug('Checking plugin registry hash')
 
         # If not already cached, calculate the hash
@@ -1132,6 +1201,9 @@ class PluginsRegistry:
             logger.info('Plugin registry hash has changed - reloading')
             self.reload_plugins(full_reload=True, force_reload=True, collect=True)
             return True
+
+        self.generation.mark_current()
+
         return False
 
     # endregion
@@ -17,9 +17,8 @@ class FilteredEventPluginSample(EventMixin, InvenTreePlugin):
     SLUG = 'filteredsampleevent'
     TITLE = 'Triggered by test.event only'
 
-    def wants_process_event(self, event):
-        """Return whether given event should be processed or not."""
-        return event == 'test.event'
+    # Only events which match these names (or patterns) are passed to this plugin
+    SUBSCRIBED_EVENTS = ['test.event']
 
     def process_event(self, event, *args, **kwargs):
         """Custom event processing."""
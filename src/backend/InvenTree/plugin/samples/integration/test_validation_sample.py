@@ -162,3 +162,20 @@ class SampleValidatorPluginTest(InvenTreeAPITestCase, InvenTreeTestCase):
                 build_itm.reference + '-SAMPLE-BATCH'
             )
         )
+
+    def test_validate_serial_numbers(self):
+        """Test batch validation of serial numbers."""
+        self.enable_plugin(True)
+
+        # The sample plugin rejects serial numbers which are a multiple of 5
+        errors = self.part.validate_serial_numbers(['1', '5', '10', '11'])
+
+        self.assertEqual(set(errors.keys()), {'5', '10'})
+        self.assertIn('multiple of 5', errors['5'])
+
+        conflicts = self.part.find_conflicting_serial_numbers(['1', '5', '10', '11'])
+        self.assertEqual(conflicts, ['5', '10'])
+
+        self.enable_plugin(False)
+
+        self.assertEqual(self.part.validate_serial_numbers(['5', '10']), {})
@@ -5,6 +5,7 @@ import shutil
 import subprocess
 import tempfile
 import textwrap
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -13,8 +14,9 @@ from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.test import TestCase, override_settings
+from django.test import RequestFactory, TestCase, override_settings, tag
 
+import InvenTree.cache
 import plugin.templatetags.plugin_extras as plugin_tags
 from InvenTree.unit_test import PluginRegistryMixin, TestQueryMixin
 from plugin import InvenTreePlugin, PluginMixinEnum
@@ -529,7 +531,9 @@ class RegistryTests(TestQueryMixin, PluginRegistryMixin, TestCase):
         # Check that the registry is not reloaded
         self.assertFalse(registry.check_reload())
 
-        with self.settings(TESTING=False, PLUGIN_TESTING_RELOAD=True):
+        with self.settings(
+            TESTING=False, PLUGIN_TESTING_RELOAD=True, REGISTRY_POLL_INTERVAL=0
+        ):
             # Check that the registry is reloaded
             registry.reload_plugins(full_reload=True, collect=True, force_reload=True)
             self.assertFalse(registry.check_reload())
@@ -538,6 +542,47 @@ class RegistryTests(TestQueryMixin, PluginRegistryMixin, TestCase):
             registry.registry_hash = 'abc'
             self.assertTrue(registry.check_reload())
 
+        with self.settings(
+            TESTING=False, PLUGIN_TESTING_RELOAD=True, REGISTRY_POLL_INTERVAL=3600
+        ):
+            # The database is not polled again within the polling interval
+            registry.registry_hash = 'abc'
+            self.assertFalse(registry.check_reload())
+
+    def test_registry_generation(self):
+        """Test the shared generation counter used to detect registry changes."""
+        from InvenTree.invalidation import RegistryGeneration
+
+        with self.settings(GLOBAL_CACHE_ENABLED=True):
+            this_process = RegistryGeneration('test')
+            other_process = RegistryGeneration('test')
+
+            with (
+                patch.object(RegistryGeneration, 'get_connection'),
+                patch.object(RegistryGeneration, 'listen'),
+            ):
+                this_process.mark_current(this_process.start_load())
+                other_process.mark_current(other_process.start_load())
+
+                self.assertFalse(this_process.should_check())
+                self.assertFalse(other_process.should_check())
+
+                # A change made by this process is not reported back to itself
+                this_process.bump()
+                self.assertFalse(this_process.should_check())
+
+                # Simulate the generation being published to the other process
+                other_process.remote = this_process.remote
+                self.assertTrue(other_process.should_check())
+
+                other_process.mark_current()
+                self.assertFalse(other_process.should_check())
+
+                # Changes are also detected by polling the shared counter
+                this_process.bump()
+                other_process.poll()
+                self.assertTrue(other_process.should_check())
+
     def test_registry_hash_order_independence(self):
         """Test that the registry hash does not depend on plugin iteration order.
 
@@ -704,6 +749,43 @@ class RegistryTests(TestQueryMixin, PluginRegistryMixin, TestCase):
         self.assertIn('inventreelabel', keys)
         self.assertIn('inventreelabelmachine', keys)
 
+    def test_with_mixin_cache(self):
+        """Test that mixin lookups are cached, and invalidated on plugin state changes."""
+        self.ensurePluginsLoaded()
+
+        registry.set_plugin_state('sampleevent', False)
+
+        slugs = [p.slug for p in registry.get_mixin_plugins(PluginMixinEnum.EVENTS)]
+        self.assertIn('sampleevent', slugs)
+
+        # The mixin index is retained between calls
+        self.assertIs(
+            registry.get_mixin_plugins(PluginMixinEnum.EVENTS),
+            registry.get_mixin_plugins(PluginMixinEnum.EVENTS),
+        )
+
+        InvenTree.cache.create_session_cache(RequestFactory().get('/'))
+
+        try:
+            plugins = registry.with_mixin(PluginMixinEnum.EVENTS)
+            self.assertNotIn('sampleevent', [p.slug for p in plugins])
+
+            # Repeated lookups within the same request do not hit the database
+            with self.assertNumQueries(0):
+                for mixin in PluginMixinEnum:
+                    registry.with_mixin(mixin)
+
+                for mixin in PluginMixinEnum:
+                    registry.with_mixin(mixin)
+
+            # Changing the plugin state updates the registry hash
+            registry.set_plugin_state('sampleevent', True)
+
+            plugins = registry.with_mixin(PluginMixinEnum.EVENTS)
+            self.assertIn('sampleevent', [p.slug for p in plugins])
+        finally:
+            InvenTree.cache.delete_session_cache()
+
     def test_config_attributes(self):
         """Test attributes for PluginConfig objects."""
         self.ensurePluginsLoaded()
@@ -753,3 +835,61 @@ class InstallerTests(TestCase):
         self.assertIn(
             'Only superuser accounts can administer plugins', str(e.exception)
         )
+
+
+@tag('performance_test')
+class RegistryBenchmarkTests(PluginRegistryMixin, TestCase):
+    """Benchmark the overhead of plugin hook dispatch."""
+
+    # Number of plugin hooks dispatched per simulated request
+    N_HOOKS = 1000
+
+    MIXINS = [
+        PluginMixinEnum.VALIDATION,
+        PluginMixinEnum.BARCODE,
+        PluginMixinEnum.NOTIFICATION,
+        PluginMixinEnum.EVENTS,
+    ]
+
+    def dispatch(self, cached: bool) -> float:
+        """Simulate the plugin hook lookups for a single request, and return the time taken.
+
+        Arguments:
+            cached: If False, the mixin index and cached results are cleared before each lookup
+        """
+        InvenTree.cache.create_session_cache(RequestFactory().get('/'))
+
+        try:
+            t1 = time.perf_counter()
+
+            for idx in range(self.N_HOOKS):
+                if not cached:
+                    registry.mixin_index_key = None
+
+                    request_cache = InvenTree.cache.thread_data.request_cache
+
+                    for key in list(request_cache.keys()):
+                        if key.startswith('plugin_mixin:'):
+                            del request_cache[key]
+
+                registry.with_mixin(self.MIXINS[idx % len(self.MIXINS)])
+
+            return time.perf_counter() - t1
+        finally:
+            InvenTree.cache.delete_session_cache()
+
+    def test_with_mixin_benchmark(self):
+        """Compare the time taken for plugin hook lookups, with and without caching."""
+        self.ensurePluginsLoaded()
+
+        # Warm up (fetch plugin configs, etc)
+        self.dispatch(cached=True)
+
+        uncached = self.dispatch(cached=False)
+        cached = self.dispatch(cached=True)
+
+        print(
+            f'Benchmark @ with_mixin: {self.N_HOOKS} lookups in {uncached:.4f}s (uncached) vs {cached:.4f}s (cached)'
+        )
+
+        self.assertLess(cached, uncached)
@@ -3,7 +3,7 @@
 from urllib.parse import urlparse
 
 import structlog
-from weasyprint.urls import URLFetcher
+from weasyprint.urls import URLFetcher, URLFetcherResponse
 
 logger = structlog.get_logger('inventree')
 
@@ -24,6 +24,10 @@ class InvenTreeURLFetcher(URLFetcher):
         if scheme in ('data', 'http', 'https'):
             from InvenTree.helpers_model import ssrf_safe_context
 
+            # Resources which have already been fetched (and validated) in this print job
+            if parsed.netloc and (cached := self._cached_response(url)) is not None:
+                return cached
+
             self._validate_http_url(url, parsed)
 
             # SSRF protection: guard the DNS resolution WeasyPrint performs internally
@@ -31,7 +35,12 @@ class InvenTreeURLFetcher(URLFetcher):
             # hostname could otherwise pass validation with one IP and then be
             # connected to via a different, private one moments later (DNS rebinding).
             with ssrf_safe_context():
-                return super().fetch(url, headers)
+                response = super().fetch(url, headers)
+
+            if parsed.netloc:
+                response = self._cache_response(url, response)
+
+            return response
 
         if scheme == 'file':
             logger.warning("InvenTreeURLFetcher: blocked file:// URL: '%s'", url)
@@ -67,3 +76,41 @@ class InvenTreeURLFetcher(URLFetcher):
                 url,
             )
             raise
+
+    def _cached_response(self, url: str):
+        """Return a previously fetched response for this URL (within the current print job)."""
+        from report.render import active_cache
+
+        if (cache := active_cache()) is None:
+            return None
+
+        if (entry := cache.values.get(('url', url))) is None:
+            return None
+
+        response_url, body, headers, status = entry
+
+        return URLFetcherResponse(response_url, body, headers, status)
+
+    def _cache_response(self, url: str, response):
+        """Store a fetched response, so that it can be reused within the current print job.
+
+        Remote resources (e.g. fonts and stylesheets) are typically identical for every
+        item in a print job, so they are only fetched once per job.
+        """
+        from report.render import active_cache
+
+        if (cache := active_cache()) is None:
+            return response
+
+        if not isinstance(response, URLFetcherResponse):
+            return response
+
+        try:
+            body = response.read()
+        finally:
+            response.close()
+
+        entry = (response.url, body, response.headers, response.status)
+        cache.values['url', url] = entry
+
+        return URLFetcherResponse(*entry)
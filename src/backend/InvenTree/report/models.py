@@ -1,6 +1,5 @@
 """Report template model definitions."""
 
-import io
 import os
 import sys
 from datetime import date, datetime
@@ -20,13 +19,13 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 import structlog
-from pypdf import PdfWriter
 
 import InvenTree.exceptions
 import InvenTree.helpers
 import InvenTree.models
 import InvenTree.ready
 import report.helpers
+import report.render
 import report.validators
 from common.models import DataOutput, RenderChoices, UpdatedUserMixin
 from common.settings import get_global_setting
@@ -281,7 +280,7 @@ class ReportTemplateBase(
         """
         html = self.render_as_string(instance, context=context, **kwargs)
         pdf = HTML(string=html, url_fetcher=InvenTreeURLFetcher()).write_pdf(
-            pdf_forms=True
+            pdf_forms=True, **report.render.pdf_options()
         )
 
         return pdf
@@ -488,6 +487,57 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             except Exception:
                 InvenTree.exceptions.log_error('report_callback', plugin=plugin.slug)
 
+    def render_report(
+        self,
+        instance,
+        output: DataOutput,
+        context: dict,
+        user: Optional[AbstractUser] = None,
+        debug_mode: bool = False,
+    ):
+        """Render a single report, recording any rendering error against the DataOutput.
+
+        Arguments:
+            instance: The model instance to render against
+            output: The DataOutput object for the print job
+            context: The template context for the report
+            user: The user to associate with the generated report
+            debug_mode: If True, render the report as raw HTML (rather than PDF)
+
+        Raises:
+            ValidationError: If there is an error rendering the report
+        """
+        try:
+            if debug_mode:
+                return self.render_as_string(instance, user=user, context=context)
+            else:
+                return self.render(instance, user=user, context=context)
+        except TemplateDoesNotExist as e:
+            t_name = str(e) or self.template
+            msg = f'Template file {t_name} does not exist'
+            output.mark_failure(error=msg)
+            raise ValidationError(msg)
+        except TemplateSyntaxError as e:
+            msg = _('Template syntax error')
+            output.mark_failure(error=str(e) or msg)
+            raise ValidationError(f'{msg}: {e!s}')
+        except ValidationError as e:
+            output.mark_failure(', '.join(e.messages))
+            raise e
+        except Exception as e:
+            msg = _('Error rendering report')
+            output.mark_failure(error=msg)
+            raise ValidationError(f'{msg}: {e!s}')
+
+    def append_report(self, merger, report, output: DataOutput):
+        """Append a rendered report to the merged output file."""
+        try:
+            merger.append(report)
+        except Exception:
+            msg = _('Error merging report outputs')
+            output.mark_failure(error=msg)
+            raise ValidationError(msg)
+
     def print(
         self,
         items: list,
@@ -521,10 +571,11 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
         # Extract user information from the provided context
         user = user or getattr(output, 'user', None)
 
-        outputs = []
-
         debug_mode = get_global_setting('REPORT_DEBUG_MODE', False)
 
+        # Each rendered report is appended to the merged output as it is generated
+        merger = report.render.OutputMerger(debug_mode=debug_mode)
+
         # Start with a default report name
         report_name: Optional[str] = None
 
@@ -545,102 +596,67 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             output.save()
 
         try:
-            if self.merge:
-                base_context = super().base_context(user=user)
-                report_context = self.get_report_context()
-                item_contexts = []
-                for instance in items:
-                    instance_context = instance.report_context()
-                    instance_context = self.get_plugin_context(
-                        instance, instance_context, user=user
-                    )
-                    item_contexts.append(instance_context)
-
-                contexts = {
-                    **base_context,
-                    **report_context,
-                    'instances': item_contexts,
-                }
-
-                if report_name is None:
-                    report_name = self.generate_filename(contexts)
-
-                try:
-                    if debug_mode:
-                        report = self.render_as_string(
-                            instance, user=user, context=contexts
+            with report.render.render_cache():
+                if self.merge:
+                    base_context = super().base_context(user=user)
+                    report_context = self.get_report_context()
+                    item_contexts = []
+                    for instance in items:
+                        instance_context = instance.report_context()
+                        instance_context = self.get_plugin_context(
+                            instance, instance_context, user=user
                         )
-                    else:
-                        report = self.render(instance, user=user, context=contexts)
-                except TemplateDoesNotExist as e:
-                    t_name = str(e) or self.template
-                    msg = f'Template file {t_name} does not exist'
-                    output.mark_failure(error=msg)
-                    raise ValidationError(msg)
-                except TemplateSyntaxError as e:
-                    msg = _('Template syntax error')
-                    output.mark_failure(str(e) or msg)
-                    raise ValidationError(f'{msg}: {e!s}')
-                except ValidationError as e:
-                    output.mark_failure(','.join(e.messages))
-                    raise e
-                except Exception as e:
-                    msg = _('Error rendering report')
-                    output.mark_failure(msg)
-                    raise ValidationError(f'{msg}: {e!s}')
-
-                outputs.append(report)
-                self.handle_attachment(instance, report, report_name, user, debug_mode)
-                self.notify_plugins(instance, report, user)
-
-                # Update the progress of the report generation
-                output.progress += 1
-                output.save()
-            else:
-                for instance in items:
-                    context = self.get_context(instance, user=user)
+                        item_contexts.append(instance_context)
+
+                    contexts = {
+                        **base_context,
+                        **report_context,
+                        'instances': item_contexts,
+                    }
 
                     if report_name is None:
-                        report_name = self.generate_filename(context)
-
-                    # Render the report output
-                    try:
-                        if debug_mode:
-                            report = self.render_as_string(
-                                instance, user=user, context=context
-                            )
-                        else:
-                            report = self.render(instance, user=user, context=None)
-                    except TemplateDoesNotExist as e:
-                        t_name = str(e) or self.template
-                        msg = f'Template file {t_name} does not exist'
-                        output.mark_failure(error=msg)
-                        raise ValidationError(msg)
-                    except TemplateSyntaxError as e:
-                        msg = _('Template syntax error')
-                        output.mark_failure(error=str(e) or msg)
-                        raise ValidationError(f'{msg}: {e!s}')
-                    except ValidationError as e:
-                        output.mark_failure(', '.join(e.messages))
-                        raise e
-                    except Exception as e:
-                        msg = _('Error rendering report')
-                        output.mark_failure(error=msg)
-                        raise ValidationError(f'{msg}: {e!s}')
-
-                    outputs.append(report)
+                        report_name = self.generate_filename(contexts)
 
-                    self.handle_attachment(
-                        instance, report, report_name, user, debug_mode
+                    data = self.render_report(
+                        instance, output, contexts, user=user, debug_mode=debug_mode
                     )
 
-                    self.notify_plugins(instance, report, user)
+                    self.append_report(merger, data, output)
+                    self.handle_attachment(
+                        instance, data, report_name, user, debug_mode
+                    )
+                    self.notify_plugins(instance, data, user)
 
                     # Update the progress of the report generation
                     output.progress += 1
                     output.save()
+                else:
+                    for instance in items:
+                        context = self.get_context(instance, user=user)
+
+                        if report_name is None:
+                            report_name = self.generate_filename(context)
+
+                        # Render the report output
+                        data = self.render_report(
+                            instance, output, context, user=user, debug_mode=debug_mode
+                        )
+
+                        self.append_report(merger, data, output)
+
+                        self.handle_attachment(
+                            instance, data, report_name, user, debug_mode
+                        )
+
+                        self.notify_plugins(instance, data, user)
+
+                        # Update the progress of the report generation
+                        output.progress += 1
+                        output.save()
 
         except Exception as exc:
+            merger.close()
+
             # Something went wrong during the report generation process
             log_report_error('ReportTemplate.print')
 
@@ -662,43 +678,89 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
         if not report_name.endswith('.pdf'):
             report_name += '.pdf'
 
-        # Combine all the generated reports into a single PDF file
         if debug_mode:
-            data = '\n'.join(outputs)
             report_name = report_name.replace('.pdf', '.html')
-        else:
-            # Merge the outputs back together into a single PDF file
-            pdf_writer = PdfWriter()
 
-            try:
-                for report in outputs:
-                    # Construct file object with raw PDF data
-                    report_file = io.BytesIO(report)
-                    pdf_writer.append(report_file)
-
-                # Generate raw output
-                pdf_file = io.BytesIO()
-                pdf_writer.write(pdf_file)
-                data = pdf_file.getvalue()
-                pdf_file.close()
-            except Exception:
-                log_report_error('ReportTemplate.print')
-                msg = _('Error merging report outputs')
-                output.mark_failure(error=msg)
+        try:
+            # Save the generated report to the database
+            output.mark_complete(output=merger.get_file(report_name))
+        except Exception:
+            log_report_error('ReportTemplate.print')
+            msg = _('Error merging report outputs')
+            output.mark_failure(error=msg)
 
-                # If the error occurred in a worker thread, we do not want to raise an error,
-                # as this would cause the worker to retry the task indefinitely
-                if InvenTree.ready.isInWorkerThread():
-                    return
+            # If the error occurred in a worker thread, we do not want to raise an error,
+            # as this would cause the worker to retry the task indefinitely
+            if InvenTree.ready.isInWorkerThread():
+                return
 
-                raise ValidationError(msg)
+            raise ValidationError(msg)
+        finally:
+            merger.close()
 
-        # Save the generated report to the database
-        generated_file = ContentFile(data, report_name)
+        return output
 
-        output.mark_complete(output=generated_file)
+    def print_chunk(
+        self,
+        items: list,
+        output: DataOutput,
+        chunk: int,
+        chunks: int,
+        report_name: str,
+        user: Optional[AbstractUser] = None,
+    ) -> None:
+        """Print a single chunk of a print job which has been split across multiple tasks.
 
-        return output
+        The rendered chunk is saved to storage, and the last chunk to complete
+        merges all chunks into a single output file.
+
+        Arguments:
+            items: The items to print for this chunk
+            output: The DataOutput object for the entire print job
+            chunk: The index of this chunk
+            chunks: The total number of chunks in the print job
+            report_name: The filename for the merged output
+            user: The user to associate with the generated reports
+        """
+        logger.info(
+            "Printing chunk %s of %s (%s reports) against template '%s'",
+            chunk + 1,
+            chunks,
+            len(items),
+            self.name,
+        )
+
+        merger = report.render.OutputMerger()
+
+        if not report_name.endswith('.pdf'):
+            report_name += '.pdf'
+
+        try:
+            with report.render.render_cache():
+                for instance in items:
+                    context = self.get_context(instance, user=user)
+                    data = self.render_report(instance, output, context, user=user)
+
+                    self.append_report(merger, data, output)
+                    self.handle_attachment(instance, data, report_name, user, False)
+                    self.notify_plugins(instance, data, user)
+
+            report.render.save_chunk(output, chunk, merger)
+
+            if report.render.complete_chunk(output, len(items), chunks):
+                report.render.merge_chunks(output, chunks, report_name)
+        except Exception:
+            log_report_error('ReportTemplate.print_chunk')
+
+            output.refresh_from_db()
+
+            if not output.errors:
+                output.mark_failure(error=_('Error generating report'))
+
+            # The print job cannot be completed, so any rendered chunks are discarded
+            report.render.discard_chunks(output, chunks)
+        finally:
+            merger.close()
 
 
 class LabelTemplate(TemplateUploadMixin, ReportTemplateBase):
@@ -831,9 +893,11 @@ class LabelTemplate(TemplateUploadMixin, ReportTemplateBase):
             if hasattr(plugin, 'before_printing'):
                 plugin.before_printing()
 
-            plugin.print_labels(
-                self, output, items, None, user=user, printing_options=options
-            )
+            # Share rendering resources (templates, assets, fonts) between labels
+            with report.render.render_cache():
+                plugin.print_labels(
+                    self, output, items, None, user=user, printing_options=options
+                )
 
             if hasattr(plugin, 'after_printing'):
                 plugin.after_printing()
@@ -0,0 +1,306 @@
+"""Rendering pipeline for report and label printing.
+
+A print job renders the same template against many items. Within a single print job,
+the following resources are cached between renders (see render_cache):
+
+- Report and label templates (and any included snippets) are parsed only once
+- Remote resources fetched by WeasyPrint (e.g. fonts and stylesheets) are fetched only once
+- Report assets and uploaded images are loaded (and encoded) only once
+- Images and fonts are decoded only once by WeasyPrint
+
+Rendered PDF outputs are appended to the merged document as each item is rendered,
+and the merged document is written to a temporary file, rather than held in memory.
+
+Large report print jobs are split into chunks, which are rendered in parallel by the
+background worker. The last chunk to complete merges the chunk outputs into a single file.
+"""
+
+import functools
+import io
+import tempfile
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import batched
+from typing import Any, Optional
+
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+
+import structlog
+from pypdf import PdfWriter
+
+logger = structlog.get_logger('inventree')
+
+# Number of reports rendered by each background task, when a print job is split into chunks
+REPORT_CHUNK_SIZE = 50
+
+
+class RenderCache:
+    """Cache of resources which are shared between renders in a single print job."""
+
+    def __init__(self):
+        """Initialize an empty render cache."""
+        self.values: dict[tuple, Any] = {}
+
+        # Image cache, passed through to WeasyPrint
+        self.images: dict = {}
+        self._font_config = None
+
+    def get(self, namespace: str, key, func: Callable[[], Any]) -> Any:
+        """Return the cached value for the provided key, calling func() if not yet cached."""
+        cache_key = (namespace, key)
+
+        if cache_key not in self.values:
+            self.values[cache_key] = func()
+
+        return self.values[cache_key]
+
+    @property
+    def font_config(self):
+        """Return a font configuration which is shared between all rendered documents."""
+        if self._font_config is None:
+            from weasyprint.text.fonts import FontConfiguration
+
+            self._font_config = FontConfiguration()
+
+        return self._font_config
+
+
+_render_cache: ContextVar[Optional[RenderCache]] = ContextVar(
+    '_render_cache', default=None
+)
+
+
+@contextmanager
+def render_cache():
+    """Cache shared rendering resources for the duration of a print job.
+
+    Nested calls share the outermost cache.
+
+    Yields:
+        The RenderCache for the current print job
+    """
+    if (cache := _render_cache.get()) is not None:
+        yield cache
+        return
+
+    cache = RenderCache()
+    token = _render_cache.set(cache)
+
+    try:
+        yield cache
+    finally:
+        _render_cache.reset(token)
+
+
+def active_cache() -> Optional[RenderCache]:
+    """Return the render cache for the current print job (if any)."""
+    return _render_cache.get()
+
+
+def cached(namespace: str, key, func: Callable[[], Any]) -> Any:
+    """Return a cached value (if a render cache is active), otherwise call func()."""
+    if (cache := _render_cache.get()) is None:
+        return func()
+
+    try:
+        hash(key)
+    except TypeError:
+        return func()
+
+    return cache.get(namespace, key, func)
+
+
+def cache_result(namespace: str):
+    """Decorator which caches the result of a template tag for the current print job."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            return cached(namespace, key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def pdf_options() -> dict:
+    """Return additional WeasyPrint options for the current print job."""
+    if (cache := _render_cache.get()) is None:
+        return {}
+
+    return {'cache': cache.images, 'font_config': cache.font_config}
+
+
+class OutputMerger:
+    """Combine rendered outputs into a single file.
+
+    Each PDF output is appended to the merged document as soon as it is rendered,
+    so that the raw PDF data for each item does not need to be retained.
+    """
+
+    def __init__(self, debug_mode: bool = False):
+        """Initialize the merger.
+
+        Arguments:
+            debug_mode: If True, outputs are raw HTML strings (rather than PDF data)
+        """
+        self.debug_mode = debug_mode
+        self.count = 0
+        self.html: list[str] = []
+        self.writer = None if debug_mode else PdfWriter()
+        self.file = None
+
+    def append(self, data) -> None:
+        """Append a rendered output to the merged document."""
+        if self.debug_mode:
+            self.html.append(data)
+        else:
+            self.writer.append(io.BytesIO(data))
+
+        self.count += 1
+
+    def get_file(self, filename: str) -> File:
+        """Return the merged document as a file object."""
+        if self.debug_mode:
+            return ContentFile('\n'.join(self.html), filename)
+
+        self.file = tempfile.TemporaryFile()  # noqa: SIM115
+        self.writer.write(self.file)
+        self.file.seek(0)
+
+        return File(self.file, filename)
+
+    def close(self) -> None:
+        """Release any resources held by the merger."""
+        if self.writer is not None:
+            self.writer.close()
+
+        if self.file is not None:
+            self.file.close()
+
+
+def chunk_path(output_id: int, chunk: int) -> str:
+    """Return the storage path for a rendered chunk of a print job."""
+    return f'data_output/chunks/{output_id}/{chunk:05d}.pdf'
+
+
+def split_report_job(template, items: list, output, user=None) -> bool:
+    """Split a large report print job into chunks, rendered by separate background tasks.
+
+    Arguments:
+        template: The ReportTemplate to print
+        items: The items to print (in order)
+        output: The DataOutput object for the print job
+        user: The user who requested the print job
+
+    Returns:
+        True if the print job was split into chunks, otherwise False
+    """
+    from common.settings import get_global_setting
+    from InvenTree.status import is_worker_running
+    from InvenTree.tasks import offload_task
+    from report import tasks as report_tasks
+
+    if template.merge or len(items) <= REPORT_CHUNK_SIZE:
+        return False
+
+    if get_global_setting('REPORT_DEBUG_MODE', False) or not is_worker_running():
+        return False
+
+    # The report name is determined by the first item in the print job
+    report_name = template.generate_filename(template.get_context(items[0], user=user))
+
+    chunks = list(batched([item.pk for item in items], REPORT_CHUNK_SIZE))
+
+    logger.info(
+        "Splitting print job for template '%s' into %s chunks",
+        template.name,
+        len(chunks),
+    )
+
+    # The total is reset, as the requested items may include items which no longer exist
+    output.total = len(items)
+    output.progress = 0
+    output.save()
+
+    for idx, chunk in enumerate(chunks):
+        offload_task(
+            report_tasks.print_report_chunk,
+            template.pk,
+            list(chunk),
+            output.pk,
+            user.pk if user else None,
+            chunk=idx,
+            chunks=len(chunks),
+            report_name=report_name,
+            force_async=True,
+            group='report',
+        )
+
+    return True
+
+
+def save_chunk(output, chunk: int, merger: OutputMerger) -> None:
+    """Save the rendered output for a single chunk of a print job."""
+    path = chunk_path(output.pk, chunk)
+
+    if default_storage.exists(path):
+        default_storage.delete(path)
+
+    default_storage.save(path, merger.get_file(path))
+
+
+def discard_chunks(output, chunks: int) -> None:
+    """Delete any rendered chunks of a print job from storage."""
+    for chunk in range(chunks):
+        path = chunk_path(output.pk, chunk)
+
+        if default_storage.exists(path):
+            default_storage.delete(path)
+
+
+def complete_chunk(output, count: int, chunks: int) -> bool:
+    """Record the completion of a chunk of a print job.
+
+    The progress is incremented and read back within a single transaction,
+    so that exactly one chunk observes the completion of the entire print job.
+
+    If the print job has already failed, any rendered chunks are discarded.
+
+    Returns:
+        True if all chunks of the print job have now been rendered
+    """
+    from common.models import DataOutput
+
+    with transaction.atomic():
+        DataOutput.objects.filter(pk=output.pk).update(progress=F('progress') + count)
+        progress, total, errors = DataOutput.objects.values_list(
+            'progress', 'total', 'errors'
+        ).get(pk=output.pk)
+
+    if errors:
+        discard_chunks(output, chunks)
+        return False
+
+    return progress >= total
+
+
+def merge_chunks(output, chunks: int, report_name: str) -> None:
+    """Merge the rendered chunks of a print job into a single output file."""
+    merger = OutputMerger()
+
+    try:
+        for chunk in range(chunks):
+            with default_storage.open(chunk_path(output.pk, chunk)) as f:
+                merger.append(f.read())
+
+        output.refresh_from_db()
+        output.mark_complete(output=merger.get_file(report_name))
+    finally:
+        merger.close()
+        discard_chunks(output, chunks)
@@ -6,11 +6,23 @@ import structlog
 from opentelemetry import trace
 
 from InvenTree.exceptions import log_error
+from report.render import split_report_job
 
 tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger('inventree')
 
 
+def get_print_items(template, item_ids: list[int]) -> list:
+    """Return the items to print against the provided template, in the order provided."""
+    model = template.get_model()
+    items = model.objects.filter(pk__in=item_ids)
+
+    # Ensure they are sorted by the order of the provided item IDs
+    order = {pk: idx for idx, pk in enumerate(item_ids)}
+
+    return sorted(items, key=lambda item: order[item.pk])
+
+
 @tracer.start_as_current_span('print_reports')
 def print_reports(
     template_id: int, item_ids: list[int], output_id: int, user_id: int, **kwargs
@@ -49,15 +61,65 @@ def print_reports(
         user = getattr(output, 'user', None)
 
     # Fetch the items to be included in the report
-    model = template.get_model()
-    items = model.objects.filter(pk__in=item_ids)
+    items = get_print_items(template, item_ids)
 
-    # Ensure they are sorted by the order of the provided item IDs
-    items = sorted(items, key=lambda item: item_ids.index(item.pk))
+    # Large print jobs are split into chunks, and rendered in parallel
+    if split_report_job(template, items, output, user=user):
+        return
 
     template.print(items, output=output, user=user)
 
 
+@tracer.start_as_current_span('print_report_chunk')
+def print_report_chunk(
+    template_id: int,
+    item_ids: list[int],
+    output_id: int,
+    user_id: int,
+    chunk: int = 0,
+    chunks: int = 1,
+    report_name: str = '',
+    **kwargs,
+):
+    """Print a single chunk of a report print job which has been split into multiple tasks.
+
+    Arguments:
+        template_id: The ID of the ReportTemplate to use
+        item_ids: List of item IDs to generate the report against (for this chunk)
+        output_id: The ID of the DataOutput for the entire print job
+        user_id: The ID of the user to associate with the generated report
+        chunk: The index of this chunk
+        chunks: The total number of chunks in the print job
+        report_name: The filename for the merged report output
+    """
+    from common.models import DataOutput
+    from report.models import ReportTemplate
+
+    try:
+        template = ReportTemplate.objects.get(pk=template_id)
+        output = DataOutput.objects.get(pk=output_id)
+    except Exception:
+        log_error('report.tasks.print_report_chunk')
+        return
+
+    user = None
+
+    if user_id:
+        try:
+            user = get_user_model().objects.get(pk=user_id)
+        except Exception:
+            log_error('report.tasks.print_report_chunk', user_id=user_id)
+
+    if not user:
+        user = getattr(output, 'user', None)
+
+    items = get_print_items(template, item_ids)
+
+    template.print_chunk(
+        items, output, chunk, chunks, report_name or 'report.pdf', user=user
+    )
+
+
 @tracer.start_as_current_span('print_labels')
 def print_labels(
     template_id: int,
@@ -103,11 +165,7 @@ def print_labels(
         user = getattr(output, 'user', None)
 
     # Fetch the items to be included in the report
-    model = template.get_model()
-    items = model.objects.filter(pk__in=item_ids)
-
-    # Ensure they are sorted by the order of the provided item IDs
-    items = sorted(items, key=lambda item: item_ids.index(item.pk))
+    items = get_print_items(template, item_ids)
 
     plugin = registry.get_plugin(plugin_slug, active=True)
 
@@ -38,6 +38,7 @@ import common.models
 import InvenTree.helpers
 import InvenTree.helpers_model
 import report.helpers
+import report.render
 from common.settings import get_global_setting
 from company.models import Company
 from part.models import Part
@@ -234,10 +235,12 @@ def get_static_file_contents(
         else:
             return None
 
-    with staticfiles_storage.open(str(path)) as f:
-        file_data = f.read()
+    def read_file():
+        with staticfiles_storage.open(str(path)) as f:
+            return f.read()
 
-    return file_data
+    # Static files are only read once per print job
+    return report.render.cached('static', str(path), read_file)
 
 
 def get_media_file_contents(
@@ -272,14 +275,16 @@ def get_media_file_contents(
         else:
             return None
 
-    # Load the file - and return the contents
-    with default_storage.open(str(path)) as f:
-        file_data = f.read()
+    def read_file():
+        with default_storage.open(str(path)) as f:
+            return f.read()
 
-    return file_data
+    # Load the file - and return the contents (only read once per print job)
+    return report.render.cached('media', str(path), read_file)
 
 
 @register.simple_tag()
+@report.render.cache_result('asset')
 def asset(filename: str, raise_error: bool = False) -> str | None:
     """Return fully-qualified path for an upload report asset file.
 
@@ -326,6 +331,7 @@ def asset(filename: str, raise_error: bool = False) -> str | None:
 
 
 @register.simple_tag()
+@report.render.cache_result('uploaded_image')
 def uploaded_image(
     filename: str,
     replace_missing: bool = True,
@@ -445,6 +451,7 @@ def uploaded_image(
 
 
 @register.simple_tag()
+@report.render.cache_result('encode_svg_image')
 def encode_svg_image(filename: str, raise_error: bool = False) -> str:
     """Return a base64-encoded svg image data string.
 
@@ -309,6 +309,113 @@ class ReportTest(InvenTreeAPITestCase):
         self.assertIsNotNone(output.output)
         self.assertTrue(output.output.name.endswith('.pdf'))
 
+    def test_print_chunks(self):
+        """Test that a print job which is split into chunks is merged into a single output."""
+        from common.models import DataOutput
+        from report.render import chunk_path
+
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem'
+        ).first()
+
+        items = list(StockItem.objects.all()[0:5])
+
+        output = DataOutput.objects.create(
+            total=len(items),
+            progress=0,
+            output_type=DataOutput.DataOutputTypes.REPORT,
+            template_name=template.name,
+        )
+
+        template.print_chunk(items[0:2], output, 0, 2, 'chunked')
+
+        # The first chunk is stored separately until the print job is complete
+        output.refresh_from_db()
+        self.assertFalse(output.complete)
+        self.assertEqual(output.progress, 2)
+        self.assertTrue(default_storage.exists(chunk_path(output.pk, 0)))
+
+        template.print_chunk(items[2:], output, 1, 2, 'chunked')
+
+        output.refresh_from_db()
+        self.assertTrue(output.complete)
+        self.assertIsNone(output.errors)
+        self.assertTrue(output.output.name.endswith('.pdf'))
+
+        # The merged output contains a page for each item
+        with output.output.open('rb') as f:
+            self.assertGreaterEqual(len(PdfReader(f).pages), len(items))
+
+        for chunk in range(2):
+            self.assertFalse(default_storage.exists(chunk_path(output.pk, chunk)))
+
+    def test_print_chunks_failure(self):
+        """Test that rendered chunks are discarded when a chunk fails to print."""
+        from common.models import DataOutput
+        from report.render import chunk_path
+
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem'
+        ).first()
+
+        items = list(StockItem.objects.all()[0:3])
+
+        output = DataOutput.objects.create(
+            total=len(items),
+            progress=0,
+            output_type=DataOutput.DataOutputTypes.REPORT,
+            template_name=template.name,
+        )
+
+        template.print_chunk(items[0:1], output, 0, 3, 'chunked')
+        self.assertTrue(default_storage.exists(chunk_path(output.pk, 0)))
+
+        with patch.object(
+            ReportTemplate, 'render_report', side_effect=ValueError('Render error')
+        ):
+            template.print_chunk(items[1:2], output, 1, 3, 'chunked')
+
+        output.refresh_from_db()
+        self.assertFalse(output.complete)
+        self.assertIsNotNone(output.errors)
+        self.assertFalse(default_storage.exists(chunk_path(output.pk, 0)))
+
+        # A chunk which completes after the failure is also discarded
+        template.print_chunk(items[2:], output, 2, 3, 'chunked')
+
+        output.refresh_from_db()
+        self.assertFalse(output.complete)
+
+        for chunk in range(3):
+            self.assertFalse(default_storage.exists(chunk_path(output.pk, chunk)))
+
+    def test_render_cache(self):
+        """Test that the report template is only loaded once within a print job."""
+        from django.template.loaders.base import Loader
+
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem'
+        ).first()
+
+        items = StockItem.objects.all()[0:5]
+
+        loaded = []
+        get_template = Loader.get_template
+
+        def load_template(loader, template_name, skip=None):
+            loaded.append(template_name)
+            return get_template(loader, template_name, skip)
+
+        with patch.object(
+            Loader, 'get_template', autospec=True, side_effect=load_template
+        ):
+            output = template.print(items)
+
+        self.assertTrue(output.complete)
+
+        # Loaded once by the cached loader, and once (bypassing cache) for the print job
+        self.assertLessEqual(loaded.count(template.template_name), 2)
+
     def test_print_custom_template(self):
         """Create a new template, print it, and check the output."""
         template_string = """
@@ -0,0 +1,577 @@
+"""Set-based stock adjustment engine.
+
+Counting, adding, removing or transferring a list of stock items previously called the
+corresponding StockItem method (stocktake, add_stock, take_stock, move) for each item in
+turn. Each call locked, validated and saved the item separately, and the post_save hooks
+(low stock notification, pricing, availability and search index updates) were run once
+for every item.
+
+Instead, the StockAdjustmentEngine class:
+
+- Locks (and refreshes the quantity of) all of the stock items with a single query
+- Applies the quantity, location and field changes in memory
+- Writes all of the changed stock items with a single bulk_update
+- Writes all of the tracking entries with a single bulk_create
+- Dispatches the events for the operation (including the generic 'saved' event for each item,
+  which is otherwise sent by the post_save signal) with a single bulk_trigger_event call per
+  event type
+- Runs the post_save hooks once per affected part (rather than once per stock item)
+
+Adjustments which create or delete stock items - partial transfers (which split the item),
+merging into existing stock, and depleting an item which is deleted on depletion - are
+delegated to the existing StockItem methods, so their behavior is unchanged.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+import structlog
+
+import InvenTree.helpers
+import InvenTree.ready
+import InvenTree.tasks
+from common.settings import get_global_setting
+from InvenTree.tasks import batch_offload_tasks
+from plugin.base.event.events import allow_table_event, batch_events
+from plugin.events import trigger_event
+from stock.events import StockEvents
+from stock.models import StockItem, batch_tracking_entries
+from stock.status_codes import StockHistoryCode
+
+logger = structlog.get_logger('inventree')
+
+# Fields which are modified when the status of a stock item is changed
+STATUS_FIELDS = ['status', 'status_custom_key']
+
+
+class StockAdjustmentEngine:
+    """Bulk stock adjustments (count, add, remove and transfer) for a list of stock items.
+
+    Each operation accepts a list of entries (as validated by StockAdjustmentItemSerializer),
+    each containing:
+
+    - pk: The StockItem to adjust
+    - quantity: The quantity to count, add, remove or transfer
+    - batch, status, packaging: Optional field changes
+    - merge: Merge into existing stock at the destination (transfer only)
+
+    Example:
+        engine = StockAdjustmentEngine(user, notes='Moved to rack')
+        engine.transfer(items, location)
+    """
+
+    def __init__(self, user, notes: str = ''):
+        """Initialize the adjustment engine.
+
+        Arguments:
+            user: The user performing the adjustment
+            notes: Notes recorded against each tracking entry
+        """
+        self.user = user
+        self.notes = notes
+
+        # Stock items which have been modified in memory (not yet written to the database)
+        self.changed: dict[int, StockItem] = {}
+
+        # Fields which have been modified (for any of the changed stock items)
+        self.fields: set[str] = set()
+
+    @staticmethod
+    def get_extra(entry: dict) -> dict:
+        """Return the optional field changes (batch, status, packaging) for a single entry."""
+        extra = {}
+
+        for field_name in StockItem.optional_transfer_fields():
+            if field_value := entry.get(field_name):
+                extra[field_name] = field_value
+
+        return extra
+
+    @contextmanager
+    def operation(self):
+        """Run a single adjustment operation, writing all changes when it completes.
+
+        Tracking entries, events and background tasks are collected for the entire
+        operation (including any items which are adjusted individually).
+
+        Any pending changes are written *before* an item is adjusted individually,
+        as the StockItem methods may save (or merge into) other stock items.
+        """
+        with (
+            transaction.atomic(),
+            batch_events(),
+            batch_tracking_entries(),
+            batch_offload_tasks(),
+        ):
+            yield
+            self.save()
+
+    def lock(self, entries: list[dict]) -> list[tuple[dict, bool]]:
+        """Lock the database rows for all stock items, and refresh their quantities.
+
+        Rows are locked in (pk) order, with a single query. Entries for stock items which
+        no longer exist are discarded.
+
+        Returns:
+            A list of (entry, bulk) tuples, where bulk is False if the stock item is
+            referenced more than once (and so must be adjusted individually, in order)
+        """
+        pks = [entry['pk'].pk for entry in entries]
+
+        quantities = dict(
+            StockItem.objects
+            .select_for_update()
+            .filter(pk__in=pks)
+            .order_by('pk')
+            .values_list('pk', 'quantity')
+        )
+
+        counts = Counter(pks)
+        result = []
+
+        for entry in entries:
+            item = entry['pk']
+
+            if item.pk not in quantities:
+                continue
+
+            item.quantity = quantities[item.pk]
+            result.append((entry, counts[item.pk] == 1))
+
+        return result
+
+    def update(self, item: StockItem, fields: list[str]) -> None:
+        """Validate the changes made to a stock item, and mark it for update.
+
+        Only the checks performed by StockItem.clean() which relate to the modified
+        fields are repeated here.
+        """
+        if 'location' in fields and item.location and item.location.structural:
+            raise ValidationError({
+                'location': _(
+                    'Stock items cannot be located into structural stock locations!'
+                )
+            })
+
+        if 'batch' in fields:
+            if type(item.batch) is str:
+                item.batch = item.batch.strip()
+
+            item.validate_batch_code()
+
+        if 'quantity' in fields:
+            if item.part.trackable and item.quantity != int(item.quantity):
+                raise ValidationError({
+                    'quantity': _('Quantity must be integer value for trackable parts')
+                })
+
+            if item.quantity < 0:
+                raise ValidationError({
+                    'quantity': _('Quantity must be greater than zero')
+                })
+
+        self.changed[item.pk] = item
+        self.fields.update(fields)
+
+    def changed_fields(self, deltas: dict, kwargs: dict) -> list[str]:
+        """Return the fields modified by a status change and / or optional field changes."""
+        fields = [field for field in ['batch', 'packaging'] if field in kwargs]
+
+        if 'status' in deltas:
+            fields.extend(STATUS_FIELDS)
+
+        return fields
+
+    def save(self) -> None:
+        """Write all changed stock items to the database, and run the post-save hooks."""
+        items = list(self.changed.values())
+
+        self.changed = {}
+        fields, self.fields = sorted(self.fields), set()
+
+        if not items:
+            return
+
+        StockItem.objects.bulk_update(items, fields, batch_size=250)
+
+        self.after_save(items)
+
+        logger.info('Adjusted %s stock items', len(items))
+
+    def after_save(self, items: list[StockItem]) -> None:
+        """Run the post_save hooks for the provided stock items (see after_save_stock_item).
+
+        bulk_update does not send post_save signals, so the hooks are run here,
+        once per affected part.
+        """
+        import common.search
+        from part import tasks as part_tasks
+        from part.availability import schedule_availability_update
+
+        # The generic 'saved' event for each item (see plugin.base.event.events.after_save)
+        table = StockItem._meta.db_table
+
+        if allow_table_event(table):
+            for item in items:
+                trigger_event(f'{table}.saved', id=item.pk, model=StockItem.__name__)
+
+        if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+            return
+
+        parts = {item.part_id: item.part for item in items}
+
+        if InvenTree.ready.canAppAccessDatabase(allow_test=True):
+            for part_id in parts:
+                InvenTree.tasks.offload_task(
+                    part_tasks.notify_low_stock_if_required,
+                    part_id,
+                    group='notification',
+                    force_async=True,
+                )
+
+        if InvenTree.ready.canAppAccessDatabase(allow_test=settings.TESTING_PRICING):
+            for part in parts.values():
+                part.schedule_pricing_update(create=True)
+
+        schedule_availability_update(parts.keys())
+
+        if common.search.index_available():
+            common.search.update_instances(StockItem, [item.pk for item in items])
+
+    def count(self, entries: list[dict], location=None) -> None:
+        """Count (stocktake) the provided stock items - see StockItem.stocktake.
+
+        Arguments:
+            entries: The stock items to count, and their new quantities
+            location: Optionally set the stock location for the counted items
+        """
+        with self.operation():
+            for entry, bulk in self.lock(entries):
+                item = entry['pk']
+                count = Decimal(entry['quantity'])
+
+                extra = self.get_extra(entry)
+
+                if location is not None:
+                    extra['location'] = location
+
+                if (
+                    not bulk
+                    or item.serialized
+                    or (count == 0 and item.delete_on_deplete)
+                ):
+                    self.save()
+                    item.stocktake(count, self.user, notes=self.notes, **extra)
+                    continue
+
+                self.stocktake(item, count, **extra)
+
+    def stocktake(self, item: StockItem, count: Decimal, **kwargs) -> None:
+        """Apply a stocktake to a single (non-serialized) stock item, in memory."""
+        if count < 0:
+            return
+
+        tracking_info = {}
+        fields = []
+
+        location = kwargs.pop('location', None)
+
+        if location and location.pk != item.location_id:
+            old_location = item.location_id
+            item.location = location
+            tracking_info['location'] = location.pk
+            tracking_info['old_location'] = old_location
+            fields.append('location')
+
+        status = item._resolve_status_kwarg(kwargs)
+        item._apply_status_change(status, tracking_info)
+
+        item._apply_optional_transfer_fields(kwargs, tracking_info)
+        fields.extend(self.changed_fields(tracking_info, kwargs))
+
+        fields_updated = len(tracking_info) > 0
+        quantity_updated = count != item.quantity
+
+        if fields_updated or quantity_updated:
+            item.stocktake_date = InvenTree.helpers.current_date()
+            item.stocktake_user = self.user
+            fields.extend(['stocktake_date', 'stocktake_user'])
+
+        if quantity_updated:
+            item.quantity = count
+            fields.append('quantity')
+
+            trigger_event(
+                StockEvents.ITEM_QUANTITY_UPDATED,
+                id=item.id,
+                quantity=float(item.quantity),
+            )
+
+        tracking_info['quantity'] = float(item.quantity)
+
+        if fields:
+            self.update(item, fields)
+
+            trigger_event(
+                StockEvents.ITEM_COUNTED, id=item.id, quantity=float(item.quantity)
+            )
+
+        item.add_tracking_entry(
+            StockHistoryCode.STOCK_COUNT,
+            self.user,
+            notes=self.notes,
+            deltas=tracking_info,
+        )
+
+    def add(self, entries: list[dict]) -> None:
+        """Add stock to the provided stock items - see StockItem.add_stock."""
+        with self.operation():
+            for entry, bulk in self.lock(entries):
+                item = entry['pk']
+                quantity = entry['quantity']
+
+                if quantity is None or quantity <= 0:
+                    # Ignore in this case - no stock to add
+                    continue
+
+                extra = self.get_extra(entry)
+
+                if not bulk or item.serialized:
+                    self.save()
+                    item.add_stock(quantity, self.user, notes=self.notes, **extra)
+                    continue
+
+                tracking_info = {}
+
+                status = item._resolve_status_kwarg(extra)
+                item._apply_status_change(status, tracking_info)
+
+                item.quantity = item.quantity + Decimal(quantity)
+
+                trigger_event(
+                    StockEvents.ITEM_QUANTITY_UPDATED,
+                    id=item.id,
+                    quantity=float(item.quantity),
+                )
+
+                tracking_info['added'] = float(quantity)
+                tracking_info['quantity'] = float(item.quantity)
+
+                item._apply_optional_transfer_fields(extra, tracking_info)
+
+                self.update(
+                    item, ['quantity', *self.changed_fields(tracking_info, extra)]
+                )
+
+                item.add_tracking_entry(
+                    StockHistoryCode.STOCK_ADD,
+                    self.user,
+                    notes=self.notes,
+                    deltas=tracking_info,
+                )
+
+    def remove(self, entries: list[dict]) -> None:
+        """Remove stock from the provided stock items - see StockItem.take_stock."""
+        with self.operation():
+            for entry, bulk in self.lock(entries):
+                item = entry['pk']
+
+                if entry['quantity'] is None or entry['quantity'] <= 0:
+                    # Ignore in this case - no stock to remove
+                    continue
+
+                # Cannot remove more than the available quantity
+                quantity = min(Decimal(entry['quantity']), item.quantity)
+
+                extra = self.get_extra(entry)
+
+                if (
+                    not bulk
+                    or item.serialized
+                    or (quantity >= item.quantity and item.delete_on_deplete)
+                ):
+                    self.save()
+                    item.take_stock(
+                        entry['quantity'], self.user, notes=self.notes, **extra
+                    )
+                    continue
+
+                if quantity <= 0:
+                    continue
+
+                deltas = {}
+
+                status = item._resolve_status_kwarg(extra)
+                item._apply_status_change(status, deltas)
+
+                item.quantity = item.quantity - quantity
+
+                trigger_event(
+                    StockEvents.ITEM_QUANTITY_UPDATED,
+                    id=item.id,
+                    quantity=float(item.quantity),
+                )
+
+                deltas['removed'] = float(quantity)
+                deltas['quantity'] = float(item.quantity)
+
+                item._apply_optional_transfer_fields(extra, deltas)
+
+                self.update(item, ['quantity', *self.changed_fields(deltas, extra)])
+
+                item.add_tracking_entry(
+                    StockHistoryCode.STOCK_REMOVE,
+                    self.user,
+                    notes=self.notes,
+                    deltas=deltas,
+                )
+
+    def transfer(self, entries: list[dict], location) -> None:
+        """Transfer (move) the provided stock items to a new location - see StockItem.move.
+
+        Arguments:
+            entries: The stock items to transfer, and the quantity to transfer
+            location: The destination stock location
+        """
+        allow_out_of_stock_transfer = get_global_setting(
+            'STOCK_ALLOW_OUT_OF_STOCK_TRANSFER', backup_value=False, cache=False
+        )
+
+        with self.operation():
+            for entry, bulk in self.lock(entries):
+                item = entry['pk']
+                quantity = entry['quantity']
+
+                extra = self.get_extra(entry)
+
+                target = None
+
+                if entry.get('merge', False):
+                    target = item.find_merge_target(location)
+
+                if target:
+                    self.save()
+                    self.merge(item, target, quantity, location, extra)
+                    continue
+
+                if not bulk or quantity < item.quantity:
+                    # Partial transfers split the stock item
+                    self.save()
+                    item.move(
+                        location, self.notes, self.user, quantity=quantity, **extra
+                    )
+                    continue
+
+                if not allow_out_of_stock_transfer and not self.in_stock(item):
+                    raise ValidationError(
+                        _('StockItem cannot be moved as it is not in stock')
+                    )
+
+                self.move(item, Decimal(quantity), location, **extra)
+
+    def in_stock(self, item: StockItem) -> bool:
+        """Determine if a stock item can be moved (see StockItem.is_in_stock).
+
+        Related objects are checked by ID, to avoid a query for each stock item.
+        """
+        return all([
+            item.quantity > 0,
+            item.sales_order_id is None,
+            item.belongs_to_id is None,
+            item.customer_id is None,
+            item.consumed_by_id is None,
+        ])
+
+    def move(self, item: StockItem, quantity: Decimal, location, **kwargs) -> None:
+        """Move the entire quantity of a single stock item to a new location, in memory."""
+        if quantity <= 0 or location is None:
+            return
+
+        old_location = item.location_id
+
+        # Moving into the same location triggers a different history code
+        same_location = location.pk == item.location_id
+
+        item.location = location
+
+        tracking_info = {'quantity': float(quantity)}
+
+        tracking_code = StockHistoryCode.STOCK_MOVE
+
+        if same_location:
+            tracking_code = StockHistoryCode.STOCK_UPDATE
+        else:
+            tracking_info['location'] = location.pk
+
+        status = item._resolve_status_kwarg(kwargs)
+        item._apply_status_change(status, tracking_info)
+
+        item._apply_optional_transfer_fields(kwargs, tracking_info)
+
+        self.update(item, ['location', *self.changed_fields(tracking_info, kwargs)])
+
+        item.add_tracking_entry(
+            tracking_code, self.user, notes=self.notes, deltas=tracking_info
+        )
+
+        trigger_event(
+            StockEvents.ITEM_MOVED,
+            id=item.id,
+            old_location=old_location,
+            new_location=location.id,
+            quantity=quantity,
+        )
+
+    def merge(
+        self,
+        item: StockItem,
+        target: StockItem,
+        quantity: Decimal,
+        location,
+        extra: dict,
+    ) -> None:
+        """Transfer a stock item by merging it into existing stock at the destination."""
+        merge_kwargs = {
+            'location': location,
+            'notes': self.notes,
+            'user': self.user,
+            **extra,
+        }
+
+        if quantity < item.quantity:
+            transfer_deltas = {}
+
+            piece = item.splitStock(
+                quantity,
+                location,
+                self.user,
+                notes=self.notes,
+                allow_production=True,
+                record_tracking=False,
+                split_transfer_deltas=transfer_deltas,
+                **extra,
+            )
+
+            if not piece:
+                return
+
+            merge_kwargs['transfer_deltas'] = transfer_deltas
+            target.merge_stock_items([piece], **merge_kwargs)
+        else:
+            transfer_deltas = {'stockitem': item.pk}
+
+            if location:
+                transfer_deltas['location'] = location.pk
+
+            for field_name in StockItem.optional_transfer_fields():
+                if field_name in extra:
+                    transfer_deltas[field_name] = extra[field_name]
+
+            merge_kwargs['transfer_deltas'] = transfer_deltas
+            target.merge_stock_items([item], **merge_kwargs)
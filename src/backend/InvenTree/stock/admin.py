@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.db.models import Count
 
 from .models import (
+    SerialNumberIndex,
     StockItem,
     StockItemTestResult,
     StockItemTracking,
@@ -113,3 +114,18 @@ class StockItemTestResultAdmin(admin.ModelAdmin):
     ]
 
     autocomplete_fields = ['stock_item']
+
+
+@admin.register(SerialNumberIndex)
+class SerialNumberIndexAdmin(admin.ModelAdmin):
+    """Admin interface for SerialNumberIndex objects - read-only lookup table."""
+
+    list_display = ('tree_id', 'serial', 'serial_int')
+
+    def has_add_permission(self, request):
+        """Prevent addition of new SerialNumberIndex objects via the admin interface."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Prevent modification of SerialNumberIndex objects via the admin interface."""
+        return False
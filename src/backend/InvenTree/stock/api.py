@@ -43,7 +43,7 @@ from InvenTree.filters import (
     InvenTreeDateFilter,
     NumberOrNullFilter,
 )
-from InvenTree.helpers import extract_serial_numbers, generateTestKey, str2bool
+from InvenTree.helpers import generateTestKey, str2bool
 from InvenTree.mixins import (
     CreateAPI,
     CustomRetrieveUpdateDestroyAPI,
@@ -1222,8 +1222,10 @@ class StockList(
 
             # If serial numbers are specified, check that they match!
             try:
-                serials = extract_serial_numbers(
-                    serial_numbers, quantity, part.get_latest_serial_number(), part=part
+                # Any "next" serial numbers are reserved, so that concurrent
+                # requests cannot be allocated the same serial numbers
+                serials = part.extract_serial_numbers(
+                    serial_numbers, quantity, reserve=True
                 )
 
                 # Determine if any of the specified serial numbers are invalid
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stock", "0127_alter_stockitemtestresult_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SerialNumberIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "tree_id",
+                    models.PositiveIntegerField(
+                        help_text="Part tree ID (zero for global scope)",
+                        unique=True,
+                        verbose_name="Tree ID",
+                    ),
+                ),
+                (
+                    "serial",
+                    models.CharField(
+                        blank=True,
+                        help_text="Latest serial number in this scope",
+                        max_length=100,
+                        verbose_name="Serial Number",
+                    ),
+                ),
+                (
+                    "serial_int",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Integer representation of the latest serial number",
+                        verbose_name="Serial Integer",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Serial Number Index",
+            },
+        ),
+    ]
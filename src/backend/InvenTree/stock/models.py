@@ -512,6 +512,9 @@ class StockItem(
 
         notes = kwargs.pop('notes', '')
 
+        # The part this item was previously assigned to (if it has changed)
+        self._previous_part_id = None
+
         if self.pk:
             # StockItem has already been saved
 
@@ -520,6 +523,10 @@ class StockItem(
 
             try:
                 old = StockItem.objects.get(pk=self.pk)
+
+                if old.part_id != self.part_id:
+                    self._previous_part_id = old.part_id
+
                 old_custom_status = old.get_custom_status()
                 custom_status = self.get_custom_status()
 
@@ -682,43 +689,18 @@ class StockItem(
         That scope depends on Part.tree_id, which is not a field on
         StockItem, so it cannot be expressed as a database-level
         UniqueConstraint on StockItem directly (a UniqueConstraint cannot
-        reference a joined field). Instead, this select_for_update()s
-        existing rows that already represent the relevant scope - every Part
-        in the tree, or (for the globally-unique case, where there is no
-        single tree to lock) the SERIAL_NUMBER_GLOBALLY_UNIQUE setting's own
-        row - so concurrent creation attempts within the same scope
-        serialize against each other. It then re-checks for conflicts
-        against StockItem while holding that lock. This closes the race
-        where two concurrent requests both read "no conflict" before either
-        has committed its creation.
+        reference a joined field). Instead, this select_for_update()s the
+        SerialNumberIndex entry which represents the relevant scope (a single
+        row, regardless of the size of the part tree), so concurrent creation
+        attempts within the same scope serialize against each other. It then
+        re-checks for conflicts against StockItem while holding that lock.
+        This closes the race where two concurrent requests both read
+        "no conflict" before either has committed its creation.
 
         Raises:
             ValidationError: If any of the provided serial numbers now conflict
         """
-        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
-            # There is no single Part tree covering "globally unique" - lock
-            # the setting's own row instead, so all concurrent global-scope
-            # creation attempts serialize against each other regardless of
-            # which part is involved. This row is guaranteed to already
-            # exist: reaching this branch means the setting is currently
-            # True, which can only happen if it was explicitly set (and
-            # therefore persisted) at some point.
-            setting, _created = common.models.InvenTreeSetting.objects.get_or_create(
-                key='SERIAL_NUMBER_GLOBALLY_UNIQUE', defaults={'value': str(True)}
-            )
-            common.models.InvenTreeSetting.objects.select_for_update().get(
-                pk=setting.pk
-            )
-        else:
-            # Lock every Part in this variant tree (this always includes
-            # 'part' itself), so concurrent creation attempts for any part in
-            # the same tree serialize against each other
-            list(
-                PartModels.Part.objects
-                .select_for_update()
-                .filter(tree_id=part.tree_id)
-                .order_by('pk')
-            )
+        SerialNumberIndex.get_entry(part, lock=True)
 
         # Re-validate for conflicts now that the lock is held - any
         # concurrent request for the same scope has either already committed
@@ -834,6 +816,11 @@ class StockItem(
         except IntegrityError as exc:
             raise ValidationError({'serial_numbers': str(exc)}) from exc
 
+        # bulk_create does not send post_save signals
+        SerialNumberIndex.update_serials(
+            data['part'].tree_id, [(item.serial_int, item.serial) for item in items]
+        )
+
         # Trigger a 'created' event for the new items
         # Note that instead of a single event for each item,
         # we trigger a single event for all items created
@@ -3642,6 +3629,269 @@ def after_save_stock_item(sender, instance: StockItem, created, **kwargs):
             instance.part.schedule_pricing_update(create=True)
 
 
+class SerialNumberIndex(models.Model):
+    """Index of the latest (highest) serial number assigned within a serial number scope.
+
+    Serial numbers are unique either across a Part variant tree (the default),
+    or across all parts (if SERIAL_NUMBER_GLOBALLY_UNIQUE is enabled).
+    An index entry is stored for each part tree (keyed by tree_id),
+    and for the global scope (tree_id = 0).
+
+    The index stores a "high-water mark" which only ever increases - it is not lowered
+    when serialized stock items are deleted, so serial numbers are not re-issued.
+    Entries are created on demand, and are updated as serialized stock is created
+    (or reserved via the reserve() method).
+
+    The index can be rebuilt with the 'rebuild_serial_index' management command.
+
+    Attributes:
+        tree_id: Part tree ID for this index entry (0 = global scope)
+        serial: The latest serial number in this scope
+        serial_int: Integer representation of the latest serial number
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Serial Number Index')
+
+    # Scope identifier used when serial numbers are globally unique
+    GLOBAL_SCOPE = 0
+
+    tree_id = models.PositiveIntegerField(
+        unique=True,
+        verbose_name=_('Tree ID'),
+        help_text=_('Part tree ID (zero for global scope)'),
+    )
+
+    serial = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name=_('Serial Number'),
+        help_text=_('Latest serial number in this scope'),
+    )
+
+    serial_int = models.IntegerField(
+        default=0,
+        verbose_name=_('Serial Integer'),
+        help_text=_('Integer representation of the latest serial number'),
+    )
+
+    def __str__(self):
+        """Return a string representation of this index entry."""
+        return f'{self.tree_id}: {self.serial}'
+
+    @classmethod
+    def get_scope(cls, part: PartModels.Part) -> int:
+        """Return the serial number scope for the provided part."""
+        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            return cls.GLOBAL_SCOPE
+
+        return part.tree_id
+
+    @staticmethod
+    def scope_items(scope: int) -> QuerySet:
+        """Return all serialized stock items within the provided scope."""
+        items = StockItem.objects.exclude(serial=None).exclude(serial='')
+
+        if scope != SerialNumberIndex.GLOBAL_SCOPE:
+            items = items.filter(part__tree_id=scope)
+
+        return items
+
+    @classmethod
+    def calculate(cls, scope: int) -> tuple[int, str]:
+        """Calculate the latest serial number for a scope, from the StockItem table.
+
+        Returns:
+            A (serial_int, serial) tuple - or (0, '') if there are no serialized items
+        """
+        latest = (
+            cls
+            .scope_items(scope)
+            .order_by('-serial_int', '-serial', '-pk')
+            .values_list('serial_int', 'serial')
+            .first()
+        )
+
+        return latest or (0, '')
+
+    @classmethod
+    def get_entry(cls, part: PartModels.Part, lock: bool = False):
+        """Return the index entry for the scope of the provided part.
+
+        If the entry does not yet exist, it is calculated from the StockItem table.
+
+        Arguments:
+            part: The Part instance to find the index entry for
+            lock: If True, lock the index entry (must be called within a transaction)
+        """
+        scope = cls.get_scope(part)
+
+        entries = cls.objects.filter(tree_id=scope)
+
+        if lock:
+            entries = entries.select_for_update()
+
+        if entry := entries.first():
+            return entry
+
+        serial_int, serial = cls.calculate(scope)
+
+        try:
+            with transaction.atomic():
+                cls.objects.create(tree_id=scope, serial=serial, serial_int=serial_int)
+        except IntegrityError:
+            # Entry was created by a concurrent request
+            pass
+
+        return entries.get()
+
+    @classmethod
+    def latest_serial(cls, part: PartModels.Part) -> str | None:
+        """Return the latest serial number for the provided part (or None)."""
+        entry = cls.get_entry(part)
+
+        return entry.serial or None
+
+    @classmethod
+    def update_serials(cls, part_tree_id: int, serials) -> None:
+        """Raise the high-water mark for a part tree (and the global scope).
+
+        Arguments:
+            part_tree_id: The tree_id of the part which the serials are assigned to
+            serials: Iterable of (serial_int, serial) tuples which have been assigned
+
+        Index entries which do not yet exist are ignored (they are calculated on demand).
+        """
+        serials = [(n or 0, str(s)) for n, s in serials if s not in [None, '']]
+
+        if not serials:
+            return
+
+        serial_int, serial = max(serials)
+
+        # Conditional update, so that concurrent updates cannot lower the value
+        cls.objects.filter(
+            Q(serial_int__lt=serial_int) | Q(serial_int=serial_int, serial__lt=serial),
+            tree_id__in=[part_tree_id, cls.GLOBAL_SCOPE],
+        ).update(serial_int=serial_int, serial=serial)
+
+    @classmethod
+    @transaction.atomic
+    def reserve(cls, part: PartModels.Part, quantity: int) -> list[str]:
+        """Atomically reserve a contiguous range of new serial numbers.
+
+        The range starts after the latest serial number for the part,
+        and the high-water mark is advanced to the end of the range,
+        so that concurrent reservations receive distinct ranges.
+
+        Arguments:
+            part: The Part instance to reserve serial numbers for
+            quantity: The number of serial numbers to reserve
+
+        Returns:
+            A list of reserved serial numbers
+
+        Raises:
+            ValidationError: If the required number of serial numbers could not be generated
+        """
+        if quantity <= 0:
+            return []
+
+        # Lock the index entry, so that concurrent reservations are serialized
+        cls.get_entry(part, lock=True)
+
+        serials = []
+
+        # Note that the latest serial number may be provided by a plugin
+        sn = part.get_latest_serial_number()
+
+        while len(serials) < quantity:
+            sn = InvenTree.helpers.increment_serial_number(sn, part=part)
+
+            # Exit if an empty or duplicated serial is generated
+            if not sn or sn in serials:
+                break
+
+            serials.append(sn)
+
+        if len(serials) < quantity:
+            raise ValidationError({
+                'quantity': _(
+                    'Unable to generate the required number of serial numbers'
+                )
+            })
+
+        conflicts = part.find_conflicting_serial_numbers(serials)
+
+        if conflicts:
+            msg = _('The following serial numbers already exist or are invalid')
+            msg += ' : '
+            msg += ','.join(str(x) for x in conflicts)
+            raise ValidationError({'serial_numbers': msg})
+
+        cls.update_serials(
+            part.tree_id, [(StockItem.convert_serial_to_int(serials[-1]), serials[-1])]
+        )
+
+        return serials
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Remove all index entries (they will be recalculated on demand).
+
+        Required when part tree IDs change (e.g. a part is moved to a different variant tree).
+        """
+        cls.objects.all().delete()
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Rebuild the index entries for all scopes which contain serialized stock.
+
+        Returns:
+            The number of index entries created
+        """
+        entries = []
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+
+            tree_ids = (
+                cls
+                .scope_items(cls.GLOBAL_SCOPE)
+                .values_list('part__tree_id', flat=True)
+                .distinct()
+                .order_by()
+            )
+
+            for scope in [cls.GLOBAL_SCOPE, *tree_ids]:
+                serial_int, serial = cls.calculate(scope)
+
+                if serial:
+                    entries.append(
+                        cls(tree_id=scope, serial=serial, serial_int=serial_int)
+                    )
+
+            cls.objects.bulk_create(entries, batch_size=1000)
+
+        return len(entries)
+
+
+@receiver(post_save, sender=StockItem, dispatch_uid='stock_item_serial_index_save')
+def update_serial_index_after_save(sender, instance: StockItem, **kwargs):
+    """Update the serial number index when a serialized StockItem is saved."""
+    if InvenTree.ready.isRunningMigrations() or not instance.serial:
+        return
+
+    try:
+        tree_id = instance.part.tree_id
+    except PartModels.Part.DoesNotExist:
+        return
+
+    SerialNumberIndex.update_serials(tree_id, [(instance.serial_int, instance.serial)])
+
+
 # Context-local batch of pending StockItemTracking entries (see batch_tracking_entries())
 _tracking_batch: contextvars.ContextVar = contextvars.ContextVar(
     'tracking_batch', default=None
@@ -44,6 +44,7 @@ from InvenTree.tasks import batch_offload_tasks
 from plugin.base.event.events import batch_events
 from users.serializers import UserSerializer
 
+from .adjustment import StockAdjustmentEngine
 from .models import (
     StockItem,
     StockItemTestResult,
@@ -771,12 +772,7 @@ class SerializeStockItemSerializer(serializers.Serializer):
         serial_numbers = data['serial_numbers']
 
         try:
-            serials = InvenTree.helpers.extract_serial_numbers(
-                serial_numbers,
-                quantity,
-                item.part.get_latest_serial_number(),
-                part=item.part,
-            )
+            serials = item.part.extract_serial_numbers(serial_numbers, quantity)
         except DjangoValidationError as e:
             raise ValidationError({'serial_numbers': e.messages})
 
@@ -806,19 +802,18 @@ class SerializeStockItemSerializer(serializers.Serializer):
 
         data = self.validated_data
 
-        serials = InvenTree.helpers.extract_serial_numbers(
-            data['serial_numbers'],
-            data['quantity'],
-            item.part.get_latest_serial_number(),
-            part=item.part,
-        )
-
         with (
             transaction.atomic(),
             batch_events(),
             batch_tracking_entries(),
             batch_offload_tasks(),
         ):
+            # Any "next" serial numbers are reserved, so that concurrent requests
+            # cannot be allocated the same serial numbers
+            serials = item.part.extract_serial_numbers(
+                data['serial_numbers'], data['quantity'], reserve=True
+            )
+
             return (
                 item.serializeStock(
                     data['quantity'],
@@ -2034,31 +2029,9 @@ class StockCountSerializer(StockAdjustmentSerializer):
         request = self.context['request']
 
         data = self.validated_data
-        items = data['items']
-        notes = data.get('notes', '')
-        location = data.get('location', None)
 
-        with (
-            transaction.atomic(),
-            batch_events(),
-            batch_tracking_entries(),
-            batch_offload_tasks(),
-        ):
-            for item in items:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                if location is not None:
-                    extra['location'] = location
-
-                stock_item.stocktake(quantity, request.user, notes=notes, **extra)
+        engine = StockAdjustmentEngine(request.user, notes=data.get('notes', ''))
+        engine.count(data['items'], location=data.get('location', None))
 
 
 class StockAddSerializer(StockAdjustmentSerializer):
@@ -2069,30 +2042,9 @@ class StockAddSerializer(StockAdjustmentSerializer):
         request = self.context['request']
 
         data = self.validated_data
-        notes = data.get('notes', '')
-
-        with (
-            transaction.atomic(),
-            batch_events(),
-            batch_tracking_entries(),
-            batch_offload_tasks(),
-        ):
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                if quantity is None or quantity <= 0:
-                    # Ignore in this case - no stock to add
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
 
-                stock_item.add_stock(quantity, request.user, notes=notes, **extra)
+        engine = StockAdjustmentEngine(request.user, notes=data.get('notes', ''))
+        engine.add(data['items'])
 
 
 class StockRemoveSerializer(StockAdjustmentSerializer):
@@ -2103,30 +2055,9 @@ class StockRemoveSerializer(StockAdjustmentSerializer):
         request = self.context['request']
 
         data = self.validated_data
-        notes = data.get('notes', '')
 
-        with (
-            transaction.atomic(),
-            batch_events(),
-            batch_tracking_entries(),
-            batch_offload_tasks(),
-        ):
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Ignore in this case - no stock to remove
-                if quantity is None or quantity <= 0:
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.take_stock(quantity, request.user, notes=notes, **extra)
+        engine = StockAdjustmentEngine(request.user, notes=data.get('notes', ''))
+        engine.remove(data['items'])
 
 
 class StockTransferSerializer(StockAdjustmentSerializer):
@@ -2163,77 +2094,8 @@ class StockTransferSerializer(StockAdjustmentSerializer):
 
         data = self.validated_data
 
-        items = data['items']
-        notes = data.get('notes', '')
-        location = data['location']
-
-        with (
-            transaction.atomic(),
-            batch_events(),
-            batch_tracking_entries(),
-            batch_offload_tasks(),
-        ):
-            for item in items:
-                # Required fields
-                stock_item = item['pk']
-                quantity = item['quantity']
-                merge = item.get('merge', False)
-
-                # Optional fields
-                kwargs = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        kwargs[field_name] = field_value
-
-                if merge:
-                    target = stock_item.find_merge_target(location)
-
-                    if target:
-                        merge_kwargs = {
-                            'location': location,
-                            'notes': notes,
-                            'user': request.user,
-                            **kwargs,
-                        }
-
-                        if quantity < stock_item.quantity:
-                            transfer_deltas = {}
-
-                            piece = stock_item.splitStock(
-                                quantity,
-                                location,
-                                request.user,
-                                notes=notes,
-                                allow_production=True,
-                                record_tracking=False,
-                                split_transfer_deltas=transfer_deltas,
-                                **kwargs,
-                            )
-
-                            if not piece:
-                                continue
-
-                            merge_kwargs['transfer_deltas'] = transfer_deltas
-                            target.merge_stock_items([piece], **merge_kwargs)
-                        else:
-                            transfer_deltas = {'stockitem': stock_item.pk}
-
-                            if location:
-                                transfer_deltas['location'] = location.pk
-
-                            for field_name in StockItem.optional_transfer_fields():
-                                if field_name in kwargs:
-                                    transfer_deltas[field_name] = kwargs[field_name]
-
-                            merge_kwargs['transfer_deltas'] = transfer_deltas
-                            target.merge_stock_items([stock_item], **merge_kwargs)
-
-                        continue
-
-                stock_item.move(
-                    location, notes, request.user, quantity=quantity, **kwargs
-                )
+        engine = StockAdjustmentEngine(request.user, notes=data.get('notes', ''))
+        engine.transfer(data['items'], data['location'])
 
 
 class StockReturnSerializer(StockAdjustmentSerializer):
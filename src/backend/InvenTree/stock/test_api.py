@@ -22,6 +22,7 @@ from common.settings import set_global_setting
 from InvenTree.unit_test import (
     InvenTreeAPIPerformanceTestCase,
     InvenTreeAPITestCase,
+    activateEventPlugin,
     findOffloadedEvent,
 )
 from part.models import Part, PartTestTemplate
@@ -3260,6 +3261,102 @@ class StocktakeTest(StockAPITestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(len(response.data['items']), 100)
 
+    def test_bulk_adjustment_semantics(self):
+        """Bulk adjustments retain the per-item behavior (depletion, splitting)."""
+        part = Part.objects.create(
+            name='Bulk adjustment part', description='Bulk adjustment part'
+        )
+
+        source = StockLocation.objects.create(name='Bulk adjustment source')
+        destination = StockLocation.objects.create(name='Bulk adjustment destination')
+
+        depleted, full, partial = [
+            StockItem.objects.create(
+                part=part, location=source, quantity=10, delete_on_deplete=True
+            )
+            for _ in range(3)
+        ]
+
+        # Remove stock (one item is depleted, and deleted)
+        self.post(
+            reverse('api-stock-remove'),
+            {
+                'items': [
+                    {'pk': depleted.pk, 'quantity': 10},
+                    {'pk': full.pk, 'quantity': 4},
+                    {'pk': partial.pk, 'quantity': 4},
+                ]
+            },
+            expected_code=201,
+        )
+
+        self.assertFalse(StockItem.objects.filter(pk=depleted.pk).exists())
+
+        for item in [full, partial]:
+            item.refresh_from_db()
+            self.assertEqual(item.quantity, 6)
+
+            entry = item.tracking_info.latest('pk')
+            self.assertEqual(entry.tracking_type, StockHistoryCode.STOCK_REMOVE)
+            self.assertEqual(entry.deltas['removed'], 4)
+            self.assertEqual(entry.deltas['quantity'], 6)
+
+        # Transfer stock (a partial transfer splits the item)
+        self.post(
+            reverse('api-stock-transfer'),
+            {
+                'items': [
+                    {'pk': full.pk, 'quantity': 6},
+                    {'pk': partial.pk, 'quantity': 2},
+                ],
+                'location': destination.pk,
+            },
+            expected_code=201,
+        )
+
+        full.refresh_from_db()
+        partial.refresh_from_db()
+
+        self.assertEqual(full.location, destination)
+        self.assertEqual(full.quantity, 6)
+        self.assertEqual(
+            full.tracking_info.latest('pk').tracking_type, StockHistoryCode.STOCK_MOVE
+        )
+
+        self.assertEqual(partial.location, source)
+        self.assertEqual(partial.quantity, 4)
+
+        split = StockItem.objects.get(parent=partial)
+        self.assertEqual(split.location, destination)
+        self.assertEqual(split.quantity, 2)
+
+        # Count stock (the same item may be referenced more than once)
+        self.post(
+            reverse('api-stock-count'),
+            {
+                'items': [
+                    {'pk': full.pk, 'quantity': 8},
+                    {'pk': partial.pk, 'quantity': 3},
+                    {'pk': partial.pk, 'quantity': 5},
+                ]
+            },
+            expected_code=201,
+        )
+
+        full.refresh_from_db()
+        partial.refresh_from_db()
+
+        self.assertEqual(full.quantity, 8)
+        self.assertEqual(partial.quantity, 5)
+        self.assertIsNotNone(full.stocktake_date)
+
+        self.assertEqual(
+            partial.tracking_info.filter(
+                tracking_type=StockHistoryCode.STOCK_COUNT
+            ).count(),
+            2,
+        )
+
 
 class StockTransferMergeTest(StockAPITestCase):
     """Tests for optional merge-on-transfer behavior."""
@@ -3775,6 +3872,7 @@ class StockTestResultTest(StockAPITestCase):
         tests = []
 
         set_global_setting('ENABLE_PLUGINS_EVENTS', True)
+        activateEventPlugin()
 
         url = reverse('api-stock-test-result-list')
 
@@ -18,7 +18,7 @@ from rest_framework.test import APIClient
 from build.models import Build
 from common.models import InvenTreeSetting
 from company.models import Company
-from InvenTree.unit_test import AdminTestCase, InvenTreeTestCase
+from InvenTree.unit_test import AdminTestCase, InvenTreeTestCase, activateEventPlugin
 from order.models import SalesOrder
 from part.models import Part, PartTestTemplate
 from plugin.base.event.events import batch_events
@@ -26,6 +26,7 @@ from stock.events import StockEvents
 from stock.status_codes import StockHistoryCode, StockStatus
 
 from .models import (
+    SerialNumberIndex,
     StockItem,
     StockItemTestResult,
     StockItemTracking,
@@ -711,7 +712,7 @@ class StockTest(StockTestBase):
         return [
             task
             for task in OrmQ.objects.all().order_by('id')
-            if task.args() == (StockEvents.ITEM_COUNTED,)
+            if task.args() == ('sampleevent', StockEvents.ITEM_COUNTED)
         ]
 
     def test_stocktake_batch_events(self):
@@ -723,6 +724,7 @@ class StockTest(StockTestBase):
         bulk_trigger_event() call, fired when the enclosing transaction commits.
         """
         InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         part = Part.objects.create(
             name='Batch stocktake part', description='For batch stocktake testing'
@@ -749,12 +751,13 @@ class StockTest(StockTestBase):
         self.assertEqual(len(counted_tasks), 10)
 
         for idx, (task, item) in enumerate(zip(counted_tasks, items, strict=True)):
-            self.assertEqual(task.func(), 'plugin.base.event.events.register_event')
+            self.assertEqual(task.func(), 'plugin.base.event.events.process_event')
             self.assertEqual(task.kwargs(), {'id': item.id, 'quantity': 100.0 + idx})
 
     def test_stocktake_events_outside_batch(self):
         """Test that stocktake() still fires events immediately when called outside batch_events()."""
         InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+        activateEventPlugin()
 
         item = StockItem.objects.get(pk=2)
 
@@ -771,6 +774,25 @@ class StockTest(StockTestBase):
         self.assertEqual(len(counted_tasks), 1)
         self.assertEqual(counted_tasks[0].kwargs(), {'id': item.id, 'quantity': 42.0})
 
+    def test_adjustment_saved_events(self):
+        """Test that bulk stock adjustments trigger the generic 'saved' event for each item."""
+        from stock.adjustment import StockAdjustmentEngine
+
+        items = [StockItem.objects.get(pk=pk) for pk in [2, 1234]]
+
+        with mock.patch('stock.adjustment.trigger_event') as trigger:
+            StockAdjustmentEngine(self.user).add([
+                {'pk': item, 'quantity': 5} for item in items
+            ])
+
+        saved = [
+            call.kwargs['id']
+            for call in trigger.call_args_list
+            if call.args == ('stock_stockitem.saved',)
+        ]
+
+        self.assertEqual(sorted(saved), [2, 1234])
+
     def test_add_stock(self):
         """Test adding stock."""
         it = StockItem.objects.get(pk=2)
@@ -1505,6 +1527,83 @@ class VariantTest(StockTestBase):
         item.save()
 
 
+class SerialNumberIndexTest(StockTestBase):
+    """Tests for the SerialNumberIndex model."""
+
+    def test_latest_serial(self):
+        """The index tracks the latest serial number for each part tree."""
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+        variant = Part.objects.get(pk=10003)
+
+        self.assertEqual(SerialNumberIndex.objects.count(), 0)
+
+        # Index entry is calculated on demand
+        self.assertEqual(chair.get_latest_serial_number(), '22')
+        self.assertEqual(SerialNumberIndex.objects.count(), 1)
+
+        # Latest serial is read from the index
+        with self.assertNumQueriesLessThan(5):
+            self.assertEqual(variant.get_latest_serial_number(), '22')
+
+        # Creating a new serialized item updates the index
+        item = StockItem.objects.create(part=variant, quantity=1, serial='100')
+        self.assertEqual(chair.get_latest_serial_number(), '100')
+
+        # Bulk creation of serialized items also updates the index
+        StockItem._create_serial_numbers(['101', '102'], part=variant)
+        self.assertEqual(chair.get_latest_serial_number(), '102')
+
+        # A "lower" serial number does not affect the index
+        StockItem.objects.create(part=variant, quantity=1, serial='50')
+        self.assertEqual(chair.get_latest_serial_number(), '102')
+
+        # The high-water mark is retained when items are deleted
+        StockItem.objects.filter(serial__in=['101', '102']).delete()
+        item.delete()
+        self.assertEqual(chair.get_latest_serial_number(), '102')
+
+        # Rebuilding the index recalculates from existing stock items
+        SerialNumberIndex.rebuild()
+        self.assertEqual(chair.get_latest_serial_number(), '50')
+
+    def test_reserve(self):
+        """Reserved serial number ranges are contiguous and distinct."""
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+
+        serials = chair.reserve_serial_numbers(5)
+        self.assertEqual(serials, ['23', '24', '25', '26', '27'])
+
+        # Reserved serials are not issued again
+        self.assertEqual(chair.get_latest_serial_number(), '27')
+        self.assertEqual(chair.reserve_serial_numbers(2), ['28', '29'])
+
+        # Reserved serials can be used to create stock items
+        variant = Part.objects.get(pk=10003)
+        items = StockItem._create_serial_numbers(serials, part=variant)
+        self.assertEqual(items.count(), 5)
+
+        self.assertEqual(chair.get_latest_serial_number(), '29')
+
+        # "Next" serial numbers are reserved when extracted for allocation
+        self.assertEqual(chair.extract_serial_numbers('~, 40', 2), ['30', '40'])
+        self.assertEqual(chair.get_latest_serial_number(), '29')
+
+        self.assertEqual(
+            chair.extract_serial_numbers('~, ~, 40', 3, reserve=True),
+            ['30', '31', '40'],
+        )
+        self.assertEqual(chair.get_latest_serial_number(), '31')
+        self.assertEqual(chair.extract_serial_numbers('~', 1, reserve=True), ['32'])
+
+        # No serial numbers are reserved unless requested
+        self.assertEqual(chair.extract_serial_numbers('50', 1, reserve=True), ['50'])
+        self.assertEqual(chair.get_latest_serial_number(), '32')
+
+
 class StockLocationTreeTest(StockTestBase):
     """Unit test for the StockLocation tree structure."""
 
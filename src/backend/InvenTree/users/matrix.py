@@ -0,0 +1,249 @@
+"""Precomputed permission matrix for each user.
+
+Previously, each call to check_user_role() or check_user_permission() walked the groups and
+rulesets of the user (and rebuilt the mapping of database tables to rulesets), and each result
+was cached only within the current request. Checking permissions for many users (e.g. the
+recipients of a notification) or against many models (e.g. global search) repeated this work
+for every check, in every request and in every process.
+
+Instead, the PermissionMatrix class:
+
+- Compiles the roles of a user into a permission bitset for each role, along with the set of
+  model permissions granted to the user (via their groups, or directly)
+- Maps each database table to the roles which control it (compiled once per process)
+- Stores the matrix in the request cache, and (if enabled) in the global cache
+- Is invalidated whenever groups, rulesets or user permissions change, via a version token
+  stored in the global cache
+"""
+
+import uuid
+from collections import defaultdict
+from functools import cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache as global_cache
+from django.db import transaction
+
+import structlog
+
+import InvenTree.instrumentation
+from InvenTree.cache import get_session_cache, set_session_cache
+from users.ruleset import (
+    RULESET_CHANGE_INHERIT,
+    RULESET_PERMISSIONS,
+    get_ruleset_ignore,
+    get_ruleset_models,
+)
+
+logger = structlog.get_logger('inventree')
+
+# Cached permission matrices are retained for one hour (unless invalidated earlier)
+CACHE_TIMEOUT = 3600
+
+# Bit value for each permission type (e.g. 'view' -> 0b0001)
+PERMISSION_BITS = {
+    permission: 1 << idx for idx, permission in enumerate(RULESET_PERMISSIONS)
+}
+
+# Incremented whenever the permission matrix is invalidated within this process
+_generation = 0
+
+
+@cache
+def _compile_tables(site_multi: bool) -> tuple[dict, dict, frozenset]:
+    """Compile the mapping of database tables to roles (see get_table_roles)."""
+    table_roles = defaultdict(list)
+
+    for role, tables in get_ruleset_models().items():
+        for table in tables:
+            table_roles[table].append(role)
+
+    # Child tables which inherit permissions from the 'change' permission of a parent role
+    inherit_roles = {
+        f'{parent}_{child}': parent for parent, child in RULESET_CHANGE_INHERIT
+    }
+
+    return (
+        {table: tuple(roles) for table, roles in table_roles.items()},
+        inherit_roles,
+        frozenset(get_ruleset_ignore()),
+    )
+
+
+def get_table_roles() -> tuple[dict, dict, frozenset]:
+    """Return the compiled mapping of database tables to roles.
+
+    Returns:
+        A tuple of:
+        - A mapping of each table name to the roles which control it
+        - A mapping of each child table name to the parent role it inherits from
+        - The set of table names which do not require any permissions
+    """
+    return _compile_tables(settings.SITE_MULTI)
+
+
+class PermissionMatrix:
+    """Compiled roles and model permissions for a single user.
+
+    Example:
+        matrix = PermissionMatrix.get(user)
+        matrix.has_role('part', 'change')
+        matrix.has_permission('part.change_part')
+    """
+
+    VERSION_KEY = 'permission_matrix_version'
+
+    def __init__(self, user_id: Optional[int]):
+        """Initialize an (empty) permission matrix for the specified user."""
+        self.user_id = user_id
+
+        # Permission bitset for each role (e.g. {'part': 0b0011})
+        self.roles: dict[str, int] = {}
+
+        # Model permissions granted to the user (e.g. {'part.view_part'})
+        self.permissions: frozenset[str] = frozenset()
+
+    @property
+    def cache_key(self) -> str:
+        """Return the cache key for the matrix data."""
+        return f'permission_matrix:{self.user_id}'
+
+    @classmethod
+    def get(cls, user, groups=None) -> 'PermissionMatrix':
+        """Return the permission matrix for the provided user.
+
+        Arguments:
+            user: The user object
+            groups: Optional queryset of groups with prefetched rule sets (see prefetch_rule_sets)
+        """
+        matrix = cls(user.pk)
+
+        if user.pk is None:
+            # Unsaved (or anonymous) user
+            matrix.compile(user, groups=groups)
+            return matrix
+
+        # Matrices cached in the request are discarded when the matrix is invalidated
+        session_key = f'{matrix.cache_key}:{_generation}'
+
+        if cached := get_session_cache(session_key):
+            return cached
+
+        # The global cache is only used if it is shared between all processes
+        matrix.load(user, groups=groups, use_cache=settings.GLOBAL_CACHE_ENABLED)
+
+        set_session_cache(session_key, matrix)
+
+        return matrix
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Invalidate the permission matrix for all users (e.g. after a group or ruleset is changed)."""
+        global _generation
+
+        _generation += 1
+
+        if settings.GLOBAL_CACHE_ENABLED:
+            cls.bump()
+
+            # Matrices compiled before the transaction is committed are also discarded
+            transaction.on_commit(cls.bump)
+
+    @classmethod
+    def bump(cls) -> None:
+        """Replace the version token, discarding all cached matrix data."""
+        try:
+            global_cache.set(cls.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        except Exception:
+            logger.warning('Failed to update permission matrix version')
+
+    def get_version(self, data: dict) -> Optional[str]:
+        """Return the current version token (creating a new token if none exists)."""
+        if version := data.get(self.VERSION_KEY):
+            return version
+
+        try:
+            global_cache.add(self.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            return global_cache.get(self.VERSION_KEY)
+        except Exception:
+            return None
+
+    def load(self, user, groups=None, use_cache: bool = True) -> None:
+        """Load the matrix, from the global cache if it is still valid."""
+        version = None
+
+        if use_cache:
+            try:
+                data = global_cache.get_many([self.VERSION_KEY, self.cache_key])
+            except Exception:
+                data = {}
+                use_cache = False
+
+            version = self.get_version(data)
+            cached = data.get(self.cache_key)
+
+            valid = bool(version and cached and cached['version'] == version)
+
+            InvenTree.instrumentation.record_cache_access(valid)
+
+            if valid:
+                self.roles = cached['roles']
+                self.permissions = cached['permissions']
+                return
+
+        self.compile(user, groups=groups)
+
+        # The matrix is tagged with the version token read *before* the data was compiled
+        if use_cache and version:
+            try:
+                global_cache.set(
+                    self.cache_key,
+                    {
+                        'version': version,
+                        'roles': self.roles,
+                        'permissions': self.permissions,
+                    },
+                    timeout=CACHE_TIMEOUT,
+                )
+            except Exception:
+                logger.warning(
+                    'Failed to cache permission matrix for user %s', self.user_id
+                )
+
+    def compile(self, user, groups=None) -> None:
+        """Compile the matrix from the groups and rulesets of the user."""
+        from users.models import RuleSet
+
+        fields = [f'can_{permission}' for permission in RULESET_PERMISSIONS]
+
+        if groups is not None:
+            rules = [
+                (rule.name, *[getattr(rule, field) for field in fields])
+                for group in groups
+                for rule in group.prefetched_rule_sets
+            ]
+        elif user.pk is not None:
+            rules = RuleSet.objects.filter(group__user=user).values_list(
+                'name', *fields
+            )
+        else:
+            rules = []
+
+        roles = defaultdict(int)
+
+        for name, *flags in rules:
+            for permission, flag in zip(RULESET_PERMISSIONS, flags, strict=True):
+                if flag:
+                    roles[name] |= PERMISSION_BITS[permission]
+
+        self.roles = dict(roles)
+        self.permissions = frozenset(user.get_all_permissions())
+
+    def has_role(self, role: str, permission: str) -> bool:
+        """Return True if the user has the specified role:permission combination."""
+        return bool(self.roles.get(role, 0) & PERMISSION_BITS.get(permission, 0))
+
+    def has_permission(self, permission_name: str) -> bool:
+        """Return True if the user has the specified model permission (e.g. 'part.view_part')."""
+        return permission_name in self.permissions
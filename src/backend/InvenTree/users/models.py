@@ -26,6 +26,7 @@ import InvenTree.models
 from common.settings import get_global_setting
 from InvenTree.ready import isImportingData, isReadOnlyCommand
 
+from .matrix import PermissionMatrix
 from .ruleset import RULESET_CHOICES, get_ruleset_models
 
 logger = structlog.get_logger('inventree')
@@ -638,3 +639,28 @@ def validate_primary_group_on_group_change(sender, instance, action, **kwargs):
         if profile.primary_group and profile.primary_group not in instance.groups.all():
             profile.primary_group = None
             profile.save()
+
+
+@receiver(post_save, sender=RuleSet, dispatch_uid='ruleset_saved_permission_matrix')
+@receiver(post_delete, sender=RuleSet, dispatch_uid='ruleset_deleted_permission_matrix')
+@receiver(post_save, sender=Group, dispatch_uid='group_saved_permission_matrix')
+@receiver(post_delete, sender=Group, dispatch_uid='group_deleted_permission_matrix')
+@receiver(
+    m2m_changed,
+    sender=User.groups.through,
+    dispatch_uid='user_groups_permission_matrix',
+)
+@receiver(
+    m2m_changed,
+    sender=User.user_permissions.through,
+    dispatch_uid='user_permissions_permission_matrix',
+)
+@receiver(
+    m2m_changed,
+    sender=Group.permissions.through,
+    dispatch_uid='group_permissions_permission_matrix',
+)
+def invalidate_permission_matrix(sender, **kwargs):
+    """Invalidate the compiled user permissions when a group, ruleset or permission assignment changes."""
+    if kwargs.get('action', 'post').startswith('post'):
+        PermissionMatrix.invalidate()
@@ -7,7 +7,7 @@ from django.db import models
 from django.db.models.query import Prefetch, QuerySet
 
 import InvenTree.cache
-from users.ruleset import RULESET_CHANGE_INHERIT, get_ruleset_ignore, get_ruleset_models
+from users.matrix import PermissionMatrix, get_table_roles
 
 
 def split_model(model_label: str) -> tuple[str, str]:
@@ -91,7 +91,7 @@ def check_user_role(
     Returns:
         bool: True if the user has the specified role:permission combination
 
-    Note: As this check may be called frequently, we cache the result in the session cache.
+    Note: As this check may be called frequently, the compiled permission matrix for the user is cached.
     """
     if not user:
         return False
@@ -102,31 +102,7 @@ def check_user_role(
     if user.is_superuser:
         return True
 
-    # First, check the session cache
-    cache_key = f'role_{user.pk}_{role}_{permission}'
-    result = InvenTree.cache.get_session_cache(cache_key)
-
-    if result is not None:
-        return result
-
-    # Default for no match
-    result = False
-
-    groups = groups or prefetch_rule_sets(user)
-
-    for group in groups:
-        for rule in group.prefetched_rule_sets:
-            if rule.name == role:
-                # Check if the rule has the specified permission
-                # e.g. "view" role maps to "can_view" attribute
-                if getattr(rule, f'can_{permission}', False):
-                    result = True
-                    break
-
-    # Save result to session-cache
-    InvenTree.cache.set_session_cache(cache_key, result)
-
-    return result
+    return PermissionMatrix.get(user, groups=groups).has_role(role, permission)
 
 
 def check_user_permission(
@@ -148,7 +124,7 @@ def check_user_permission(
     Returns:
         bool: True if the user has the specified permission
 
-    Note: As this check may be called frequently, we cache the result in the session cache.
+    Note: As this check may be called frequently, the compiled permission matrix for the user is cached.
     """
     if not user:
         return False
@@ -161,46 +137,42 @@ def check_user_permission(
 
     table_name = f'{model._meta.app_label}_{model._meta.model_name}'
 
+    table_roles, inherit_roles, ignored_tables = get_table_roles()
+
     # Particular table does not require specific permissions
-    if table_name in get_ruleset_ignore():
+    if table_name in ignored_tables:
         return True
 
-    groups = groups or prefetch_rule_sets(user)
+    matrix = PermissionMatrix.get(user, groups=groups)
 
-    for role, table_names in get_ruleset_models().items():
-        if table_name in table_names:
-            if check_user_role(user, role, permission, groups=groups):
-                return True
+    if any(
+        matrix.has_role(role, permission) for role in table_roles.get(table_name, [])
+    ):
+        return True
 
     # Check for children models which inherits from parent role
-    for parent, child in RULESET_CHANGE_INHERIT:
-        # Get child model name
-        parent_child_string = f'{parent}_{child}'
-
-        if parent_child_string == table_name:
-            # Check if parent role has change permission
-            if check_user_role(user, parent, 'change', groups=groups):
-                return True
+    if (parent := inherit_roles.get(table_name)) and matrix.has_role(parent, 'change'):
+        return True
 
     # Generate the permission name based on the model and permission
     # e.g. 'part.view_part'
     permission_name = f'{model._meta.app_label}.{permission}_{model._meta.model_name}'
 
-    # First, check the session cache
-    cache_key = f'permission_{user.pk}_{permission_name}'
-    result = InvenTree.cache.get_session_cache(cache_key)
-
-    if result is not None:
-        return result
-
-    result = user.has_perm(permission_name)
+    if matrix.has_permission(permission_name):
+        return True
 
     # If the user does not have permissions (as determined above), check if the model class provides a custom permission check method
     # This is required for non-standard models (i.e. defined via plugins), which do not have the required ruleset definitions
-    if not result and hasattr(model, 'check_user_permission'):  # pragma: no cover
-        result = model.check_user_permission(user, permission)
+    if hasattr(model, 'check_user_permission'):  # pragma: no cover
+        cache_key = f'permission_{user.pk}_{permission_name}'
+        result = InvenTree.cache.get_session_cache(cache_key)
+
+        if result is None:
+            result = model.check_user_permission(user, permission)
 
-    # Save result to session-cache
-    InvenTree.cache.set_session_cache(cache_key, result)
+            # Save result to session-cache
+            InvenTree.cache.set_session_cache(cache_key, result)
+
+        return result
 
-    return result
+    return False
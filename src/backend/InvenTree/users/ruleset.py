@@ -85,6 +85,9 @@ def get_ruleset_models() -> dict:
             'plugin_pluginusersetting',
             # Misc
             'common_barcodescanresult',
+            'common_barcodeindex',
+            'common_searchdocument',
+            'stock_serialnumberindex',
             'common_newsfeedentry',
             'taggit_tag',
             'taggit_taggeditem',
@@ -118,6 +121,7 @@ def get_ruleset_models() -> dict:
         RuleSetEnum.PART: [
             'part_part',
             'part_partpricing',
+            'part_partavailability',
             'part_partsellpricebreak',
             'part_partinternalpricebreak',
             'part_parttesttemplate',
@@ -213,6 +217,8 @@ def get_ruleset_ignore() -> list[str]:
         'django_q_task',
         'django_q_schedule',
         'django_q_success',
+        'common_taskqueueindex',
+        'common_treerebuild',
         # Importing
         'importer_dataimportsession',
         'importer_dataimportcolumnmap',
@@ -192,6 +192,57 @@ class RuleSetModelTest(TestCase):
         # There should now not be any permissions assigned to this group
         self.assertEqual(group.permissions.count(), 0)
 
+    def test_permission_matrix(self):
+        """Test that the compiled permission matrix is invalidated when permissions change."""
+        from django.contrib.auth.models import User
+
+        from InvenTree.cache import create_session_cache, delete_session_cache
+        from part.models import Part, PartCategory
+        from users.matrix import PermissionMatrix
+        from users.permissions import check_user_permission, check_user_role
+
+        user = User.objects.create_user(username='matrix', password='matrix')
+        group = Group.objects.create(name='Matrix group')
+
+        # Checks within a request are served from the same matrix
+        create_session_cache(None)
+
+        try:
+            self.assertFalse(check_user_role(user, 'part', 'view'))
+            self.assertIs(PermissionMatrix.get(user), PermissionMatrix.get(user))
+
+            # Adding the user to a group invalidates the matrix
+            user.groups.add(group)
+
+            rule = group.rule_sets.get(name='part')
+            rule.can_add = True
+            rule.save()
+
+            matrix = PermissionMatrix.get(user)
+            self.assertEqual(matrix.roles['part'], 0b0111)
+
+            for permission, expected in [
+                ('view', True),
+                ('add', True),
+                ('change', True),
+                ('delete', False),
+            ]:
+                self.assertEqual(check_user_role(user, 'part', permission), expected)
+                self.assertEqual(
+                    check_user_permission(user, Part, permission), expected
+                )
+
+            # Part categories are controlled by a different role
+            self.assertFalse(check_user_permission(user, PartCategory, 'view'))
+
+            # Removing the user from the group invalidates the matrix
+            user.groups.remove(group)
+
+            self.assertFalse(check_user_role(user, 'part', 'view'))
+            self.assertFalse(check_user_permission(user, Part, 'view'))
+        finally:
+            delete_session_cache()
+
 
 class OwnerModelTest(InvenTreeTestCase):
     """Some simplistic tests to ensure the Owner model is setup correctly."""
@@ -1,5 +1,5 @@
 import { t } from '@lingui/core/macro';
-import { Center, Loader, Stack } from '@mantine/core';
+import { Center, Loader, Progress, Stack, Text } from '@mantine/core';
 import { useInterval } from '@mantine/hooks';
 import { useMemo } from 'react';
 
@@ -20,6 +20,11 @@ export default function ImporterStatus({
     );
   }, [session.status]);
 
+  // Number of rows which have been validated
+  const progress: number = useMemo(() => {
+    return session.sessionData?.progress ?? 0;
+  }, [session.sessionData]);
+
   // Periodically refresh the import session data
   const _interval = useInterval(
     () => {
@@ -36,6 +41,18 @@ export default function ImporterStatus({
       <Stack gap='xs' align='center' justify='center'>
         <StylishText size='lg'>{statusText}</StylishText>
         <Loader />
+        {session.rowCount > 0 && (
+          <Stack gap='xs' align='center' w={300}>
+            <Progress
+              value={(100 * progress) / session.rowCount}
+              w='100%'
+              animated
+            />
+            <Text size='sm'>
+              {progress} / {session.rowCount}
+            </Text>
+          </Stack>
+        )}
       </Stack>
     </Center>
   );
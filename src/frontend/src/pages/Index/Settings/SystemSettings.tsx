@@ -56,7 +56,8 @@ export default function SystemSettings() {
                 'INVENTREE_SHOW_ADMIN_BANNER',
                 'INVENTREE_RESTRICT_ABOUT',
                 'INVENTREE_UPLOAD_MAX_SIZE',
-                'INVENTREE_STRICT_URLS'
+                'INVENTREE_STRICT_URLS',
+                'INVENTREE_SEARCH_INDEX'
               ]}
             />
             <GlobalSettingList
@@ -231,7 +232,8 @@ export default function SystemSettings() {
                 'PART_REVISION_ASSEMBLY_ONLY',
                 'PART_SHOW_RELATED',
                 'PART_BOM_ALLOW_ZERO_QUANTITY',
-                'PART_CATEGORY_DEFAULT_ICON'
+                'PART_CATEGORY_DEFAULT_ICON',
+                'PART_AVAILABILITY_CACHE'
               ]}
             />
             <GlobalSettingList
@@ -1,6 +1,7 @@
 """Tasks for automating certain actions and interacting with InvenTree from the CLI."""
 
 import datetime
+import gzip
 import json
 import os
 import pathlib
@@ -372,6 +373,8 @@ def content_excludes(
         'importer.dataimportsession',
         'importer.dataimportcolumnmap',
         'importer.dataimportrow',
+        'common.taskqueueindex',
+        'common.treerebuild',
     ]
 
     # Optional exclude email message logs
@@ -676,6 +679,25 @@ def check_file_existence(filename: Path, overwrite: bool = False):
             sys.exit(1)
 
 
+def is_stream_file(filename: Path) -> bool:
+    """Return True if the provided file is a (streamed) JSON Lines data file."""
+    return str(filename).lower().endswith(('.jsonl', '.jsonl.gz'))
+
+
+def read_stream_metadata(filename: Path) -> dict:
+    """Read the metadata from the first line of a (streamed) JSON Lines data file."""
+    opener = gzip.open if str(filename).lower().endswith('.gz') else open
+
+    with opener(filename, 'rb') as f_in:
+        try:
+            data = json.loads(f_in.readline() or '{}')
+        except json.JSONDecodeError as exc:
+            error(f'ERROR: Failed to decode JSON file: {exc}')
+            sys.exit(1)
+
+    return data if isinstance(data, dict) and data.get('metadata') else {}
+
+
 @task(help={'verbose': 'Print verbose output from the command'})
 @state_logger
 def wait(c, verbose: bool = False):
@@ -1196,7 +1218,7 @@ def update(
 # Data tasks
 @task(
     help={
-        'filename': "Output filename (default = 'data.json')",
+        'filename': "Output filename (default = 'data.json'). Use a '.jsonl' or '.jsonl.gz' extension to stream records to file",
         'overwrite': 'Overwrite existing files without asking first (default = False)',
         'include_email': 'Include email logs in the output file (default = False)',
         'include_permissions': 'Include user and group permissions in the output file (default = False)',
@@ -1239,6 +1261,17 @@ def export_records(
         allow_sso=include_sso,
     )
 
+    if is_stream_file(target):
+        # Stream records directly to file, one model at a time
+        cmd = f"dump_records '{target}' {excludes}"
+
+        if include_permissions:
+            cmd += ' --include-permissions'
+
+        manage(c, cmd, pty=True, verbose=verbose)
+        success('Data export completed')
+        return
+
     with tempfile.NamedTemporaryFile(
         suffix='.json', encoding='utf-8', mode='w+t', delete=True
     ) as tmpfile:
@@ -1356,6 +1389,7 @@ def validate_import_metadata(
         'ignore_nonexistent': 'Ignore non-existent database models (default = False)',
         'exclude_plugins': 'Exclude plugin data from the import process (default = False)',
         'skip_migrations': 'Skip the migration step after clearing data (default = False)',
+        'resume': 'Resume an interrupted import from a streamed (.jsonl) data file (default = False)',
         'verbose': 'Print verbose output from management commands',
     },
     pre=[wait],
@@ -1369,6 +1403,7 @@ def import_records(
     exclude_plugins: bool = False,
     ignore_nonexistent: bool = False,
     skip_migrations: bool = False,
+    resume: bool = False,
     verbose: bool = False,
 ):
     """Import database records from a file."""
@@ -1382,12 +1417,34 @@ def import_records(
         error(f"ERROR: File '{target}' does not exist")
         sys.exit(1)
 
+    if resume and not is_stream_file(target):
+        error('ERROR: Only streamed (.jsonl) data files can be resumed')
+        sys.exit(1)
+
+    if resume and clear:
+        warning('Existing data is not cleared when resuming an import')
+        clear = False
+
     if clear:
         delete_data(c, force=True, migrate=True, verbose=verbose)
 
     if not skip_migrations:
         migrate(c, verbose=verbose)
 
+    if is_stream_file(target):
+        import_stream_records(
+            c,
+            target,
+            strict=strict,
+            exclude_plugins=exclude_plugins,
+            ignore_nonexistent=ignore_nonexistent,
+            skip_migrations=skip_migrations,
+            resume=resume,
+            verbose=verbose,
+        )
+        success('Data import completed')
+        return
+
     info(f"Importing database records from '{target}'")
 
     with open(target, encoding='utf-8') as f_in:
@@ -1500,6 +1557,82 @@ def import_records(
     success('Data import completed')
 
 
+def import_stream_records(
+    c,
+    target: Path,
+    strict: bool = False,
+    exclude_plugins: bool = False,
+    ignore_nonexistent: bool = False,
+    skip_migrations: bool = False,
+    resume: bool = False,
+    verbose: bool = False,
+):
+    """Import database records from a (streamed) JSON Lines data file.
+
+    Records are loaded in the same order as for a JSON data file (auth, common, plugins, remaining).
+    The progress of each phase is recorded, so that an interrupted import can be resumed.
+    """
+    progress_file = Path(f'{target}.progress')
+
+    if not resume:
+        progress_file.unlink(missing_ok=True)
+
+    info(f"Streaming database records from '{target}'")
+
+    metadata = read_stream_metadata(target)
+
+    # Do not validate the 'apps' list yet - as the plugins have not yet been loaded
+    validate_import_metadata(c, metadata, strict=strict, apps=False)
+
+    def load_phase(phase: str, apps: Optional[list[str]] = None, excludes: str = ''):
+        """Load the records for a single import phase."""
+        info(f'Loading {phase} records...')
+
+        cmd = f"load_records '{target}' --phase {phase}"
+
+        for app in apps or []:
+            cmd += f' --app {app}'
+
+        if excludes:
+            cmd += f' {excludes}'
+
+        if ignore_nonexistent:
+            cmd += ' --ignorenonexistent'
+
+        if resume:
+            cmd += ' --resume'
+
+        manage(c, cmd, pty=True, verbose=verbose)
+
+    load_phase('auth', apps=['auth', 'users'])
+    load_phase('common', apps=['common'])
+
+    if not exclude_plugins:
+        load_phase('plugins', apps=['plugin'])
+
+        plugin_models = [
+            label for label in metadata.get('models', []) if label.startswith('plugin.')
+        ]
+
+        if plugin_models and not skip_migrations:
+            # Now that the plugins have been loaded, run database migrations again to ensure any new plugins have their database schema up to date
+            migrate(c)
+
+    # Run validation again - ensure that the plugin apps have been loaded correctly
+    validate_import_metadata(c, metadata, strict=strict, apps=True)
+
+    load_phase(
+        'remaining',
+        excludes=' '.join([
+            content_excludes(allow_auth=False),
+            '--exclude auth --exclude users --exclude common --exclude plugin',
+        ]),
+    )
+
+    # The import is complete - progress no longer needs to be tracked
+    progress_file.unlink(missing_ok=True)
+
+
 @task(
     help={
         'force': 'Force deletion of all data without confirmation',
@@ -1616,14 +1749,27 @@ def server(c, address='0.0.0.0:8000', no_reload=False, no_threading=False):
     manage(c, cmd, pty=True)
 
 
-@task(pre=[wait], help={'verbose': 'Print verbose output from the command'})
-def worker(c, verbose: bool = False):
+@task(
+    pre=[wait],
+    help={
+        'verbose': 'Print verbose output from the command',
+        'queue': 'Process tasks from a separate task queue (e.g. "low"), configured via INVENTREE_BACKGROUND_QUEUES',
+    },
+)
+def worker(c, verbose: bool = False, queue: str = ''):
     """Run the InvenTree background worker process.
 
     Launches a django-q2 cluster to process background tasks.
     Ref: https://django-q2.readthedocs.io
     """
-    manage(c, 'qcluster', pty=True, verbose=verbose)
+    env = None
+
+    if queue and queue != 'default':
+        # Each additional task queue is processed by a separate cluster
+        # (see InvenTree.setting.worker.get_queue_cluster_name)
+        env = {'Q_CLUSTER_NAME': f'InvenTree-{queue}'}
+
+    manage(c, 'qcluster', pty=True, verbose=verbose, env=env)
 
 
 @task(help={'timeout': 'Maximum minutes since last heartbeat (default: 3)'})
@@ -1843,6 +1989,54 @@ def test(
         manage(c, cmd, pty=pty)
 
 
+@task(
+    help={
+        'seed': 'Random seed for the generated dataset (default = 0)',
+        'scale': 'Scale factor for the dataset size (default = 1.0, i.e. 100k parts and 1M stock items)',
+        'repeat': 'Number of timed runs for each benchmark (default = 3)',
+        'filter': 'Only run benchmarks whose name starts with this value (comma separated)',
+        'output': "Output file for the benchmark results (default = 'benchmark.json')",
+        'baseline': 'Baseline result file to compare against (fails if regressions are detected)',
+        'tolerance': 'Allowed (fractional) increase in time before a regression is reported (default = 0.25)',
+        'keepdb': 'Keep the test database (and generated dataset) for the next run (default = False)',
+    }
+)
+def benchmark(
+    c,
+    seed: int = 0,
+    scale: float = 1.0,
+    repeat: int = 3,
+    filter: str = '',
+    output: str = 'benchmark.json',
+    baseline: str = '',
+    tolerance: float = 0.25,
+    keepdb: bool = False,
+):
+    """Run the backend benchmark suite against a generated (seeded) dataset.
+
+    A separate test database is created, and populated with a synthetic dataset.
+    Timings and query counts for each benchmark are written to the output file.
+
+    Example:
+        benchmark --scale=0.1 --baseline=benchmark.json --output=current.json
+    """
+    cmd = f'benchmark --seed {seed} --scale {scale} --repeat {repeat}'
+    cmd += f" --tolerance {tolerance} --output '{Path(output).resolve()}'"
+
+    for name in filter.split(','):
+        if name := name.strip():
+            cmd += f" --filter '{name}'"
+
+    if baseline:
+        cmd += f" --baseline '{Path(baseline).resolve()}'"
+
+    if keepdb:
+        cmd += ' --keepdb'
+
+    info('Running backend benchmarks...')
+    manage(c, cmd, pty=True)
+
+
 @task(
     help={
         'dev': 'Set up development environment at the end',
@@ -2525,6 +2719,7 @@ def monitor(c):
 
 # Collection sorting
 development = Collection(
+    benchmark,
     delete_data,
     docs_server,
     frontend_server,